@@ -0,0 +1,673 @@
+# warehouse.py
+"""
+연구용 로컬 데이터 웨어하우스 (SQLite)
+
+흩어진 산출물을 하나의 파일 DB 로 모아 SQL 로 조인합니다.
+(기존 merge_scan_trade.py 처럼 CSV 전체를 pandas 로 읽어 merge 할 필요 없음)
+
+소스 → 테이블:
+- daily scan CSV          (test/daily_scan/output/scan_result_YYYY-MM-DD.csv) → scan_results
+- 매매 로그                (trade_logs/trade_log_YYYYMMDD.csv)                 → trades
+- 정찰 JSONL              (records/scout/...)                                  → scout_records, scout_daily
+  (JSONL 이 보관된 날짜는 day_archive.scpk 컨테이너)
+- 이벤트 JSONL            (scout_bot/output/events/events_YYYYMMDD.jsonl)      → events
+  (보관된 날짜는 정찰 날짜 디렉터리의 컨테이너)
+- 문지기 watchlist         (scout_selector|gatekeeper_bot/output/watchlist_*.json) → watchlist_picks
+- daily_analysis.json     (records/analysis/YYYY/MM/YYYYMMDD/)                 → analysis_days, scout_cycles
+
+설계:
+- 모든 테이블은 date(YYYY-MM-DD) + symbol 컬럼과 (date, symbol) 인덱스를 가짐
+- 원본 파일 1개 = 하나의 날짜 파티션 조각 (source_file 컬럼)
+- ingested_files 에 파일별 (크기, 수정시각) 지문 저장
+  → 바뀐 파일만 해당 조각을 지우고 다시 적재 (여러 번 실행해도 결과 동일)
+  → 사라진 파일(삭제/보관)의 조각은 다음 적재 때 제거
+- 같은 이름의 watchlist 가 여러 출력 디렉터리에 있으면 WATCHLIST_DIRS 앞쪽 것만 적재,
+  조회는 (date, symbol, bucket) 단위로 중복 제거
+- scout_daily.last_price 는 장중 마지막 관찰가 (종가 근사치)
+
+사용법:
+    python research/warehouse.py ingest
+    python research/warehouse.py picks --exit-type reached_1pct
+    python research/warehouse.py query "SELECT date, COUNT(*) FROM scout_cycles GROUP BY date"
+"""
+import os
+import sys
+import csv
+import json
+import sqlite3
+import argparse
+from glob import glob
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+try:
+    from test.framework.analyzer import scout_archive
+    HAS_SCOUT_ARCHIVE = True
+except ImportError:
+    scout_archive = None
+    HAS_SCOUT_ARCHIVE = False
+DEFAULT_DB_PATH = PROJECT_ROOT / "records" / "warehouse" / "research.sqlite3"
+
+SCAN_DIRS = [PROJECT_ROOT / "test" / "daily_scan" / "output", PROJECT_ROOT / "daily_scan" / "output"]
+TRADE_LOG_DIRS = [PROJECT_ROOT / "trade_logs", PROJECT_ROOT / "test" / "trade_logs", PROJECT_ROOT / "live" / "trade_logs"]
+SCOUT_RECORDS_DIR = PROJECT_ROOT / "records" / "scout"
+EVENTS_DIR = PROJECT_ROOT / "scout_bot" / "output" / "events"
+WATCHLIST_DIRS = [PROJECT_ROOT / "scout_selector" / "output", PROJECT_ROOT / "gatekeeper_bot" / "output"]
+ANALYSIS_DIR = PROJECT_ROOT / "records" / "analysis"
+
+WATCHLIST_BUCKETS = ["largecap", "volume", "structure", "theme"]
+
+
+# ======================================================
+# 📐 스키마
+# ======================================================
+SCHEMA = {
+    "scan_results": """
+        date TEXT NOT NULL, symbol TEXT NOT NULL,
+        score_total REAL, watch_tier TEXT, source_tags TEXT,
+        source_file TEXT NOT NULL
+    """,
+    "trades": """
+        date TEXT NOT NULL, symbol TEXT NOT NULL, datetime TEXT,
+        qty INTEGER, buy_price REAL, sell_price REAL, pnl REAL, pnl_pct REAL, reason TEXT,
+        source_file TEXT NOT NULL
+    """,
+    "scout_records": """
+        date TEXT NOT NULL, symbol TEXT NOT NULL, ts TEXT, session TEXT,
+        price INTEGER, volume INTEGER, turnover_krw INTEGER,
+        triggered INTEGER, box_formed INTEGER, base_candle_exists INTEGER,
+        exit_type TEXT, no_event_reason TEXT,
+        source_file TEXT NOT NULL
+    """,
+    "scout_daily": """
+        date TEXT NOT NULL, symbol TEXT NOT NULL,
+        records INTEGER, triggered_records INTEGER,
+        first_price INTEGER, last_price INTEGER, high_price INTEGER, low_price INTEGER,
+        source_file TEXT NOT NULL
+    """,
+    "events": """
+        date TEXT NOT NULL, symbol TEXT NOT NULL, event_type TEXT, occurred_at TEXT,
+        metrics TEXT,
+        source_file TEXT NOT NULL
+    """,
+    "watchlist_picks": """
+        date TEXT NOT NULL, symbol TEXT NOT NULL, bucket TEXT, score REAL, reason TEXT,
+        source_file TEXT NOT NULL
+    """,
+    "analysis_days": """
+        date TEXT NOT NULL, symbol TEXT NOT NULL DEFAULT '',
+        total_records INTEGER, trigger_rate REAL, box_rate REAL, character TEXT,
+        triggered_cycles INTEGER,
+        source_file TEXT NOT NULL
+    """,
+    "scout_cycles": """
+        date TEXT NOT NULL, symbol TEXT NOT NULL, cycle_id TEXT,
+        start_time TEXT, end_time TEXT, duration_sec INTEGER, exit_type TEXT,
+        timeout_subtype TEXT, info_score REAL, max_return_pct REAL, slot_type TEXT,
+        source_file TEXT NOT NULL
+    """,
+}
+
+# 소스 → 적재 테이블
+SOURCE_TABLES = {
+    "scan": ["scan_results"],
+    "trades": ["trades"],
+    "scout": ["scout_records", "scout_daily"],
+    "events": ["events"],
+    "watchlist": ["watchlist_picks"],
+    "analysis": ["analysis_days", "scout_cycles"],
+}
+
+
+def _normalize_date(value: str) -> str:
+    """YYYYMMDD / YYYY-MM-DD → YYYY-MM-DD"""
+    value = (value or "").strip()
+    if len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    return value[:10]
+
+
+def _to_int(value) -> Optional[int]:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ======================================================
+# 🗄️ 웨어하우스
+# ======================================================
+class ResearchWarehouse:
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path or DEFAULT_DB_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _create_schema(self):
+        with self.conn:
+            for table, columns in SCHEMA.items():
+                self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_date_symbol ON {table} (date, symbol)"
+                )
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_source ON {table} (source_file)"
+                )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scout_cycles_exit ON scout_cycles (exit_type, date, symbol)"
+            )
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS ingested_files (
+                    source TEXT NOT NULL, path TEXT NOT NULL,
+                    size INTEGER, mtime_ns INTEGER, date TEXT, rows INTEGER,
+                    PRIMARY KEY (source, path)
+                )
+            """)
+
+    # --------------------------------------------------
+    # 📥 공통 적재 (파일 단위 멱등)
+    # --------------------------------------------------
+    def _is_ingested(self, source: str, path: Path) -> bool:
+        stat = path.stat()
+        row = self.conn.execute(
+            "SELECT size, mtime_ns FROM ingested_files WHERE source = ? AND path = ?",
+            (source, str(path)),
+        ).fetchone()
+        return row is not None and row["size"] == stat.st_size and row["mtime_ns"] == stat.st_mtime_ns
+
+    def _replace_file(self, source: str, path: Path, date: str, rows_by_table: Dict[str, List[tuple]]) -> int:
+        """파일 1개 조각을 지우고 다시 적재 (트랜잭션 1개)"""
+        stat = path.stat()
+        key = str(path)
+        total = 0
+        with self.conn:
+            for table in SOURCE_TABLES[source]:
+                self.conn.execute(f"DELETE FROM {table} WHERE source_file = ?", (key,))
+            for table, rows in rows_by_table.items():
+                if not rows:
+                    continue
+                placeholders = ", ".join("?" * len(rows[0]))
+                self.conn.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+                total += len(rows)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?, ?, ?, ?)",
+                (source, key, stat.st_size, stat.st_mtime_ns, date, total),
+            )
+        return total
+
+    def _drop_file(self, source: str, key: str) -> None:
+        """사라진 파일의 조각과 지문 삭제"""
+        with self.conn:
+            for table in SOURCE_TABLES[source]:
+                self.conn.execute(f"DELETE FROM {table} WHERE source_file = ?", (key,))
+            self.conn.execute("DELETE FROM ingested_files WHERE source = ? AND path = ?", (source, key))
+
+    def _ingest_files(self, source: str, paths: Sequence[Path], parser, force: bool = False) -> Dict[str, int]:
+        stats = {"files": 0, "skipped": 0, "rows": 0, "removed": 0}
+
+        # 이번 소스 목록에 없는 파일 (삭제되었거나 컨테이너로 보관됨)
+        current = {str(path) for path in paths}
+        stale = [
+            row["path"]
+            for row in self.conn.execute("SELECT path FROM ingested_files WHERE source = ?", (source,)).fetchall()
+            if row["path"] not in current
+        ]
+        for key in stale:
+            self._drop_file(source, key)
+        stats["removed"] = len(stale)
+
+        for path in paths:
+            if not force and self._is_ingested(source, path):
+                stats["skipped"] += 1
+                continue
+            try:
+                date, rows_by_table = parser(path)
+            except Exception as e:
+                print(f"⚠️  적재 실패 ({source}: {path}): {e}")
+                continue
+            stats["rows"] += self._replace_file(source, path, date, rows_by_table)
+            stats["files"] += 1
+        return stats
+
+    # --------------------------------------------------
+    # 📄 소스별 파서
+    # --------------------------------------------------
+    @staticmethod
+    def _parse_scan(path: Path):
+        date = _normalize_date(path.stem.replace("scan_result_", ""))
+        key = str(path)
+        rows = []
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                symbol = (row.get("code") or row.get("symbol") or "").strip()
+                if symbol:
+                    rows.append((
+                        date, symbol.zfill(6), _to_float(row.get("score_total")),
+                        row.get("watch_tier"), row.get("source_tags"), key,
+                    ))
+        return date, {"scan_results": rows}
+
+    @staticmethod
+    def _parse_trades(path: Path):
+        date = _normalize_date(path.stem.replace("trade_log_", ""))
+        key = str(path)
+        rows = []
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                symbol = (row.get("stk_cd") or "").strip()
+                if not symbol:
+                    continue
+                rows.append((
+                    _normalize_date(row.get("datetime", "")) or date, symbol.zfill(6), row.get("datetime"),
+                    _to_int(row.get("qty")), _to_float(row.get("buy_price")), _to_float(row.get("sell_price")),
+                    _to_float(row.get("pnl")), _to_float(row.get("pnl_pct")), row.get("reason"), key,
+                ))
+        return date, {"trades": rows}
+
+    @staticmethod
+    def _scout_rows(records: Iterable[Dict[str, Any]], key: str, default_symbol: str) -> Tuple[str, List[tuple], Optional[tuple]]:
+        """종목 1개 레코드 → (날짜, scout_records 행, scout_daily 행)"""
+        rows = []
+        daily = None
+        for rec in records:
+            meta = rec.get("meta", {})
+            snapshot = rec.get("snapshot", {})
+            date = meta.get("date") or _normalize_date(meta.get("timestamp", ""))
+            symbol = meta.get("stock_code", default_symbol)
+            price = _to_int(snapshot.get("current_price"))
+            triggered = bool(rec.get("observer", {}).get("triggered", False))
+            exit_type = rec.get("outcome", {}).get("exit_type")
+            if isinstance(exit_type, list):
+                exit_type = ",".join(str(e) for e in exit_type)
+            rows.append((
+                date, symbol, meta.get("timestamp"), meta.get("session"),
+                price, _to_int(snapshot.get("volume")), _to_int(snapshot.get("turnover_krw")),
+                int(triggered), int(bool(rec.get("box", {}).get("formed", False))),
+                int(bool(rec.get("base_candle", {}).get("exists", False))),
+                exit_type, json.dumps(rec.get("no_event_reason", []), ensure_ascii=False), key,
+            ))
+
+            if daily is None:
+                daily = {"date": date, "symbol": symbol, "records": 0, "triggered": 0,
+                         "first": None, "last": None, "high": None, "low": None}
+            daily["records"] += 1
+            daily["triggered"] += int(triggered)
+            if price:
+                daily["first"] = daily["first"] or price
+                daily["last"] = price
+                daily["high"] = max(daily["high"] or price, price)
+                daily["low"] = min(daily["low"] or price, price)
+
+        if daily is None:
+            return "", rows, None
+        daily_row = (
+            daily["date"], daily["symbol"], daily["records"], daily["triggered"],
+            daily["first"], daily["last"], daily["high"], daily["low"], key,
+        )
+        return daily["date"], rows, daily_row
+
+    @staticmethod
+    def _parse_scout(path: Path):
+        def records():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+        date, rows, daily_row = ResearchWarehouse._scout_rows(records(), str(path), path.stem)
+        return date, {"scout_records": rows, "scout_daily": [daily_row] if daily_row else []}
+
+    @staticmethod
+    def _parse_scout_archive(path: Path):
+        """보관된 날짜 컨테이너 → 종목별 scout_records / scout_daily (조각 키 = 컨테이너 경로)"""
+        records = scout_archive.load_archived_records(str(path.parent))
+        if records is None:
+            raise ValueError("컨테이너를 읽을 수 없거나 JSONL 이 다시 생김")
+
+        by_stock: Dict[str, List[Dict[str, Any]]] = {}
+        for rec in records:
+            by_stock.setdefault(str(rec.get("meta", {}).get("stock_code", "")), []).append(rec)
+
+        date = _normalize_date(path.parent.name)
+        key = str(path)
+        all_rows, daily_rows = [], []
+        for stock, stock_records in by_stock.items():
+            _, rows, daily_row = ResearchWarehouse._scout_rows(stock_records, key, stock)
+            all_rows.extend(rows)
+            if daily_row:
+                daily_rows.append(daily_row)
+        return date, {"scout_records": all_rows, "scout_daily": daily_rows}
+
+    @staticmethod
+    def _parse_events(path: Path):
+        date = _normalize_date(path.stem.replace("events_", ""))
+        key = str(path)
+        rows = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                rows.append((
+                    _normalize_date(event.get("occurred_at", "")) or date, event.get("symbol", ""),
+                    event.get("event_type"), event.get("occurred_at"),
+                    json.dumps(event.get("metrics", {}), ensure_ascii=False), key,
+                ))
+        return date, {"events": rows}
+
+    @staticmethod
+    def _parse_events_archive(path: Path):
+        """보관된 날짜 컨테이너의 이벤트 (조각 키 = 컨테이너 경로)"""
+        date = _normalize_date(path.parent.name)
+        events = scout_archive.load_archived_events(date)
+        if events is None:
+            raise ValueError("컨테이너에 이벤트가 없음")
+        key = str(path)
+        rows = [
+            (
+                _normalize_date(event.get("occurred_at", "")) or date, event.get("symbol", ""),
+                event.get("event_type"), event.get("occurred_at"),
+                json.dumps(event.get("metrics", {}), ensure_ascii=False), key,
+            )
+            for event in events
+        ]
+        return date, {"events": rows}
+
+    @staticmethod
+    def _parse_watchlist(path: Path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        raw_date = data.get("date") or data.get("meta", {}).get("date") or path.stem.replace("watchlist_", "")
+        date = _normalize_date(str(raw_date))
+        key = str(path)
+        rows = []
+        for bucket in WATCHLIST_BUCKETS:
+            items = data.get(bucket, [])
+            if not isinstance(items, list):
+                continue
+            for item in items:
+                if isinstance(item, dict):
+                    symbol = item.get("symbol") or item.get("code") or ""
+                    reason = item.get("reason", item.get("selection_reason"))
+                    rows.append((
+                        date, str(symbol), bucket, _to_float(item.get("score")),
+                        json.dumps(reason, ensure_ascii=False), key,
+                    ))
+                elif isinstance(item, str):
+                    rows.append((date, item, bucket, None, None, key))
+        return date, {"watchlist_picks": rows}
+
+    @staticmethod
+    def _parse_analysis(path: Path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        date = _normalize_date(data.get("date", ""))
+        key = str(path)
+        observer_stats = data.get("observer_stats", {})
+        summary = observer_stats.get("observer_summary", {})
+        market = data.get("market_character", {})
+        cycles = summary.get("cycle_summary", [])
+
+        enhanced = {
+            c.get("cycle_id"): c
+            for c in observer_stats.get("enhanced_cycle_analysis", {}).get("cycles", [])
+        }
+        cycle_rows = []
+        for cycle in cycles:
+            extra = enhanced.get(cycle.get("cycle_id"), {})
+            cycle_rows.append((
+                date, cycle.get("stock", ""), cycle.get("cycle_id"),
+                cycle.get("start_time"), cycle.get("end_time"), _to_int(cycle.get("duration_sec")),
+                cycle.get("exit_type"), extra.get("timeout_subtype"), _to_float(extra.get("info_score")),
+                _to_float(extra.get("max_return_pct")), extra.get("slot_type"), key,
+            ))
+        day_row = (
+            date, "", _to_int(observer_stats.get("total_records")),
+            _to_float(market.get("trigger_rate")), _to_float(market.get("box_rate")),
+            market.get("character"), len(cycles), key,
+        )
+        return date, {"analysis_days": [day_row], "scout_cycles": cycle_rows}
+
+    # --------------------------------------------------
+    # 📥 소스별 적재
+    # --------------------------------------------------
+    def ingest_scan(self, force: bool = False) -> Dict[str, int]:
+        paths = sorted(p for d in SCAN_DIRS for p in d.glob("scan_result_*.csv"))
+        return self._ingest_files("scan", paths, self._parse_scan, force)
+
+    def ingest_trades(self, force: bool = False) -> Dict[str, int]:
+        paths = sorted(p for d in TRADE_LOG_DIRS for p in d.glob("trade_log_*.csv"))
+        return self._ingest_files("trades", paths, self._parse_trades, force)
+
+    @staticmethod
+    def _scout_glob(name: str) -> List[Path]:
+        # YYYY/MM/YYYYMMDD 구조 + 과거 YYYY-MM-DD 구조
+        return sorted(
+            Path(p) for p in
+            glob(str(SCOUT_RECORDS_DIR / "*" / "*" / "*" / name))
+            + glob(str(SCOUT_RECORDS_DIR / "*-*-*" / name))
+        )
+
+    def _archive_paths(self) -> List[Path]:
+        """JSONL 이 남아 있지 않은(보관된) 날짜의 컨테이너"""
+        if not HAS_SCOUT_ARCHIVE:
+            return []
+        return [
+            path for path in self._scout_glob(scout_archive.ARCHIVE_FILENAME)
+            if not scout_archive.has_live_jsonl(str(path.parent))
+        ]
+
+    def ingest_scout(self, force: bool = False) -> Dict[str, int]:
+        # 보관된 날짜는 컨테이너 1개 = 조각 1개 (보관 전 JSONL 조각은 사라진 파일로 정리됨)
+        archive_paths = self._archive_paths()
+        archived = set(archive_paths)
+
+        def parse(path: Path):
+            return self._parse_scout_archive(path) if path in archived else self._parse_scout(path)
+
+        return self._ingest_files("scout", self._scout_glob("*.jsonl") + archive_paths, parse, force)
+
+    def ingest_events(self, force: bool = False) -> Dict[str, int]:
+        paths = sorted(EVENTS_DIR.glob("events_*.jsonl"))
+
+        # 이벤트 로그가 컨테이너로 보관된 날짜 (원본 로그가 남아 있으면 원본 사용)
+        live_dates = {_normalize_date(p.stem.replace("events_", "")) for p in paths}
+        archived = set()
+        for path in self._archive_paths():
+            if _normalize_date(path.parent.name) in live_dates:
+                continue
+            archive = scout_archive.open_day_archive(str(path.parent))
+            if archive is not None and archive.has_events():
+                archived.add(path)
+
+        def parse(path: Path):
+            return self._parse_events_archive(path) if path in archived else self._parse_events(path)
+
+        return self._ingest_files("events", paths + sorted(archived), parse, force)
+
+    def ingest_watchlists(self, force: bool = False) -> Dict[str, int]:
+        # 같은 파일이 여러 출력 디렉터리에 있으면 WATCHLIST_DIRS 앞쪽 것만
+        by_name: Dict[str, Path] = {}
+        for d in WATCHLIST_DIRS:
+            for path in sorted(d.glob("watchlist_[0-9]*.json")):
+                by_name.setdefault(path.name, path)
+        paths = sorted(by_name.values())
+        return self._ingest_files("watchlist", paths, self._parse_watchlist, force)
+
+    def ingest_analysis(self, force: bool = False) -> Dict[str, int]:
+        # YYYY/MM/YYYYMMDD 구조 + 과거 YYYY-MM-DD 구조
+        paths = sorted(
+            list(ANALYSIS_DIR.glob("*/*/*/daily_analysis.json"))
+            + list(ANALYSIS_DIR.glob("*-*-*/daily_analysis.json"))
+        )
+        return self._ingest_files("analysis", paths, self._parse_analysis, force)
+
+    def ingest_all(self, sources: Optional[Sequence[str]] = None, force: bool = False) -> Dict[str, Dict[str, int]]:
+        """모든(또는 지정) 소스 증분 적재"""
+        ingesters = {
+            "scan": self.ingest_scan,
+            "trades": self.ingest_trades,
+            "scout": self.ingest_scout,
+            "events": self.ingest_events,
+            "watchlist": self.ingest_watchlists,
+            "analysis": self.ingest_analysis,
+        }
+        results = {}
+        for name in sources or list(ingesters):
+            results[name] = ingesters[name](force=force)
+        self.conn.execute("ANALYZE")
+        return results
+
+    # --------------------------------------------------
+    # 🔎 조회 API
+    # --------------------------------------------------
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def query_df(self, sql: str, params: Sequence[Any] = ()):
+        """pandas DataFrame 으로 조회 (pandas 필요)"""
+        import pandas as pd
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def symbol_history(self, symbol: str, start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """종목의 일별 정찰 요약 + 선정/cycle/매매 여부"""
+        return self.query(
+            """
+            SELECT d.date, d.symbol, d.records, d.triggered_records, d.first_price, d.last_price,
+                   (SELECT GROUP_CONCAT(DISTINCT bucket) FROM watchlist_picks w WHERE w.date = d.date AND w.symbol = d.symbol) AS buckets,
+                   (SELECT COUNT(*) FROM scout_cycles c WHERE c.date = d.date AND c.symbol = d.symbol) AS cycles,
+                   (SELECT SUM(pnl) FROM trades t WHERE t.date = d.date AND t.symbol = d.symbol) AS pnl
+            FROM scout_daily d
+            WHERE d.symbol = ? AND d.date >= ? AND d.date <= ?
+            ORDER BY d.date
+            """,
+            (symbol, start or "0000-00-00", end or "9999-99-99"),
+        )
+
+    def picks_next_day_return(
+        self,
+        exit_type: str = "reached_1pct",
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        문지기 선정 종목 중 당일 cycle 이 exit_type 으로 끝난 종목의 다음 거래일 수익률
+
+        - 종가: scout_daily.last_price (장중 마지막 관찰가)
+        - 다음 거래일: 해당 종목의 다음 정찰 날짜
+        - 같은 선정이 여러 watchlist 파일에 있어도 (date, symbol, bucket) 당 1행
+        """
+        return self.query(
+            """
+            WITH closes AS (
+                SELECT date, symbol, last_price,
+                       LEAD(date) OVER (PARTITION BY symbol ORDER BY date) AS next_date,
+                       LEAD(last_price) OVER (PARTITION BY symbol ORDER BY date) AS next_close
+                FROM scout_daily
+            ),
+            hits AS (
+                SELECT date, symbol, COUNT(*) AS hit_cycles
+                FROM scout_cycles
+                WHERE exit_type = ? AND date >= ? AND date <= ?
+                GROUP BY date, symbol
+            ),
+            picks AS (
+                SELECT date, symbol, bucket, MAX(score) AS score
+                FROM watchlist_picks
+                GROUP BY date, symbol, bucket
+            )
+            SELECT w.date, w.symbol, w.bucket, w.score, h.hit_cycles,
+                   cl.last_price AS close, cl.next_date, cl.next_close,
+                   CASE WHEN cl.last_price > 0 AND cl.next_close IS NOT NULL
+                        THEN ROUND((cl.next_close - cl.last_price) * 100.0 / cl.last_price, 2)
+                   END AS next_day_return_pct
+            FROM picks w
+            JOIN hits h ON h.date = w.date AND h.symbol = w.symbol
+            LEFT JOIN closes cl ON cl.date = w.date AND cl.symbol = w.symbol
+            ORDER BY w.date, w.symbol
+            """,
+            (exit_type, start or "0000-00-00", end or "9999-99-99"),
+        )
+
+
+# ======================================================
+# 🧪 CLI
+# ======================================================
+def _print_rows(rows: List[Dict[str, Any]], limit: int = 50):
+    if not rows:
+        print("(결과 없음)")
+        return
+    columns = list(rows[0].keys())
+    print(" | ".join(columns))
+    for row in rows[:limit]:
+        print(" | ".join("" if row[c] is None else str(row[c]) for c in columns))
+    if len(rows) > limit:
+        print(f"... 외 {len(rows) - limit}행")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="연구용 로컬 데이터 웨어하우스")
+    parser.add_argument("--db", default=None, help=f"DB 경로 (기본: {DEFAULT_DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_ingest = sub.add_parser("ingest", help="증분 적재")
+    p_ingest.add_argument("--source", action="append", choices=list(SOURCE_TABLES), help="적재할 소스 (반복 가능)")
+    p_ingest.add_argument("--force", action="store_true", help="지문 무시하고 다시 적재")
+
+    p_query = sub.add_parser("query", help="SQL 조회")
+    p_query.add_argument("sql")
+    p_query.add_argument("--limit", type=int, default=50)
+
+    p_picks = sub.add_parser("picks", help="선정 종목 다음 거래일 수익률")
+    p_picks.add_argument("--exit-type", dest="exit_type", default="reached_1pct")
+    p_picks.add_argument("--start", default=None)
+    p_picks.add_argument("--end", default=None)
+
+    args = parser.parse_args()
+
+    with ResearchWarehouse(args.db) as wh:
+        if args.command == "ingest":
+            results = wh.ingest_all(args.source, force=args.force)
+            for source, stats in results.items():
+                print(f"[INGEST] {source}: files={stats['files']} skipped={stats['skipped']} "
+                      f"removed={stats['removed']} rows={stats['rows']}")
+        elif args.command == "query":
+            _print_rows(wh.query(args.sql), args.limit)
+        elif args.command == "picks":
+            _print_rows(wh.picks_next_day_return(args.exit_type, args.start, args.end))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+# ===============================
+# scout_selector/backtest.py
+# 문지기봇 과거 선정 백테스트 (다음 거래일 성과)
+# ===============================
+"""
+문지기봇 과거 선정 백테스트
+
+역할:
+- 히스토리 저장소 전체 패널로 피처 1회 계산 (rolling/shift 는 과거 방향만 → 날짜 d 행은 d 이전 데이터만 사용)
+- 기간 내 거래일마다 날짜 d 피처 슬라이스로 select_watchlist 실행 (날짜별 재계산 없음)
+- 선정 종목 × 다음 거래일 성과 결합 → 버킷별(largecap/volume/structure/theme) 적중률 통계
+
+Look-ahead 방지:
+- 선정에 쓰는 피처 슬라이스에는 다음 날 값이 없음 (성과는 별도 테이블, 선정 후 부모 프로세스에서 결합)
+- phase 는 날짜 d 까지의 종목별 누적 거래일 수로 판단 (prepare_tomorrow 와 같은 기준)
+- 테마 점수는 prepare_tomorrow 처럼 다음 거래일 날짜 입력 파일 사용 (input/, history/input/)
+
+다음 거래일 성과 (저장소의 d 다음 거래일에 행이 있는 종목만):
+- open_to_high:   다음날 고가 ÷ 다음날 시가 - 1
+- close_to_close: 다음날 종가 ÷ 당일 종가 - 1
+- range:          (다음날 고가 - 저가) ÷ 다음날 시가
+
+병렬 처리:
+- 피처 슬라이스는 부모에서 1회 pickle → 워커는 initializer 에서 1회 로드 (날짜별 전달 없음)
+
+사용법:
+    python backtest.py --start 20250101 --end 20251231
+    python backtest.py --start 20250101 --end 20251231 --workers 4 --hit-pct 0.03
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+try:
+    from scout_selector.selector import SelectorConfig, compute_features, select_watchlist
+    from scout_selector.ohlcv_store import OHLCVStore, _normalize_date
+except ImportError:
+    from selector import SelectorConfig, compute_features, select_watchlist
+    from ohlcv_store import OHLCVStore, _normalize_date
+
+# =========================
+# Constants
+# =========================
+
+BUCKETS = ["largecap", "volume", "structure", "theme"]
+OUTCOME_COLUMNS = ["open_to_high", "close_to_close", "range"]
+
+DEFAULT_LARGECAPS = ["005930", "000660"]
+PHASE_LOOKBACK = 20
+
+# 적중 기준 (다음 거래일)
+DEFAULT_HIT_PCT = 0.02      # open_to_high >= 2%
+DEFAULT_RANGE_PCT = 0.03    # range >= 3%
+
+OUTPUT_DIR = BASE_DIR / "output" / "backtest"
+THEME_INPUT_DIRS = [BASE_DIR / "input", BASE_DIR / "history" / "input"]
+
+
+# =========================
+# 준비 (부모 프로세스)
+# =========================
+
+def build_outcomes(df: pd.DataFrame, trading_dates: List[str]) -> pd.DataFrame:
+    """
+    (date, symbol) → 다음 거래일 성과
+
+    종목의 다음 행이 저장소의 다음 거래일이 아니면 (거래정지 등) 결측
+    """
+    df = df.sort_values(["symbol", "date"]).reset_index(drop=True)
+    dates = df["date"].dt.strftime("%Y-%m-%d")
+    same = df["symbol"].eq(df["symbol"].shift(-1))
+
+    next_trading = dict(zip(trading_dates[:-1], trading_dates[1:]))
+    expected = dates.map(next_trading)
+    valid = same & dates.shift(-1).eq(expected)
+
+    def _next(col: str) -> pd.Series:
+        return df[col].shift(-1).where(valid).astype(float)
+
+    next_open, next_high, next_low, next_close = (_next(c) for c in ["open", "high", "low", "close"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = pd.DataFrame({
+            "date": dates,
+            "symbol": df["symbol"],
+            "open_to_high": next_high / next_open.replace(0, np.nan) - 1,
+            "close_to_close": next_close / df["close"].astype(float).replace(0, np.nan) - 1,
+            "range": (next_high - next_low) / next_open.replace(0, np.nan),
+        })
+    return out
+
+
+def _theme_map_for(date: str) -> Dict:
+    """prepare_tomorrow 와 같은 입력 (선정 대상일 = 다음 거래일) - 파일이 있을 때만"""
+    from theme_score_builder import build_theme_score_map
+
+    for input_dir in THEME_INPUT_DIRS:
+        if (input_dir / "conditions" / f"conditions_{date}.json").exists() or (
+            input_dir / "news" / f"news_{date}.json"
+        ).exists():
+            return build_theme_score_map(input_dir, date=date, archive_history=False)
+    return {}
+
+
+def prepare_backtest(
+    start: str,
+    end: str,
+    store: Optional[OHLCVStore] = None,
+    use_theme: bool = True,
+) -> Dict[str, Any]:
+    """
+    피처 패널 1회 계산 + 날짜별 슬라이스 위치 / phase / 테마 입력 / 성과 테이블
+
+    Returns:
+        {"dates", "features", "bounds", "phases", "themes", "outcomes"}
+    """
+    store = store or OHLCVStore()
+    start, end = _normalize_date(start), _normalize_date(end)
+    trading_dates = store.trading_dates()
+
+    # 다음 거래일이 있는 날짜만 (성과 측정 가능)
+    dates = [d for d in trading_dates[:-1] if start <= d <= end]
+    if not dates:
+        return {"dates": []}
+    last_needed = trading_dates[trading_dates.index(dates[-1]) + 1]
+    history = trading_dates[: trading_dates.index(last_needed) + 1]
+
+    df = store.load_window(end_date=last_needed, days=len(history))
+    outcomes = build_outcomes(df, trading_dates)
+
+    # 피처: 과거 방향 rolling 만 사용 → 전체 패널 1회 계산 후 날짜별 슬라이스
+    feat = compute_features(df[df["date"] <= pd.Timestamp(dates[-1])], SelectorConfig())
+    feat["_rows"] = feat.groupby("symbol").cumcount() + 1
+    feat["_date"] = feat["date"].dt.strftime("%Y-%m-%d")
+    feat = feat[feat["_date"].isin(dates)].sort_values(["_date", "symbol"], kind="stable").reset_index(drop=True)
+
+    day_values = feat["_date"].to_numpy()
+    cuts = np.flatnonzero(day_values[1:] != day_values[:-1]) + 1
+    starts = np.concatenate(([0], cuts))
+    ends = np.concatenate((cuts, [len(day_values)]))
+    bounds = {day_values[s]: (int(s), int(e)) for s, e in zip(starts, ends)}
+
+    rows = feat["_rows"].to_numpy()
+    phases = {
+        d: ("normal" if rows[s:e].max() >= PHASE_LOOKBACK else "warmup")
+        for d, (s, e) in bounds.items()
+    }
+
+    themes = {}
+    if use_theme:
+        next_trading = dict(zip(trading_dates[:-1], trading_dates[1:]))
+        for d in dates:
+            theme_map = _theme_map_for(next_trading[d].replace("-", ""))
+            if theme_map:
+                themes[d] = theme_map
+
+    features = feat.drop(columns=["_rows", "_date"])
+    return {
+        "dates": [d for d in dates if d in bounds],
+        "features": features,
+        "bounds": bounds,
+        "phases": phases,
+        "themes": themes,
+        "outcomes": outcomes,
+    }
+
+
+# =========================
+# 워커
+# =========================
+_WORKER_FEATURES: Optional[pd.DataFrame] = None
+_WORKER_CONTEXT: Dict[str, Any] = {}
+
+
+def _init_worker(cache_path: str) -> None:
+    """워커당 1회: 피처 패널 + 날짜별 슬라이스 위치 로드"""
+    global _WORKER_FEATURES, _WORKER_CONTEXT
+    with open(cache_path, "rb") as f:
+        payload = pickle.load(f)
+    _WORKER_FEATURES = payload.pop("features")
+    _WORKER_CONTEXT = payload
+
+
+def run_backtest_date(date: str) -> List[Dict[str, Any]]:
+    """날짜 1개 선정 (날짜 d 피처 슬라이스만 사용)"""
+    ctx = _WORKER_CONTEXT
+    s, e = ctx["bounds"][date]
+    latest = _WORKER_FEATURES.iloc[s:e].set_index("symbol")
+
+    cfg = SelectorConfig(phase=ctx["phases"][date])
+    result = select_watchlist(
+        None,
+        cfg=cfg,
+        largecap_symbols=ctx["largecap_symbols"],
+        theme_score_map=ctx["themes"].get(date),
+        latest=latest,
+    )
+    return [
+        {"date": date, "bucket": bucket, "symbol": item["symbol"], "score": float(item.get("score", 0.0)), "phase": cfg.phase}
+        for bucket in BUCKETS
+        for item in result.get(bucket, [])
+    ]
+
+
+# =========================
+# 실행 / 집계
+# =========================
+
+def run_backtest(
+    prepared: Dict[str, Any],
+    largecap_symbols: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    날짜별 선정을 프로세스 풀에서 병렬 실행 후 다음 거래일 성과 결합
+
+    Args:
+        workers: 프로세스 수 (None 이면 CPU 수, 1 이면 현재 프로세스에서 실행)
+
+    Returns:
+        picks DataFrame (date, bucket, symbol, score, phase, open_to_high, close_to_close, range)
+    """
+    dates = prepared["dates"]
+    payload = {
+        "features": prepared["features"],
+        "bounds": prepared["bounds"],
+        "phases": prepared["phases"],
+        "themes": prepared["themes"],
+        "largecap_symbols": largecap_symbols or DEFAULT_LARGECAPS,
+    }
+
+    workers = min(workers or os.cpu_count() or 1, max(1, len(dates)))
+    fd, cache_path = tempfile.mkstemp(prefix="gatekeeper_backtest_", suffix=".pkl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if workers <= 1:
+            _init_worker(cache_path)
+            per_date = [run_backtest_date(d) for d in dates]
+        else:
+            chunksize = max(1, len(dates) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(cache_path,),
+            ) as executor:
+                per_date = list(executor.map(run_backtest_date, dates, chunksize=chunksize))
+    finally:
+        os.remove(cache_path)
+
+    picks = pd.DataFrame(
+        [row for rows in per_date for row in rows],
+        columns=["date", "bucket", "symbol", "score", "phase"],
+    )
+    return picks.merge(prepared["outcomes"], on=["date", "symbol"], how="left")
+
+
+def _bucket_stats(frame: pd.DataFrame, hit_pct: float, range_pct: float) -> Dict[str, Any]:
+    measured = frame.dropna(subset=OUTCOME_COLUMNS)
+    stats: Dict[str, Any] = {"picks": len(frame), "measured": len(measured)}
+    if measured.empty:
+        return stats
+    for col in OUTCOME_COLUMNS:
+        stats[f"{col}_mean"] = round(float(measured[col].mean()), 6)
+        stats[f"{col}_median"] = round(float(measured[col].median()), 6)
+    stats["hit_rate"] = round(float((measured["open_to_high"] >= hit_pct).mean()), 4)
+    stats["up_rate"] = round(float((measured["close_to_close"] > 0).mean()), 4)
+    stats["range_rate"] = round(float((measured["range"] >= range_pct).mean()), 4)
+    return stats
+
+
+def summarize_backtest(
+    picks: pd.DataFrame,
+    outcomes: Optional[pd.DataFrame] = None,
+    dates: Optional[List[str]] = None,
+    hit_pct: float = DEFAULT_HIT_PCT,
+    range_pct: float = DEFAULT_RANGE_PCT,
+) -> Dict[str, Any]:
+    """
+    버킷별 적중률 통계
+
+    - hit_rate:   open_to_high >= hit_pct 비율
+    - up_rate:    close_to_close > 0 비율
+    - range_rate: range >= range_pct 비율
+    - market:     같은 날짜 전체 종목 (비교 기준, outcomes 를 줄 때)
+    """
+    summary: Dict[str, Any] = {
+        "hit_pct": hit_pct,
+        "range_pct": range_pct,
+        "dates": int(picks["date"].nunique()) if not picks.empty else 0,
+        "buckets": {},
+    }
+    for bucket in BUCKETS:
+        summary["buckets"][bucket] = _bucket_stats(picks[picks["bucket"] == bucket], hit_pct, range_pct)
+    summary["buckets"]["all"] = _bucket_stats(picks, hit_pct, range_pct)
+    if outcomes is not None and dates:
+        summary["buckets"]["market"] = _bucket_stats(outcomes[outcomes["date"].isin(dates)], hit_pct, range_pct)
+    return summary
+
+
+def print_summary(summary: Dict[str, Any]) -> None:
+    print(f"\n📊 버킷별 다음 거래일 성과 ({summary['dates']}일, 적중: 시가→고가 >= {summary['hit_pct']:.1%})")
+    print(f"  {'bucket':<10}{'picks':>7}{'hit':>8}{'up':>8}{'range':>8}{'o→h':>9}{'c→c':>9}")
+    for bucket, s in summary["buckets"].items():
+        if not s.get("measured"):
+            print(f"  {bucket:<10}{s['picks']:>7}{'-':>8}{'-':>8}{'-':>8}{'-':>9}{'-':>9}")
+            continue
+        print(
+            f"  {bucket:<10}{s['picks']:>7}{s['hit_rate']:>8.1%}{s['up_rate']:>8.1%}{s['range_rate']:>8.1%}"
+            f"{s['open_to_high_mean']:>9.2%}{s['close_to_close_mean']:>9.2%}"
+        )
+
+
+# =========================
+# Main
+# =========================
+
+def main():
+    parser = argparse.ArgumentParser(description="문지기봇 과거 선정 백테스트")
+    parser.add_argument("--start", required=True, help="시작일 (YYYYMMDD)")
+    parser.add_argument("--end", default=None, help="종료일 (YYYYMMDD, 기본: 저장소 마지막 거래일 전날)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--hit-pct", dest="hit_pct", type=float, default=DEFAULT_HIT_PCT)
+    parser.add_argument("--range-pct", dest="range_pct", type=float, default=DEFAULT_RANGE_PCT)
+    parser.add_argument("--no-theme", dest="use_theme", action="store_false", help="테마 입력 파일 사용 안 함")
+    parser.add_argument("--output-dir", dest="output_dir", default=None, help=f"결과 저장 디렉터리 (기본: {OUTPUT_DIR})")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    prepared = prepare_backtest(args.start, args.end or "9999-12-31", use_theme=args.use_theme)
+    if not prepared["dates"]:
+        print("❌ 백테스트할 거래일이 없습니다. (ohlcv_store backfill 먼저 실행)")
+        return 1
+    prepare_sec = time.perf_counter() - started
+
+    picks = run_backtest(prepared, workers=args.workers)
+    summary = summarize_backtest(picks, prepared["outcomes"], prepared["dates"], args.hit_pct, args.range_pct)
+    total_sec = time.perf_counter() - started
+    print_summary(summary)
+
+    dates = prepared["dates"]
+    output_dir = Path(args.output_dir) if args.output_dir else OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"backtest_{dates[0].replace('-', '')}_{dates[-1].replace('-', '')}"
+    picks_path = output_dir / f"{stem}_picks.csv"
+    summary_path = output_dir / f"{stem}.json"
+    picks.to_csv(picks_path, index=False, encoding="utf-8")
+    summary["meta"] = {
+        "start": dates[0],
+        "end": dates[-1],
+        "created_at": datetime.now().isoformat(),
+        "prepare_sec": round(prepare_sec, 2),
+        "total_sec": round(total_sec, 2),
+    }
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print(f"\n⏱️  준비 {prepare_sec:.1f}s, 전체 {total_sec:.1f}s ({len(dates)} 거래일)")
+    print(f"📁 {summary_path}")
+    print(f"📁 {picks_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,7 +30,8 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 # Windows 콘솔 인코딩 설정
-if sys.platform == "win32":
+# (같은 프로세스에서 여러 번 import 되어도 한 번만 감싸기: 파이프라인 러너)
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower() != "utf-8":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
@@ -283,7 +284,7 @@ def build_candidate_pool(
 # Main
 # =========================
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description=f"{BOT_NAME} - 후보 풀 생성")
     parser.add_argument(
         "--date",
@@ -303,7 +304,7 @@ def main():
         default=None,
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # 날짜 결정
     if args.date:
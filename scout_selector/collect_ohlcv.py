@@ -28,8 +28,13 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Set, Optional
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
 # Windows 콘솔 인코딩 설정
-if sys.platform == "win32":
+# (같은 프로세스에서 여러 번 import 되어도 한 번만 감싸기: 파이프라인 러너)
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower() != "utf-8":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
@@ -73,13 +78,13 @@ def collect_ohlcv_pykrx(symbol: str, date: str) -> Optional[Dict]:
         OHLCV 데이터 딕셔너리 또는 None (실패 시)
     """
     try:
-        from pykrx import stock
+        from test.daily_scan.data.krx_source import get_source
         
         # 날짜 형식 변환 (YYYYMMDD -> YYYY-MM-DD)
         date_str = f"{date[:4]}-{date[4:6]}-{date[6:8]}"
         
-        # 일봉 데이터 수집
-        df = stock.get_market_ohlcv_by_date(date_str, date_str, symbol)
+        # 일봉 데이터 수집 (KRX 응답 캐시 경유)
+        df = get_source().get_market_ohlcv_by_date(date_str, date_str, symbol)
         
         if df is None or df.empty:
             return None
@@ -113,10 +118,53 @@ def collect_ohlcv_pykrx(symbol: str, date: str) -> Optional[Dict]:
         return None
 
 
+def collect_market_snapshot(symbols: List[str], date: str) -> Dict[str, Dict]:
+    """
+    시장 전체 스냅샷(날짜 1개, 시장별 1회 요청)에서 종목 OHLCV 추출
+    
+    Args:
+        symbols: 종목 코드 리스트
+        date: 날짜 (YYYYMMDD)
+        
+    Returns:
+        {종목 코드: OHLCV 딕셔너리} (스냅샷에 있는 종목만, 실패 시 빈 dict)
+    """
+    try:
+        from test.daily_scan.data.market_ohlcv import get_market_ohlcv
+        snapshot = get_market_ohlcv(date)
+    except ImportError:
+        return {}
+    except Exception as e:
+        print(f"  ⚠️  시장 스냅샷 수집 실패 (종목별 수집으로 진행): {e}")
+        return {}
+    
+    results = {}
+    for symbol in symbols:
+        if symbol not in snapshot.index:
+            continue
+        row = snapshot.loc[symbol]
+        close = int(row['종가'])
+        volume = int(row['거래량'])
+        results[symbol] = {
+            "date": date,
+            "symbol": symbol,
+            "open": int(row['시가']),
+            "high": int(row['고가']),
+            "low": int(row['저가']),
+            "close": close,
+            "volume": volume,
+            "turnover_krw": close * volume,
+        }
+    return results
+
+
 def collect_ohlcv_batch(symbols: List[str], date: str) -> List[Dict]:
     """
     여러 종목의 OHLCV 일괄 수집
     
+    시장 스냅샷(시장별 1회 요청)으로 먼저 채우고,
+    스냅샷에 없는 종목(ETF 등)만 종목별로 수집
+    
     Args:
         symbols: 종목 코드 리스트
         date: 날짜 (YYYYMMDD)
@@ -129,7 +177,15 @@ def collect_ohlcv_batch(symbols: List[str], date: str) -> List[Dict]:
     
     print(f"\n📊 OHLCV 수집 시작 ({total}종목)")
     
+    snapshot = collect_market_snapshot(symbols, date)
+    if snapshot:
+        print(f"  ✅ 시장 스냅샷: {len(snapshot)}/{total} 종목")
+    
     for idx, symbol in enumerate(symbols, 1):
+        if symbol in snapshot:
+            results.append(snapshot[symbol])
+            continue
+        
         print(f"  [{idx}/{total}] {symbol}...", end=" ", flush=True)
         
         data = collect_ohlcv_pykrx(symbol, date)
@@ -318,11 +374,30 @@ def save_ohlcv_csv(data: List[Dict], output_file: Path, date: str):
     print(f"   총 {len(data)}개 종목 데이터")
 
 
+def save_to_history_store(data: List[Dict]):
+    """
+    OHLCV 히스토리 저장소(월 파티션)에 추가
+    
+    문지기봇이 20/60일 lookback 패널을 바로 읽을 수 있도록 누적
+    """
+    if not data:
+        return
+    try:
+        try:
+            from scout_selector.ohlcv_store import upsert_daily
+        except ImportError:
+            from ohlcv_store import upsert_daily
+        changed = upsert_daily(data)
+        print(f"📚 히스토리 저장소 갱신: {', '.join(f'{k}({v:,}행)' for k, v in changed.items())}")
+    except Exception as e:
+        print(f"  ⚠️  히스토리 저장소 갱신 실패 (무시): {e}")
+
+
 # =========================
 # Main
 # =========================
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description=f"{COLLECTOR_NAME} - OHLCV 수집")
     parser.add_argument(
         "--date",
@@ -342,7 +417,7 @@ def main():
         default=None,
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # 날짜 결정
     if args.date:
@@ -391,6 +466,9 @@ def main():
         # CSV 저장
         save_ohlcv_csv(ohlcv_data, output_file, date)
         
+        # 히스토리 저장소 누적 (실패해도 CSV 는 유지)
+        save_to_history_store(ohlcv_data)
+        
         print(f"\n✅ {COLLECTOR_NAME} 완료")
         print(f"   문지기봇이 {output_file.name} 파일을 입력으로 사용합니다.")
         print("=" * 60)
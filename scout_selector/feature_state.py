@@ -0,0 +1,543 @@
+# ===============================
+# scout_selector/feature_state.py
+# 문지기봇 증분 피처 상태 (종목별 rolling 상태 저장)
+# ===============================
+"""
+문지기봇 증분 피처 상태
+
+역할:
+- compute_features 의 종목별 rolling 피처를 저장된 상태로 이어서 계산
+- 신규 거래일 1일 반영 = 종목당 O(1) (전체 히스토리 재계산 없음)
+- 전체 재계산(compute_features)은 검증 모드로 유지 (verify)
+
+상태 (종목별):
+- 이동평균 창 합계/개수 (종가 5/20/60, 거래량 20, above_ma5 5)
+- 창 계산에 필요한 최근 N개 값 (종가 60, 고가 20, 거래량 20, above_ma5 5)
+- 기울기용 직전 ma5/ma20, higher_low 용 직전 저가
+- 마지막 행 OHLCV + 마지막 피처 (latest() 로 select_watchlist 에 바로 전달)
+
+저장 구조:
+    scout_selector/data/feature_state/feature_state.npz
+
+상태 재생성 (rebuild) 조건:
+- 상태 파일 없음 / 파라미터(lookback, struct_trend_days) 변경
+- 상태 기준일 이전 거래일 수 변경 (백필)
+- 기준일 행 재수집 (기준일 행 fingerprint 불일치)
+
+사용법:
+    python feature_state.py update      # 신규 거래일만 반영
+    python feature_state.py rebuild     # 히스토리 저장소 전체로 재생성
+    python feature_state.py verify      # 전체 재계산과 비교
+    python feature_state.py info
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+try:
+    from scout_selector.selector import SelectorConfig, compute_features
+    from scout_selector.ohlcv_store import COLUMNS, OHLCVStore, _normalize_date
+except ImportError:
+    from selector import SelectorConfig, compute_features
+    from ohlcv_store import COLUMNS, OHLCVStore, _normalize_date
+
+# =========================
+# Constants
+# =========================
+
+STATE_VERSION = 1
+
+MA_WINDOWS = (5, 20, 60)
+HIGH_WINDOW = 20
+CLEAN_WINDOW = 5
+OVERHEAT_DAYS = 5
+
+DEFAULT_LOOKBACK = 20
+
+# compute_features 와 같은 컬럼 순서 (date, symbol 다음)
+PRICE_COLUMNS = ["open", "high", "low", "close", "volume", "turnover_krw"]
+FEATURE_COLUMNS = [
+    "vol_avg", "intraday_volatility", "hlc_volatility", "vol_spike_ratio", "trend",
+    "ma5", "ma20", "ma60", "ma5_slope", "ma20_slope", "ma_spread", "above_ma5", "clean",
+    "higher_low", "new_high", "big_red_candle", "short_term_overheat",
+]
+INT_FEATURES = ["above_ma5", "higher_low", "new_high", "big_red_candle", "short_term_overheat"]
+
+# 상태에 저장하는 피처 (나머지는 당일 행만으로 계산 → latest() 에서 compute_features 와 같은 식 사용)
+STORED_FEATURES = [
+    "vol_avg", "trend", "ma5", "ma20", "ma60", "ma5_slope", "ma20_slope", "clean",
+] + INT_FEATURES
+
+STATE_DIR = BASE_DIR / "data" / "feature_state"
+STATE_FILE = STATE_DIR / "feature_state.npz"
+
+
+# =========================
+# Helpers
+# =========================
+
+def _nan0(values: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(values), 0.0, values)
+
+
+def _valid(values: np.ndarray) -> np.ndarray:
+    return (~np.isnan(values)).astype(np.int64)
+
+
+def _pct(cur: np.ndarray, prev: np.ndarray) -> np.ndarray:
+    """pct_change 와 같은 값 (결측 미보정, 0 으로 나누면 inf)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cur / prev - 1.0
+
+
+def _push(buf: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """최근 값 버퍼 (오래된 값 → 최신 값) 에 1개 추가"""
+    out = np.empty_like(buf)
+    out[:, :-1] = buf[:, 1:]
+    out[:, -1] = values
+    return out
+
+
+def day_fingerprint(day: pd.DataFrame) -> str:
+    """거래일 1일 행 fingerprint (재수집 감지)"""
+    if day.empty:
+        return ""
+    day = day[COLUMNS].sort_values("symbol").reset_index(drop=True)
+    day = day.assign(date=day["date"].astype(str).str[:10])
+    hashed = pd.util.hash_pandas_object(day, index=False).to_numpy()
+    return hashlib.sha1(hashed.tobytes()).hexdigest()
+
+
+# =========================
+# State
+# =========================
+
+class FeatureState:
+    """종목별 rolling 피처 상태 (배열 단위 일괄 갱신)"""
+
+    def __init__(self, lookback: int = DEFAULT_LOOKBACK, trend_days: int = 5):
+        self.lookback = lookback
+        self.trend_days = trend_days
+        # 종가 버퍼: 최장 이동평균 + pct_change(N/5) 에 필요한 직전 값
+        self.close_len = max(max(MA_WINDOWS), trend_days + 1, OVERHEAT_DAYS + 1)
+
+        self.as_of = ""          # 마지막 반영 거래일 (YYYY-MM-DD)
+        self.days = 0            # 반영한 거래일 수
+        self.fingerprint = ""    # as_of 행 fingerprint
+
+        self.symbols = np.array([], dtype="U6")
+        self._pos: Dict[str, int] = {}
+        self.arrays: Dict[str, np.ndarray] = {}
+        self._resize(0)
+
+    # ---------------------------
+    # Arrays
+    # ---------------------------
+    def _shapes(self) -> Dict[str, tuple]:
+        shapes = {
+            "last_date": ((), "U10", ""),
+            "rows": ((), np.int64, 0),
+            "close_buf": ((self.close_len,), np.float64, np.nan),
+            "high_buf": ((HIGH_WINDOW,), np.float64, np.nan),
+            "vol_buf": ((self.lookback,), np.float64, np.nan),
+            "above_buf": ((CLEAN_WINDOW,), np.float64, np.nan),
+            "vol_sum": ((), np.float64, 0.0),
+            "vol_cnt": ((), np.int64, 0),
+            "above_sum": ((), np.float64, 0.0),
+            "above_cnt": ((), np.int64, 0),
+            "prev_low": ((), np.float64, np.nan),
+        }
+        for w in MA_WINDOWS:
+            shapes[f"close_sum{w}"] = ((), np.float64, 0.0)
+            shapes[f"close_cnt{w}"] = ((), np.int64, 0)
+        for col in PRICE_COLUMNS:
+            shapes[f"last_{col}"] = ((), np.int64, 0)
+        for col in STORED_FEATURES:
+            shapes[f"feat_{col}"] = ((), np.float64, np.nan)
+        return shapes
+
+    def _resize(self, n: int) -> None:
+        for name, (shape, dtype, fill) in self._shapes().items():
+            new = np.full((n,) + shape, fill, dtype=dtype)
+            old = self.arrays.get(name)
+            if old is not None:
+                new[: len(old)] = old
+            self.arrays[name] = new
+
+    def _index(self, symbols: np.ndarray) -> np.ndarray:
+        """종목 → 상태 행 위치 (신규 종목은 추가)"""
+        new = [s for s in dict.fromkeys(symbols.tolist()) if s not in self._pos]
+        if new:
+            start = len(self.symbols)
+            self.symbols = np.concatenate([self.symbols, np.array(new, dtype="U6")])
+            self._pos.update({s: start + i for i, s in enumerate(new)})
+            self._resize(len(self.symbols))
+        return np.fromiter((self._pos[s] for s in symbols.tolist()), dtype=np.int64, count=len(symbols))
+
+    # ---------------------------
+    # Update
+    # ---------------------------
+    def update_day(self, day: pd.DataFrame) -> int:
+        """
+        거래일 1일 반영 (종목당 O(1))
+
+        Args:
+            day: COLUMNS DataFrame (한 거래일, 종목당 1행)
+
+        Returns:
+            반영한 종목 수
+        """
+        if day.empty:
+            return 0
+        dates = day["date"].astype(str).str[:10].unique()
+        if len(dates) != 1:
+            raise ValueError(f"update_day 는 거래일 1일만 받습니다: {sorted(dates)}")
+        date = _normalize_date(dates[0])
+        if self.as_of and date <= self.as_of:
+            raise ValueError(f"이미 반영된 거래일 이후만 추가할 수 있습니다: {date} <= {self.as_of}")
+
+        day = day.drop_duplicates(subset=["symbol"], keep="last")
+        idx = self._index(day["symbol"].astype(str).str.zfill(6).to_numpy())
+        a = self.arrays
+
+        raw = {col: day[col].to_numpy(dtype=np.int64) for col in PRICE_COLUMNS}
+        close = raw["close"].astype(np.float64)
+        high = raw["high"].astype(np.float64)
+        low = raw["low"].astype(np.float64)
+        volume = raw["volume"].astype(np.float64)
+
+        # ---------- 종가 창 (합계 갱신: 들어오는 값 + / 나가는 값 -) ----------
+        close_buf = a["close_buf"][idx]
+        ma = {}
+        for w in MA_WINDOWS:
+            leaving = close_buf[:, self.close_len - w]
+            a[f"close_sum{w}"][idx] += _nan0(close) - _nan0(leaving)
+            a[f"close_cnt{w}"][idx] += _valid(close) - _valid(leaving)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ma[w] = np.where(a[f"close_cnt{w}"][idx] > 0, a[f"close_sum{w}"][idx] / a[f"close_cnt{w}"][idx], np.nan)
+        close_buf = _push(close_buf, close)
+        a["close_buf"][idx] = close_buf
+
+        # ---------- 거래량 창 ----------
+        vol_buf = a["vol_buf"][idx]
+        leaving = vol_buf[:, 0]
+        a["vol_sum"][idx] += _nan0(volume) - _nan0(leaving)
+        a["vol_cnt"][idx] += _valid(volume) - _valid(leaving)
+        a["vol_buf"][idx] = _push(vol_buf, volume)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vol_avg = np.where(a["vol_cnt"][idx] > 0, a["vol_sum"][idx] / a["vol_cnt"][idx], np.nan)
+
+        # ---------- 추세 / 기울기 ----------
+        feat = {}
+        feat["vol_avg"] = vol_avg
+        feat["trend"] = _nan0(_pct(close, close_buf[:, -(self.trend_days + 1)]))
+        feat["ma5"], feat["ma20"], feat["ma60"] = ma[5], ma[20], ma[60]
+        feat["ma5_slope"] = _nan0(_pct(ma[5], a["feat_ma5"][idx]))
+        feat["ma20_slope"] = _nan0(_pct(ma[20], a["feat_ma20"][idx]))
+
+        # ---------- 정배열 유지 비율 (above_ma5 5일 평균) ----------
+        above = (close > ma[5]).astype(np.float64)
+        above_buf = a["above_buf"][idx]
+        leaving = above_buf[:, 0]
+        a["above_sum"][idx] += above - _nan0(leaving)
+        a["above_cnt"][idx] += 1 - _valid(leaving)
+        a["above_buf"][idx] = _push(above_buf, above)
+        feat["above_ma5"] = above
+        feat["clean"] = a["above_sum"][idx] / a["above_cnt"][idx]
+
+        # ---------- 고점/저점 구조, 캔들 ----------
+        high_buf = _push(a["high_buf"][idx], high)
+        a["high_buf"][idx] = high_buf
+        feat["higher_low"] = (low > a["prev_low"][idx]).astype(np.float64)
+        feat["new_high"] = (high >= np.fmax.reduce(high_buf, axis=1)).astype(np.float64)
+        feat["big_red_candle"] = (_pct(close, close_buf[:, -2]) < -0.05).astype(np.float64)
+        feat["short_term_overheat"] = (
+            _pct(close, close_buf[:, -(OVERHEAT_DAYS + 1)]) > 0.15
+        ).astype(np.float64)
+        a["prev_low"][idx] = low
+
+        for col in STORED_FEATURES:
+            a[f"feat_{col}"][idx] = feat[col]
+        for col in PRICE_COLUMNS:
+            a[f"last_{col}"][idx] = raw[col]
+        a["last_date"][idx] = date
+        a["rows"][idx] += 1
+
+        self.as_of = date
+        self.days += 1
+        self.fingerprint = day_fingerprint(day)
+        return len(idx)
+
+    def update_panel(self, df: pd.DataFrame) -> int:
+        """여러 거래일 패널을 날짜순으로 반영 (반영한 거래일 수)"""
+        if df.empty:
+            return 0
+        df = df.assign(date=df["date"].astype(str).str[:10]).sort_values(["date", "symbol"], kind="stable")
+        dates = df["date"].to_numpy()
+        bounds = np.flatnonzero(dates[1:] != dates[:-1]) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [len(dates)]))
+        for s, e in zip(starts, ends):
+            self.update_day(df.iloc[s:e])
+        return len(starts)
+
+    # ---------------------------
+    # Read
+    # ---------------------------
+    def active_positions(self) -> np.ndarray:
+        """as_of 거래일에 행이 있는 종목 위치 (종목 코드 정렬)"""
+        pos = np.flatnonzero(self.arrays["last_date"] == self.as_of) if self.as_of else np.array([], dtype=np.int64)
+        return pos[np.argsort(self.symbols[pos], kind="stable")]
+
+    def max_rows(self) -> int:
+        """활성 종목의 최대 누적 거래일 수 (infer_phase 기준)"""
+        pos = self.active_positions()
+        return int(self.arrays["rows"][pos].max()) if len(pos) else 0
+
+    def latest(self) -> pd.DataFrame:
+        """
+        as_of 기준 종목별 마지막 행 피처
+
+        compute_features(df).groupby("symbol").tail(1).set_index("symbol") 와 같은 형태
+        (select_watchlist(latest=...) 에 바로 전달)
+        """
+        pos = self.active_positions()
+        a = self.arrays
+        df = pd.DataFrame({
+            "date": pd.to_datetime(pd.Series(a["last_date"][pos])),
+            "symbol": self.symbols[pos].astype(str),
+        })
+        for col in PRICE_COLUMNS:
+            df[col] = a[f"last_{col}"][pos]
+
+        # 당일 행만으로 계산하는 피처 (compute_features 와 같은 식)
+        df["vol_avg"] = a["feat_vol_avg"][pos]
+        df["intraday_volatility"] = (df["high"] - df["low"]) / df["open"].replace(0, pd.NA)
+        df["hlc_volatility"] = (df["high"] - df["low"]) / df["close"].replace(0, pd.NA)
+        df["vol_spike_ratio"] = (
+            df["volume"] / df["vol_avg"].replace(0, pd.NA)
+        ).fillna(1.0)
+        for col in ["trend", "ma5", "ma20", "ma60", "ma5_slope", "ma20_slope"]:
+            df[col] = a[f"feat_{col}"][pos]
+        df["ma_spread"] = (
+            (df["ma5"] - df["ma20"]).abs() / df["close"].replace(0, pd.NA)
+        ).fillna(0.0)
+        df["above_ma5"] = a["feat_above_ma5"][pos].astype(int)
+        df["clean"] = a["feat_clean"][pos]
+        for col in INT_FEATURES[1:]:
+            df[col] = a[f"feat_{col}"][pos].astype(int)
+        return df.set_index("symbol")
+
+    def info(self) -> Dict:
+        return {
+            "as_of": self.as_of or None,
+            "days": self.days,
+            "symbols": len(self.symbols),
+            "active_symbols": len(self.active_positions()),
+            "max_rows": self.max_rows(),
+            "lookback": self.lookback,
+            "trend_days": self.trend_days,
+        }
+
+    # ---------------------------
+    # Persist
+    # ---------------------------
+    def params(self) -> Dict:
+        return {"version": STATE_VERSION, "lookback": self.lookback, "trend_days": self.trend_days}
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        path = Path(path) if path else STATE_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        meta = dict(self.params(), as_of=self.as_of, days=self.days, fingerprint=self.fingerprint)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, meta=np.array(json.dumps(meta)), symbols=self.symbols, **self.arrays)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> Optional["FeatureState"]:
+        path = Path(path) if path else STATE_FILE
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data["meta"]))
+                if meta.get("version") != STATE_VERSION:
+                    return None
+                state = cls(lookback=meta["lookback"], trend_days=meta["trend_days"])
+                state.symbols = data["symbols"]
+                state.arrays = {name: data[name] for name in state._shapes()}
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️ 피처 상태 읽기 실패 (재생성): {e}")
+            return None
+        state.as_of = meta["as_of"]
+        state.days = meta["days"]
+        state.fingerprint = meta["fingerprint"]
+        state._pos = {s: i for i, s in enumerate(state.symbols.tolist())}
+        return state
+
+
+# =========================
+# Store 연동
+# =========================
+
+def rebuild_feature_state(
+    store: Optional[OHLCVStore] = None,
+    end_date: Optional[str] = None,
+    cfg: Optional[SelectorConfig] = None,
+    lookback: int = DEFAULT_LOOKBACK,
+) -> FeatureState:
+    """히스토리 저장소 전체 거래일로 상태 재생성"""
+    store = store or OHLCVStore()
+    cfg = cfg or SelectorConfig()
+    end = _normalize_date(end_date) if end_date else None
+    dates = [d for d in store.trading_dates() if end is None or d <= end]
+
+    state = FeatureState(lookback=lookback, trend_days=cfg.struct_trend_days)
+    if dates:
+        state.update_panel(store.load_window(end_date=dates[-1], days=len(dates)))
+    return state
+
+
+def update_feature_state(
+    store: Optional[OHLCVStore] = None,
+    end_date: Optional[str] = None,
+    cfg: Optional[SelectorConfig] = None,
+    lookback: int = DEFAULT_LOOKBACK,
+    path: Optional[Path] = None,
+    verbose: bool = True,
+) -> FeatureState:
+    """
+    저장된 상태에 신규 거래일만 반영 후 저장 (필요 시 재생성)
+
+    Args:
+        end_date: 기준일 (None 이면 저장소 마지막 거래일)
+    """
+    store = store or OHLCVStore()
+    cfg = cfg or SelectorConfig()
+    end = _normalize_date(end_date) if end_date else None
+    dates = [d for d in store.trading_dates() if end is None or d <= end]
+
+    state = FeatureState.load(path)
+    reason = None
+    if state is None:
+        reason = "상태 없음"
+    elif (state.lookback, state.trend_days) != (lookback, cfg.struct_trend_days):
+        reason = "파라미터 변경"
+    elif state.as_of:
+        done = [d for d in dates if d <= state.as_of]
+        if not done or done[-1] != state.as_of or len(done) != state.days:
+            reason = "저장소 거래일 변경"
+        elif day_fingerprint(store.load_window(end_date=state.as_of, days=1)) != state.fingerprint:
+            reason = "기준일 재수집"
+
+    if reason:
+        state = rebuild_feature_state(store, end, cfg, lookback)
+        applied = state.days
+    else:
+        new_dates = [d for d in dates if d > state.as_of]
+        applied = 0
+        if new_dates:
+            applied = state.update_panel(store.load_window(end_date=new_dates[-1], days=len(new_dates)))
+
+    if verbose:
+        mode = f"재생성 ({reason})" if reason else "증분"
+        print(f"🧮 피처 상태 {mode}: +{applied} 거래일 → 기준일 {state.as_of or '-'}, 활성 {len(state.active_positions())} 종목")
+    if state.as_of and (reason or applied):
+        state.save(path)
+    return state
+
+
+def verify_feature_state(
+    state: FeatureState,
+    store: Optional[OHLCVStore] = None,
+    cfg: Optional[SelectorConfig] = None,
+    rtol: float = 1e-9,
+) -> Dict:
+    """
+    검증 모드: 저장소 전체 히스토리로 compute_features 재계산 후 상태의 latest() 와 비교
+
+    Returns:
+        {"symbols", "max_rel_diff", "mismatches": {컬럼: [종목, ...]}}
+    """
+    store = store or OHLCVStore()
+    cfg = cfg or SelectorConfig(struct_trend_days=state.trend_days)
+    dates = [d for d in store.trading_dates() if d <= state.as_of]
+    if not dates:
+        return {"symbols": 0, "max_rel_diff": 0.0, "mismatches": {}}
+
+    df = store.load_window(end_date=state.as_of, days=len(dates), active_only=True)
+    full = compute_features(df, cfg, lookback=state.lookback)
+    expected = full.groupby("symbol", as_index=False).tail(1).set_index("symbol")
+    actual = state.latest()
+
+    mismatches: Dict[str, List[str]] = {}
+    if not expected.index.equals(actual.index):
+        mismatches["symbol"] = sorted(set(expected.index) ^ set(actual.index))
+        actual = actual.reindex(expected.index)
+
+    max_rel = 0.0
+    for col in PRICE_COLUMNS + FEATURE_COLUMNS:
+        a = pd.to_numeric(actual[col], errors="coerce").to_numpy(dtype=float)
+        b = pd.to_numeric(expected[col], errors="coerce").to_numpy(dtype=float)
+        same = np.isclose(a, b, rtol=rtol, atol=0.0, equal_nan=True) | (a == b)
+        if not same.all():
+            mismatches[col] = expected.index[~same].tolist()
+        finite = np.isfinite(a) & np.isfinite(b)
+        if finite.any():
+            diff = np.abs(a[finite] - b[finite]) / np.maximum(np.abs(b[finite]), 1e-12)
+            max_rel = max(max_rel, float(diff.max()))
+    return {"symbols": len(expected), "max_rel_diff": max_rel, "mismatches": mismatches}
+
+
+# =========================
+# Main
+# =========================
+
+def main():
+    parser = argparse.ArgumentParser(description="문지기봇 증분 피처 상태")
+    parser.add_argument("command", choices=["update", "rebuild", "verify", "info"])
+    parser.add_argument("--date", default=None, help="기준일 (YYYYMMDD, 기본: 저장소 마지막 거래일)")
+    args = parser.parse_args()
+
+    if args.command == "update":
+        state = update_feature_state(end_date=args.date)
+    elif args.command == "rebuild":
+        state = rebuild_feature_state(end_date=args.date)
+        state.save()
+        print(f"✅ 피처 상태 재생성: {state.days} 거래일")
+    else:
+        state = FeatureState.load()
+        if state is None:
+            print("⚠️ 저장된 피처 상태가 없습니다. (update 또는 rebuild 먼저 실행)")
+            return 1
+
+    if args.command == "verify":
+        result = verify_feature_state(state)
+        status = "✅ 일치" if not result["mismatches"] else "❌ 불일치"
+        print(f"{status}: {result['symbols']} 종목, 최대 상대 오차 {result['max_rel_diff']:.2e}")
+        for col, symbols in result["mismatches"].items():
+            print(f"   {col}: {len(symbols)} 종목 (예: {', '.join(symbols[:5])})")
+        return 0 if not result["mismatches"] else 1
+
+    print(json.dumps(state.info(), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
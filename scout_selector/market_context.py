@@ -24,7 +24,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 # Windows 콘솔 인코딩 설정
-if sys.platform == "win32":
+# (같은 프로세스에서 여러 번 import 되어도 한 번만 감싸기: 파이프라인 러너)
+if sys.platform == "win32" and (sys.stdout.encoding or "").lower() != "utf-8":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
@@ -250,7 +251,7 @@ def ensure_context_exists(date: str) -> Dict[str, Any]:
 # CLI (선택적 - 수동 입력용)
 # =========================
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """MarketContext 수동 생성/수정 CLI"""
     import argparse
     
@@ -294,7 +295,7 @@ def main():
         help="기본값으로 자동 생성 (입력 없이)",
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # 날짜 결정
     if args.date:
@@ -0,0 +1,410 @@
+# ===============================
+# scout_selector/multi_selector.py
+# 문지기봇 다중 설정 선정 엔진 (피처 1회 → 설정 N개 평가)
+# ===============================
+"""
+문지기봇 다중 설정 선정 엔진
+
+역할:
+- 피처 계산 1회 후 여러 SelectorConfig 를 일괄 평가 (runner.py 반복 실행 불필요)
+- Gate → Primary → 점수 → 선정 단계의 중간 결과를 설정 간 공유
+- 설정별 watchlist + 차이(diff) / 겹침(overlap) 리포트
+
+공유 단위 (같은 값이면 재계산하지 않음):
+- 피처 (latest): struct_trend_days
+- Gate Filter: gate_filter_min_turnover_krw, gate_filter_min_price
+- Primary Filter + 출력 규모 관리: primary_filter_*
+- 점수 구성요소: universe (거래량형 시그모이드, 테마 점수) / struct_range_min·max (구조 점수)
+- 설정별 계산: 가중치 결합(w_*), phase 기준, 버킷 선정
+
+사용법:
+    from multi_selector import evaluate_configs, grid_configs, compare_watchlists
+    configs = grid_configs(SelectorConfig(phase="normal"), w_turnover=[0.25, 0.35, 0.45])
+    results = evaluate_configs(df, configs, largecap_symbols=["005930", "000660"])
+    report = compare_watchlists(results, baseline="base")
+
+    python multi_selector.py --variants variants.json
+    python multi_selector.py --grid w_turnover=0.25,0.35,0.45 --grid primary_filter_vol_spike_min=1.5,1.8
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+from dataclasses import asdict, fields, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+try:
+    from scout_selector.selector import (
+        SelectorConfig,
+        apply_gate_filter,
+        apply_primary_filter,
+        build_theme_series,
+        compute_features,
+        manage_primary_filter_output_size,
+        pick_watchlist,
+        score_structure,
+        score_theme,
+        score_volume,
+        volume_components,
+    )
+except ImportError:
+    from selector import (
+        SelectorConfig,
+        apply_gate_filter,
+        apply_primary_filter,
+        build_theme_series,
+        compute_features,
+        manage_primary_filter_output_size,
+        pick_watchlist,
+        score_structure,
+        score_theme,
+        score_volume,
+        volume_components,
+    )
+
+# =========================
+# Constants
+# =========================
+
+CATEGORIES = ["largecap", "volume", "structure", "theme"]
+
+GATE_FIELDS = ("gate_filter_min_turnover_krw", "gate_filter_min_price")
+PRIMARY_FIELDS = (
+    "primary_filter_vol_spike_min",
+    "primary_filter_min_turnover_krw",
+    "primary_filter_min_volatility",
+    "primary_filter_output_min",
+    "primary_filter_output_max",
+)
+STRUCTURE_FIELDS = ("struct_range_min", "struct_range_max")
+
+OUTPUT_DIR = BASE_DIR / "output"
+
+ConfigBatch = Union[Mapping[str, SelectorConfig], Iterable[SelectorConfig]]
+
+
+# =========================
+# Config 생성
+# =========================
+
+def config_from_dict(base: SelectorConfig, overrides: Mapping[str, Any]) -> SelectorConfig:
+    """
+    base 에 필드 덮어쓰기 (quota 는 dict 로 부분 지정 가능)
+
+    예: {"w_turnover": 0.5, "quota": {"max_per_category": 2}}
+    """
+    known = {f.name for f in fields(SelectorConfig)}
+    unknown = set(overrides) - known
+    if unknown:
+        raise ValueError(f"알 수 없는 SelectorConfig 필드: {', '.join(sorted(unknown))}")
+
+    values = dict(overrides)
+    quota = values.get("quota")
+    if isinstance(quota, Mapping):
+        values["quota"] = replace(base.quota, **quota)
+    return replace(base, **values)
+
+
+def grid_configs(base: SelectorConfig, **param_lists: Iterable[Any]) -> Dict[str, SelectorConfig]:
+    """
+    파라미터 격자 → {이름: SelectorConfig} (민감도 분석용)
+
+    이름 예: "w_turnover=0.25,primary_filter_vol_spike_min=1.5"
+    첫 항목으로 "base" (덮어쓰기 없음) 포함
+    """
+    configs = {"base": base}
+    names = list(param_lists)
+    for values in itertools.product(*(list(param_lists[n]) for n in names)):
+        overrides = dict(zip(names, values))
+        label = ",".join(f"{k}={v}" for k, v in overrides.items())
+        configs[label] = config_from_dict(base, overrides)
+    return configs
+
+
+def _named(configs: ConfigBatch) -> Dict[str, SelectorConfig]:
+    if isinstance(configs, Mapping):
+        return dict(configs)
+    return {f"cfg{i}": cfg for i, cfg in enumerate(configs)}
+
+
+def _key(cfg: SelectorConfig, names: Iterable[str]) -> tuple:
+    return tuple(getattr(cfg, n) for n in names)
+
+
+# =========================
+# 일괄 평가
+# =========================
+
+def evaluate_configs(
+    df: Optional[pd.DataFrame],
+    configs: ConfigBatch,
+    *,
+    largecap_symbols: List[str],
+    theme_score_map: Optional[Dict] = None,
+    latest: Optional[pd.DataFrame] = None,
+) -> Dict[str, Dict[str, List[Dict]]]:
+    """
+    여러 SelectorConfig 를 피처 1회 계산으로 평가
+
+    설정마다 select_watchlist(df, cfg=...) 를 호출한 것과 같은 결과
+
+    Args:
+        df: OHLCV 패널 (latest 를 주면 사용하지 않음)
+        configs: {이름: SelectorConfig} 또는 SelectorConfig 리스트
+        latest: 종목별 마지막 행 피처 (feature_state.latest() 등)
+
+    Returns:
+        {이름: watchlist(dict: largecap/volume/structure/theme)}
+    """
+    named = _named(configs)
+    theme_score_map = theme_score_map or {}
+
+    latest_cache: Dict[Any, pd.DataFrame] = {}
+    gate_cache: Dict[tuple, pd.DataFrame] = {}
+    primary_cache: Dict[tuple, pd.DataFrame] = {}
+    universe_cache: Dict[tuple, Dict[str, Any]] = {}
+    struct_cache: Dict[tuple, pd.Series] = {}
+
+    results: Dict[str, Dict[str, List[Dict]]] = {}
+    for name, cfg in named.items():
+        # ---------- 피처 (trend 기간이 같으면 공유) ----------
+        feat_key = None if latest is not None else cfg.struct_trend_days
+        if feat_key not in latest_cache:
+            if latest is not None:
+                latest_cache[feat_key] = latest
+            else:
+                df_feat = compute_features(df, cfg)
+                latest_cache[feat_key] = df_feat.groupby("symbol", as_index=False).tail(1).set_index("symbol")
+        cfg_latest = latest_cache[feat_key]
+
+        # ---------- Gate / Primary ----------
+        gate_key = (feat_key,) + _key(cfg, GATE_FIELDS)
+        if gate_key not in gate_cache:
+            gate_cache[gate_key] = apply_gate_filter(cfg_latest, cfg)
+        gate_filtered = gate_cache[gate_key]
+
+        primary_key = gate_key + _key(cfg, PRIMARY_FIELDS)
+        if primary_key not in primary_cache:
+            primary = apply_primary_filter(
+                gate_filtered,
+                cfg,
+                gate_filtered["vol_spike_ratio"],
+                gate_filtered["intraday_volatility"],
+            )
+            primary_cache[primary_key] = manage_primary_filter_output_size(primary, cfg, gate_filtered)
+        universe = primary_cache[primary_key]
+
+        # ---------- 점수 구성요소 (universe 단위 공유) ----------
+        if primary_key not in universe_cache:
+            components = volume_components(universe)
+            universe_cache[primary_key] = {
+                "volume": components,
+                "theme_series": build_theme_series(universe, theme_score_map),
+            }
+        shared = universe_cache[primary_key]
+
+        struct_key = primary_key + _key(cfg, STRUCTURE_FIELDS)
+        if struct_key not in struct_cache:
+            struct_cache[struct_key] = score_structure(universe, cfg)
+
+        # ---------- 설정별: 가중치 결합 + 선정 ----------
+        results[name] = pick_watchlist(
+            cfg_latest,
+            universe,
+            cfg=cfg,
+            largecap_symbols=largecap_symbols,
+            theme_score_map=theme_score_map,
+            theme_series=shared["theme_series"],
+            vol_scores=score_volume(universe, cfg, components=shared["volume"]),
+            struct_scores=struct_cache[struct_key],
+            theme_scores=score_theme(
+                universe, shared["theme_series"], cfg, z_turn=shared["volume"]["turnover"]
+            ),
+        )
+
+    return results
+
+
+# =========================
+# Diff / Overlap 리포트
+# =========================
+
+def _symbols(watchlist: Dict[str, List[Dict]]) -> Dict[str, str]:
+    """watchlist → {종목: 카테고리}"""
+    out = {}
+    for category in CATEGORIES:
+        for item in watchlist.get(category, []):
+            out.setdefault(item["symbol"], category)
+    return out
+
+
+def compare_watchlists(
+    results: Mapping[str, Dict[str, List[Dict]]],
+    baseline: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    설정별 watchlist 비교
+
+    Returns:
+        {
+          "baseline": 기준 설정 이름,
+          "variants": {이름: {"symbols": [...], "by_category": {...}}},
+          "diff": {이름: {"added", "removed", "moved": {종목: [기준 카테고리, 변경 카테고리]}}},
+          "overlap": {이름: {이름: Jaccard}},
+          "frequency": {종목: 선정된 설정 수} (많은 순),
+        }
+    """
+    names = list(results)
+    if not names:
+        return {"baseline": None, "variants": {}, "diff": {}, "overlap": {}, "frequency": {}}
+    baseline = baseline if baseline in results else names[0]
+
+    picked = {name: _symbols(results[name]) for name in names}
+
+    variants = {
+        name: {
+            "symbols": sorted(picked[name]),
+            "by_category": {c: [item["symbol"] for item in results[name].get(c, [])] for c in CATEGORIES},
+        }
+        for name in names
+    }
+
+    base = picked[baseline]
+    diff = {}
+    for name in names:
+        cur = picked[name]
+        diff[name] = {
+            "added": sorted(set(cur) - set(base)),
+            "removed": sorted(set(base) - set(cur)),
+            "moved": {s: [base[s], cur[s]] for s in sorted(set(cur) & set(base)) if base[s] != cur[s]},
+        }
+
+    overlap = {}
+    for a in names:
+        overlap[a] = {}
+        for b in names:
+            sa, sb = set(picked[a]), set(picked[b])
+            union = sa | sb
+            overlap[a][b] = round(len(sa & sb) / len(union), 4) if union else 1.0
+
+    counts: Dict[str, int] = {}
+    for cur in picked.values():
+        for s in cur:
+            counts[s] = counts.get(s, 0) + 1
+    frequency = dict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])))
+
+    return {"baseline": baseline, "variants": variants, "diff": diff, "overlap": overlap, "frequency": frequency}
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\n📊 설정 {len(report['variants'])}개 비교 (기준: {report['baseline']})")
+    for name, d in report["diff"].items():
+        overlap = report["overlap"][report["baseline"]][name]
+        changes = []
+        if d["added"]:
+            changes.append(f"+{','.join(d['added'])}")
+        if d["removed"]:
+            changes.append(f"-{','.join(d['removed'])}")
+        if d["moved"]:
+            changes.append(f"이동 {len(d['moved'])}")
+        print(f"  • {name}: 겹침 {overlap:.2f} {' '.join(changes) if changes else '(동일)'}")
+    stable = [s for s, n in report["frequency"].items() if n == len(report["variants"])]
+    print(f"  모든 설정에서 선정: {', '.join(stable) if stable else '-'}")
+
+
+# =========================
+# Main
+# =========================
+
+def _load_latest(date: Optional[str]) -> pd.DataFrame:
+    """증분 피처 상태 우선, 없으면 히스토리 저장소 패널로 재계산"""
+    try:
+        from feature_state import update_feature_state
+        state = update_feature_state(end_date=date)
+        if state.as_of:
+            return state.latest()
+    except Exception as e:
+        print(f"⚠️ 피처 상태 사용 불가 (전체 재계산): {e}")
+    from ohlcv_store import load_window
+    df = load_window(end_date=date, active_only=True)
+    if df.empty:
+        return pd.DataFrame()
+    df_feat = compute_features(df, SelectorConfig())
+    return df_feat.groupby("symbol", as_index=False).tail(1).set_index("symbol")
+
+
+def _parse_grid(items: List[str]) -> Dict[str, List[Any]]:
+    grid = {}
+    for item in items:
+        name, _, raw = item.partition("=")
+        grid[name] = [json.loads(v) for v in raw.split(",") if v]
+    return grid
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문지기봇 다중 설정 선정 비교")
+    parser.add_argument("--date", default=None, help="기준일 (YYYYMMDD, 기본: 저장소 마지막 거래일)")
+    parser.add_argument("--phase", default="normal", choices=["warmup", "normal"])
+    parser.add_argument("--variants", default=None, help="설정 JSON 파일 ({이름: {필드: 값}})")
+    parser.add_argument("--grid", action="append", default=[], help="필드=값1,값2 (여러 번 지정 가능)")
+    parser.add_argument("--output", default=None, help="리포트 저장 경로 (기본: output/selector_variants_YYYYMMDD.json)")
+    args = parser.parse_args()
+
+    base = SelectorConfig(phase=args.phase)
+    configs: Dict[str, SelectorConfig] = {}
+    if args.variants:
+        with open(args.variants, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        configs["base"] = base
+        configs.update({name: config_from_dict(base, overrides) for name, overrides in raw.items()})
+    if args.grid:
+        configs.update(grid_configs(base, **_parse_grid(args.grid)))
+    if not configs:
+        parser.error("--variants 또는 --grid 를 지정하세요.")
+
+    latest = _load_latest(args.date)
+    if latest.empty:
+        print("⚠️ 피처 데이터가 없습니다. (ohlcv_store backfill 먼저 실행)")
+        return 1
+
+    from theme_score_builder import build_theme_score_map
+    theme_score_map = build_theme_score_map(BASE_DIR / "input", date=args.date, archive_history=False)
+
+    results = evaluate_configs(
+        None,
+        configs,
+        largecap_symbols=["005930", "000660"],
+        theme_score_map=theme_score_map,
+        latest=latest,
+    )
+    report = compare_watchlists(results, baseline="base")
+    print_report(report)
+
+    date_str = args.date or datetime.now().strftime("%Y%m%d")
+    out_path = Path(args.output) if args.output else OUTPUT_DIR / f"selector_variants_{date_str}.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "meta": {"date": date_str, "created_at": datetime.now().isoformat(), "configs": len(configs)},
+        "configs": {name: asdict(cfg) for name, cfg in configs.items()},
+        "watchlists": results,
+        "report": report,
+    }
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2, default=str)
+    print(f"📁 저장 위치: {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,483 @@
+# ===============================
+# scout_selector/ohlcv_store.py
+# OHLCV 히스토리 저장소 (월 단위 파티션)
+# ===============================
+"""
+문지기봇용 일봉 OHLCV 히스토리 저장소
+
+역할:
+- 캔들기록봇이 만든 하루치 OHLCV 를 월 단위 파티션(ohlcv_YYYYMM.parquet)에 누적
+- (date, symbol) 중복 제거 (같은 날 재수집 시 최신 값으로 교체)
+- load_window(symbols, end_date, days) → compute_features 에 바로 넣는 패널
+- 1회 일괄 백필 (최근 60+ 거래일) → Cold Start 에도 20일 warmup 없이 normal phase
+
+저장 구조:
+    scout_selector/data/ohlcv_history/
+        _manifest.json          # 파티션별 행 수 / 거래일 목록 (파티션을 열지 않고 기간 계산)
+        ohlcv_202601.parquet    # symbol, date 정렬 (pyarrow 없으면 ohlcv_202601.csv.gz)
+
+사용법:
+    python ohlcv_store.py backfill --days 80
+    python ohlcv_store.py import-csv
+    python ohlcv_store.py info
+
+주의:
+- pyarrow 는 선택 의존성 (없으면 gzip CSV 파티션으로 동작, 읽기/쓰기 API 동일)
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# =========================
+# Constants
+# =========================
+
+STORE_VERSION = 1
+
+# collect_ohlcv.CSV_COLUMNS 와 동일
+COLUMNS = ["date", "symbol", "open", "high", "low", "close", "volume", "turnover_krw"]
+INT_COLUMNS = ["open", "high", "low", "close", "volume", "turnover_krw"]
+
+# compute_features 의 최장 이동평균(ma60) + 여유
+DEFAULT_WINDOW_DAYS = 80
+DEFAULT_BACKFILL_DAYS = 80
+
+# =========================
+# Paths
+# =========================
+
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BASE_DIR.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+DATA_DIR = BASE_DIR / "data"
+STORE_DIR = DATA_DIR / "ohlcv_history"
+MANIFEST_FILE = "_manifest.json"
+
+
+# =========================
+# Helpers
+# =========================
+
+def _normalize_date(date: str) -> str:
+    """YYYYMMDD / YYYY-MM-DD / Timestamp → YYYY-MM-DD"""
+    text = str(date)[:10]
+    if len(text) == 8 and text.isdigit():
+        return f"{text[:4]}-{text[4:6]}-{text[6:8]}"
+    return text
+
+
+def _partition_key(date: str) -> str:
+    """YYYY-MM-DD → YYYYMM"""
+    return date[:4] + date[5:7]
+
+
+def _partition_path(key: str, store_dir: Path) -> Path:
+    suffix = ".parquet" if HAS_PYARROW else ".csv.gz"
+    return store_dir / f"ohlcv_{key}{suffix}"
+
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """컬럼/타입 고정 (date: YYYY-MM-DD 문자열, symbol: 6자리 문자열, 가격/거래량: int64)"""
+    df = df.reindex(columns=COLUMNS).copy()
+    df["date"] = df["date"].map(_normalize_date)
+    df["symbol"] = df["symbol"].astype(str).str.zfill(6)
+    for col in INT_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df = df.dropna(subset=INT_COLUMNS)
+    for col in INT_COLUMNS:
+        df[col] = df[col].astype("int64")
+    return df
+
+
+def _write_atomic(df: pd.DataFrame, path: Path) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    if HAS_PYARROW:
+        df.to_parquet(tmp_path, index=False, compression="zstd")
+    else:
+        df.to_csv(tmp_path, index=False, compression="gzip")
+    os.replace(tmp_path, path)
+
+
+def _read_partition(
+    path: Path,
+    symbols: Optional[List[str]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> pd.DataFrame:
+    if HAS_PYARROW and path.suffix == ".parquet":
+        filters = []
+        if symbols is not None:
+            filters.append(("symbol", "in", list(symbols)))
+        if start:
+            filters.append(("date", ">=", start))
+        if end:
+            filters.append(("date", "<=", end))
+        return pd.read_parquet(path, filters=filters or None)
+
+    df = pd.read_csv(path, dtype={"symbol": str, "date": str}, compression="gzip")
+    if symbols is not None:
+        df = df[df["symbol"].isin(symbols)]
+    if start:
+        df = df[df["date"] >= start]
+    if end:
+        df = df[df["date"] <= end]
+    return df
+
+
+# =========================
+# Store
+# =========================
+
+class OHLCVStore:
+    """월 단위 파티션 OHLCV 저장소"""
+
+    def __init__(self, store_dir: Optional[Path] = None):
+        self.store_dir = Path(store_dir) if store_dir else STORE_DIR
+        self.manifest = self._load_manifest()
+
+    # ---------------------------
+    # Manifest
+    # ---------------------------
+    def _load_manifest(self) -> Dict:
+        path = self.store_dir / MANIFEST_FILE
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == STORE_VERSION:
+                return manifest
+        except (OSError, json.JSONDecodeError):
+            pass
+        return {"version": STORE_VERSION, "partitions": {}}
+
+    def _save_manifest(self) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        path = self.store_dir / MANIFEST_FILE
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def trading_dates(self) -> List[str]:
+        """저장된 거래일 (오름차순)"""
+        dates = []
+        for key in sorted(self.manifest["partitions"]):
+            dates.extend(self.manifest["partitions"][key]["dates"])
+        return dates
+
+    def info(self) -> Dict:
+        dates = self.trading_dates()
+        return {
+            "partitions": len(self.manifest["partitions"]),
+            "rows": sum(p["rows"] for p in self.manifest["partitions"].values()),
+            "days": len(dates),
+            "first_date": dates[0] if dates else None,
+            "last_date": dates[-1] if dates else None,
+            "format": "parquet" if HAS_PYARROW else "csv.gz",
+        }
+
+    # ---------------------------
+    # Write
+    # ---------------------------
+    def upsert(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        OHLCV 행 추가 (파티션별 병합, (date, symbol) 중복은 새 값으로 교체)
+
+        Args:
+            df: COLUMNS 를 가진 DataFrame (date 는 YYYYMMDD/YYYY-MM-DD 모두 허용)
+
+        Returns:
+            {YYYYMM: 파티션 전체 행 수} - 변경된 파티션만
+        """
+        df = _normalize_frame(df)
+        if df.empty:
+            return {}
+
+        changed = {}
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        for key, part in df.groupby(df["date"].map(_partition_key)):
+            path = _partition_path(key, self.store_dir)
+            if path.exists():
+                existing = _read_partition(path)
+                part = pd.concat([existing, part], ignore_index=True)
+            part = (
+                part.drop_duplicates(subset=["date", "symbol"], keep="last")
+                .sort_values(["symbol", "date"])
+                .reset_index(drop=True)
+            )
+            _write_atomic(part, path)
+            self.manifest["partitions"][key] = {
+                "file": path.name,
+                "rows": len(part),
+                "symbols": int(part["symbol"].nunique()),
+                "dates": sorted(part["date"].unique().tolist()),
+            }
+            changed[key] = len(part)
+
+        self._save_manifest()
+        return changed
+
+    def upsert_daily(self, rows: List[Dict]) -> Dict[str, int]:
+        """collect_ohlcv 의 일별 수집 결과(dict 리스트) 추가"""
+        if not rows:
+            return {}
+        return self.upsert(pd.DataFrame(rows))
+
+    # ---------------------------
+    # Read
+    # ---------------------------
+    def load_window(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        end_date: Optional[str] = None,
+        days: int = DEFAULT_WINDOW_DAYS,
+        active_only: bool = False,
+    ) -> pd.DataFrame:
+        """
+        end_date 이전(포함) 최근 days 거래일 패널
+
+        Args:
+            symbols: 종목 코드 (None 이면 전체)
+            end_date: 기준일 (None 이면 저장된 마지막 거래일)
+            days: 거래일 수
+            active_only: 기준 기간의 마지막 거래일에 행이 있는 종목만 (당일 미수집 종목 제외)
+
+        Returns:
+            COLUMNS DataFrame (symbol, date 정렬, date 는 datetime64)
+        """
+        end = _normalize_date(end_date) if end_date else None
+        dates = [d for d in self.trading_dates() if end is None or d <= end]
+        if not dates:
+            return pd.DataFrame(columns=COLUMNS)
+        window = dates[-days:]
+        start, end = window[0], window[-1]
+
+        wanted = sorted({str(s).zfill(6) for s in symbols}) if symbols is not None else None
+        frames = []
+        for key in sorted(self.manifest["partitions"]):
+            if not (_partition_key(start) <= key <= _partition_key(end)):
+                continue
+            path = self.store_dir / self.manifest["partitions"][key]["file"]
+            if path.exists():
+                frames.append(_read_partition(path, wanted, start, end))
+
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame(columns=COLUMNS)
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+        if active_only:
+            df = df[df["symbol"].isin(df.loc[df["date"] == end, "symbol"])]
+
+        df = df.sort_values(["symbol", "date"]).reset_index(drop=True)
+        df["date"] = pd.to_datetime(df["date"])
+        return df[COLUMNS]
+
+
+# =========================
+# Backfill
+# =========================
+
+def fetch_symbol_range_pykrx(symbol: str, start: str, end: str) -> pd.DataFrame:
+    """
+    pykrx 로 종목 1개의 기간 일봉 수집 (호출 1회로 기간 전체, KRX 응답 캐시 경유)
+
+    Args:
+        symbol: 종목 코드
+        start / end: YYYYMMDD
+
+    Returns:
+        COLUMNS DataFrame (실패 시 빈 DataFrame)
+    """
+    from test.daily_scan.data.krx_source import get_source
+
+    df = get_source().get_market_ohlcv_by_date(start, end, symbol)
+    if df is None or df.empty:
+        return pd.DataFrame(columns=COLUMNS)
+
+    out = pd.DataFrame({
+        "date": pd.to_datetime(df.index).strftime("%Y-%m-%d"),
+        "symbol": symbol,
+        "open": df["시가"].to_numpy(),
+        "high": df["고가"].to_numpy(),
+        "low": df["저가"].to_numpy(),
+        "close": df["종가"].to_numpy(),
+        "volume": df["거래량"].to_numpy(),
+    })
+    # 거래대금은 collect_ohlcv 와 같은 기준 (종가 * 거래량)
+    out["turnover_krw"] = out["close"].astype("int64") * out["volume"].astype("int64")
+    return out
+
+
+def backfill(
+    symbols: List[str],
+    end_date: Optional[str] = None,
+    days: int = DEFAULT_BACKFILL_DAYS,
+    fetch: Optional[Callable[[str, str, str], pd.DataFrame]] = None,
+    store: Optional[OHLCVStore] = None,
+) -> Dict[str, int]:
+    """
+    최근 days 거래일 일괄 적재 (Cold Start 1회)
+
+    Args:
+        symbols: 종목 코드
+        end_date: 기준일 (기본: 오늘)
+        days: 거래일 수 (주말/휴장 여유를 두고 달력일로 넉넉히 요청한 뒤 잘라냄)
+        fetch: fetch(symbol, start_YYYYMMDD, end_YYYYMMDD) → DataFrame
+               (기본: 날짜별 시장 스냅샷 패널, 스냅샷에 없는 종목만 pykrx 종목별 수집)
+
+    Returns:
+        {"symbols": 성공 종목 수, "failed": 실패 종목 수, "rows": 적재 행 수}
+    """
+    store = store or OHLCVStore()
+    end = _normalize_date(end_date) if end_date else datetime.now().strftime("%Y-%m-%d")
+    end_dt = datetime.strptime(end, "%Y-%m-%d")
+    start_dt = end_dt - timedelta(days=int(days * 7 / 5) + 14)
+    start_compact, end_compact = start_dt.strftime("%Y%m%d"), end_dt.strftime("%Y%m%d")
+
+    frames = []
+    failed = 0
+    total = len(symbols)
+    print(f"\n📊 OHLCV 백필 시작 ({total}종목, {start_dt:%Y-%m-%d} ~ {end})")
+
+    remaining = list(symbols)
+    if fetch is None:
+        market = _load_market_frame(remaining, start_compact, end_compact)
+        if not market.empty:
+            frames.append(market)
+            covered = set(market["symbol"])
+            remaining = [s for s in remaining if s not in covered]
+        fetch = fetch_symbol_range_pykrx
+
+    for idx, symbol in enumerate(remaining, 1):
+        try:
+            df = fetch(symbol, start_compact, end_compact)
+        except Exception as e:
+            print(f"  ⚠️  [{idx}/{total}] {symbol} 백필 실패: {e}")
+            failed += 1
+            continue
+        if df is None or df.empty:
+            failed += 1
+            continue
+        frames.append(df)
+
+    if not frames:
+        return {"symbols": 0, "failed": failed, "rows": 0}
+
+    panel = _normalize_frame(pd.concat(frames, ignore_index=True))
+    keep_dates = sorted(panel["date"].unique())[-days:]
+    panel = panel[panel["date"].isin(keep_dates)]
+    store.upsert(panel)
+
+    loaded = int(panel["symbol"].nunique())
+    print(f"✅ 백필 완료: {loaded}/{total} 종목, {len(keep_dates)} 거래일, {len(panel):,} 행")
+    return {"symbols": loaded, "failed": failed, "rows": len(panel)}
+
+
+def _load_market_frame(symbols: List[str], start: str, end: str) -> pd.DataFrame:
+    """날짜별 시장 스냅샷 패널(캐시) → COLUMNS (요청 종목만, 실패 시 빈 DataFrame)"""
+    try:
+        from test.daily_scan.data.market_ohlcv import load_market_panel
+        panel = load_market_panel(start, end, verbose=True)
+    except ImportError:
+        return pd.DataFrame(columns=COLUMNS)
+    except Exception as e:
+        print(f"  ⚠️  시장 스냅샷 패널 로드 실패 (종목별 수집으로 진행): {e}")
+        return pd.DataFrame(columns=COLUMNS)
+
+    panel = panel[panel["symbol"].isin(symbols)]
+    out = pd.DataFrame({
+        "date": panel["날짜"].dt.strftime("%Y-%m-%d"),
+        "symbol": panel["symbol"],
+        "open": panel["시가"],
+        "high": panel["고가"],
+        "low": panel["저가"],
+        "close": panel["종가"],
+        "volume": panel["거래량"],
+    })
+    out["turnover_krw"] = out["close"].astype("int64") * out["volume"].astype("int64")
+    return out
+
+
+def import_daily_csv(data_dir: Optional[Path] = None, store: Optional[OHLCVStore] = None) -> Dict[str, int]:
+    """기존 data/ohlcv_YYYYMMDD.csv 파일을 저장소로 가져오기"""
+    store = store or OHLCVStore()
+    data_dir = Path(data_dir) if data_dir else DATA_DIR
+    frames = []
+    for path in sorted(data_dir.glob("ohlcv_[0-9]*.csv")):
+        try:
+            frames.append(pd.read_csv(path, dtype={"symbol": str, "date": str}))
+        except Exception as e:
+            print(f"  ⚠️  {path.name} 읽기 실패: {e}")
+    if not frames:
+        return {"files": 0, "rows": 0}
+    df = pd.concat(frames, ignore_index=True)
+    store.upsert(df)
+    return {"files": len(frames), "rows": len(df)}
+
+
+# =========================
+# Module-level API
+# =========================
+
+def upsert_daily(rows: List[Dict]) -> Dict[str, int]:
+    return OHLCVStore().upsert_daily(rows)
+
+
+def load_window(
+    symbols: Optional[Iterable[str]] = None,
+    end_date: Optional[str] = None,
+    days: int = DEFAULT_WINDOW_DAYS,
+    active_only: bool = False,
+) -> pd.DataFrame:
+    return OHLCVStore().load_window(symbols, end_date, days, active_only)
+
+
+# =========================
+# Main
+# =========================
+
+def main():
+    parser = argparse.ArgumentParser(description="OHLCV 히스토리 저장소")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_backfill = sub.add_parser("backfill", help="최근 N 거래일 일괄 적재")
+    p_backfill.add_argument("--days", type=int, default=DEFAULT_BACKFILL_DAYS)
+    p_backfill.add_argument("--date", default=None, help="기준일 (YYYYMMDD, 기본: 오늘)")
+    p_backfill.add_argument("--symbols-file", dest="symbols_file", default=None, help="종목 리스트 파일 (없으면 캔들기록봇 입력 소스)")
+
+    sub.add_parser("import-csv", help="data/ohlcv_YYYYMMDD.csv 가져오기")
+    sub.add_parser("info", help="저장소 요약")
+
+    args = parser.parse_args()
+
+    if args.command == "backfill":
+        from collect_ohlcv import collect_input_symbols
+        date = args.date or datetime.now().strftime("%Y%m%d")
+        symbols_file = Path(args.symbols_file) if args.symbols_file else None
+        symbols = collect_input_symbols(date, symbols_file)
+        backfill(symbols, date, args.days)
+    elif args.command == "import-csv":
+        result = import_daily_csv()
+        print(f"✅ {result['files']}개 파일, {result['rows']:,} 행 가져오기 완료")
+
+    print(json.dumps(OHLCVStore().info(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,6 @@ import pandas as pd
 from selector import (
     SelectorConfig,
     select_watchlist,
-    compute_features,
 )
 
 # =========================
@@ -209,44 +208,72 @@ def main():
         print(f"   ⚠️  종목선정회의 로드 실패 (무시): {e}")
         # MarketContext 없어도 정상 동작 (설계서 v0 - 7장)
     
-    # 데이터 파일 찾기 (어제 또는 오늘 데이터 사용)
-    data_files = []
-    for days_ago in range(5):  # 최근 5일 데이터 확인
-        check_date = datetime.now() - timedelta(days=days_ago)
-        check_file = DATA_DIR / f"ohlcv_{check_date.strftime('%Y%m%d')}.csv"
-        if check_file.exists():
-            data_files.append((check_file, check_date))
-    
-    if not data_files:
-        # Cold Start: 데이터 파일이 없으면 빈 DataFrame으로 시작 (warmup phase)
-        print(f"\n⚠️  데이터 파일 없음: {DATA_DIR}/ohlcv_YYYYMMDD.csv")
-        print(f"   → Cold Start 모드 (warmup phase)")
-        df = pd.DataFrame(columns=["symbol", "date", "open", "high", "low", "close", "volume", "turnover_krw"])
+    # 증분 피처 상태 우선 (히스토리 저장소의 신규 거래일만 반영, 종목당 O(1))
+    latest_feat = None
+    feature_rows = 0
+    try:
+        from feature_state import update_feature_state
+        
+        state = update_feature_state(end_date=today_str)
+        if state.as_of:
+            latest_feat = state.latest()
+            feature_rows = state.max_rows()
+    except Exception as e:
+        print(f"   ⚠️  피처 상태 갱신 실패 (전체 재계산으로 진행): {e}")
+    
+    if latest_feat is not None and not latest_feat.empty:
+        df = latest_feat.reset_index()
+        print(f"\n📊 사용할 데이터: 증분 피처 상태 (기준일 {state.as_of}, 종목별 최대 {feature_rows} 거래일)")
+        print(f"   종목 수: {len(df)} 종목")
     else:
-        # 가장 최근 데이터 사용
-        data_file, data_date = data_files[0]
-        print(f"\n📊 사용할 데이터: {data_file.name} ({data_date.strftime('%Y-%m-%d')})")
+        latest_feat = None
+        # 히스토리 저장소 우선 (20/60일 lookback 패널, 오늘 이전 최근 거래일 기준)
+        from ohlcv_store import load_window
+    
+        history_df = load_window(end_date=today_str, active_only=True)
+    
+        # 데이터 파일 찾기 (어제 또는 오늘 데이터 사용)
+        data_files = []
+        for days_ago in range(5):  # 최근 5일 데이터 확인
+            check_date = datetime.now() - timedelta(days=days_ago)
+            check_file = DATA_DIR / f"ohlcv_{check_date.strftime('%Y%m%d')}.csv"
+            if check_file.exists():
+                data_files.append((check_file, check_date))
+    
+        if not history_df.empty:
+            df = history_df
+            print(f"\n📊 사용할 데이터: 히스토리 저장소 ({df['date'].min():%Y-%m-%d} ~ {df['date'].max():%Y-%m-%d})")
+            print(f"   종목 수: {df['symbol'].nunique()} 종목, {df['date'].nunique()} 거래일")
+        elif not data_files:
+            # Cold Start: 데이터 파일이 없으면 빈 DataFrame으로 시작 (warmup phase)
+            print(f"\n⚠️  데이터 파일 없음: {DATA_DIR}/ohlcv_YYYYMMDD.csv")
+            print(f"   → Cold Start 모드 (warmup phase)")
+            df = pd.DataFrame(columns=["symbol", "date", "open", "high", "low", "close", "volume", "turnover_krw"])
+        else:
+            # 가장 최근 데이터 사용
+            data_file, data_date = data_files[0]
+            print(f"\n📊 사용할 데이터: {data_file.name} ({data_date.strftime('%Y-%m-%d')})")
         
-        # 데이터 로드
-        df = pd.read_csv(data_file)
-        if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"])
+            # 데이터 로드
+            df = pd.read_csv(data_file)
+            if "date" in df.columns:
+                df["date"] = pd.to_datetime(df["date"])
         
-        print(f"   종목 수: {df['symbol'].nunique()} 종목")
-        if not df.empty and "date" in df.columns:
-            print(f"   데이터 기간: {df['date'].min()} ~ {df['date'].max()}")
+            print(f"   종목 수: {df['symbol'].nunique()} 종목")
+            if not df.empty and "date" in df.columns:
+                print(f"   데이터 기간: {df['date'].min()} ~ {df['date'].max()}")
     
-    # Phase 추론
-    phase = infer_phase(df)
+    # Phase 추론 (증분 피처 상태는 종목별 누적 거래일 수 기준)
+    if latest_feat is not None:
+        phase = "normal" if feature_rows >= 20 else "warmup"
+    else:
+        phase = infer_phase(df)
     print(f"   Phase: {phase}")
     
     # Config
     CFG = SelectorConfig(phase=phase)
     LARGECAPS = ["005930", "000660"]
     
-    # Feature 계산
-    df_feat = compute_features(df, CFG)
-    
     # Theme Score Map 빌드 (표준 입력 경로, 내일 날짜만 사용)
     from theme_score_builder import build_theme_score_map
     
@@ -304,6 +331,7 @@ def main():
             cfg=CFG,
             largecap_symbols=LARGECAPS,
             theme_score_map=theme_score_map,
+            latest=latest_feat,
         )
     
     # 결과 출력
@@ -70,7 +70,14 @@ def infer_phase(df: pd.DataFrame, lookback: int = 20) -> str:
 # =========================
 
 DATA_FILE = DATA_DIR / "ohlcv_today.csv"
-if not DATA_FILE.exists():
+
+# 히스토리 저장소에 누적된 기간이 있으면 lookback 패널 사용 (없으면 당일 CSV)
+from ohlcv_store import load_window
+
+df = load_window(end_date=datetime.now().strftime("%Y%m%d"), active_only=True)
+if not df.empty:
+    print(f"📚 히스토리 저장소 사용: {df['symbol'].nunique()} 종목, {df['date'].nunique()} 거래일")
+elif not DATA_FILE.exists():
     # Cold Start: 데이터 파일이 없으면 빈 DataFrame으로 시작 (warmup phase)
     print(f"⚠️  데이터 파일 없음: {DATA_FILE} → Cold Start 모드 (warmup)")
     df = pd.DataFrame(columns=["symbol", "date", "open", "high", "low", "close", "volume", "turnover_krw"])
@@ -42,7 +42,9 @@ GATEKEEPER_BOT_VERSION = "1.0.0"
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 import math
+import numpy as np
 import pandas as pd
+from pandas.api.indexers import BaseIndexer
 
 # =========================
 # Config
@@ -130,16 +132,84 @@ def _sigmoid(x: float) -> float:
     return 1.0 / (1.0 + math.exp(-x))
 
 
+def _sigmoid_series(series: pd.Series) -> pd.Series:
+    """_sigmoid 의 배열 버전 (원소별 .map 호출 없음)"""
+    return pd.Series(1.0 / (1.0 + np.exp(-series.to_numpy(dtype=float))), index=series.index)
+
+
 # =========================
 # Features
 # =========================
 
+class _GroupWindowIndexer(BaseIndexer):
+    """
+    종목 경계를 넘지 않는 고정 길이 rolling 창
+
+    정렬된 패널 전체에 rolling 을 1회 실행 (종목별 lambda 호출 없음)
+    창 시작 = max(i + 1 - window_size, 종목 첫 행) → 종목별 rolling(window_size) 와 같은 창
+    """
+
+    def get_window_bounds(self, num_values=0, min_periods=None, center=None, closed=None, step=None):
+        end = np.arange(1, num_values + 1, dtype=np.int64)
+        start = np.maximum(end - self.window_size, self.group_start[:num_values])
+        return start, end
+
+
+class _SymbolPanel:
+    """
+    (symbol, date) 정렬된 패널의 종목 경계 (1회 계산 후 모든 피처에서 재사용)
+
+    - group_start: 각 행이 속한 종목의 첫 행 위치
+    - pos: 종목 내 순번 (0부터)
+    """
+
+    def __init__(self, symbols: np.ndarray):
+        n = len(symbols)
+        is_start = np.ones(n, dtype=bool)
+        if n > 1:
+            is_start[1:] = symbols[1:] != symbols[:-1]
+        rows = np.arange(n, dtype=np.int64)
+        self.group_start = np.maximum.accumulate(np.where(is_start, rows, 0)) if n else rows
+        self.pos = rows - self.group_start
+
+    def rolling(self, values: pd.Series, window: int):
+        return values.rolling(
+            _GroupWindowIndexer(window_size=window, group_start=self.group_start),
+            min_periods=1,
+        )
+
+    def shift(self, values: np.ndarray, periods: int) -> np.ndarray:
+        """종목 내 periods 행 이전 값 (없으면 NaN)"""
+        shifted = np.full(len(values), np.nan)
+        if periods < len(values):
+            shifted[periods:] = values[:-periods]
+        shifted[self.pos < periods] = np.nan
+        return shifted
+
+    def pct_change(self, values: np.ndarray, periods: int) -> np.ndarray:
+        """종목 내 pct_change (pandas 와 같이 결측 미보정, 0 으로 나누면 inf)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return values / self.shift(values, periods) - 1.0
+
+
+def _fill_nan(values: np.ndarray, fill: float) -> np.ndarray:
+    return np.where(np.isnan(values), fill, values)
+
+
 def compute_features(df: pd.DataFrame, cfg: SelectorConfig, lookback: int = 20) -> pd.DataFrame:
+    """
+    종목별 rolling/shift/pct_change 피처 계산
+
+    (symbol, date) 로 한 번 정렬한 뒤 종목 경계만 계산해서
+    모든 피처를 패널 전체 벡터 연산으로 처리 (groupby + lambda 반복 없음)
+    """
     df = df.sort_values(["symbol", "date"]).copy()
+    panel = _SymbolPanel(df["symbol"].to_numpy())
 
-    df["vol_avg"] = df.groupby("symbol")["volume"].transform(
-        lambda s: s.rolling(lookback, min_periods=1).mean()
-    )
+    close = df["close"].astype(float)
+    close_values = close.to_numpy()
+
+    df["vol_avg"] = panel.rolling(df["volume"].astype(float), lookback).mean().to_numpy()
 
     # 일중 변동성: (고가 - 저가) ÷ 시가 (설계 기준)
     df["intraday_volatility"] = (df["high"] - df["low"]) / df["open"].replace(0, pd.NA)
@@ -151,56 +221,38 @@ def compute_features(df: pd.DataFrame, cfg: SelectorConfig, lookback: int = 20)
     ).fillna(1.0)
 
     N = cfg.struct_trend_days
-    df["trend"] = df.groupby("symbol")["close"].transform(
-        lambda s: s.pct_change(N).fillna(0.0)
-    )
+    df["trend"] = _fill_nan(panel.pct_change(close_values, N), 0.0)
 
     # 이동평균 계산 (단/중/장기)
-    df["ma5"] = df.groupby("symbol")["close"].transform(
-        lambda s: s.rolling(5, min_periods=1).mean()
-    )
-    df["ma20"] = df.groupby("symbol")["close"].transform(
-        lambda s: s.rolling(20, min_periods=1).mean()
-    )
-    df["ma60"] = df.groupby("symbol")["close"].transform(
-        lambda s: s.rolling(60, min_periods=1).mean()
-    )
-    
+    ma5 = panel.rolling(close, 5).mean().to_numpy()
+    df["ma5"] = ma5
+    ma20 = panel.rolling(close, 20).mean().to_numpy()
+    df["ma20"] = ma20
+    df["ma60"] = panel.rolling(close, 60).mean().to_numpy()
+
     # MA 기울기 (전일 대비 변화율)
-    df["ma5_slope"] = df.groupby("symbol")["ma5"].transform(
-        lambda s: s.pct_change(1).fillna(0.0)
-    )
-    df["ma20_slope"] = df.groupby("symbol")["ma20"].transform(
-        lambda s: s.pct_change(1).fillna(0.0)
-    )
-    
+    df["ma5_slope"] = _fill_nan(panel.pct_change(ma5, 1), 0.0)
+    df["ma20_slope"] = _fill_nan(panel.pct_change(ma20, 1), 0.0)
+
     # MA 밀집도 (MA 간 거리)
     df["ma_spread"] = (
         (df["ma5"] - df["ma20"]).abs() / df["close"].replace(0, pd.NA)
     ).fillna(0.0)
-    
+
     df["above_ma5"] = (df["close"] > df["ma5"]).astype(int)
-    df["clean"] = df.groupby("symbol")["above_ma5"].transform(
-        lambda s: s.rolling(5, min_periods=1).mean().fillna(0.5)
-    )
-    
+    df["clean"] = panel.rolling(df["above_ma5"].astype(float), 5).mean().fillna(0.5).to_numpy()
+
     # 고점/저점 구조 (Higher Low, 고점 갱신)
-    df["higher_low"] = df.groupby("symbol")["low"].transform(
-        lambda s: (s > s.shift(1)).fillna(False).astype(int)
-    )
-    df["new_high"] = df.groupby("symbol")["high"].transform(
-        lambda s: (s >= s.rolling(20, min_periods=1).max()).fillna(False).astype(int)
-    )
-    
+    low_values = df["low"].astype(float).to_numpy()
+    df["higher_low"] = (low_values > panel.shift(low_values, 1)).astype(int)
+    high = df["high"].astype(float)
+    df["new_high"] = (high.to_numpy() >= panel.rolling(high, 20).max().to_numpy()).astype(int)
+
     # 장대 음봉 체크 (전일 대비 하락률 > 5%)
-    df["big_red_candle"] = df.groupby("symbol")["close"].transform(
-        lambda s: (s.pct_change(1) < -0.05).fillna(False).astype(int)
-    )
-    
+    df["big_red_candle"] = (panel.pct_change(close_values, 1) < -0.05).astype(int)
+
     # 단기 과열 체크 (RSI 유사 지표: 최근 5일 상승률)
-    df["short_term_overheat"] = df.groupby("symbol")["close"].transform(
-        lambda s: (s.pct_change(5) > 0.15).fillna(False).astype(int)
-    )
+    df["short_term_overheat"] = (panel.pct_change(close_values, 5) > 0.15).astype(int)
 
     return df
 
@@ -209,17 +261,36 @@ def compute_features(df: pd.DataFrame, cfg: SelectorConfig, lookback: int = 20)
 # Scoring
 # =========================
 
-def score_volume(latest: pd.DataFrame, cfg: SelectorConfig) -> pd.Series:
-    z_turn = _z_norm(latest["turnover_krw"].fillna(0)).map(_sigmoid)
-    z_spike = _z_norm(latest["vol_spike_ratio"]).map(_sigmoid)
+def _turnover_sigmoid(latest: pd.DataFrame) -> pd.Series:
+    return _sigmoid_series(_z_norm(latest["turnover_krw"].fillna(0)))
+
+
+def volume_components(latest: pd.DataFrame) -> Dict[str, pd.Series]:
+    """
+    거래량형 점수의 가중치 적용 전 구성요소 (설정 무관)
+
+    같은 universe 를 쓰는 여러 SelectorConfig 에서 1회만 계산
+    """
     # 일중 변동성 사용 (시가 기준, 없으면 종가 기준 fallback)
     vola_col = latest.get("intraday_volatility", latest.get("hlc_volatility", pd.Series(0.0, index=latest.index)))
-    z_vola = _z_norm(vola_col.fillna(0)).map(_sigmoid)
+    return {
+        "turnover": _turnover_sigmoid(latest),
+        "vol_spike": _sigmoid_series(_z_norm(latest["vol_spike_ratio"])),
+        "volatility": _sigmoid_series(_z_norm(vola_col.fillna(0))),
+    }
+
+
+def score_volume(
+    latest: pd.DataFrame,
+    cfg: SelectorConfig,
+    components: Optional[Dict[str, pd.Series]] = None,
+) -> pd.Series:
+    comp = components if components is not None else volume_components(latest)
 
     score = (
-        cfg.w_turnover * z_turn +
-        cfg.w_vol_spike * z_spike +
-        cfg.w_volatility * z_vola
+        cfg.w_turnover * comp["turnover"] +
+        cfg.w_vol_spike * comp["vol_spike"] +
+        cfg.w_volatility * comp["volatility"]
     )
 
     if cfg.phase == "normal":
@@ -355,9 +426,15 @@ def score_structure(latest: pd.DataFrame, cfg: SelectorConfig) -> pd.Series:
     return scores
 
 
-def score_theme(latest: pd.DataFrame, theme_score: pd.Series, cfg: SelectorConfig) -> pd.Series:
+def score_theme(
+    latest: pd.DataFrame,
+    theme_score: pd.Series,
+    cfg: SelectorConfig,
+    z_turn: Optional[pd.Series] = None,
+) -> pd.Series:
     ts = theme_score.fillna(0).clip(0, 1)
-    z_turn = _z_norm(latest["turnover_krw"].fillna(0)).map(_sigmoid)
+    if z_turn is None:
+        z_turn = _turnover_sigmoid(latest)
 
     score = (cfg.w_theme * ts + cfg.w_theme_turnover * z_turn).clip(0, 1)
 
@@ -543,10 +620,13 @@ def select_watchlist(
     cfg: SelectorConfig,
     largecap_symbols: List[str],
     theme_score_map: Optional[Dict[str, float]] = None,
+    latest: Optional[pd.DataFrame] = None,
 ) -> Dict[str, List[Dict]]:
 
-    df_feat = compute_features(df, cfg)
-    latest = df_feat.groupby("symbol", as_index=False).tail(1).set_index("symbol")
+    # latest: 종목별 마지막 행 피처 (feature_state 증분 상태), 없으면 전체 재계산
+    if latest is None:
+        df_feat = compute_features(df, cfg)
+        latest = df_feat.groupby("symbol", as_index=False).tail(1).set_index("symbol")
 
     # ============================================================
     # [단계 1] Gate Filter (입구 필터)
@@ -585,6 +665,63 @@ def select_watchlist(
     # 구조형: 구조 점수(0~100점) 사용, 그랜빌 법칙은 보조 요소로만 사용
     universe = primary_filtered
 
+    # ============================================================
+    # [Secondary Filter] 버킷별 점수 계산
+    # ============================================================
+    # volume 버킷: 거래량형 점수 계산
+    vol_scores = score_volume(universe, cfg)
+    
+    # structure 버킷: 구조형 점수 계산 (0~100점)
+    # 중요: 구조 점수는 우선순위 결정용, 탈락 기준으로 사용 금지
+    struct_scores = score_structure(universe, cfg)
+
+    theme_score_map = theme_score_map or {}
+    theme_series = build_theme_series(universe, theme_score_map)
+    theme_scores = score_theme(universe, theme_series, cfg)
+
+    return pick_watchlist(
+        latest,
+        universe,
+        cfg=cfg,
+        largecap_symbols=largecap_symbols,
+        theme_score_map=theme_score_map,
+        theme_series=theme_series,
+        vol_scores=vol_scores,
+        struct_scores=struct_scores,
+        theme_scores=theme_scores,
+    )
+
+
+def build_theme_series(universe: pd.DataFrame, theme_score_map: Dict) -> pd.Series:
+    """theme_score_map({symbol: float} 또는 {symbol: {score, sources}}) → universe 종목별 테마 점수"""
+    # theme_score_map이 {symbol: {score: float, sources: List[str]}} 형태일 수 있음
+    return pd.Series({
+        s: (
+            theme_score_map[s]["score"] 
+            if isinstance(theme_score_map.get(s), dict) and "score" in theme_score_map[s]
+            else (theme_score_map.get(s) if isinstance(theme_score_map.get(s), (int, float)) else 0.0)
+        )
+        for s in universe.index
+    })
+
+
+def pick_watchlist(
+    latest: pd.DataFrame,
+    universe: pd.DataFrame,
+    *,
+    cfg: SelectorConfig,
+    largecap_symbols: List[str],
+    theme_score_map: Dict,
+    theme_series: pd.Series,
+    vol_scores: pd.Series,
+    struct_scores: pd.Series,
+    theme_scores: pd.Series,
+) -> Dict[str, List[Dict]]:
+    """
+    버킷별 점수 → 대형주/거래량형/구조형/테마형 선정 + 최종 압축
+
+    select_watchlist 와 multi_selector(여러 설정 일괄 평가) 가 공유
+    """
     largecap = []
     for s in largecap_symbols:
         if s not in latest.index:
@@ -611,28 +748,6 @@ def select_watchlist(
         })
     picked = {item["symbol"] for item in largecap}
 
-    # ============================================================
-    # [Secondary Filter] 버킷별 점수 계산
-    # ============================================================
-    # volume 버킷: 거래량형 점수 계산
-    vol_scores = score_volume(universe, cfg)
-    
-    # structure 버킷: 구조형 점수 계산 (0~100점)
-    # 중요: 구조 점수는 우선순위 결정용, 탈락 기준으로 사용 금지
-    struct_scores = score_structure(universe, cfg)
-
-    theme_score_map = theme_score_map or {}
-    # theme_score_map이 {symbol: {score: float, sources: List[str]}} 형태일 수 있음
-    theme_series = pd.Series({
-        s: (
-            theme_score_map[s]["score"] 
-            if isinstance(theme_score_map.get(s), dict) and "score" in theme_score_map[s]
-            else (theme_score_map.get(s) if isinstance(theme_score_map.get(s), (int, float)) else 0.0)
-        )
-        for s in universe.index
-    })
-    theme_scores = score_theme(universe, theme_series, cfg)
-
     def _pick_volume(scores: pd.Series, k: int):
         """거래량 기반 선정 (상세 이유 포함)"""
         out = []
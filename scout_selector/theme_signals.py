@@ -7,11 +7,24 @@ Theme Score 신호 수집 (최소 버전)
 (A) 조건검색식 포함 여부
 (B) 뉴스 키워드 히트 수
 (C) 테마 군 동시 상승
+
+여러 종목을 점수화할 때는 build_theme_signal_index() 로 신호 인덱스를 1회 만들어 재사용
+(뉴스 히트 1회 로드, 종목 → 테마 역인덱스, 테마별 상승 종목 수 1회 계산)
 """
+import json
+from dataclasses import dataclass, field
 from typing import Dict, List, Set, Optional
 from pathlib import Path
 import pandas as pd
 
+NEWS_HITS_FILE = Path(__file__).parent / "data" / "news_hits.json"
+
+THEME_RISE_PCT = 0.03       # 테마 종목 상승 기준 (+3%)
+THEME_RISE_MIN_COUNT = 3    # 같은 테마 상승 종목 수 기준
+
+# news_hits.json 캐시: (경로, mtime) 가 같으면 재사용
+_NEWS_HITS_CACHE: Dict[str, tuple] = {}
+
 
 # ===============================
 # (A) 조건검색식 포함 여부
@@ -70,39 +83,170 @@ def get_condition_hit_list() -> Set[str]:
 # ===============================
 # (B) 뉴스 키워드 히트 수
 # ===============================
-def get_news_hit_count(symbol: str) -> int:
+def load_news_hits(news_file: Optional[Path] = None) -> Dict[str, int]:
     """
-    종목의 뉴스 키워드 히트 수 반환
+    뉴스 키워드 히트 수 전체 로드 (파일 변경 시에만 다시 읽음)
     
     Args:
-        symbol: 종목 코드
+        news_file: 뉴스 히트 파일 (기본: scout_selector/data/news_hits.json)
     
     Returns:
-        뉴스 히트 수 (0 이상)
+        {symbol: 히트 수} 딕셔너리 (파일 없거나 오류 시 빈 딕셔너리)
     """
     # TODO: 실제 뉴스 API 연동
     # 현재는 파일 기반으로 구현 (선택적)
+    news_file = Path(news_file) if news_file else NEWS_HITS_FILE
     try:
-        # scout_selector/data/news_hits.json
-        news_file = Path(__file__).parent / "data" / "news_hits.json"
-        if news_file.exists():
-            import json
-            with open(news_file, "r", encoding="utf-8") as f:
-                news_data = json.load(f)
-                return news_data.get(symbol, 0)
+        mtime = news_file.stat().st_mtime_ns
+    except OSError:
+        return {}
+    
+    key = str(news_file)
+    cached = _NEWS_HITS_CACHE.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    try:
+        with open(news_file, "r", encoding="utf-8") as f:
+            news_data = json.load(f)
     except Exception:
-        pass
+        return {}
+    if not isinstance(news_data, dict):
+        news_data = {}
+    _NEWS_HITS_CACHE[key] = (mtime, news_data)
+    return news_data
+
+
+def get_news_hit_count(symbol: str, news_hits: Optional[Dict[str, int]] = None) -> int:
+    """
+    종목의 뉴스 키워드 히트 수 반환
+    
+    Args:
+        symbol: 종목 코드
+        news_hits: load_news_hits() 결과 (None 이면 캐시된 파일 내용 사용)
     
-    return 0
+    Returns:
+        뉴스 히트 수 (0 이상)
+    """
+    if news_hits is None:
+        news_hits = load_news_hits()
+    return news_hits.get(symbol, 0)
 
 
 # ===============================
 # (C) 테마 군 동시 상승
 # ===============================
+def build_symbol_theme_index(theme_groups: Optional[Dict[str, List[str]]]) -> Dict[str, List[str]]:
+    """
+    종목 → 소속 테마 역인덱스
+    
+    Args:
+        theme_groups: 테마 그룹 딕셔너리 {theme_name: [symbols]}
+    
+    Returns:
+        {symbol: [theme_name]} (테마 순서 유지)
+    """
+    symbol_themes: Dict[str, List[str]] = {}
+    for theme, symbols in (theme_groups or {}).items():
+        for sym in dict.fromkeys(symbols):
+            symbol_themes.setdefault(sym, []).append(theme)
+    return symbol_themes
+
+
+def count_theme_rises(
+    latest: pd.DataFrame,
+    theme_groups: Optional[Dict[str, List[str]]],
+    rise_pct: float = THEME_RISE_PCT,
+) -> Dict[str, int]:
+    """
+    테마별 상승 종목 수 (latest 1회 벡터 연산)
+    
+    전일 대비 상승률 대신 5일 추세(trend)로 대체 (간단 버전)
+    
+    Args:
+        latest: 최신 데이터 DataFrame (symbol 인덱스)
+        theme_groups: 테마 그룹 딕셔너리
+        rise_pct: 상승 기준
+    
+    Returns:
+        {theme_name: 상승 종목 수}
+    """
+    theme_groups = theme_groups or {}
+    if not theme_groups:
+        return {}
+    
+    if "trend" in latest.columns:
+        trend = pd.to_numeric(latest["trend"], errors="coerce")
+        trend = trend[~trend.index.duplicated(keep="last")]
+        rising = trend.ge(rise_pct)
+    else:
+        rising = pd.Series(False, index=latest.index.unique())
+    
+    members = pd.Series(
+        [sym for symbols in theme_groups.values() for sym in symbols],
+        index=[theme for theme, symbols in theme_groups.items() for _ in symbols],
+        dtype=object,
+    )
+    hits = members.map(rising).fillna(False).astype(bool)
+    counts = hits.groupby(level=0, sort=False).sum()
+    return {theme: int(counts.get(theme, 0)) for theme in theme_groups}
+
+
+@dataclass
+class ThemeSignalIndex:
+    """
+    실행당 1회 만드는 Theme 신호 인덱스
+    
+    - condition_hits: 조건검색식 포함 종목
+    - news_hits: 종목별 뉴스 히트 수
+    - symbol_themes: 종목 → 소속 테마
+    - theme_rise_counts: 테마별 상승 종목 수
+    """
+    condition_hits: Set[str] = field(default_factory=set)
+    news_hits: Dict[str, int] = field(default_factory=dict)
+    symbol_themes: Dict[str, List[str]] = field(default_factory=dict)
+    theme_rise_counts: Dict[str, int] = field(default_factory=dict)
+    min_rise_count: int = THEME_RISE_MIN_COUNT
+
+    def news_count(self, symbol: str) -> int:
+        return self.news_hits.get(symbol, 0)
+
+    def group_rise(self, symbol: str) -> bool:
+        """소속 테마 중 하나라도 상승 종목 수가 기준 이상인지"""
+        return any(
+            self.theme_rise_counts.get(theme, 0) >= self.min_rise_count
+            for theme in self.symbol_themes.get(symbol, ())
+        )
+
+
+def build_theme_signal_index(
+    latest: pd.DataFrame,
+    theme_groups: Optional[Dict[str, List[str]]] = None,
+    condition_hit_list: Optional[Set[str]] = None,
+    news_hits: Optional[Dict[str, int]] = None,
+) -> ThemeSignalIndex:
+    """
+    Theme 신호 인덱스 생성 (O(종목 + 테마 소속 수))
+    
+    Args:
+        latest: 최신 데이터 DataFrame (symbol 인덱스)
+        theme_groups: 테마 그룹 딕셔너리
+        condition_hit_list: 조건검색식 포함 종목 (None 이면 get_condition_hit_list())
+        news_hits: 뉴스 히트 수 (None 이면 load_news_hits())
+    """
+    return ThemeSignalIndex(
+        condition_hits=set(condition_hit_list) if condition_hit_list is not None else get_condition_hit_list(),
+        news_hits=news_hits if news_hits is not None else load_news_hits(),
+        symbol_themes=build_symbol_theme_index(theme_groups),
+        theme_rise_counts=count_theme_rises(latest, theme_groups),
+    )
+
+
 def check_theme_group_rise(
     symbol: str,
     latest: pd.DataFrame,
     theme_groups: Optional[Dict[str, List[str]]] = None,
+    index: Optional[ThemeSignalIndex] = None,
 ) -> bool:
     """
     테마 군 동시 상승 확인
@@ -113,46 +257,21 @@ def check_theme_group_rise(
         symbol: 종목 코드
         latest: 최신 데이터 DataFrame (symbol 인덱스)
         theme_groups: 테마 그룹 딕셔너리 {theme_name: [symbols]}
+        index: build_theme_signal_index() 결과 (있으면 재계산 없이 조회)
     
     Returns:
         테마 군 동시 상승 여부
     """
-    if theme_groups is None:
-        # 기본 테마 그룹 (예시)
-        theme_groups = {}
-    
-    # symbol이 속한 테마 찾기
-    symbol_themes = [
-        theme for theme, symbols in theme_groups.items()
-        if symbol in symbols
-    ]
+    if index is not None:
+        return index.group_rise(symbol)
     
+    # symbol이 속한 테마만 계산
+    symbol_themes = build_symbol_theme_index(theme_groups).get(symbol)
     if not symbol_themes:
         return False
     
-    # 각 테마에서 상승 종목 수 확인
-    for theme in symbol_themes:
-        theme_symbols = theme_groups[theme]
-        
-        # 최신 데이터에서 상승 종목 확인
-        rise_count = 0
-        for sym in theme_symbols:
-            if sym not in latest.index:
-                continue
-            
-            row = latest.loc[sym]
-            # 전일 대비 상승률 계산 (간단 버전)
-            # 실제로는 전일 종가와 비교해야 함
-            # 여기서는 hlc_volatility나 trend로 대체
-            change_pct = row.get("trend", 0)  # 5일 추세로 대체
-            if change_pct >= 0.03:  # +3% 이상
-                rise_count += 1
-        
-        # 같은 테마 종목 3개 이상 상승
-        if rise_count >= 3:
-            return True
-    
-    return False
+    rise_counts = count_theme_rises(latest, {theme: theme_groups[theme] for theme in symbol_themes})
+    return any(count >= THEME_RISE_MIN_COUNT for count in rise_counts.values())
 
 
 # ===============================
@@ -163,6 +282,7 @@ def compute_theme_score_minimal(
     latest: pd.DataFrame,
     condition_hit_list: Set[str],
     theme_groups: Optional[Dict[str, List[str]]] = None,
+    index: Optional[ThemeSignalIndex] = None,
 ) -> float:
     """
     최소 버전 Theme Score 계산
@@ -177,6 +297,7 @@ def compute_theme_score_minimal(
         latest: 최신 데이터 DataFrame
         condition_hit_list: 조건검색식 포함 종목 리스트
         theme_groups: 테마 그룹 딕셔너리
+        index: build_theme_signal_index() 결과 (여러 종목 점수화 시 재사용)
     
     Returns:
         Theme Score (0.0 ~ 1.0)
@@ -186,7 +307,7 @@ def compute_theme_score_minimal(
         return 1.0
     
     # (B) 뉴스 키워드 히트 수
-    news_count = get_news_hit_count(symbol)
+    news_count = index.news_count(symbol) if index is not None else get_news_hit_count(symbol)
     if news_count > 0:
         news_score = min(1.0, news_count * 0.3)
         # 뉴스만으로도 충분하면 반환
@@ -195,7 +316,7 @@ def compute_theme_score_minimal(
     
     # (C) 테마 군 동시 상승
     if symbol in latest.index:
-        if check_theme_group_rise(symbol, latest, theme_groups):
+        if check_theme_group_rise(symbol, latest, theme_groups, index=index):
             # 테마 군 상승이 있으면 최소 0.5
             # 뉴스 점수와 합산
             return max(0.5, news_count * 0.3)
@@ -223,19 +344,22 @@ def build_theme_score_map(
     Returns:
         {symbol: theme_score} 딕셔너리
     """
-    condition_hit_list = get_condition_hit_list()
+    # 신호 인덱스 1회 생성 → 종목별 조회는 O(소속 테마 수)
+    index = build_theme_signal_index(latest, theme_groups)
+    latest_symbols = set(latest.index)
     
     theme_score_map = {}
     for symbol in symbols:
-        if symbol not in latest.index:
+        if symbol not in latest_symbols:
             theme_score_map[symbol] = 0.0
             continue
         
         score = compute_theme_score_minimal(
             symbol,
             latest,
-            condition_hit_list,
+            index.condition_hits,
             theme_groups,
+            index=index,
         )
         theme_score_map[symbol] = score
     
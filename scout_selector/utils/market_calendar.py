@@ -6,124 +6,456 @@
 거래일/휴장일 판단 모듈
 
 역할:
-- 특정 날짜가 거래일인지 휴장일인지 판단
-- pykrx 기반 판단 (우선순위 1)
-- 주말 체크 (우선순위 2)
-- 데이터 파일 존재 여부 (우선순위 3, fallback)
+- 연도별 KRX 거래일 목록을 1회 만들어 저장 → 이후 판단은 메모리 정렬 배열 조회 (bisect, 네트워크 없음)
+- is_market_open / next_trading_day / prev_trading_day / trading_days_between
+
+거래일 목록 구성 (연도 단위):
+1. 기록 구간 (~ 어제): pykrx 삼성전자 일봉 날짜 (KRX 응답 캐시 경유, 연도당 1회 조회)
+   → scout_selector/data/calendar/krx_calendar_YYYY.json 에 저장, 다음 실행부터는 파일만 읽음
+   - 빈 응답 / 최근 거래일이 빠진 응답은 조회 실패로 보고 저장하지 않음
+2. 오늘 (장 마감 후): pykrx 오늘 일봉 조회 (KRX 응답 캐시 TTL 경유) → 행이 있으면 거래일
+3. 예정 구간 (오늘 이후, 또는 pykrx 사용 불가 시 전체): 규칙 기반
+   - 주말, 고정 공휴일(1/1, 3/1, 5/1, 5/5, 6/6, 8/15, 10/3, 10/9, 12/25), 연말 휴장일(연도 마지막 평일) 제외
+   - 휴장일 파일(scout_selector/data/calendar/krx_holidays.txt) 날짜 제외 (설/추석, 대체공휴일, 선거일 등)
+   - 데이터 파일(ohlcv_YYYYMMDD.csv)이 있는 날짜는 거래일로 간주 (fallback)
+
+사용법:
+    from scout_selector.utils.market_calendar import is_market_open, next_trading_day
+    is_market_open("20260107")
+    next_trading_day("20260107")
+
+    python scout_selector/utils/market_calendar.py build --year 2026
+    python scout_selector/utils/market_calendar.py info
 """
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import argparse
+import json
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import datetime, time, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = PROJECT_ROOT / "scout_selector" / "data"
+CALENDAR_DIR = DATA_DIR / "calendar"
+HOLIDAY_FILE = CALENDAR_DIR / "krx_holidays.txt"
+
+# 거래일 판단 기준 종목 (삼성전자)
+REFERENCE_SYMBOL = "005930"
+
+# 매년 휴장 (양력 고정 공휴일 + 근로자의 날)
+FIXED_HOLIDAYS = ("0101", "0301", "0501", "0505", "0606", "0815", "1003", "1009", "1225")
+
+MIN_YEAR, MAX_YEAR = 1990, 2100
+
+# 오늘 거래 여부를 pykrx 로 확인하는 시각 (정규장 마감)
+MARKET_CLOSE_TIME = time(15, 30)
+
+# 기록 응답 검증: 마지막 기록 거래일이 규칙상 최근 N 거래일 안에 있어야 함
+RECENT_TRADING_DAYS = 5
+
+# next_day / prev_day 탐색 범위 (연도 수)
+SEARCH_YEARS = 2
+
+
+def _normalize(date: Optional[str]) -> str:
+    """YYYYMMDD / YYYY-MM-DD → YYYYMMDD (None 이면 오늘), 형식 오류 시 ValueError"""
+    if date is None:
+        return datetime.now().strftime("%Y%m%d")
+    text = str(date).replace("-", "")[:8]
+    datetime.strptime(text, "%Y%m%d")
+    return text
+
+
+def load_holidays(path: Optional[Path] = None) -> Set[str]:
+    """
+    휴장일 파일 로드 (한 줄에 하나, YYYYMMDD 또는 YYYY-MM-DD, # 주석)
+
+    Returns:
+        휴장일 set (파일 없으면 빈 set)
+    """
+    path = Path(path) if path else HOLIDAY_FILE
+    holidays: Set[str] = set()
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                text = line.split("#", 1)[0].strip()
+                if not text:
+                    continue
+                try:
+                    holidays.add(_normalize(text))
+                except ValueError:
+                    print(f"⚠️ 휴장일 파일 형식 오류 무시: {text}")
+    except FileNotFoundError:
+        pass
+    return holidays
+
+
+def rule_trading_days(year: int, holidays: Set[str]) -> List[str]:
+    """규칙 기반 거래일 (주말/고정 공휴일/연말 휴장일/휴장일 파일 제외)"""
+    day = datetime(year, 1, 1)
+    weekdays = []
+    while day.year == year:
+        if day.weekday() < 5:
+            weekdays.append(day.strftime("%Y%m%d"))
+        day += timedelta(days=1)
+
+    # 연말 휴장일: 연도 마지막 평일
+    closed = set(holidays) | {f"{year}{mmdd}" for mmdd in FIXED_HOLIDAYS} | {weekdays[-1]}
+    return [d for d in weekdays if d not in closed]
+
+
+# ===============================
+# 거래일 캘린더
+# ===============================
+class TradingCalendar:
+    """
+    KRX 거래일 캘린더 (필요한 연도만 1회 로드, 조회는 정렬 배열 bisect / set)
+
+    Args:
+        calendar_dir: 연도별 거래일 파일 저장 위치
+        holiday_file: 휴장일 파일
+        fetch: 기록 구간을 pykrx(KRX 응답 캐시)로 갱신할지 여부
+        today: 기준일 (YYYYMMDD, None 이면 오늘)
+    """
+
+    def __init__(
+        self,
+        calendar_dir: Optional[Path] = None,
+        holiday_file: Optional[Path] = None,
+        fetch: bool = True,
+        today: Optional[str] = None,
+    ):
+        self.calendar_dir = Path(calendar_dir) if calendar_dir else CALENDAR_DIR
+        self.holidays = load_holidays(holiday_file)
+        self.fetch = fetch
+        self.today = _normalize(today)
+        self.years: Dict[int, Dict] = {}
+        self._days: List[str] = []
+        self._day_set: Set[str] = set()
+        self._csv_days: Optional[Set[str]] = None
+        self._today_resolved = False
+
+    # ---------------------------
+    # 연도 로드
+    # ---------------------------
+    def _year_path(self, year: int) -> Path:
+        return self.calendar_dir / f"krx_calendar_{year}.json"
+
+    def _load_recorded(self, year: int) -> Optional[Dict]:
+        try:
+            with open(self._year_path(year), "r", encoding="utf-8") as f:
+                recorded = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not self._is_complete(year, recorded.get("trading_days", []), recorded.get("recorded_until", "")):
+            print(f"⚠️ 거래일 캘린더 기록 불완전 → 무시: {self._year_path(year).name}")
+            return None
+        return recorded
+
+    def _is_complete(self, year: int, days: List[str], until: str) -> bool:
+        """
+        기록 거래일 검증 (빈 기록 / 최근 거래일 누락 = 조회 실패)
+
+        규칙상 until 까지 거래일이 있는데 기록이 비었거나,
+        마지막 기록일이 규칙상 최근 RECENT_TRADING_DAYS 거래일보다 이전이면 False
+        """
+        expected = [d for d in rule_trading_days(year, self.holidays) if d <= until]
+        if not expected:
+            return True
+        if not days:
+            return False
+        return max(days) >= expected[-min(len(expected), RECENT_TRADING_DAYS)]
+
+    def _save_recorded(self, year: int, recorded: Dict) -> None:
+        """원자적 저장 (tmp → replace)"""
+        self.calendar_dir.mkdir(parents=True, exist_ok=True)
+        path = self._year_path(year)
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(recorded, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+
+    def _fetch_recorded(self, year: int, until: str) -> Optional[Dict]:
+        """pykrx 기준 종목 일봉 날짜 = 거래일 (연도 시작 ~ until)"""
+        try:
+            from test.daily_scan.data.krx_source import get_source
+
+            df = get_source().get_market_ohlcv_by_date(f"{year}0101", until, REFERENCE_SYMBOL)
+        except Exception:
+            # pykrx 없음 / 네트워크 오류 / replay 누락 → 규칙 기반
+            return None
+        if df is None:
+            return None
+        days = sorted({d.strftime("%Y%m%d") for d in df.index})
+        if not self._is_complete(year, days, until):
+            print(f"⚠️ 거래일 조회 결과 불완전 ({year}, {len(days)}일, ~{until}) → 저장하지 않음")
+            return None
+        return {
+            "year": year,
+            "recorded_until": until,
+            "trading_days": days,
+            "source": "pykrx",
+            "built_at": datetime.now().isoformat(),
+        }
+
+    def _recorded_year(self, year: int) -> Optional[Dict]:
+        """저장된 기록 구간 (어제까지 기록되지 않았으면 pykrx 로 1회 갱신)"""
+        recorded = self._load_recorded(year)
+        yesterday = (datetime.strptime(self.today, "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d")
+        until = min(yesterday, f"{year}1231")
+        if until < f"{year}0101":
+            return recorded  # 미래 연도: 기록 없음
+
+        if self.fetch and (recorded is None or recorded.get("recorded_until", "") < until):
+            fetched = self._fetch_recorded(year, until)
+            if fetched is not None:
+                try:
+                    self._save_recorded(year, fetched)
+                except OSError as e:
+                    print(f"⚠️ 거래일 캘린더 저장 실패: {e}")
+                recorded = fetched
+        return recorded
+
+    def _fallback_days(self) -> Set[str]:
+        """데이터 파일(ohlcv_YYYYMMDD.csv)이 있는 날짜"""
+        if self._csv_days is None:
+            self._csv_days = {p.stem[len("ohlcv_"):] for p in DATA_DIR.glob("ohlcv_????????.csv")}
+        return self._csv_days
+
+    def build_year(self, year: int) -> Dict:
+        """연도 거래일 목록 (기록 구간 + 규칙 기반 예정 구간)"""
+        recorded = self._recorded_year(year)
+        recorded_until = recorded["recorded_until"] if recorded else ""
+        recorded_days = [d for d in (recorded or {}).get("trading_days", []) if d <= recorded_until]
+
+        projected = [d for d in rule_trading_days(year, self.holidays) if d > recorded_until]
+        extra = [d for d in self._fallback_days() if d[:4] == str(year) and d > recorded_until]
+        days = sorted(set(recorded_days) | set(projected) | set(extra))
+        return {
+            "year": year,
+            "days": days,
+            "recorded_until": recorded_until or None,
+            "source": recorded.get("source", "rules") if recorded else "rules",
+        }
+
+    def _lookup_today(self) -> Optional[bool]:
+        """
+        오늘 거래 여부 (pykrx 오늘 일봉 조회, KRX 응답 캐시 TTL 경유)
+
+        Returns:
+            True/False: 조회 결과, None: 조회 불가 (규칙 사용)
+        """
+        try:
+            from test.daily_scan.data.krx_source import get_source
 
+            df = get_source().get_market_ohlcv_by_date(self.today, self.today, REFERENCE_SYMBOL)
+        except Exception:
+            return None
+        if df is None:
+            return None
+        if "거래량" in getattr(df, "columns", []):
+            df = df[df["거래량"] > 0]
+        return not df.empty
+
+    def _resolve_today(self) -> None:
+        """오늘 거래 여부를 pykrx 조회 결과로 반영 (장 마감 후 1회, 조회 불가 시 규칙 유지)"""
+        if self._today_resolved or not self.fetch:
+            return
+        close = datetime.strptime(self.today, "%Y%m%d").replace(
+            hour=MARKET_CLOSE_TIME.hour, minute=MARKET_CLOSE_TIME.minute
+        )
+        if datetime.now() < close:
+            return
+        self._today_resolved = True
+        is_open = self._lookup_today()
+        if is_open is None or is_open == (self.today in self._day_set):
+            return
+        if is_open:
+            self._day_set.add(self.today)
+        else:
+            print(f"⚠️ {self.today}: 규칙상 거래일이나 KRX 조회 결과 휴장 → 휴장일 파일 확인 필요")
+            self._day_set.discard(self.today)
+        self._days = sorted(self._day_set)
+
+    def ensure_year(self, year: int) -> None:
+        if year in self.years:
+            return
+        if not (MIN_YEAR <= year <= MAX_YEAR):
+            raise ValueError(f"지원하지 않는 연도: {year}")
+        built = self.build_year(year)
+        self.years[year] = built
+        self._day_set.update(built["days"])
+        self._days = sorted(self._day_set)
+
+    def _ensure_resolved(self, year: int) -> None:
+        """연도 로드 + 오늘이 속한 연도면 오늘 거래 여부 반영"""
+        self.ensure_year(year)
+        if year == int(self.today[:4]):
+            self._resolve_today()
+
+    # ---------------------------
+    # 조회
+    # ---------------------------
+    def is_open(self, date: Optional[str] = None) -> bool:
+        date = _normalize(date)
+        self._ensure_resolved(int(date[:4]))
+        return date in self._day_set
+
+    def next_day(self, date: Optional[str] = None) -> str:
+        """date 다음 거래일 (date 제외, SEARCH_YEARS 년 내 없으면 ValueError)"""
+        date = _normalize(date)
+        start = int(date[:4])
+        for year in range(start, start + SEARCH_YEARS):
+            self._ensure_resolved(year)
+            i = bisect_right(self._days, date)
+            if i < len(self._days) and self._days[i][:4] == str(year):
+                return self._days[i]
+        raise ValueError(f"{date} 이후 {SEARCH_YEARS}년 내 거래일 없음 (캘린더 기록 확인 필요)")
+
+    def prev_day(self, date: Optional[str] = None) -> str:
+        """date 이전 거래일 (date 제외, SEARCH_YEARS 년 내 없으면 ValueError)"""
+        date = _normalize(date)
+        start = int(date[:4])
+        for year in range(start, start - SEARCH_YEARS, -1):
+            self._ensure_resolved(year)
+            i = bisect_left(self._days, date)
+            if i > 0 and self._days[i - 1][:4] == str(year):
+                return self._days[i - 1]
+        raise ValueError(f"{date} 이전 {SEARCH_YEARS}년 내 거래일 없음 (캘린더 기록 확인 필요)")
+
+    def days_between(self, start: str, end: str) -> List[str]:
+        """start ~ end (양끝 포함) 거래일 목록"""
+        start, end = _normalize(start), _normalize(end)
+        for year in range(int(start[:4]), int(end[:4]) + 1):
+            self._ensure_resolved(year)
+        return self._days[bisect_left(self._days, start):bisect_right(self._days, end)]
+
+    def info(self) -> Dict:
+        return {
+            "calendar_dir": str(self.calendar_dir),
+            "holidays": len(self.holidays),
+            "years": {
+                year: {
+                    "days": len(built["days"]),
+                    "recorded_until": built["recorded_until"],
+                    "source": built["source"],
+                }
+                for year, built in sorted(self.years.items())
+            },
+        }
+
+
+_default_calendar: Optional[TradingCalendar] = None
+
+
+def get_calendar() -> TradingCalendar:
+    """프로세스 기본 캘린더 (1회 생성)"""
+    global _default_calendar
+    if _default_calendar is None:
+        _default_calendar = TradingCalendar()
+    return _default_calendar
 
+
+def set_calendar(calendar: Optional[TradingCalendar]) -> None:
+    """기본 캘린더 교체 (None 이면 다음 호출 시 재생성)"""
+    global _default_calendar
+    _default_calendar = calendar
+
+
+# ===============================
+# 함수 API
+# ===============================
 def is_market_open(date: Optional[str] = None) -> bool:
     """
     거래일 여부 판단
-    
+
     Args:
         date: 날짜 (YYYYMMDD, None이면 오늘)
-        
+
     Returns:
         True: 거래일
-        False: 휴장일
+        False: 휴장일 (날짜 형식 오류 포함)
     """
-    if date is None:
-        date = datetime.now().strftime("%Y%m%d")
-    
-    # 날짜 형식 검증
-    if len(date) != 8 or not date.isdigit():
+    if date is not None and (len(date) != 8 or not date.isdigit()):
         return False
-    
-    # ==========================================
-    # 우선순위 1: 주말 체크 (빠른 스킵)
-    # ==========================================
-    try:
-        year = int(date[:4])
-        month = int(date[4:6])
-        day = int(date[6:8])
-        dt = datetime(year, month, day)
-        weekday = dt.weekday()  # 0=월요일, 6=일요일
-        
-        if weekday >= 5:  # 토요일(5) 또는 일요일(6)
-            return False
-    except Exception:
-        pass  # 날짜 파싱 실패 시 다음 단계로
-    
-    # ==========================================
-    # 우선순위 2: pykrx 캘린더 기반 판단
-    # ==========================================
     try:
-        from pykrx import stock
-        
-        # 날짜 형식 변환 (YYYYMMDD -> YYYY-MM-DD)
-        date_str = f"{date[:4]}-{date[4:6]}-{date[6:8]}"
-        
-        # 대형주(삼성전자) 데이터로 거래일 여부 판단
-        # 데이터가 있으면 거래일, 없으면 휴장일
-        df = stock.get_market_ohlcv_by_date(date_str, date_str, "005930")
-        
-        if df is not None and not df.empty and len(df) > 0:
-            return True  # 거래일
-        else:
-            return False  # 휴장일
-    except ImportError:
-        # pykrx가 없으면 다음 단계로
-        pass
-    except Exception:
-        # pykrx 조회 실패 시 다음 단계로
-        pass
-    
-    # ==========================================
-    # 우선순위 3: 데이터 파일 존재 여부 (fallback)
-    # ==========================================
-    try:
-        # 프로젝트 루트 기준으로 scout_selector/data 경로 찾기
-        current_file = Path(__file__).resolve()
-        # scout_selector/utils/market_calendar.py → 프로젝트 루트
-        project_root = current_file.parents[2]
-        data_dir = project_root / "scout_selector" / "data"
-        ohlcv_file = data_dir / f"ohlcv_{date}.csv"
-        
-        # 파일이 존재하면 거래일로 간주
-        if ohlcv_file.exists():
-            return True
-    except Exception:
-        pass
-    
-    # 모든 방법 실패 시 기본값: 휴장일로 간주 (안전한 선택)
-    return False
+        return get_calendar().is_open(date)
+    except ValueError:
+        return False
+
+
+def next_trading_day(date: Optional[str] = None) -> str:
+    """다음 거래일 (YYYYMMDD, date 제외, None이면 오늘 기준)"""
+    return get_calendar().next_day(date)
+
+
+def prev_trading_day(date: Optional[str] = None) -> str:
+    """이전 거래일 (YYYYMMDD, date 제외, None이면 오늘 기준)"""
+    return get_calendar().prev_day(date)
+
+
+def trading_days_between(start: str, end: str) -> List[str]:
+    """start ~ end (양끝 포함) 거래일 목록 (YYYYMMDD)"""
+    return get_calendar().days_between(start, end)
 
 
 def get_next_trading_day(date: Optional[str] = None) -> str:
     """
     다음 거래일 반환
-    
+
     Args:
         date: 기준 날짜 (YYYYMMDD, None이면 오늘)
-        
+
     Returns:
-        다음 거래일 (YYYYMMDD)
+        다음 거래일 (YYYYMMDD), 날짜 형식 오류 시 원본 날짜
     """
-    if date is None:
-        date = datetime.now().strftime("%Y%m%d")
-    
-    # 최대 10일 후까지 탐색
-    for i in range(1, 11):
-        try:
-            year = int(date[:4])
-            month = int(date[4:6])
-            day = int(date[6:8])
-            dt = datetime(year, month, day)
-            next_dt = dt + timedelta(days=i)
-            next_date = next_dt.strftime("%Y%m%d")
-            
-            if is_market_open(next_date):
-                return next_date
-        except Exception:
-            continue
-    
-    # 탐색 실패 시 원본 날짜 반환
-    return date
+    try:
+        return next_trading_day(date)
+    except ValueError:
+        return date
+
+
+# ===============================
+# CLI
+# ===============================
+def main() -> int:
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+
+    parser = argparse.ArgumentParser(description="KRX 거래일 캘린더")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="연도 거래일 기록 (pykrx → krx_calendar_YYYY.json)")
+    p_build.add_argument("--year", type=int, action="append", help="연도 (여러 번 지정 가능, 기본: 올해)")
+    p_info = sub.add_parser("info", help="캘린더 요약")
+    p_info.add_argument("--year", type=int, action="append")
+    p_check = sub.add_parser("check", help="날짜 거래일 여부 / 이전·다음 거래일")
+    p_check.add_argument("date", help="YYYYMMDD")
+
+    args = parser.parse_args()
+    calendar = get_calendar()
+
+    if args.command == "check":
+        date = _normalize(args.date)
+        print(f"📅 {date}: {'거래일' if calendar.is_open(date) else '휴장일'}")
+        print(f"   이전 거래일: {calendar.prev_day(date)}")
+        print(f"   다음 거래일: {calendar.next_day(date)}")
+        return 0
+
+    for year in args.year or [int(calendar.today[:4])]:
+        calendar.ensure_year(year)
+    info = calendar.info()
+    print(f"📊 거래일 캘린더 ({info['calendar_dir']}, 휴장일 파일 {info['holidays']}일)")
+    for year, summary in info["years"].items():
+        print(f"  {year}: {summary['days']}일, 기록 ~{summary['recorded_until'] or '-'} ({summary['source']})")
+    if args.command == "build" and any(s["source"] == "rules" for s in info["years"].values()):
+        print("⚠️ pykrx 기록을 가져오지 못한 연도는 규칙 + 휴장일 파일 기준입니다.")
+    return 0
+
 
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Post-Market Analyzer 단계별 벤치마크
+
+합성 정찰 기록(gen_scout_records) 을 10 / 100 / 1,000 종목 규모로 만들고
+분석 단계별 소요 시간과 peak 메모리(tracemalloc)를 측정합니다.
+
+단계:
+    load_scout_records → aggregate_observers → aggregate_reasons
+    → enhance_cycle_analysis → save (시장 성격 요약 + daily_analysis 저장)
+    + stream_scout_records (스트리밍 1-pass 비교용)
+
+--baseline 으로 이전 결과 JSON 을 주면 --max-ratio 배 이상 느려진 단계를 표시하고 종료 코드 1
+
+사용법:
+    python scripts/benchmark/bench_analyzer.py
+    python scripts/benchmark/bench_analyzer.py --sizes 10,100 --output bench.json
+    python scripts/benchmark/bench_analyzer.py --baseline bench.json --max-ratio 1.5
+"""
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(script_dir))
+
+import test.framework.analyzer.post_market_analyzer as pma
+from test.framework.analyzer.cycle_analyzer_enhanced import enhance_cycle_analysis
+from test.framework.analyzer.streaming_analyzer import stream_scout_records
+from gen_scout_records import generate_scout_records
+
+STAGES = [
+    "load_scout_records",
+    "aggregate_observers",
+    "aggregate_reasons",
+    "enhance_cycle_analysis",
+    "save_daily_analysis",
+    "stream_scout_records",
+]
+
+
+def _measure(func: Callable[[], Any], with_memory: bool) -> Dict[str, Any]:
+    """함수 1회 실행 시간(초) + peak 메모리(MB, 선택)"""
+    result: Dict[str, Any] = {}
+    sink = io.StringIO()
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sink):
+        value = func()
+    result["sec"] = round(time.perf_counter() - started, 4)
+
+    if with_memory:
+        # 시간 측정과 분리 (tracemalloc 오버헤드 제외)
+        tracemalloc.start()
+        with contextlib.redirect_stdout(sink):
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_mb"] = round(peak / (1024 * 1024), 2)
+
+    result["value"] = value
+    return result
+
+
+def run_size(symbols: int, work_root: str, with_memory: bool, gen_options: Dict[str, Any]) -> Dict[str, Any]:
+    """종목 수 1개 규모 측정"""
+    size_root = os.path.join(work_root, f"s{symbols}")
+    generated = generate_scout_records(size_root, symbols=symbols, days=1, **gen_options)
+    date = generated["dates"][0]
+
+    # 분석기 경로를 합성 데이터로 전환
+    pma.SCOUT_RECORDS_DIR = generated["scout_root"]
+    pma.ANALYSIS_OUTPUT_DIR = os.path.join(size_root, "records", "analysis")
+    pma.PROJECT_ROOT = size_root
+
+    stages: Dict[str, Dict[str, Any]] = {}
+
+    loaded = _measure(lambda: pma.load_scout_records(date), with_memory)
+    records = loaded.pop("value")
+    stages["load_scout_records"] = loaded
+
+    observed = _measure(lambda: pma.aggregate_observers(records), with_memory)
+    observer_stats = observed.pop("value")
+    stages["aggregate_observers"] = observed
+
+    reasons = _measure(lambda: pma.aggregate_reasons(date), with_memory)
+    reason_stats = reasons.pop("value")
+    stages["aggregate_reasons"] = reasons
+
+    cycles = observer_stats["observer_summary"]["cycle_summary"]
+    enhanced = _measure(
+        lambda: enhance_cycle_analysis(cycles, records, None, exclude_fail=True),
+        with_memory,
+    )
+    enhanced_result = enhanced.pop("value")
+    stages["enhance_cycle_analysis"] = enhanced
+
+    def save():
+        market_character = pma.generate_market_character_summary(
+            observer_stats, date=date, total_records=len(records),
+        )
+        return pma.save_daily_analysis(date, observer_stats, market_character, reason_stats)
+
+    saved = _measure(save, with_memory)
+    saved.pop("value")
+    stages["save_daily_analysis"] = saved
+
+    streamed = _measure(
+        lambda: stream_scout_records(pma.get_scout_date_dir(date)),
+        with_memory,
+    )
+    streamed.pop("value")
+    stages["stream_scout_records"] = streamed
+
+    return {
+        "symbols": symbols,
+        "records": generated["records"],
+        "cycles": len(cycles),
+        "enhanced_cycles": len(enhanced_result["enhanced_cycles"]),
+        "stages": stages,
+        "total_sec": round(sum(s["sec"] for name, s in stages.items() if name != "stream_scout_records"), 4),
+    }
+
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    header = f"{'stage':<24}" + "".join(f"{r['symbols']:>10,} sym" + " " * 10 for r in results)
+    print(header)
+    print(f"{'(records)':<24}" + "".join(f"{r['records']:>14,}" + " " * 10 for r in results))
+    for stage in STAGES:
+        row = f"{stage:<24}"
+        for r in results:
+            s = r["stages"][stage]
+            mem = f"{s['peak_mb']:>8.1f}MB" if "peak_mb" in s else " " * 10
+            row += f"{s['sec']:>12.3f}s {mem}"
+        print(row)
+    print(f"{'total (batch)':<24}" + "".join(f"{r['total_sec']:>12.3f}s" + " " * 11 for r in results))
+
+
+def compare_baseline(results: List[Dict[str, Any]], baseline_path: str, max_ratio: float) -> List[str]:
+    """이전 결과 대비 max_ratio 배 이상 느려진 단계"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {r["symbols"]: r for r in json.load(f)["results"]}
+
+    regressions = []
+    for r in results:
+        base = baseline.get(r["symbols"])
+        if base is None:
+            continue
+        for stage, s in r["stages"].items():
+            base_stage = base["stages"].get(stage)
+            # 너무 짧은 단계는 측정 잡음이 커서 비교하지 않음
+            if not base_stage or base_stage["sec"] < 0.05:
+                continue
+            ratio = s["sec"] / base_stage["sec"]
+            if ratio >= max_ratio:
+                regressions.append(
+                    f"{r['symbols']} sym / {stage}: {base_stage['sec']:.3f}s → {s['sec']:.3f}s (x{ratio:.2f})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Post-Market Analyzer 단계별 벤치마크")
+    parser.add_argument("--sizes", default="10,100,1000", help="종목 수 목록 (쉼표 구분)")
+    parser.add_argument("--cycles-per-symbol", dest="cycles_per_symbol", type=int, default=3)
+    parser.add_argument("--interval-min", dest="interval_min", type=int, default=5)
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="peak 메모리 측정 생략")
+    parser.add_argument("--work-dir", dest="work_dir", default=None, help="합성 데이터 위치 (기본: 임시 디렉터리, 종료 시 삭제)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-ratio", dest="max_ratio", type=float, default=1.5)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    gen_options = {"cycles_per_symbol": args.cycles_per_symbol, "interval_min": args.interval_min}
+
+    work_root = args.work_dir or tempfile.mkdtemp(prefix="bench_analyzer_")
+    try:
+        results = []
+        for symbols in sizes:
+            print(f"⏱️  {symbols:,} 종목 측정 중...")
+            results.append(run_size(symbols, work_root, args.memory, gen_options))
+    finally:
+        if args.work_dir is None:
+            shutil.rmtree(work_root, ignore_errors=True)
+
+    print()
+    print_table(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"\n📁 결과: {args.output}")
+
+    if args.baseline:
+        regressions = compare_baseline(results, args.baseline, args.max_ratio)
+        if regressions:
+            print(f"\n❌ x{args.max_ratio} 이상 느려진 단계:")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print(f"\n✅ 기준 대비 x{args.max_ratio} 이상 느려진 단계 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
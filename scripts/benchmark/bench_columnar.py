@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+컬럼형(Parquet) vs JSONL 스트리밍 집계 벤치마크
+
+합성 정찰 기록(gen_scout_records) 하루치를 만들고
+    - stream_scout_records (JSONL k-way merge)
+    - compact_scout_dir    (JSONL → Parquet 압축, 장 마감 후 1회)
+    - stream_scout_records (최신 컬럼형 파일: 필요한 컬럼만 읽음)
+소요 시간을 비교합니다. 두 경로의 집계 결과가 다르거나
+컬럼형 경로가 JSONL 보다 빠르지 않으면 종료 코드 1
+
+사용법:
+    python scripts/benchmark/bench_columnar.py
+    python scripts/benchmark/bench_columnar.py --symbols 1200 --repeat 3 --output columnar.json
+"""
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(script_dir))
+
+from test.framework.analyzer.scout_compactor import HAS_PYARROW, compact_scout_dir
+from test.framework.analyzer.streaming_analyzer import stream_scout_records
+from gen_scout_records import generate_scout_records
+
+
+def _best_of(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """repeat 회 중 최소 시간(초)과 마지막 결과"""
+    best = None
+    value = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            value = func()
+            elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 4), value
+
+
+def _comparable(result: Dict[str, Any]) -> str:
+    """집계 결과 비교용 (set 에서 온 목록은 순서 무관)"""
+    stats = json.loads(json.dumps(result["observer_stats"], default=str))
+    summary = stats["observer_summary"]
+    summary["triggered_stocks"] = sorted(summary["triggered_stocks"])
+    stats["box_summary"]["formed_stocks"].sort()
+    stats["base_candle_summary"]["exists_stocks"].sort()
+    return json.dumps(
+        [stats, result["enhanced_result"], result["total_records"], result["first_record"]],
+        sort_keys=True, default=str,
+    )
+
+
+def run(symbols: int, repeat: int, work_root: str) -> Dict[str, Any]:
+    generated = generate_scout_records(work_root, symbols=symbols, days=1)
+    date = generated["dates"][0]
+    year, month, day = date.split("-")
+    date_dir = os.path.join(generated["scout_root"], year, month, f"{year}{month}{day}")
+
+    jsonl_sec, from_jsonl = _best_of(lambda: stream_scout_records(date_dir), repeat)
+    compact_sec, _ = _best_of(lambda: compact_scout_dir(date_dir, force=True), 1)
+    columnar_sec, from_columnar = _best_of(lambda: stream_scout_records(date_dir), repeat)
+
+    return {
+        "symbols": symbols,
+        "records": generated["records"],
+        "jsonl_sec": jsonl_sec,
+        "compact_sec": compact_sec,
+        "columnar_sec": columnar_sec,
+        "speedup": round(jsonl_sec / columnar_sec, 2) if columnar_sec else None,
+        "same_result": _comparable(from_jsonl) == _comparable(from_columnar),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="컬럼형 vs JSONL 스트리밍 집계 벤치마크")
+    parser.add_argument("--symbols", type=int, default=1200)
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최소 시간 사용)")
+    parser.add_argument("--work-dir", dest="work_dir", default=None, help="합성 데이터 위치 (기본: 임시 디렉터리, 종료 시 삭제)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    if not HAS_PYARROW:
+        print("❌ pyarrow 가 설치되어 있지 않습니다 (pip install pyarrow)")
+        return 1
+
+    work_root = args.work_dir or tempfile.mkdtemp(prefix="bench_columnar_")
+    try:
+        print(f"⏱️  {args.symbols:,} 종목 측정 중...")
+        result = run(args.symbols, args.repeat, work_root)
+    finally:
+        if args.work_dir is None:
+            shutil.rmtree(work_root, ignore_errors=True)
+
+    print(f"\n📊 {result['records']:,} records")
+    print(f"   JSONL 스트리밍     : {result['jsonl_sec']:>8.3f}s")
+    print(f"   컬럼형 압축 (1회)  : {result['compact_sec']:>8.3f}s")
+    print(f"   컬럼형 스트리밍    : {result['columnar_sec']:>8.3f}s (x{result['speedup']})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "result": result}, f, ensure_ascii=False, indent=2)
+        print(f"\n📁 결과: {args.output}")
+
+    if not result["same_result"]:
+        print("\n❌ 컬럼형 경로의 집계 결과가 JSONL 과 다름")
+        return 1
+    if result["columnar_sec"] >= result["jsonl_sec"]:
+        print("\n❌ 컬럼형 경로가 JSONL 보다 빠르지 않음")
+        return 1
+    print("\n✅ 결과 동일, 컬럼형 경로가 더 빠름")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Record → Cycle 매칭 벤치마크
+
+기존 이중 루프(O(records × cycles), 쌍마다 ISO 3회 파싱) 와
+종목별 인덱스 + bisect 구현(match_records_to_cycles) 을 비교하고
+결과가 동일한지 확인합니다.
+
+사용법:
+    python scripts/benchmark/bench_cycle_matching.py
+    python scripts/benchmark/bench_cycle_matching.py --stocks 100 --cycles-per-stock 8
+"""
+import sys
+import time
+import random
+import argparse
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.insert(0, str(project_root))
+
+from test.framework.analyzer.cycle_analyzer_enhanced import match_records_to_cycles
+
+
+def legacy_match_records_to_cycles(cycles, all_records):
+    """기존 enhance_cycle_analysis 의 매칭 루프 (비교 기준)"""
+    records_by_cycle = defaultdict(list)
+    for rec in all_records:
+        meta = rec.get("meta", {})
+        stock_code = meta.get("stock_code", "")
+        timestamp_str = meta.get("timestamp", "")
+
+        for cycle in cycles:
+            if cycle.get("stock") == stock_code:
+                start_time_str = cycle.get("start_time", "")
+                end_time_str = cycle.get("end_time", "")
+
+                try:
+                    if start_time_str and end_time_str and timestamp_str:
+                        rec_dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                        start_dt = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
+                        end_dt = datetime.fromisoformat(end_time_str.replace("Z", "+00:00"))
+
+                        if start_dt <= rec_dt <= end_dt:
+                            cycle_id = cycle.get("cycle_id", "")
+                            records_by_cycle[cycle_id].append(rec)
+                except Exception:
+                    pass
+    return records_by_cycle
+
+
+def build_session(stocks: int, interval_sec: int, cycles_per_stock: int, seed: int = 7):
+    """종목 × 장중(09:00~15:30) 기록과 종목별 cycle 생성"""
+    rng = random.Random(seed)
+    day_start = datetime(2026, 1, 7, 9, 0, 0)
+    day_end = datetime(2026, 1, 7, 15, 30, 0)
+    date_str = day_start.strftime("%Y-%m-%d")
+
+    records = []
+    cycles = []
+    for s in range(stocks):
+        stock = f"{s:06d}"
+        t = day_start + timedelta(microseconds=rng.randint(0, 999_999))
+        while t <= day_end:
+            records.append({"meta": {"stock_code": stock, "timestamp": t.isoformat()}})
+            t += timedelta(seconds=interval_sec)
+
+        span = (day_end - day_start).total_seconds()
+        for i in range(cycles_per_stock):
+            start = day_start + timedelta(seconds=rng.uniform(0, span))
+            end = start + timedelta(minutes=rng.randint(5, 60))
+            cycles.append({
+                "cycle_id": f"{date_str}-{stock}-{i + 1:02d}",
+                "stock": stock,
+                "start_time": start.isoformat(),
+                "end_time": end.isoformat(),
+            })
+
+    # 실전과 같이 파일(종목)별 → 시간 순으로 쌓인 순서를 섞어 둔다
+    rng.shuffle(records)
+    return records, cycles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record → Cycle 매칭 벤치마크")
+    parser.add_argument("--stocks", type=int, default=100)
+    parser.add_argument("--interval-sec", dest="interval_sec", type=int, default=60)
+    parser.add_argument("--cycles-per-stock", dest="cycles_per_stock", type=int, default=6)
+    parser.add_argument("--skip-legacy", dest="skip_legacy", action="store_true", help="기존 구현 측정 생략")
+    args = parser.parse_args()
+
+    records, cycles = build_session(args.stocks, args.interval_sec, args.cycles_per_stock)
+    print(f"records: {len(records):,}  cycles: {len(cycles):,}")
+
+    started = time.perf_counter()
+    indexed = match_records_to_cycles(cycles, records)
+    indexed_sec = time.perf_counter() - started
+    print(f"[indexed] {indexed_sec:.3f}s")
+
+    if args.skip_legacy:
+        return 0
+
+    started = time.perf_counter()
+    legacy = legacy_match_records_to_cycles(cycles, records)
+    legacy_sec = time.perf_counter() - started
+    print(f"[legacy]  {legacy_sec:.3f}s  (x{legacy_sec / max(indexed_sec, 1e-9):.1f})")
+
+    same = dict(legacy) == dict(indexed) and all(
+        [id(r) for r in legacy[k]] == [id(r) for r in indexed[k]] for k in legacy
+    )
+    print(f"identical: {same}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
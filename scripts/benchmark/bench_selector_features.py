@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+문지기봇 피처 계산 벤치마크
+
+기존 compute_features (종목별 groupby + transform(lambda) 13회) 와
+정렬 패널 1회 + 종목 경계 기반 벡터 연산(selector.compute_features) 을 비교하고
+피처/점수가 동일한지 확인합니다.
+
+- 합성 OHLCV 패널: 종목마다 상장일(기록 일수)이 다르고 일부 결측/거래량 0 포함
+- 비교: 모든 피처 컬럼 + score_volume / score_theme (시그모이드 배열 연산)
+
+사용법:
+    python scripts/benchmark/bench_selector_features.py
+    python scripts/benchmark/bench_selector_features.py --symbols 2500 --days 80 --repeat 3
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+script_dir = Path(__file__).parent
+project_root = script_dir.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "scout_selector"))
+
+from selector import (
+    SelectorConfig,
+    _sigmoid,
+    _z_norm,
+    compute_features,
+    score_theme,
+    score_volume,
+)
+
+FEATURE_COLUMNS = [
+    "vol_avg", "intraday_volatility", "hlc_volatility", "vol_spike_ratio", "trend",
+    "ma5", "ma20", "ma60", "ma5_slope", "ma20_slope", "ma_spread", "above_ma5", "clean",
+    "higher_low", "new_high", "big_red_candle", "short_term_overheat",
+]
+
+
+def legacy_compute_features(df: pd.DataFrame, cfg: SelectorConfig, lookback: int = 20) -> pd.DataFrame:
+    """기존 groupby + transform(lambda) 구현 (비교 기준)"""
+    df = df.sort_values(["symbol", "date"]).copy()
+
+    df["vol_avg"] = df.groupby("symbol")["volume"].transform(
+        lambda s: s.rolling(lookback, min_periods=1).mean()
+    )
+    df["intraday_volatility"] = (df["high"] - df["low"]) / df["open"].replace(0, pd.NA)
+    df["hlc_volatility"] = (df["high"] - df["low"]) / df["close"].replace(0, pd.NA)
+    df["vol_spike_ratio"] = (
+        df["volume"] / df["vol_avg"].replace(0, pd.NA)
+    ).fillna(1.0)
+
+    N = cfg.struct_trend_days
+    df["trend"] = df.groupby("symbol")["close"].transform(
+        lambda s: s.pct_change(N).fillna(0.0)
+    )
+    df["ma5"] = df.groupby("symbol")["close"].transform(
+        lambda s: s.rolling(5, min_periods=1).mean()
+    )
+    df["ma20"] = df.groupby("symbol")["close"].transform(
+        lambda s: s.rolling(20, min_periods=1).mean()
+    )
+    df["ma60"] = df.groupby("symbol")["close"].transform(
+        lambda s: s.rolling(60, min_periods=1).mean()
+    )
+    df["ma5_slope"] = df.groupby("symbol")["ma5"].transform(
+        lambda s: s.pct_change(1).fillna(0.0)
+    )
+    df["ma20_slope"] = df.groupby("symbol")["ma20"].transform(
+        lambda s: s.pct_change(1).fillna(0.0)
+    )
+    df["ma_spread"] = (
+        (df["ma5"] - df["ma20"]).abs() / df["close"].replace(0, pd.NA)
+    ).fillna(0.0)
+    df["above_ma5"] = (df["close"] > df["ma5"]).astype(int)
+    df["clean"] = df.groupby("symbol")["above_ma5"].transform(
+        lambda s: s.rolling(5, min_periods=1).mean().fillna(0.5)
+    )
+    df["higher_low"] = df.groupby("symbol")["low"].transform(
+        lambda s: (s > s.shift(1)).fillna(False).astype(int)
+    )
+    df["new_high"] = df.groupby("symbol")["high"].transform(
+        lambda s: (s >= s.rolling(20, min_periods=1).max()).fillna(False).astype(int)
+    )
+    df["big_red_candle"] = df.groupby("symbol")["close"].transform(
+        lambda s: (s.pct_change(1) < -0.05).fillna(False).astype(int)
+    )
+    df["short_term_overheat"] = df.groupby("symbol")["close"].transform(
+        lambda s: (s.pct_change(5) > 0.15).fillna(False).astype(int)
+    )
+    return df
+
+
+def legacy_score_volume(latest: pd.DataFrame, cfg: SelectorConfig) -> pd.Series:
+    z_turn = _z_norm(latest["turnover_krw"].fillna(0)).map(_sigmoid)
+    z_spike = _z_norm(latest["vol_spike_ratio"]).map(_sigmoid)
+    z_vola = _z_norm(latest["intraday_volatility"].fillna(0)).map(_sigmoid)
+    return cfg.w_turnover * z_turn + cfg.w_vol_spike * z_spike + cfg.w_volatility * z_vola
+
+
+def build_panel(symbols: int, days: int, seed: int = 11) -> pd.DataFrame:
+    """종목 × 영업일 합성 OHLCV (상장 기간 차이, 결측, 거래량 0 포함)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2025-09-01", periods=days).strftime("%Y-%m-%d")
+
+    frames = []
+    for i in range(symbols):
+        n = days if rng.random() > 0.1 else int(rng.integers(1, days + 1))
+        base = float(rng.uniform(1_000, 200_000))
+        close = base * np.cumprod(1 + rng.normal(0, 0.03, n))
+        close = np.round(close, -1)
+        open_ = np.round(close * (1 + rng.normal(0, 0.01, n)), -1)
+        high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.015, n)))
+        low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.015, n)))
+        volume = rng.integers(0, 5_000_000, n).astype(float)
+        volume[rng.random(n) < 0.02] = 0
+        frame = pd.DataFrame({
+            "date": dates[-n:],
+            "symbol": f"{i:06d}",
+            "open": open_,
+            "high": np.round(high, -1),
+            "low": np.round(low, -1),
+            "close": close,
+            "volume": volume,
+        })
+        frame["turnover_krw"] = frame["close"] * frame["volume"]
+        if rng.random() < 0.05:
+            frame.loc[frame.sample(frac=0.05, random_state=i).index, "close"] = np.nan
+        frames.append(frame)
+
+    # 수집 순서(날짜순) 그대로 섞어서 정렬 비용도 포함
+    return pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+def compare(new: pd.DataFrame, old: pd.DataFrame) -> float:
+    """피처 비교 (정수 피처는 완전 일치, 실수 피처는 최대 상대 오차 반환)"""
+    assert list(new.columns) == list(old.columns), "컬럼 순서 불일치"
+    assert new.index.equals(old.index), "행 순서 불일치"
+    max_rel = 0.0
+    for col in FEATURE_COLUMNS:
+        a = pd.to_numeric(new[col], errors="coerce").to_numpy(dtype=float)
+        b = pd.to_numeric(old[col], errors="coerce").to_numpy(dtype=float)
+        assert new[col].dtype == old[col].dtype, f"{col}: dtype 불일치"
+        mask = np.isfinite(a)
+        assert (mask == np.isfinite(b)).all(), f"{col}: 결측/inf 위치 불일치"
+        assert np.array_equal(a[~mask], b[~mask], equal_nan=True), f"{col}: 결측/inf 값 불일치"
+        if new[col].dtype.kind in "iu":
+            assert (a == b).all(), f"{col}: 정수 피처 불일치"
+            continue
+        diff = np.abs(a[mask] - b[mask]) / np.maximum(np.abs(b[mask]), 1e-12)
+        if diff.size:
+            max_rel = max(max_rel, float(diff.max()))
+    return max_rel
+
+
+def _best_of(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="문지기봇 피처 계산 벤치마크")
+    parser.add_argument("--symbols", type=int, default=2500)
+    parser.add_argument("--days", type=int, default=65)
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소 시간 사용)")
+    args = parser.parse_args()
+
+    cfg = SelectorConfig()
+    df = build_panel(args.symbols, args.days)
+    print(f"📊 패널: {args.symbols:,} 종목 × {args.days} 일 = {len(df):,} 행")
+
+    new = compute_features(df, cfg)
+    old = legacy_compute_features(df, cfg)
+    max_rel = compare(new, old)
+    print(f"✅ 피처 일치 (정수 피처 완전 일치, 실수 피처 최대 상대 오차 {max_rel:.2e})")
+
+    latest = new.groupby("symbol", as_index=False).tail(1).set_index("symbol")
+    vol_new = score_volume(latest, cfg)
+    vol_old = legacy_score_volume(latest, cfg)
+    theme = pd.Series(np.linspace(0, 1, len(latest)), index=latest.index)
+    theme_new = score_theme(latest, theme, cfg)
+    assert np.allclose(vol_new, vol_old, rtol=1e-12, atol=0), "score_volume 불일치"
+    assert (vol_new.rank(method="first") == vol_old.rank(method="first")).all(), "score_volume 순위 불일치"
+    assert theme_new.between(0, 1).all()
+    print("✅ 점수 일치 (score_volume 값/순위)")
+
+    legacy_sec = _best_of(lambda: legacy_compute_features(df, cfg), args.repeat)
+    new_sec = _best_of(lambda: compute_features(df, cfg), args.repeat)
+    print(f"\n{'compute_features (legacy)':<30}{legacy_sec:>10.3f}s")
+    print(f"{'compute_features (vectorized)':<30}{new_sec:>10.3f}s")
+    print(f"{'speedup':<30}{legacy_sec / new_sec:>10.1f}x")
+
+    sig_legacy = _best_of(lambda: legacy_score_volume(latest, cfg), args.repeat)
+    sig_new = _best_of(lambda: score_volume(latest, cfg), args.repeat)
+    print(f"{'score_volume (map → 배열)':<30}{sig_legacy * 1000:>9.2f}ms → {sig_new * 1000:.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+합성 정찰 기록(v2 JSONL) 생성기
+
+실제 정찰봇과 같은 디렉터리 구조(records/scout/YYYY/MM/YYYYMMDD/{종목코드}.jsonl)와
+스키마로 종목 × cycle × 날짜 규모의 기록을 만듭니다.
+
+- cycle 시작 record 는 observer.triggered=True, 종료 record 는 outcome.exit_type 기록
+  (exit_type 비율은 --exit-mix, 비율에 없으면 장 종료까지 열린 cycle → session_end timeout)
+- cycle 내부 트리거 비율, Box/기준봉 형성 비율, 거래량/거래대금 기록 비율, 시각 jitter 조절
+- gatekeeper watchlist(사유 집계용) 도 함께 생성
+
+사용법:
+    python scripts/benchmark/gen_scout_records.py --output-root /tmp/scout_bench --symbols 100 --days 5
+    python scripts/benchmark/gen_scout_records.py --output-root /tmp/scout_bench --symbols 1000 \\
+        --cycles-per-symbol 4 --trigger-rate 0.4 --exit-mix reached_1pct=0.3,no_reaction=0.3,timeout=0.3,open=0.1
+"""
+import os
+import sys
+import json
+import random
+import argparse
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+MARKET_OPEN = (9, 0)
+MARKET_CLOSE = (15, 30)
+OPEN_FOCUS_MINUTES = 30
+
+DEFAULT_EXIT_MIX = {
+    "reached_1pct": 0.25,
+    "no_reaction": 0.3,
+    "timeout": 0.3,
+    "manual_stop": 0.05,
+    "open": 0.1,          # 종료 record 없음 → 장 종료 시 session_end
+}
+
+NO_EVENT_REASONS = [
+    "volume_not_enough",
+    "price_not_moved",
+    "box_not_formed",
+    "base_candle_missing",
+]
+
+
+def parse_exit_mix(text: Optional[str]) -> Dict[str, float]:
+    """'reached_1pct=0.3,timeout=0.5,open=0.2' → dict"""
+    if not text:
+        return dict(DEFAULT_EXIT_MIX)
+    mix = {}
+    for part in text.split(","):
+        key, _, value = part.partition("=")
+        mix[key.strip()] = float(value)
+    return mix
+
+
+def _business_days(start: str, days: int) -> List[str]:
+    current = datetime.strptime(start, "%Y-%m-%d")
+    dates = []
+    while len(dates) < days:
+        if current.weekday() < 5:
+            dates.append(current.strftime("%Y-%m-%d"))
+        current += timedelta(days=1)
+    return dates
+
+
+def _timeline(rng: random.Random, date: str, interval_min: int, jitter_sec: float) -> List[datetime]:
+    """장중 관찰 시각 (개장 직후 30분은 2분 간격, 이후 interval_min)"""
+    day = datetime.strptime(date, "%Y-%m-%d")
+    t = day.replace(hour=MARKET_OPEN[0], minute=MARKET_OPEN[1])
+    close = day.replace(hour=MARKET_CLOSE[0], minute=MARKET_CLOSE[1])
+    focus_end = t + timedelta(minutes=OPEN_FOCUS_MINUTES)
+
+    times = []
+    while t <= close:
+        jitter = rng.uniform(0, jitter_sec) if jitter_sec > 0 else 0.0
+        times.append(t + timedelta(seconds=jitter, microseconds=rng.randint(0, 999_999)))
+        t += timedelta(minutes=2 if t < focus_end else interval_min)
+    return times
+
+
+def _plan_cycles(rng: random.Random, n: int, cycles: int, min_len: int, max_len: int) -> List[tuple]:
+    """겹치지 않는 (시작 idx, 종료 idx) 목록"""
+    planned = []
+    if n <= 1 or cycles <= 0:
+        return planned
+    slot = n // cycles
+    for i in range(cycles):
+        lo = i * slot
+        hi = min(n - 1, (i + 1) * slot - 1)
+        if hi - lo < 1:
+            break
+        length = rng.randint(min_len, max_len)
+        start = rng.randint(lo, max(lo, hi - 1))
+        end = min(hi, start + length)
+        planned.append((start, end))
+    return planned
+
+
+def _choose(rng: random.Random, mix: Dict[str, float]) -> str:
+    keys = list(mix)
+    return rng.choices(keys, weights=[mix[k] for k in keys], k=1)[0]
+
+
+def build_symbol_day(
+    rng: random.Random,
+    symbol: str,
+    date: str,
+    *,
+    cycles_per_symbol: int,
+    interval_min: int,
+    trigger_rate: float,
+    exit_mix: Dict[str, float],
+    box_rate: float,
+    base_candle_rate: float,
+    volume_rate: float,
+    jitter_sec: float,
+    is_large_cap: bool,
+) -> List[Dict[str, Any]]:
+    """종목 1개 × 하루치 record"""
+    times = _timeline(rng, date, interval_min, jitter_sec)
+    n = len(times)
+    cycles = _plan_cycles(rng, n, cycles_per_symbol, 3, 40)
+    cycle_at = {}
+    for start, end in cycles:
+        exit_type = _choose(rng, exit_mix)
+        for idx in range(start, end + 1):
+            cycle_at[idx] = (start, end, exit_type)
+
+    price = rng.randint(5_000, 300_000)
+    open_time = times[0]
+    focus_end = open_time + timedelta(minutes=OPEN_FOCUS_MINUTES)
+    day_high = day_low = price
+
+    box_state = None
+    base_state = None
+    records = []
+    for idx, ts in enumerate(times):
+        price = max(100, int(price * (1 + rng.gauss(0, 0.003))))
+        high_updated = price > day_high
+        low_updated = price < day_low
+        day_high = max(day_high, price)
+        day_low = min(day_low, price)
+
+        snapshot = {
+            "price_checked": True,
+            "current_price": price,
+            "high_updated": high_updated,
+            "low_updated": low_updated,
+        }
+        if rng.random() < volume_rate:
+            volume = rng.randint(1_000, 500_000)
+            snapshot["volume"] = volume
+            snapshot["turnover_krw"] = volume * price
+
+        in_cycle = cycle_at.get(idx)
+        if in_cycle is None:
+            triggered = False
+        elif idx == in_cycle[0]:
+            triggered = True
+        else:
+            triggered = rng.random() < trigger_rate
+
+        outcome = {}
+        if in_cycle is not None and idx == in_cycle[1] and in_cycle[2] != "open":
+            outcome = {"exit_type": in_cycle[2]}
+
+        # Box / 기준봉 (한번 생기면 일정 시간 유지)
+        if box_state is None and rng.random() < box_rate:
+            box_state = {"start": ts, "high": int(price * 1.01), "low": int(price * 0.99), "left": rng.randint(5, 40)}
+        box = {"formed": False}
+        if box_state is not None:
+            elapsed_min = (ts - box_state["start"]).total_seconds() / 60
+            box = {
+                "formed": True,
+                "box_high": box_state["high"],
+                "box_low": box_state["low"],
+                "box_start_time": box_state["start"].isoformat(),
+                "duration": "짧음" if elapsed_min < 30 else ("중간" if elapsed_min < 120 else "김"),
+            }
+            box_state["left"] -= 1
+            if box_state["left"] <= 0:
+                box_state = None
+
+        if base_state is None and rng.random() < base_candle_rate:
+            base_state = {"time": ts, "open": price, "close": int(price * 1.02), "volume": rng.randint(10_000, 900_000), "left": rng.randint(5, 60)}
+        base_candle = {"exists": False}
+        if base_state is not None:
+            base_candle = {
+                "exists": True,
+                "anchor_time": base_state["time"].isoformat(),
+                "anchor_open": base_state["open"],
+                "anchor_close": base_state["close"],
+                "anchor_volume": base_state["volume"],
+            }
+            base_state["left"] -= 1
+            if base_state["left"] <= 0:
+                base_state = None
+
+        no_event_reason = [] if triggered else rng.sample(NO_EVENT_REASONS, rng.randint(0, 2))
+        asof = ts.strftime("%H:%M:%S")
+        records.append({
+            "meta": {
+                "schema_version": "v2",
+                "bot_id": "scout_v1",
+                "date": date,
+                "time": asof,
+                "timestamp": ts.isoformat(),
+                "session": "OPEN" if ts < focus_end else "NORMAL",
+                "stock_code": symbol,
+                "is_large_cap": is_large_cap,
+                "first_valid_date": "2026-01-07",
+            },
+            "snapshot": snapshot,
+            "observer": {"triggered": triggered, "buy_signal": triggered, "sell_signal": False},
+            "base_candle": base_candle,
+            "box": box,
+            "outcome": outcome,
+            "expectation": {},
+            "no_event_reason": no_event_reason,
+            "environment": {},
+            "flow": {
+                "foreign": {"net_volume": 0, "net_value": 0, "asof_time": asof, "source": "MOCK"},
+                "institution": {"net_volume": 0, "net_value": 0, "asof_time": asof, "source": "MOCK"},
+            },
+            "interval_min": interval_min,
+        })
+    return records
+
+
+def write_watchlist(output_root: str, date: str, symbols: List[str], rng: random.Random) -> str:
+    """gatekeeper_bot/output/watchlist_YYYYMMDD.json (사유 집계용)"""
+    buckets = ["largecap", "volume", "structure", "theme"]
+    watchlist: Dict[str, Any] = {"date": date.replace("-", ""), "phase": "normal"}
+    for i, bucket in enumerate(buckets):
+        watchlist[bucket] = [
+            {"symbol": s, "bucket": bucket, "score": round(rng.random(), 3), "reason": {"close": rng.randint(5_000, 300_000)}}
+            for s in symbols[i::len(buckets)]
+        ]
+    path = os.path.join(output_root, "gatekeeper_bot", "output", f"watchlist_{date.replace('-', '')}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(watchlist, f, ensure_ascii=False)
+    return path
+
+
+def generate_scout_records(
+    output_root: str,
+    *,
+    symbols: int = 100,
+    days: int = 1,
+    start_date: str = "2026-01-07",
+    cycles_per_symbol: int = 3,
+    interval_min: int = 5,
+    trigger_rate: float = 0.5,
+    exit_mix: Optional[Dict[str, float]] = None,
+    box_rate: float = 0.05,
+    base_candle_rate: float = 0.03,
+    volume_rate: float = 0.9,
+    jitter_sec: float = 20.0,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    합성 정찰 기록 생성
+
+    Returns:
+        {"scout_root", "dates", "files", "records"}
+    """
+    rng = random.Random(seed)
+    exit_mix = exit_mix or dict(DEFAULT_EXIT_MIX)
+    scout_root = os.path.join(output_root, "records", "scout")
+    codes = [f"{900000 + i:06d}" for i in range(symbols)]
+    large_caps = set(codes[: max(1, symbols // 10)])
+
+    dates = _business_days(start_date, days)
+    files = 0
+    total = 0
+    for date in dates:
+        year, month, day = date.split("-")
+        date_dir = os.path.join(scout_root, year, month, f"{year}{month}{day}")
+        os.makedirs(date_dir, exist_ok=True)
+        for code in codes:
+            records = build_symbol_day(
+                rng, code, date,
+                cycles_per_symbol=cycles_per_symbol,
+                interval_min=interval_min,
+                trigger_rate=trigger_rate,
+                exit_mix=exit_mix,
+                box_rate=box_rate,
+                base_candle_rate=base_candle_rate,
+                volume_rate=volume_rate,
+                jitter_sec=jitter_sec,
+                is_large_cap=code in large_caps,
+            )
+            with open(os.path.join(date_dir, f"{code}.jsonl"), "w", encoding="utf-8") as f:
+                for rec in records:
+                    f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            files += 1
+            total += len(records)
+        write_watchlist(output_root, date, codes, rng)
+
+    return {"scout_root": scout_root, "dates": dates, "files": files, "records": total}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 정찰 기록(v2 JSONL) 생성기")
+    parser.add_argument("--output-root", dest="output_root", required=True, help="출력 루트 (records/scout/... 생성)")
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--days", type=int, default=1)
+    parser.add_argument("--start-date", dest="start_date", default="2026-01-07")
+    parser.add_argument("--cycles-per-symbol", dest="cycles_per_symbol", type=int, default=3)
+    parser.add_argument("--interval-min", dest="interval_min", type=int, default=5)
+    parser.add_argument("--trigger-rate", dest="trigger_rate", type=float, default=0.5, help="cycle 내부 record 트리거 비율")
+    parser.add_argument("--exit-mix", dest="exit_mix", default=None, help="예: reached_1pct=0.3,timeout=0.5,open=0.2")
+    parser.add_argument("--box-rate", dest="box_rate", type=float, default=0.05)
+    parser.add_argument("--base-candle-rate", dest="base_candle_rate", type=float, default=0.03)
+    parser.add_argument("--volume-rate", dest="volume_rate", type=float, default=0.9, help="거래량/거래대금 기록 비율")
+    parser.add_argument("--jitter-sec", dest="jitter_sec", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    result = generate_scout_records(
+        args.output_root,
+        symbols=args.symbols,
+        days=args.days,
+        start_date=args.start_date,
+        cycles_per_symbol=args.cycles_per_symbol,
+        interval_min=args.interval_min,
+        trigger_rate=args.trigger_rate,
+        exit_mix=parse_exit_mix(args.exit_mix),
+        box_rate=args.box_rate,
+        base_candle_rate=args.base_candle_rate,
+        volume_rate=args.volume_rate,
+        jitter_sec=args.jitter_sec,
+        seed=args.seed,
+    )
+    print(f"✅ {result['records']:,}개 record / {result['files']:,}개 파일 생성: {result['scout_root']}")
+    print(f"   날짜: {', '.join(result['dates'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
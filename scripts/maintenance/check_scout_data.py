@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-"""오늘 수집된 정찰 데이터 검토 스크립트"""
-import json
+"""정찰 데이터 검토 스크립트 (종목 1개, 인덱스 기반 1-pass)
+
+사용법:
+    python scripts/maintenance/check_scout_data.py [날짜] [종목코드] [--from HH:MM] [--to HH:MM]
+"""
 import sys
+import argparse
 from pathlib import Path
 from collections import defaultdict
 
@@ -11,128 +15,148 @@ script_dir = Path(__file__).parent
 project_root = script_dir.parent.parent
 sys.path.insert(0, str(project_root))
 
-file_path = project_root / "records/scout/2026-01-07/000660.jsonl"
+from test.framework.analyzer.scout_index import get_scout_index, query_scout_records
+
+parser = argparse.ArgumentParser(description="정찰 데이터 검토")
+parser.add_argument("date", nargs="?", default="2026-01-07", help="날짜 (YYYY-MM-DD)")
+parser.add_argument("stock", nargs="?", default="000660", help="종목 코드")
+parser.add_argument("--from", dest="start_time", default=None, help="시작 시각 (HH[:MM[:SS]])")
+parser.add_argument("--to", dest="end_time", default=None, help="종료 시각 (HH[:MM[:SS]], 포함)")
+args = parser.parse_args()
+
+index = get_scout_index(args.date, [args.stock])
+file_path = Path(index["date_dir"]) / f"{args.stock}.jsonl"
 
-if not file_path.exists():
+if not file_path.exists() and args.stock not in index["files"]:
     print(f"[ERROR] 파일이 없습니다: {file_path}")
     exit(1)
 
-# 데이터 로드
-data = []
-with open(file_path, 'r', encoding='utf-8') as f:
-    for line in f:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data.append(json.loads(line))
-        except json.JSONDecodeError as e:
-            print(f"⚠️  JSON 파싱 오류: {e}")
-
 import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# 1-pass 집계 (레코드 목록을 메모리에 올리지 않음)
+stats = defaultdict(int)
+sessions = defaultdict(int)
+intervals = defaultdict(int)
+first_time = last_time = None
+prev_time = None
+min_price = max_price = None
+time_gap_mismatches = 0
+
+for _, r in query_scout_records(index, args.stock, args.start_time, args.end_time):
+    stats["total"] += 1
+    sessions[r['meta']['session']] += 1
+    intervals[r['interval_min']] += 1
+
+    curr_time = r['meta']['time']
+    if first_time is None:
+        first_time = curr_time
+    last_time = curr_time
+
+    # 시간 간격 검사 (HH:MM:SS 형식)
+    if prev_time is not None:
+        prev_parts = prev_time.split(':')
+        curr_parts = curr_time.split(':')
+        prev_min = int(prev_parts[0]) * 60 + int(prev_parts[1])
+        curr_min = int(curr_parts[0]) * 60 + int(curr_parts[1])
+        gap = curr_min - prev_min
+        if gap < 0:
+            gap += 24 * 60  # 다음날 처리
+        if gap != r['interval_min']:
+            time_gap_mismatches += 1
+    prev_time = curr_time
+
+    stats["triggered"] += bool(r['observer']['triggered'])
+    stats["buy_signal"] += bool(r['observer'].get('buy_signal'))
+    stats["sell_signal"] += bool(r['observer'].get('sell_signal'))
+    stats["price_checked"] += bool(r['snapshot']['price_checked'])
+    stats["high_updated"] += bool(r['snapshot'].get('high_updated'))
+    stats["low_updated"] += bool(r['snapshot'].get('low_updated'))
+    price = r['snapshot'].get('current_price')
+    if r['snapshot']['price_checked'] and price:
+        min_price = price if min_price is None else min(min_price, price)
+        max_price = price if max_price is None else max(max_price, price)
+    stats["base_candle"] += bool(r['base_candle'].get('exists'))
+    stats["box_formed"] += bool(r['box'].get('formed'))
+    stats["first_valid_date"] += r['meta'].get('first_valid_date') == args.date
+
+total = stats["total"]
+
 print("=" * 60)
-print("정찰 데이터 검토 결과 - 2026-01-07 (000660)")
+print(f"정찰 데이터 검토 결과 - {args.date} ({args.stock})")
 print("=" * 60)
 
 # 기본 통계
-print(f"\n[OK] 총 레코드 수: {len(data)}")
-if data:
-    print(f"[TIME] 시간 범위: {data[0]['meta']['time']} ~ {data[-1]['meta']['time']}")
+print(f"\n[OK] 총 레코드 수: {total}")
+if total:
+    print(f"[TIME] 시간 범위: {first_time} ~ {last_time}")
     
     # Session 분포
-    sessions = defaultdict(int)
-    for r in data:
-        sessions[r['meta']['session']] += 1
     print(f"\n[SESSION] Session 분포:")
     for session, count in sorted(sessions.items()):
         print(f"   - {session}: {count}개")
     
     # Interval 분포
-    intervals = defaultdict(int)
-    for r in data:
-        intervals[r['interval_min']] += 1
     print(f"\n[INTERVAL] Interval 분포:")
     for interval, count in sorted(intervals.items()):
         print(f"   - {interval}분: {count}개")
     
     # Observer 통계
-    triggered_count = sum(1 for r in data if r['observer']['triggered'])
-    buy_signal_count = sum(1 for r in data if r['observer'].get('buy_signal'))
-    sell_signal_count = sum(1 for r in data if r['observer'].get('sell_signal'))
+    triggered_count = stats["triggered"]
+    buy_signal_count = stats["buy_signal"]
+    sell_signal_count = stats["sell_signal"]
     
     print(f"\n[OBSERVER] Observer 통계:")
-    print(f"   - Triggered: {triggered_count}/{len(data)} ({triggered_count*100/len(data):.1f}%)")
-    print(f"   - Buy Signal: {buy_signal_count}/{len(data)} ({buy_signal_count*100/len(data):.1f}%)")
-    print(f"   - Sell Signal: {sell_signal_count}/{len(data)} ({sell_signal_count*100/len(data):.1f}%)")
+    print(f"   - Triggered: {triggered_count}/{total} ({triggered_count*100/total:.1f}%)")
+    print(f"   - Buy Signal: {buy_signal_count}/{total} ({buy_signal_count*100/total:.1f}%)")
+    print(f"   - Sell Signal: {sell_signal_count}/{total} ({sell_signal_count*100/total:.1f}%)")
     
     # Snapshot 통계
-    price_checked_count = sum(1 for r in data if r['snapshot']['price_checked'])
-    high_updated_count = sum(1 for r in data if r['snapshot'].get('high_updated'))
-    low_updated_count = sum(1 for r in data if r['snapshot'].get('low_updated'))
+    price_checked_count = stats["price_checked"]
     
     print(f"\n[SNAPSHOT] Snapshot 통계:")
-    print(f"   - 가격 조회 성공: {price_checked_count}/{len(data)} ({price_checked_count*100/len(data):.1f}%)")
-    print(f"   - 고가 갱신: {high_updated_count}회")
-    print(f"   - 저가 갱신: {low_updated_count}회")
+    print(f"   - 가격 조회 성공: {price_checked_count}/{total} ({price_checked_count*100/total:.1f}%)")
+    print(f"   - 고가 갱신: {stats['high_updated']}회")
+    print(f"   - 저가 갱신: {stats['low_updated']}회")
     
-    if price_checked_count > 0:
-        prices = [r['snapshot']['current_price'] for r in data if r['snapshot'].get('current_price')]
-        if prices:
-            print(f"   - 가격 범위: {min(prices):,}원 ~ {max(prices):,}원")
+    if min_price is not None:
+        print(f"   - 가격 범위: {min_price:,}원 ~ {max_price:,}원")
     
     # Base Candle 통계
-    base_candle_exists_count = sum(1 for r in data if r['base_candle'].get('exists'))
+    base_candle_exists_count = stats["base_candle"]
     print(f"\n[BASE_CANDLE] Base Candle 통계:")
-    print(f"   - 존재: {base_candle_exists_count}/{len(data)} ({base_candle_exists_count*100/len(data):.1f}%)")
+    print(f"   - 존재: {base_candle_exists_count}/{total} ({base_candle_exists_count*100/total:.1f}%)")
     
     # Box 통계
-    box_formed_count = sum(1 for r in data if r['box'].get('formed'))
+    box_formed_count = stats["box_formed"]
     print(f"\n[BOX] Box 통계:")
-    print(f"   - 형성: {box_formed_count}/{len(data)} ({box_formed_count*100/len(data):.1f}%)")
+    print(f"   - 형성: {box_formed_count}/{total} ({box_formed_count*100/total:.1f}%)")
     
     # Meta 정보 확인
-    first_valid_date_count = sum(1 for r in data if r['meta'].get('first_valid_date') == '2026-01-07')
+    first_valid_date_count = stats["first_valid_date"]
     print(f"\n[META] Meta 정보:")
-    print(f"   - first_valid_date 설정: {first_valid_date_count}/{len(data)} ({first_valid_date_count*100/len(data):.1f}%)")
+    print(f"   - first_valid_date 설정: {first_valid_date_count}/{total} ({first_valid_date_count*100/total:.1f}%)")
     
     # 데이터 품질 검사
     print(f"\n[QUALITY] 데이터 품질 검사:")
     issues = []
     
     # 시간 간격 검사
-    if len(data) > 1:
-        time_gaps = []
-        for i in range(1, len(data)):
-            prev_time = data[i-1]['meta']['time']
-            curr_time = data[i]['meta']['time']
-            # 간단한 시간 차이 계산 (HH:MM:SS 형식)
-            prev_parts = prev_time.split(':')
-            curr_parts = curr_time.split(':')
-            prev_min = int(prev_parts[0]) * 60 + int(prev_parts[1])
-            curr_min = int(curr_parts[0]) * 60 + int(curr_parts[1])
-            gap = curr_min - prev_min
-            if gap < 0:
-                gap += 24 * 60  # 다음날 처리
-            time_gaps.append(gap)
-        
-        expected_intervals = [r['interval_min'] for r in data[1:]]
-        mismatches = sum(1 for gap, expected in zip(time_gaps, expected_intervals) if gap != expected)
-        if mismatches > 0:
-            issues.append(f"[WARN] 시간 간격 불일치: {mismatches}개")
+    if total > 1:
+        if time_gap_mismatches > 0:
+            issues.append(f"[WARN] 시간 간격 불일치: {time_gap_mismatches}개")
         else:
             print("   [OK] 시간 간격 정상")
     
     # 모든 레코드에 first_valid_date가 있는지 확인
-    if first_valid_date_count != len(data):
-        issues.append(f"[WARN] first_valid_date 누락: {len(data) - first_valid_date_count}개")
+    if first_valid_date_count != total:
+        issues.append(f"[WARN] first_valid_date 누락: {total - first_valid_date_count}개")
     else:
         print("   [OK] first_valid_date 모두 설정됨")
     
     # 모든 레코드에 가격 정보가 있는지 확인
-    if price_checked_count != len(data):
-        issues.append(f"[WARN] 가격 조회 실패: {len(data) - price_checked_count}개")
+    if price_checked_count != total:
+        issues.append(f"[WARN] 가격 조회 실패: {total - price_checked_count}개")
     else:
         print("   [OK] 가격 정보 모두 수집됨")
     
@@ -0,0 +1,598 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ===============================
+# scripts/run/post_market_pipeline.py
+# Post-Market 파이프라인 러너 (단일 프로세스 DAG)
+# ===============================
+"""
+Post-Market 파이프라인 러너
+
+역할:
+- 단계를 DAG(requires / inputs / outputs)로 선언하고 한 프로세스에서 실행
+  (pandas/pykrx import, KRX 응답 캐시, 거래일 캘린더 등 모듈 상태를 단계 간 공유)
+- 의존 관계가 없는 단계는 스레드로 병렬 실행 (예: 종목선정회의 ∥ 대기실장봇 → 캔들기록봇)
+- 입력 파일 내용 해시 + 인자가 지난 성공 실행과 같고 출력이 그대로면 단계 건너뜀
+  (선언된 입력이 없거나 KRX 등 외부 데이터를 가져오는 단계는 해시로 건너뛰지 않음,
+   출력 확인에 실패한 실행은 경고로 남기고 다음 실행에서 다시 수행)
+- 단계별 시작/종료/소요 시간 기록 (logs/post_market_YYYYMMDD.json)
+
+단계:
+    candidate_pool ──→ collect_ohlcv ──┐
+    market_context (실패해도 계속) ────┴─→ gatekeeper
+    analyzer (독립, 실패해도 계속)
+
+사용법:
+    python scripts/run/post_market_pipeline.py
+    python scripts/run/post_market_pipeline.py --date 20260107 --skip gatekeeper
+    python scripts/run/post_market_pipeline.py --only collect_ohlcv --force
+    python scripts/run/post_market_pipeline.py --list
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+for path in (PROJECT_ROOT, PROJECT_ROOT / "scout_selector"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+LOG_DIR = PROJECT_ROOT / "logs"
+STATE_FILE = PROJECT_ROOT / "scout_selector" / "data" / "pipeline" / "pipeline_state.json"
+
+DEFAULT_WORKERS = 3
+
+
+# ===============================
+# 단계 선언
+# ===============================
+@dataclass
+class Stage:
+    """
+    파이프라인 단계
+
+    args / inputs / outputs 는 {date} {date_dash} {yyyy} {mm} {tomorrow} 치환 (inputs 는 glob 허용)
+
+    Attributes:
+        module: main(argv) 를 가진 모듈 (args 가 None 이면 main() 호출)
+        requires: 먼저 끝나야 하는 단계
+        critical: False 면 실패해도 경고만 하고 다음 단계 진행
+        force_args: 입력이 바뀌어 다시 실행할 때 붙일 인자 (단계 자체 멱등성 우회)
+        today_only: 오늘 날짜 실행에서만 동작하는 단계 (--date 과거 날짜면 건너뜀)
+        fetches: 외부 데이터(KRX 등)를 가져오는 단계 (입력 해시로 건너뛰지 않음)
+        output_check: 출력 파일 확인 (문제 있으면 사유 문자열 → 경고, 건너뛰기 기록 안 함)
+    """
+    name: str
+    label: str
+    module: str
+    args: Optional[List[str]] = None
+    requires: Tuple[str, ...] = ()
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+    critical: bool = True
+    force_args: List[str] = field(default_factory=list)
+    today_only: bool = False
+    fetches: bool = False
+    output_check: Optional[Callable[[List[Path]], Optional[str]]] = None
+
+    @property
+    def cacheable(self) -> bool:
+        """입력 해시로 건너뛸 수 있는 단계 (로컬 입력만으로 결과가 정해짐)"""
+        return bool(self.inputs) and not self.fetches
+
+
+def csv_has_rows(paths: List[Path]) -> Optional[str]:
+    """CSV 출력에 헤더 외 데이터 행이 있는지 확인"""
+    for path in paths:
+        if not path.is_file():
+            return f"{path.name} 없음"
+        with open(path, "r", encoding="utf-8-sig") as f:
+            if sum(1 for line in f if line.strip()) < 2:
+                return f"{path.name} 데이터 행 없음"
+    return None
+
+
+STAGES: List[Stage] = [
+    Stage(
+        name="candidate_pool",
+        label="WaitingRoomManager",
+        module="scout_selector.build_candidate_pool",
+        args=["--date", "{date}"],
+        inputs=["scout_selector/input/conditions/conditions_{date}.json"],
+        outputs=["scout_selector/output/history/{yyyy}/{mm}/candidate_pool_{date}.json"],
+    ),
+    Stage(
+        name="collect_ohlcv",
+        label="OHLCVCollector",
+        module="scout_selector.collect_ohlcv",
+        args=["--date", "{date}"],
+        requires=("candidate_pool",),
+        inputs=["scout_selector/output/history/{yyyy}/{mm}/candidate_pool_{date}.json"],
+        outputs=["scout_selector/data/ohlcv_{date}.csv"],
+        force_args=["--force"],
+        fetches=True,
+        output_check=csv_has_rows,
+    ),
+    Stage(
+        name="market_context",
+        label="MarketContext",
+        module="scout_selector.market_context",
+        args=["--date", "{date}", "--auto"],
+        outputs=["scout_selector/output/market_context_{date}.json"],
+        critical=False,
+    ),
+    Stage(
+        name="gatekeeper",
+        label="Gatekeeper",
+        module="scout_selector.prepare_tomorrow",
+        requires=("collect_ohlcv", "market_context"),
+        inputs=[
+            "scout_selector/data/ohlcv_{date}.csv",
+            "scout_selector/data/ohlcv_history/*",
+            "scout_selector/output/market_context_{date}.json",
+            "scout_selector/input/conditions/conditions_{tomorrow}.json",
+            "scout_selector/input/news/news_{tomorrow}.json",
+        ],
+        outputs=["scout_selector/history/{yyyy}/{mm}/{date}/watchlist.json"],
+        today_only=True,
+    ),
+    Stage(
+        name="analyzer",
+        label="PostMarketAnalyzer",
+        module="test.framework.analyzer.run_analyzer",
+        # 단계 스레드와 함께 도는 프로세스에서 fork 하지 않도록 그래프는 순차 렌더링
+        args=["{date_dash}", "--with-graphs", "--workers", "1"],
+        inputs=[
+            "records/scout/{yyyy}/{mm}/{date}/*.jsonl",
+            "scout_selector/output/watchlist_{date}.json",
+        ],
+        outputs=["records/analysis/{yyyy}/{mm}/{date}/daily_analysis.json"],
+        critical=False,
+    ),
+]
+
+
+def date_context(date: str) -> Dict[str, str]:
+    """템플릿 치환 값 (tomorrow 는 prepare_tomorrow 와 같은 달력 기준 다음 날)"""
+    dt = datetime.strptime(date, "%Y%m%d")
+    return {
+        "date": date,
+        "date_dash": dt.strftime("%Y-%m-%d"),
+        "yyyy": date[:4],
+        "mm": date[4:6],
+        "tomorrow": (dt + timedelta(days=1)).strftime("%Y%m%d"),
+    }
+
+
+def validate_stages(stages: List[Stage]) -> None:
+    """이름 중복 / 알 수 없는 의존 / 순환 확인"""
+    names = [s.name for s in stages]
+    if len(names) != len(set(names)):
+        raise ValueError(f"단계 이름 중복: {names}")
+    by_name = {s.name: s for s in stages}
+    for stage in stages:
+        unknown = set(stage.requires) - set(by_name)
+        if unknown:
+            raise ValueError(f"{stage.name}: 알 수 없는 의존 단계 {sorted(unknown)}")
+
+    visiting, done = set(), set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"순환 의존: {name}")
+        visiting.add(name)
+        for dep in by_name[name].requires:
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in names:
+        visit(name)
+
+
+# ===============================
+# 내용 해시
+# ===============================
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _expand(pattern: str) -> List[Path]:
+    if any(ch in pattern for ch in "*?["):
+        return sorted(p for p in PROJECT_ROOT.glob(pattern) if p.is_file())
+    path = PROJECT_ROOT / pattern
+    return [path] if path.is_file() else []
+
+
+def input_digest(stage: Stage, args: Optional[List[str]], patterns: List[str]) -> str:
+    """단계 인자 + 입력 파일 내용 해시 (없는 입력도 '없음' 으로 반영)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([stage.name, stage.module, args]).encode("utf-8"))
+    for pattern in patterns:
+        files = _expand(pattern)
+        if not files:
+            digest.update(f"{pattern}:missing\n".encode("utf-8"))
+        for path in files:
+            rel = path.relative_to(PROJECT_ROOT).as_posix()
+            digest.update(f"{rel}:{_file_sha256(path)}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def output_hashes(patterns: List[str]) -> Optional[Dict[str, str]]:
+    """출력 파일 해시 (하나라도 없으면 None)"""
+    hashes = {}
+    for pattern in patterns:
+        path = PROJECT_ROOT / pattern
+        if not path.is_file():
+            return None
+        hashes[pattern] = _file_sha256(path)
+    return hashes
+
+
+# ===============================
+# 상태 파일
+# ===============================
+def load_state(path: Path = STATE_FILE) -> Dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"stages": {}}
+
+
+def save_state(state: Dict, path: Path = STATE_FILE) -> None:
+    """원자적 저장 (tmp → replace)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+# ===============================
+# 단계별 출력 분리 (스레드별 버퍼)
+# ===============================
+class _StageStream(io.TextIOBase):
+    """현재 스레드가 실행 중인 단계 버퍼로 print 를 보냄 (단계 밖에서는 원래 스트림)"""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.local = threading.local()
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, "buffer", None)
+        (buffer if buffer is not None else self.fallback).write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        if getattr(self.local, "buffer", None) is None:
+            self.fallback.flush()
+
+
+# ===============================
+# 실행
+# ===============================
+@dataclass
+class StageResult:
+    name: str
+    status: str                 # success / failed / warn / skipped / blocked
+    reason: str = ""
+    started_at: Optional[str] = None
+    elapsed_sec: float = 0.0
+    output: str = ""
+
+
+class PipelineRunner:
+    """
+    DAG 파이프라인 실행기
+
+    Args:
+        date: 기준일 (YYYYMMDD)
+        stages: 단계 목록 (기본 STAGES)
+        workers: 동시 실행 단계 수
+        force: 입력 해시와 관계없이 모두 실행
+        only: 이 단계들만 실행 (의존 단계는 실행 여부 확인 없이 완료로 간주)
+        skip: 실행하지 않을 단계
+    """
+
+    def __init__(
+        self,
+        date: str,
+        stages: Optional[List[Stage]] = None,
+        workers: int = DEFAULT_WORKERS,
+        force: bool = False,
+        only: Optional[List[str]] = None,
+        skip: Optional[List[str]] = None,
+        state_path: Path = STATE_FILE,
+        log_file: Optional[Path] = None,
+    ):
+        self.date = date
+        self.ctx = date_context(date)
+        self.stages = list(stages or STAGES)
+        validate_stages(self.stages)
+        self.by_name = {s.name: s for s in self.stages}
+        unknown = set(only or []) | set(skip or [])
+        unknown -= set(self.by_name)
+        if unknown:
+            raise ValueError(f"알 수 없는 단계: {sorted(unknown)}")
+
+        self.workers = max(1, workers)
+        self.force = force
+        self.only = set(only) if only else None
+        self.skip = set(skip or [])
+        self.state_path = state_path
+        self.state = load_state(state_path)
+        self.log_file = log_file or LOG_DIR / f"post_market_{date}.log"
+        self.results: Dict[str, StageResult] = {}
+        self._log_lock = threading.Lock()
+
+    # ---------------------------
+    # 로그
+    # ---------------------------
+    def log(self, text: str) -> None:
+        """콘솔 + 로그 파일 (단계 출력 블록 단위로 섞이지 않게 잠금)"""
+        with self._log_lock:
+            console = sys.stdout.fallback if isinstance(sys.stdout, _StageStream) else sys.stdout
+            console.write(text + "\n")
+            console.flush()
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(text + "\n")
+
+    # ---------------------------
+    # 단계 준비
+    # ---------------------------
+    def _render(self, values: Optional[List[str]]) -> Optional[List[str]]:
+        return None if values is None else [v.format(**self.ctx) for v in values]
+
+    def _skip_reason(self, stage: Stage) -> Optional[str]:
+        if stage.name in self.skip or (self.only is not None and stage.name not in self.only):
+            return "not selected"
+        if stage.today_only and self.date != datetime.now().strftime("%Y%m%d"):
+            return "today only"
+        return None
+
+    def _is_unchanged(self, stage: Stage, digest: str) -> bool:
+        record = self.state.get("stages", {}).get(stage.name)
+        if self.force or not record:
+            return False
+        if record.get("date") != self.date or record.get("input_hash") != digest:
+            return False
+        if not stage.cacheable or record.get("status") != "success" or not record.get("outputs"):
+            return False
+        return output_hashes(self._render(stage.outputs)) == record["outputs"]
+
+    # ---------------------------
+    # 단계 실행 (작업 스레드)
+    # ---------------------------
+    def _run_stage(self, stage: Stage, args: Optional[List[str]]) -> StageResult:
+        result = StageResult(name=stage.name, status="success", started_at=datetime.now().isoformat())
+        stream = sys.stdout if isinstance(sys.stdout, _StageStream) else None
+        buffer = io.StringIO()
+        if stream is not None:
+            stream.local.buffer = buffer
+            sys.stderr.local.buffer = buffer
+        started = time.perf_counter()
+        try:
+            module = importlib.import_module(stage.module)
+            if args is None:
+                module.main()
+            else:
+                module.main(args)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                result.status = "failed"
+                result.reason = f"exit code {e.code}"
+        except Exception as e:
+            result.status = "failed"
+            result.reason = f"{type(e).__name__}: {e}"
+            traceback.print_exc()
+        finally:
+            result.elapsed_sec = round(time.perf_counter() - started, 3)
+            if stream is not None:
+                stream.local.buffer = None
+                sys.stderr.local.buffer = None
+        if result.status == "success" and stage.output_check is not None:
+            problem = stage.output_check([PROJECT_ROOT / p for p in self._render(stage.outputs)])
+            if problem:
+                result.status = "warn"
+                result.reason = f"output check: {problem}"
+        if result.status == "failed" and not stage.critical:
+            result.status = "warn"
+        result.output = buffer.getvalue()
+        return result
+
+    def _record(self, stage: Stage, digest: str, result: StageResult) -> None:
+        self.state.setdefault("stages", {})[stage.name] = {
+            "date": self.date,
+            "status": result.status,
+            "input_hash": digest,
+            "outputs": output_hashes(self._render(stage.outputs)),
+            "started_at": result.started_at,
+            "elapsed_sec": result.elapsed_sec,
+        }
+        save_state(self.state, self.state_path)
+
+    # ---------------------------
+    # 스케줄링
+    # ---------------------------
+    def run(self) -> bool:
+        """
+        DAG 실행
+
+        Returns:
+            필수(critical) 단계가 모두 성공/건너뜀이면 True
+        """
+        started = time.perf_counter()
+        self.log("=" * 38)
+        self.log(f"[START] Post Market Pipeline {datetime.now():%Y-%m-%d %H:%M:%S} (date={self.date})")
+        self.log("=" * 38)
+
+        # 단계 모듈 먼저 import (공유, 단계 출력 분리 전에 콘솔 인코딩 설정까지 끝내기)
+        for stage in self.stages:
+            if self._skip_reason(stage) is None:
+                try:
+                    importlib.import_module(stage.module)
+                except Exception as e:
+                    self.log(f"[WARN] {stage.label} import 실패: {type(e).__name__}: {e}")
+
+        orig_stdout, orig_stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = _StageStream(orig_stdout), _StageStream(orig_stderr)
+        try:
+            self._schedule()
+        finally:
+            sys.stdout, sys.stderr = orig_stdout, orig_stderr
+
+        ok = all(r.status in ("success", "warn", "skipped") for r in self.results.values())
+        self._write_timings(time.perf_counter() - started)
+        self.log(f"[{'SUCCESS' if ok else 'FAIL'}] Pipeline Finished ({time.perf_counter() - started:.1f}s)")
+        return ok
+
+    def _finish(self, stage: Stage, result: StageResult) -> None:
+        self.results[stage.name] = result
+        if result.output:
+            self.log(result.output.rstrip("\n"))
+        tag = {"success": "SUCCESS", "warn": "WARN", "failed": "FAIL", "skipped": "SKIP", "blocked": "BLOCKED"}[result.status]
+        detail = f" ({result.reason})" if result.reason else ""
+        timing = f" {result.elapsed_sec:.2f}s" if result.status in ("success", "warn", "failed") else ""
+        self.log(f"[{tag}] {stage.label}{timing}{detail}")
+
+    def _schedule(self) -> None:
+        pending = {s.name: s for s in self.stages}
+        running = {}
+        digests: Dict[str, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    deps = [self.results.get(d) for d in stage.requires]
+                    if any(r is None for r in deps):
+                        continue
+                    del pending[name]
+
+                    if any(r.status in ("failed", "blocked") for r in deps):
+                        failed = [r.name for r in deps if r.status in ("failed", "blocked")]
+                        self._finish(stage, StageResult(name, "blocked", f"upstream failed: {', '.join(failed)}"))
+                        continue
+                    reason = self._skip_reason(stage)
+                    if reason:
+                        self._finish(stage, StageResult(name, "skipped", reason))
+                        continue
+
+                    args = self._render(stage.args)
+                    digest = input_digest(stage, args, self._render(stage.inputs))
+                    if self._is_unchanged(stage, digest):
+                        self._finish(stage, StageResult(name, "skipped", "inputs unchanged"))
+                        continue
+                    # 같은 날짜를 입력이 바뀌었거나 지난 실행이 성공하지 못해 다시 실행
+                    # → 단계 자체 멱등성(기존 파일 유지) 우회
+                    record = self.state.get("stages", {}).get(name) or {}
+                    rerun = record.get("date") == self.date and (
+                        record.get("input_hash") != digest or record.get("status") != "success"
+                    )
+                    if stage.force_args and args is not None and (self.force or rerun):
+                        args = args + stage.force_args
+
+                    digests[name] = digest
+                    self.log(f"[RUN] {stage.label}")
+                    running[executor.submit(self._run_stage, stage, args)] = stage
+
+                if not running:
+                    if pending:
+                        raise RuntimeError(f"실행할 수 없는 단계: {sorted(pending)}")
+                    break
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    result = future.result()
+                    self._record(stage, digests[stage.name], result)
+                    self._finish(stage, result)
+
+    def _write_timings(self, total_sec: float) -> None:
+        """단계별 소요 시간 기록 (logs/post_market_YYYYMMDD.json)"""
+        path = self.log_file.with_suffix(".json")
+        report = {
+            "date": self.date,
+            "finished_at": datetime.now().isoformat(),
+            "total_sec": round(total_sec, 3),
+            "stages": [
+                {
+                    "name": r.name,
+                    "status": r.status,
+                    "reason": r.reason,
+                    "started_at": r.started_at,
+                    "elapsed_sec": r.elapsed_sec,
+                }
+                for r in self.results.values()
+            ],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+
+        self.log("\n📊 단계별 소요 시간")
+        for r in self.results.values():
+            elapsed = f"{r.elapsed_sec:7.2f}s" if r.started_at else "      -"
+            self.log(f"  {r.name:<16}{r.status:<9}{elapsed}  {r.reason}")
+
+
+# ===============================
+# Main
+# ===============================
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Post-Market 파이프라인 러너 (단일 프로세스 DAG)")
+    parser.add_argument("--date", default=None, help="기준일 (YYYYMMDD, 기본: 오늘)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 실행 단계 수")
+    parser.add_argument("--force", action="store_true", help="입력 해시와 관계없이 모든 단계 실행")
+    parser.add_argument("--only", action="append", default=None, help="이 단계만 실행 (여러 번 지정 가능)")
+    parser.add_argument("--skip", action="append", default=None, help="건너뛸 단계 (여러 번 지정 가능)")
+    parser.add_argument("--list", action="store_true", help="단계 목록 출력")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for stage in STAGES:
+            deps = ", ".join(stage.requires) or "-"
+            flag = "" if stage.critical else " (실패 허용)"
+            print(f"  {stage.name:<16} ← {deps:<30} {stage.module}{flag}")
+        return 0
+
+    date = (args.date or datetime.now().strftime("%Y%m%d")).replace("-", "")
+    try:
+        runner = PipelineRunner(date, workers=args.workers, force=args.force, only=args.only, skip=args.skip)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    return 0 if runner.run() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
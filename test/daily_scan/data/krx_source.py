@@ -0,0 +1,314 @@
+# daily_scan/data/krx_source.py
+"""
+KRX(pykrx) 데이터 소스 (디스크 응답 캐시 + 기록/재생)
+
+pykrx stock.* 호출을 (함수, 인자) 키로 디스크에 저장합니다.
+
+- 지난 날짜만 포함한 호출 → 불변 항목 (만료 없음)
+- 오늘/미래 날짜 또는 날짜 인자가 없는 호출 → 짧은 TTL (기본 10분)
+- 예외는 캐시하지 않음, 빈 결과(None/빈 DataFrame)는 지난 날짜여도 TTL 항목으로만 저장
+
+모드 (환경 변수 KRX_SOURCE_MODE, 파이프라인 하위 프로세스에도 그대로 전달):
+- cache  (기본) 유효한 캐시 우선, 없으면 pykrx 호출 후 저장
+- record 항상 pykrx 호출, 응답을 저장 (재생용 스냅샷 갱신)
+- replay 저장된 응답만 사용 (네트워크/pykrx 불필요, TTL 무시, 없으면 KrxReplayMiss)
+- off    캐시 없이 pykrx 직접 호출
+
+저장 위치: KRX_CACHE_DIR (기본 data/krx_cache/{함수}/{키 해시}.pkl)
+
+사용법:
+    from test.daily_scan.data.krx_source import get_source
+    df = get_source().get_market_ohlcv_by_date("20260105", "20260109", "005930")
+
+    python test/daily_scan/data/krx_source.py info
+    python test/daily_scan/data/krx_source.py prune      # 만료된 TTL 항목 삭제
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+# =========================
+# 설정
+# =========================
+MODES = ("cache", "record", "replay", "off")
+DEFAULT_MODE = "cache"
+
+CACHE_DIR = PROJECT_ROOT / "data" / "krx_cache"
+
+# 오늘(장중 포함) 데이터 재사용 시간
+TODAY_TTL_SEC = 600
+
+ENV_MODE = "KRX_SOURCE_MODE"
+ENV_CACHE_DIR = "KRX_CACHE_DIR"
+ENV_TTL = "KRX_CACHE_TTL"
+
+_DATE_RE = re.compile(r"^(\d{4})-?(\d{2})-?(\d{2})$")
+
+
+class KrxReplayMiss(LookupError):
+    """replay 모드에서 저장된 응답이 없음"""
+
+
+# =========================
+# 키 / 불변 판단
+# =========================
+def _normalize_arg(value: Any) -> Any:
+    """YYYY-MM-DD / YYYYMMDD 를 같은 키로 취급"""
+    if isinstance(value, str):
+        m = _DATE_RE.match(value)
+        if m:
+            return "".join(m.groups())
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.strftime("%Y%m%d")
+    if isinstance(value, (list, tuple)):
+        return [_normalize_arg(v) for v in value]
+    return value
+
+
+def make_key(func: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    payload = {
+        "func": func,
+        "args": [_normalize_arg(a) for a in args],
+        "kwargs": {k: _normalize_arg(v) for k, v in sorted(kwargs.items())},
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _date_args(args: tuple, kwargs: Dict[str, Any]) -> list:
+    dates = []
+    for value in list(args) + list(kwargs.values()):
+        norm = _normalize_arg(value)
+        if isinstance(norm, str) and len(norm) == 8 and norm.isdigit() and norm[:2] in ("19", "20"):
+            dates.append(norm)
+    return dates
+
+
+def is_immutable(args: tuple, kwargs: Dict[str, Any], today: Optional[str] = None) -> bool:
+    """지난 날짜만 조회하는 호출인지 (결과가 더 이상 바뀌지 않음)"""
+    dates = _date_args(args, kwargs)
+    if not dates:
+        return False
+    today = today or dt.date.today().strftime("%Y%m%d")
+    return max(dates) < today
+
+
+def is_empty_value(value: Any) -> bool:
+    """빈 응답 (None / 빈 DataFrame·리스트) - pykrx 는 오류 시에도 빈 결과를 돌려줌"""
+    if value is None:
+        return True
+    empty = getattr(value, "empty", None)
+    if isinstance(empty, bool):
+        return empty
+    if isinstance(value, (list, tuple, dict, set, str)):
+        return len(value) == 0
+    return False
+
+
+# =========================
+# 데이터 소스
+# =========================
+def _pykrx_call(func: str, *args, **kwargs) -> Any:
+    from pykrx import stock  # ImportError 는 호출자에게 그대로 전달
+
+    return getattr(stock, func)(*args, **kwargs)
+
+
+class KrxSource:
+    """
+    pykrx stock.* 호출 래퍼 (디스크 캐시 / 기록 / 재생)
+
+    stats: hits / misses / requests / stores
+    """
+
+    def __init__(
+        self,
+        mode: str = DEFAULT_MODE,
+        cache_dir: Optional[Path] = None,
+        ttl_sec: int = TODAY_TTL_SEC,
+        fetch: Optional[Callable[..., Any]] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 KRX_SOURCE_MODE: {mode} (가능: {', '.join(MODES)})")
+        self.mode = mode
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+        self.ttl_sec = ttl_sec
+        self._fetch = fetch or _pykrx_call
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "requests": 0, "stores": 0}
+
+    # ---------- 저장소 ----------
+    def _path(self, func: str, key: str) -> Path:
+        return self.cache_dir / func / f"{key}.pkl"
+
+    def _load(self, path: Path) -> Optional[Dict[str, Any]]:
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ KRX 캐시 읽기 실패 (무시): {path.name} ({e})")
+            return None
+
+    def _store(self, path: Path, entry: Dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self.stats["stores"] += 1
+
+    def _is_fresh(self, entry: Dict[str, Any], now: float) -> bool:
+        if self.mode == "replay" or entry.get("immutable"):
+            return True
+        return now - float(entry.get("fetched_at", 0)) < self.ttl_sec
+
+    # ---------- 호출 ----------
+    def call(self, func: str, *args, **kwargs) -> Any:
+        """pykrx stock.<func>(*args, **kwargs) (모드에 따라 캐시/기록/재생)"""
+        if self.mode == "off":
+            self.stats["requests"] += 1
+            return self._fetch(func, *args, **kwargs)
+
+        key = make_key(func, args, kwargs)
+        path = self._path(func, key)
+        now = time.time()
+
+        if self.mode != "record":
+            entry = self._load(path)
+            if entry is not None and self._is_fresh(entry, now):
+                self.stats["hits"] += 1
+                return entry["value"]
+            if self.mode == "replay":
+                raise KrxReplayMiss(f"기록된 응답 없음: {func}{tuple(args)} {kwargs or ''}")
+
+        self.stats["misses"] += 1
+        self.stats["requests"] += 1
+        value = self._fetch(func, *args, **kwargs)
+        self._store(path, {
+            "func": func,
+            "args": [_normalize_arg(a) for a in args],
+            "kwargs": {k: _normalize_arg(v) for k, v in kwargs.items()},
+            "fetched_at": now,
+            # 빈 응답은 일시 장애일 수 있으므로 지난 날짜여도 TTL 항목으로만 저장
+            "immutable": is_immutable(args, kwargs) and not is_empty_value(value),
+            "value": value,
+        })
+        return value
+
+    # ---------- pykrx 함수 (자주 쓰는 것) ----------
+    def get_market_ohlcv(self, date: str, market: str = "KOSPI"):
+        return self.call("get_market_ohlcv", date, market=market)
+
+    def get_market_ohlcv_by_date(self, fromdate: str, todate: str, ticker: str):
+        return self.call("get_market_ohlcv_by_date", fromdate, todate, ticker)
+
+    def get_market_ticker_list(self, date: Optional[str] = None, market: str = "KOSPI"):
+        if date is None:
+            return self.call("get_market_ticker_list", market=market)
+        return self.call("get_market_ticker_list", date, market=market)
+
+    def get_market_ticker_name(self, ticker: str):
+        return self.call("get_market_ticker_name", ticker)
+
+    # ---------- 관리 ----------
+    def iter_entries(self):
+        if not self.cache_dir.exists():
+            return
+        for path in sorted(self.cache_dir.glob("*/*.pkl")):
+            entry = self._load(path)
+            if entry is not None:
+                yield path, entry
+
+    def prune(self) -> int:
+        """만료된 TTL 항목 삭제 (불변 항목 유지)"""
+        now = time.time()
+        removed = 0
+        for path, entry in self.iter_entries():
+            if not entry.get("immutable") and now - float(entry.get("fetched_at", 0)) >= self.ttl_sec:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def info(self) -> Dict[str, Any]:
+        funcs: Dict[str, int] = {}
+        immutable = 0
+        size = 0
+        for path, entry in self.iter_entries():
+            funcs[entry.get("func", path.parent.name)] = funcs.get(entry.get("func", path.parent.name), 0) + 1
+            immutable += int(bool(entry.get("immutable")))
+            size += path.stat().st_size
+        return {
+            "mode": self.mode,
+            "cache_dir": str(self.cache_dir),
+            "entries": sum(funcs.values()),
+            "immutable": immutable,
+            "bytes": size,
+            "functions": funcs,
+        }
+
+
+# =========================
+# 프로세스 기본 소스
+# =========================
+_default_source: Optional[KrxSource] = None
+
+
+def source_from_env() -> KrxSource:
+    mode = os.environ.get(ENV_MODE, DEFAULT_MODE).strip().lower() or DEFAULT_MODE
+    cache_dir = os.environ.get(ENV_CACHE_DIR) or None
+    ttl = int(os.environ.get(ENV_TTL, TODAY_TTL_SEC))
+    return KrxSource(mode=mode, cache_dir=cache_dir, ttl_sec=ttl)
+
+
+def get_source() -> KrxSource:
+    """프로세스 기본 KrxSource (환경 변수 설정으로 1회 생성)"""
+    global _default_source
+    if _default_source is None:
+        _default_source = source_from_env()
+    return _default_source
+
+
+def set_source(source: Optional[KrxSource]) -> None:
+    """기본 KrxSource 교체 (None 이면 다음 호출 시 환경 변수로 재생성)"""
+    global _default_source
+    _default_source = source
+
+
+# =========================
+# CLI
+# =========================
+def main() -> int:
+    parser = argparse.ArgumentParser(description="KRX(pykrx) 응답 캐시 관리")
+    parser.add_argument("command", choices=["info", "prune"])
+    parser.add_argument("--cache-dir", default=None, help=f"캐시 경로 (기본: {CACHE_DIR})")
+    args = parser.parse_args()
+
+    source = source_from_env()
+    if args.cache_dir:
+        source.cache_dir = Path(args.cache_dir)
+
+    if args.command == "info":
+        print(json.dumps(source.info(), ensure_ascii=False, indent=2))
+    else:
+        removed = source.prune()
+        print(f"✅ 만료 항목 {removed}개 삭제")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
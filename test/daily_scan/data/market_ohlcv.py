@@ -0,0 +1,260 @@
+# daily_scan/data/market_ohlcv.py
+"""
+전 종목 일봉 OHLCV (날짜별 시장 스냅샷 + 로컬 캐시)
+
+- pykrx get_market_ohlcv(date, market=...) 1회로 해당 날짜 시장 전체 OHLCV 수집
+  (종목마다 get_market_ohlcv_by_date 를 호출하지 않음)
+- 날짜별 결과를 market_cache/ 에 저장 → 지난 날짜는 다시 요청하지 않음
+  (당일은 장 마감 후 수집분만 캐시)
+- 기간 패널 → 종목별 창(window) 은 캐시된 패널에서 잘라서 제공
+  (get_market_ohlcv_by_date 와 같은 한글 컬럼, 날짜 인덱스)
+
+요청 수:
+- 최초: 기간 내 평일 수 × 시장 수
+- 이후 매일: 시장 수 (신규 날짜만)
+
+주의:
+- 시장 스냅샷은 수정주가가 아닌 당일 가격 (기간 중 액면분할 종목은 by_date(adjusted) 와 다를 수 있음)
+- 기본 fetcher 는 krx_source 경유 (KRX_SOURCE_MODE=replay 로 오프라인 재현)
+- fetcher 를 주입하면 pykrx 대신 주입한 함수 사용
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from test.daily_scan.data.krx_source import get_source
+
+
+# =========================
+# 설정
+# =========================
+DEFAULT_MARKETS = ("KOSPI", "KOSDAQ")
+
+# pykrx 스냅샷 컬럼 (get_market_ohlcv_by_date 와 동일 이름)
+OHLCV_COLUMNS = ["시가", "고가", "저가", "종가", "거래량", "거래대금", "등락률"]
+
+# 당일 데이터는 이 시각 이후 수집분만 확정으로 캐시
+MARKET_FINAL_TIME = dt.time(15, 40)
+
+CACHE_DIR = Path(__file__).resolve().parent / "market_cache"
+
+Fetcher = Callable[[str, str], pd.DataFrame]
+
+
+# =========================
+# 수집 (pykrx)
+# =========================
+def fetch_market_snapshot_pykrx(date: str, market: str) -> pd.DataFrame:
+    """
+    날짜 1개 시장 전체 OHLCV (index: 티커)
+
+    Args:
+        date: YYYYMMDD
+        market: KOSPI / KOSDAQ / KONEX / ALL
+    """
+    try:
+        df = get_source().get_market_ohlcv(date, market=market)
+    except ImportError as e:
+        raise RuntimeError(
+            "pykrx를 불러올 수 없습니다. " "`pip install pykrx` 후 다시 시도하세요."
+        ) from e
+
+    if df is None:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    return df
+
+
+# =========================
+# 캐시
+# =========================
+def _cache_path(date: str, market: str, cache_dir: Path) -> Path:
+    suffix = ".parquet" if HAS_PYARROW else ".csv.gz"
+    return cache_dir / date[:6] / f"ohlcv_{date}_{market}{suffix}"
+
+
+def _read_cache(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path, dtype={"symbol": str}, compression="gzip")
+    return df.set_index("symbol")
+
+
+def _write_cache(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    out = df.rename_axis("symbol").reset_index()
+    tmp_path = path.with_name(path.name + ".tmp")
+    if path.suffix == ".parquet":
+        out.to_parquet(tmp_path, index=False)
+    else:
+        out.to_csv(tmp_path, index=False, compression="gzip")
+    os.replace(tmp_path, path)
+
+
+def _is_final(date: str, now: Optional[dt.datetime] = None) -> bool:
+    """캐시해도 되는 (더 이상 바뀌지 않는) 날짜인지"""
+    now = now or dt.datetime.now()
+    today = now.strftime("%Y%m%d")
+    return date < today or (date == today and now.time() >= MARKET_FINAL_TIME)
+
+
+def is_known_market_closed(date: str) -> bool:
+    """
+    휴장일로 확인된 날짜인지 (주말 또는 거래일 캘린더 기준)
+
+    캘린더를 사용할 수 없으면 False (빈 응답을 휴장일로 확정하지 않음)
+    """
+    try:
+        if dt.datetime.strptime(date, "%Y%m%d").weekday() >= 5:
+            return True
+        from scout_selector.utils.market_calendar import is_market_open
+
+        return not is_market_open(date)
+    except Exception:
+        return False
+
+
+def _normalize_snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.reindex(columns=OHLCV_COLUMNS)
+    df.index = df.index.astype(str).str.zfill(6)
+    df.index.name = "symbol"
+    return df
+
+
+def get_market_ohlcv(
+    date: str,
+    markets: Iterable[str] = DEFAULT_MARKETS,
+    fetcher: Optional[Fetcher] = None,
+    cache_dir: Optional[Path] = None,
+    stats: Optional[Dict[str, int]] = None,
+    closed_check: Optional[Callable[[str], bool]] = None,
+) -> pd.DataFrame:
+    """
+    날짜 1개 시장 전체 OHLCV (캐시 우선)
+
+    빈 결과(거래량 합계 0 → 빈 DataFrame)는 휴장일로 확인된 날짜만 캐시
+    (pykrx 는 요청 오류 시에도 빈 결과를 돌려주므로, 거래일이면 캐시하지 않고 다음에 다시 요청)
+
+    Args:
+        closed_check: 휴장일 판단 함수 (기본: is_known_market_closed)
+
+    Returns:
+        index: symbol, columns: OHLCV_COLUMNS
+    """
+    fetcher = fetcher or fetch_market_snapshot_pykrx
+    closed_check = closed_check or is_known_market_closed
+    cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+
+    frames = []
+    for market in markets:
+        path = _cache_path(date, market, cache_dir)
+        if path.exists():
+            frames.append(_read_cache(path))
+            if stats is not None:
+                stats["cache_hits"] = stats.get("cache_hits", 0) + 1
+            continue
+
+        df = _normalize_snapshot(fetcher(date, market))
+        if stats is not None:
+            stats["requests"] = stats.get("requests", 0) + 1
+        if df.empty or float(df["거래량"].fillna(0).sum()) == 0:
+            df = df.iloc[0:0]
+            if not closed_check(date):
+                print(f"⚠️ [MARKET_OHLCV] {date} {market} 빈 응답 (거래일) → 캐시하지 않음")
+                frames.append(df)
+                continue
+        if _is_final(date):
+            _write_cache(df, path)
+        frames.append(df)
+
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return _normalize_snapshot(pd.DataFrame(columns=OHLCV_COLUMNS))
+    df = pd.concat(frames) if len(frames) > 1 else frames[0]
+    return df[~df.index.duplicated(keep="first")]
+
+
+# =========================
+# 기간 패널 / 종목별 창
+# =========================
+def _weekdays(start: str, end: str) -> List[str]:
+    days = pd.bdate_range(pd.Timestamp(start), pd.Timestamp(end))
+    return [d.strftime("%Y%m%d") for d in days]
+
+
+def load_market_panel(
+    start: str,
+    end: str,
+    markets: Iterable[str] = DEFAULT_MARKETS,
+    fetcher: Optional[Fetcher] = None,
+    cache_dir: Optional[Path] = None,
+    verbose: bool = False,
+    closed_check: Optional[Callable[[str], bool]] = None,
+) -> pd.DataFrame:
+    """
+    기간(start~end, YYYYMMDD) 시장 전체 OHLCV 패널
+
+    Returns:
+        columns: 날짜(datetime64), symbol, OHLCV_COLUMNS (symbol, 날짜 정렬)
+    """
+    markets = tuple(markets)
+    stats: Dict[str, int] = {}
+    frames = []
+    for date in _weekdays(start, end):
+        df = get_market_ohlcv(date, markets, fetcher, cache_dir, stats, closed_check)
+        if df.empty:
+            continue
+        df = df.reset_index()
+        df.insert(0, "날짜", pd.Timestamp(date))
+        frames.append(df)
+
+    if verbose:
+        print(
+            f"[MARKET_OHLCV] {start}~{end} trading_days={len(frames)} "
+            f"requests={stats.get('requests', 0)} cache_hits={stats.get('cache_hits', 0)}"
+        )
+
+    if not frames:
+        return pd.DataFrame(columns=["날짜", "symbol"] + OHLCV_COLUMNS)
+    panel = pd.concat(frames, ignore_index=True)
+    return panel.sort_values(["symbol", "날짜"], kind="stable").reset_index(drop=True)
+
+
+def split_symbol_windows(panel: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """패널(symbol, 날짜 정렬) → {종목: get_market_ohlcv_by_date 형태 DataFrame (index: 날짜)}"""
+    if panel.empty:
+        return {}
+    # symbol 정렬된 패널 → 경계 위치로 잘라내기 (종목별 groupby/drop 보다 빠름)
+    symbols = panel["symbol"].to_numpy()
+    bounds = np.flatnonzero(symbols[1:] != symbols[:-1]) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(symbols)]))
+    body = panel.set_index("날짜")[OHLCV_COLUMNS]
+    return {symbols[s]: body.iloc[s:e] for s, e in zip(starts, ends)}
+
+
+def load_symbol_windows(
+    start: str,
+    end: str,
+    markets: Iterable[str] = DEFAULT_MARKETS,
+    fetcher: Optional[Fetcher] = None,
+    cache_dir: Optional[Path] = None,
+    verbose: bool = False,
+    closed_check: Optional[Callable[[str], bool]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """기간 패널을 1회 로드해서 종목별 창으로 분리"""
+    panel = load_market_panel(start, end, markets, fetcher, cache_dir, verbose, closed_check)
+    return split_symbol_windows(panel)
@@ -17,12 +17,20 @@ C_volume_accum
 from __future__ import annotations
 
 import datetime as dt
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional
 
 import pandas as pd
 
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from test.daily_scan.data.krx_source import get_source
+from test.daily_scan.data.market_ohlcv import load_symbol_windows
+
 
 # ======================================================
 # 🔧 설정 (실전 기준)
@@ -62,22 +70,13 @@ def _write_symbol_csv(symbols: Iterable[str], path: Path) -> None:
 # 데이터 수집 (pykrx)
 # ======================================================
 def _get_universe_pykrx(date: str, markets: tuple[str, ...]) -> List[str]:
-    from pykrx import stock
-
+    source = get_source()
     symbols: List[str] = []
     for m in markets:
-        symbols.extend(stock.get_market_ticker_list(date, market=m))
+        symbols.extend(source.get_market_ticker_list(date, market=m))
     return list(dict.fromkeys(symbols))
 
 
-def _get_ohlcv_pykrx(symbol: str, start: str, end: str) -> pd.DataFrame:
-    from pykrx import stock
-
-    df = stock.get_market_ohlcv_by_date(start, end, symbol)
-    if df is None or df.empty:
-        return pd.DataFrame()
-    return df
-
 
 # ======================================================
 # 메인 로직
@@ -107,10 +106,14 @@ def generate_c_volume_accum(
     if verbose:
         print(f"[C_VOL_ACCUM] universe size={len(symbols)}")
 
+    # 기간 전체를 날짜별 시장 스냅샷(캐시)으로 1회 로드 → 종목별 창
+    windows = load_symbol_windows(start, end, cfg.markets, verbose=verbose)
+    empty = pd.DataFrame()
+
     picked: List[str] = []
 
     for idx, sym in enumerate(symbols, start=1):
-        df = _get_ohlcv_pykrx(sym, start, end)
+        df = windows.get(sym, empty)
         if df.empty or "거래량" not in df.columns or "거래대금" not in df.columns:
             continue
 
@@ -18,6 +18,7 @@ PROJECT_ROOT = os.path.abspath(
 sys.path.insert(0, PROJECT_ROOT)
 
 from test.framework.analyzer.post_market_analyzer import analyze_daily_market
+from test.framework.analyzer.scout_compactor import compact_scout_day
 
 
 def main():
@@ -28,11 +29,17 @@ def main():
     print("=" * 60)
     print()
     
+    # 장 마감 후 컬럼형 압축 (원본 JSONL 보존, pyarrow 없으면 생략)
+    compacted_path = compact_scout_day(datetime.now().strftime("%Y-%m-%d"))
+    if compacted_path:
+        print(f"🗜️  컬럼형 압축: {compacted_path}")
+    
     # 오늘 날짜로 분석 실행 (그래프 포함)
     result = analyze_daily_market(
         date=None,  # 오늘 날짜
         include_top_100=False,
         with_graphs=True,  # 그래프 자동 생성
+        incremental=True,  # 장중 증분 상태가 있으면 남은 줄만 집계
     )
     
     if "error" in result:
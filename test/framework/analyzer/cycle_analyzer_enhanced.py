@@ -17,6 +17,7 @@ import statistics
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from collections import defaultdict
+from bisect import bisect_left, bisect_right
 
 
 # ===============================
@@ -395,6 +396,106 @@ def get_slot_type(symbol: str, watchlist_data: Optional[Dict[str, Any]] = None)
     return "unknown"
 
 
+# ===============================
+# 7-0. Record → Cycle 매칭 (종목별 인덱스)
+# ===============================
+def _parse_iso(value: str) -> Optional[datetime]:
+    """ISO 문자열 → datetime (빈 값/파싱 실패 시 None)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except Exception:
+        return None
+
+
+def _match_pairwise(
+    indexed_records: List[tuple],
+    indexed_cycles: List[tuple],
+    matches: Dict[str, List[tuple]],
+) -> None:
+    """
+    tz 유무가 섞인 종목용 fallback (기존 이중 루프와 동일, 비교 불가 쌍은 건너뜀)
+    """
+    for rec_idx, rec_dt, _ in indexed_records:
+        for cycle_pos, cycle_id, start_dt, end_dt in indexed_cycles:
+            try:
+                if start_dt <= rec_dt <= end_dt:
+                    matches[cycle_id].append((rec_idx, cycle_pos))
+            except TypeError:
+                pass
+
+
+def match_records_to_cycles(
+    cycles: List[Dict[str, Any]],
+    all_records: List[Dict[str, Any]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    record를 cycle_id로 그룹화 (start_time <= timestamp <= end_time, 같은 종목)
+    
+    - timestamp 는 record/cycle 당 1회만 파싱
+    - 종목별로 record 를 시각 정렬 후 cycle 구간을 bisect 로 검색
+      → O(R log R + 매칭 수) (기존: O(R × C) 및 쌍마다 3회 파싱)
+    - 결과 순서는 기존 구현과 동일 (cycle_id 별로 all_records 순서)
+    
+    Args:
+        cycles: cycle 목록 (stock, start_time, end_time, cycle_id)
+        all_records: 모든 record
+        
+    Returns:
+        {cycle_id: [record, ...]}
+    """
+    # 종목별 cycle (파싱 실패/빈 값 cycle 은 매칭 대상 아님)
+    cycles_by_stock = defaultdict(list)
+    for cycle_pos, cycle in enumerate(cycles):
+        start_dt = _parse_iso(cycle.get("start_time", ""))
+        end_dt = _parse_iso(cycle.get("end_time", ""))
+        if start_dt is None or end_dt is None:
+            continue
+        cycles_by_stock[cycle.get("stock")].append(
+            (cycle_pos, cycle.get("cycle_id", ""), start_dt, end_dt)
+        )
+    
+    # 종목별 record (cycle 이 있는 종목만)
+    records_by_stock = defaultdict(list)
+    for rec_idx, rec in enumerate(all_records):
+        meta = rec.get("meta", {})
+        stock_code = meta.get("stock_code", "")
+        if stock_code not in cycles_by_stock:
+            continue
+        rec_dt = _parse_iso(meta.get("timestamp", ""))
+        if rec_dt is None:
+            continue
+        records_by_stock[stock_code].append((rec_idx, rec_dt, rec))
+    
+    # cycle_id → [(record 순번, cycle 순번)]
+    matches: Dict[str, List[tuple]] = defaultdict(list)
+    for stock_code, indexed_records in records_by_stock.items():
+        indexed_cycles = cycles_by_stock[stock_code]
+        
+        aware = {dt.tzinfo is not None for _, dt, _ in indexed_records}
+        aware |= {dt.tzinfo is not None for _, _, s, e in indexed_cycles for dt in (s, e)}
+        if len(aware) > 1:
+            _match_pairwise(indexed_records, indexed_cycles, matches)
+            continue
+        
+        indexed_records.sort(key=lambda item: (item[1], item[0]))
+        times = [dt for _, dt, _ in indexed_records]
+        for cycle_pos, cycle_id, start_dt, end_dt in indexed_cycles:
+            lo = bisect_left(times, start_dt)
+            hi = bisect_right(times, end_dt)
+            for rec_idx, _, _ in indexed_records[lo:hi]:
+                matches[cycle_id].append((rec_idx, cycle_pos))
+    
+    # 기존 구현의 append 순서 복원: record 순서 → cycle 순서
+    records_by_cycle = defaultdict(list)
+    for cycle_id, pairs in matches.items():
+        pairs.sort()
+        records_by_cycle[cycle_id] = [all_records[rec_idx] for rec_idx, _ in pairs]
+    
+    return records_by_cycle
+
+
 # ===============================
 # 7. Cycle 확장 분석 (메인 함수)
 # ===============================
@@ -419,30 +520,8 @@ def enhance_cycle_analysis(
     enhanced_cycles = []
     fail_cycles = []
     
-    # record를 cycle_id로 그룹화
-    records_by_cycle = defaultdict(list)
-    for rec in all_records:
-        meta = rec.get("meta", {})
-        stock_code = meta.get("stock_code", "")
-        timestamp_str = meta.get("timestamp", "")
-        
-        # cycle과 매칭 (start_time ~ end_time 사이)
-        for cycle in cycles:
-            if cycle.get("stock") == stock_code:
-                start_time_str = cycle.get("start_time", "")
-                end_time_str = cycle.get("end_time", "")
-                
-                try:
-                    if start_time_str and end_time_str and timestamp_str:
-                        rec_dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                        start_dt = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-                        end_dt = datetime.fromisoformat(end_time_str.replace("Z", "+00:00"))
-                        
-                        if start_dt <= rec_dt <= end_dt:
-                            cycle_id = cycle.get("cycle_id", "")
-                            records_by_cycle[cycle_id].append(rec)
-                except Exception:
-                    pass
+    # record를 cycle_id로 그룹화 (종목별 인덱스 + bisect)
+    records_by_cycle = match_records_to_cycles(cycles, all_records)
     
     # 각 cycle 확장 분석
     for cycle in cycles:
@@ -0,0 +1,431 @@
+# ===============================
+# test/framework/analyzer/cycle_engine.py
+# ===============================
+"""
+Cycle 상태 머신 엔진 (종목별 IDLE/ACTIVE)
+
+용어 정의:
+- cycle: 트리거 이후 유지, 종료까지의 묶음
+    * 시작: observer.triggered == True (이전 cycle 종료 후 첫 trigger)
+    * 종료: outcome.exit_type 존재 (v1 허용: reached_1pct, no_reaction, timeout, manual_stop)
+    * 종목별로 동시에 1개만 존재
+
+사용처:
+- post_market_analyzer.aggregate_observers (전체 정렬 후 1회 순회)
+- streaming_analyzer.CycleAccumulator (k-way merge 스트림, 장중 증분)
+- engine.replay.ReplayEngine (재생된 기록)
+
+record 를 시간순으로 feed() 하고 finalize() 로 cycle 목록을 받습니다.
+finalize() 는 상태를 바꾸지 않으므로 장중에 여러 번 호출할 수 있고,
+to_dict() / from_dict() 로 장중 상태를 JSON 으로 저장/복원할 수 있습니다.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# ============================================================
+# exit_type 판정 기준 (v1 고정)
+# ============================================================
+# 대원칙:
+# 1. exit_type은 반드시 하나만
+# 2. 숫자보다 이벤트 기준
+# 3. 성과/성공/실패 용어 금지
+#    - "잘 됐냐?" ❌
+#    - "어떤 이유로 관측이 끝났냐?" ✅
+#
+# v1에서 허용하는 exit_type (고정, 변경 불가):
+VALID_EXIT_TYPES = {
+    "reached_1pct",    # 기준 반응 폭 도달
+    "no_reaction",     # 관측 시간 동안 의미 있는 반응 없음
+    "timeout",         # 최대 관측 시간 초과
+    "manual_stop",     # 시스템/테스트 종료
+}
+# ❗ 이 4개 외에는 v1에 넣지 않는다
+
+# 같은 record에서 여러 조건이 동시에 만족될 수 있으므로 우선순위가 필수
+# v1 우선순위 (고정):
+EXIT_TYPE_PRIORITY = [
+    "manual_stop",   # 1순위: 사람이 멈추면 그게 최우선
+    "reached_1pct",  # 2순위: 반응 도달은 가장 명확한 종료
+    "timeout",       # 3순위: timeout은 시스템 조건
+    "no_reaction",   # 4순위: no_reaction은 "나머지"
+]
+
+# 우선순위 조회표 (리스트 탐색 대신 dict 1회 조회)
+EXIT_TYPE_RANK = {exit_type: rank for rank, exit_type in enumerate(EXIT_TYPE_PRIORITY)}
+_UNRANKED = len(EXIT_TYPE_PRIORITY)
+
+
+def select_exit_type(exit_types) -> Optional[str]:
+    """
+    exit_type 우선순위에 따라 하나 선택
+
+    Args:
+        exit_types: exit_type 문자열, 리스트, 또는 None
+
+    Returns:
+        우선순위에 따라 선택된 exit_type (문자열) 또는 None
+    """
+    if not exit_types:
+        return None
+
+    # 문자열 1개 (가장 흔한 경우)
+    if isinstance(exit_types, str):
+        return exit_types if exit_types in VALID_EXIT_TYPES else None
+    if not isinstance(exit_types, list):
+        return None
+
+    # 유효한 것 중 우선순위가 가장 높은 것 (동순위면 먼저 나온 것)
+    best = None
+    best_rank = _UNRANKED + 1
+    for et in exit_types:
+        if isinstance(et, str) and et in VALID_EXIT_TYPES:
+            rank = EXIT_TYPE_RANK.get(et, _UNRANKED)
+            if rank < best_rank:
+                best, best_rank = et, rank
+    return best
+
+
+def parse_timestamp(ts_str) -> Optional[datetime]:
+    """ISO timestamp → datetime (실패 시 None)"""
+    if not ts_str:
+        return None
+    try:
+        return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+    except Exception:
+        return None
+
+
+def record_timestamp(rec: Dict[str, Any]) -> datetime:
+    """record 정렬 키 (timestamp 가 없거나 ISO 가 아니면 datetime.min)"""
+    ts_str = rec.get("meta", {}).get("timestamp", "")
+    if not ts_str:
+        return datetime.min
+    try:
+        if isinstance(ts_str, str):
+            if "T" in ts_str:
+                return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+            return datetime.min
+        return ts_str
+    except Exception:
+        return datetime.min
+
+
+def _iso(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+# ============================================================
+# 종목별 cycle 상태
+# ============================================================
+class CycleState:
+    """진행 중/종료된 cycle 1개"""
+
+    __slots__ = (
+        "stock",
+        "start_time",
+        "start_time_str",
+        "start_record_index",
+        "start_session",
+        "trigger_type",
+        "records_in_cycle",
+        "end_time",
+        "end_time_str",
+        "end_record_index",
+        "end_session",
+        "exit_type",
+        "payload",
+    )
+
+    def __init__(
+        self,
+        stock: str,
+        start_time: Optional[datetime],
+        start_time_str: str,
+        start_record_index: int,
+        start_session: str,
+    ):
+        self.stock = stock
+        self.start_time = start_time
+        self.start_time_str = start_time_str
+        self.start_record_index = start_record_index
+        self.start_session = start_session
+        self.trigger_type = "observer_triggered"
+        self.records_in_cycle = 1
+        self.end_time: Optional[datetime] = None
+        self.end_time_str = ""
+        self.end_record_index: Optional[int] = None
+        self.end_session: Optional[str] = None
+        self.exit_type: Optional[str] = None
+        # 다른 누적기가 cycle 단위 지표를 붙이는 자리 (직렬화 대상 아님)
+        self.payload: Any = None
+
+    def _base_dict(self, start_time) -> Dict[str, Any]:
+        return {
+            "stock": self.stock,
+            "start_time": start_time,
+            "start_time_str": self.start_time_str,
+            "start_record_index": self.start_record_index,
+            "start_session": self.start_session,
+            "trigger_type": self.trigger_type,
+            "records_in_cycle": self.records_in_cycle,
+        }
+
+    def closed_dict(self) -> Dict[str, Any]:
+        """exit_type 으로 종료된 cycle (시각은 ISO 문자열)"""
+        cycle = self._base_dict(_iso(self.start_time))
+        cycle["end_time"] = _iso(self.end_time)
+        cycle["end_time_str"] = self.end_time_str
+        cycle["end_record_index"] = self.end_record_index
+        cycle["end_session"] = self.end_session
+        cycle["exit_type"] = self.exit_type
+        return cycle
+
+    def session_end_dict(self, close_time: Optional[datetime], close_time_str: str) -> Dict[str, Any]:
+        """장 종료 시점 미종료 cycle → timeout(session_end)"""
+        cycle = self._base_dict(self.start_time)
+        cycle["end_time"] = close_time
+        cycle["end_time_str"] = close_time_str or ""
+        cycle["exit_type"] = "timeout"
+        cycle["end_reason"] = "session_end"
+        return cycle
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stock": self.stock,
+            "start_time_str": self.start_time_str,
+            "start_record_index": self.start_record_index,
+            "start_session": self.start_session,
+            "trigger_type": self.trigger_type,
+            "records_in_cycle": self.records_in_cycle,
+            "end_time_str": self.end_time_str,
+            "end_record_index": self.end_record_index,
+            "end_session": self.end_session,
+            "exit_type": self.exit_type,
+            "has_start_time": self.start_time is not None,
+            "has_end_time": self.end_time is not None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CycleState":
+        state = cls(
+            data["stock"],
+            parse_timestamp(data["start_time_str"]) if data.get("has_start_time") else None,
+            data["start_time_str"],
+            data["start_record_index"],
+            data["start_session"],
+        )
+        state.trigger_type = data.get("trigger_type", "observer_triggered")
+        state.records_in_cycle = data["records_in_cycle"]
+        state.end_time_str = data.get("end_time_str", "")
+        state.end_time = parse_timestamp(state.end_time_str) if data.get("has_end_time") else None
+        state.end_record_index = data.get("end_record_index")
+        state.end_session = data.get("end_session")
+        state.exit_type = data.get("exit_type")
+        return state
+
+
+# ============================================================
+# 엔진
+# ============================================================
+class CycleEngine:
+    """
+    Cycle 상태 머신
+
+    - feed(record)  : record 1건 처리 → 그 record 가 속한 cycle (없으면 None)
+    - advance(...)  : 이미 파싱된 값으로 처리 (스트림/리플레이의 빠른 경로)
+    - finalize()    : 종료 cycle + 미종료 cycle(timeout) 목록 (상태 변경 없음)
+    """
+
+    def __init__(self, warn_invalid: bool = True):
+        self.open_cycles: Dict[str, CycleState] = {}
+        self.closed: List[CycleState] = []
+        self.first_date = ""
+        self.records = 0
+        self.invalid_exit_types = 0
+        self.current: Optional[CycleState] = None
+        self.last_time_str = ""
+        self.last_time: Optional[datetime] = None
+        self.warn_invalid = warn_invalid
+
+    # --------------------------------------------------
+    # 입력
+    # --------------------------------------------------
+    def feed(self, record: Dict[str, Any], index: Optional[int] = None) -> Optional[CycleState]:
+        """record 1건 처리 (index 를 생략하면 feed 순번)"""
+        meta = record.get("meta", {})
+        ts_str = meta.get("timestamp", "")
+        return self.advance(
+            meta.get("stock_code", "UNKNOWN"),
+            record.get("observer", {}).get("triggered", False),
+            record.get("outcome", {}).get("exit_type"),
+            ts_str,
+            parse_timestamp(ts_str),
+            meta.get("session", "UNKNOWN"),
+            self.records if index is None else index,
+            meta.get("date", ""),
+        )
+
+    def feed_many(self, records: Iterable[Dict[str, Any]]) -> "CycleEngine":
+        for record in records:
+            self.feed(record)
+        return self
+
+    def advance(
+        self,
+        stock_code: str,
+        is_triggered: bool,
+        raw_exit_type,
+        ts_str: str,
+        ts_dt: Optional[datetime],
+        session: str,
+        index: int,
+        date: str = "",
+    ) -> Optional[CycleState]:
+        if self.records == 0:
+            self.first_date = date
+        self.records += 1
+        self.last_time_str = ts_str
+        self.last_time = ts_dt
+
+        # Cycle 시작 판정 (IDLE -> ACTIVE)
+        state = self.open_cycles.get(stock_code)
+        if state is None:
+            if is_triggered:
+                state = CycleState(stock_code, ts_dt, ts_str, index, session)
+                self.open_cycles[stock_code] = state
+        else:
+            state.records_in_cycle += 1
+
+        self.current = state
+        if state is None:
+            return None
+
+        # Cycle 종료 판정 (ACTIVE -> IDLE)
+        exit_type = select_exit_type(raw_exit_type)
+        if exit_type:
+            state.end_time = ts_dt
+            state.end_time_str = ts_str
+            state.end_record_index = index
+            state.end_session = session
+            state.exit_type = exit_type
+            self.closed.append(state)
+            del self.open_cycles[stock_code]
+        elif raw_exit_type:
+            # 잘못된 exit_type은 무시하고 cycle은 계속 진행
+            self.invalid_exit_types += 1
+            if self.warn_invalid:
+                print(
+                    f"⚠️  잘못된 exit_type: {raw_exit_type} "
+                    f"(종목: {stock_code}, record_index: {index})"
+                )
+                print(f"    허용되는 exit_type: {VALID_EXIT_TYPES}")
+        return state
+
+    # --------------------------------------------------
+    # 결과
+    # --------------------------------------------------
+    def states_in_order(self) -> List[CycleState]:
+        """finalize() 목록과 같은 순서의 CycleState (종료 순 → 미종료)"""
+        return self.closed + list(self.open_cycles.values())
+
+    def finalize(
+        self,
+        close_time_str: Optional[str] = None,
+        close_time: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        cycle 목록 (aggregate_observers 의 triggered_cycle 과 같은 구조)
+
+        Args:
+            close_time_str: 장 종료 시각 (None 이면 마지막으로 feed 한 record 의 timestamp)
+            close_time: close_time_str 의 datetime (None 이면 파싱)
+        """
+        if close_time_str is None:
+            close_time_str, close_time = self.last_time_str, self.last_time
+        if close_time is None:
+            close_time = parse_timestamp(close_time_str)
+        cycles = [state.closed_dict() for state in self.closed]
+        for state in self.open_cycles.values():
+            cycles.append(state.session_end_dict(close_time, close_time_str))
+        return cycles
+
+    def summary(self, close_time_str: Optional[str] = None, close_time: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """cycle_summary (구조 정보만)"""
+        return build_cycle_summary(self.finalize(close_time_str, close_time), self.first_date)
+
+    # --------------------------------------------------
+    # 장중 상태 저장/복원
+    # --------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "first_date": self.first_date,
+            "records": self.records,
+            "last_time_str": self.last_time_str,
+            "invalid_exit_types": self.invalid_exit_types,
+            "open_cycles": [state.to_dict() for state in self.open_cycles.values()],
+            "closed": [state.to_dict() for state in self.closed],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], warn_invalid: bool = True) -> "CycleEngine":
+        engine = cls(warn_invalid=warn_invalid)
+        engine.first_date = data.get("first_date", "")
+        engine.records = data.get("records", 0)
+        engine.last_time_str = data.get("last_time_str", "")
+        engine.last_time = parse_timestamp(engine.last_time_str)
+        engine.invalid_exit_types = data.get("invalid_exit_types", 0)
+        for item in data.get("open_cycles", []):
+            state = CycleState.from_dict(item)
+            engine.open_cycles[state.stock] = state
+        engine.closed = [CycleState.from_dict(item) for item in data.get("closed", [])]
+        return engine
+
+
+def build_cycles(records: Iterable[Dict[str, Any]]) -> CycleEngine:
+    """record 목록을 시간순 정렬 후 엔진에 feed (aggregate_observers 와 같은 순서)"""
+    engine = CycleEngine()
+    for index, record in enumerate(sorted(records, key=record_timestamp)):
+        engine.feed(record, index)
+    return engine
+
+
+# ============================================================
+# Cycle 요약 (구조 정보만)
+# ============================================================
+def build_cycle_summary(triggered_cycle: List[Dict[str, Any]], date_str: str) -> List[Dict[str, Any]]:
+    """triggered_cycle → cycle_summary (cycle_id, 시각, 유지 시간, exit_type)"""
+    summary_cycles = []
+    for i, cycle in enumerate(triggered_cycle, start=1):
+        # start_time과 end_time이 datetime 또는 문자열일 수 있음
+        start_dt = cycle.get("start_time")
+        end_dt = cycle.get("end_time")
+        if isinstance(start_dt, str):
+            start_dt = parse_timestamp(start_dt)
+        if isinstance(end_dt, str):
+            end_dt = parse_timestamp(end_dt)
+
+        duration_sec = 0
+        if start_dt and end_dt:
+            try:
+                duration_sec = int((end_dt - start_dt).total_seconds())
+            except Exception:
+                pass
+
+        # start_time_str과 end_time_str 우선 사용, 없으면 datetime을 문자열로 변환
+        start_time_str = cycle.get("start_time_str", "")
+        if not start_time_str and start_dt:
+            start_time_str = start_dt.isoformat()
+        end_time_str = cycle.get("end_time_str", "")
+        if not end_time_str and end_dt:
+            end_time_str = end_dt.isoformat()
+
+        summary_cycles.append({
+            "cycle_id": f"{date_str}-{cycle['stock']}-{i:02d}",
+            "stock": cycle["stock"],
+            "start_time": start_time_str,
+            "end_time": end_time_str,
+            "duration_sec": duration_sec,
+            "exit_type": cycle.get("exit_type", "unknown"),
+        })
+    return summary_cycles
@@ -5,36 +5,81 @@
 Daily Report Graph Generator
 
 정찰봇 일일 보고서 고정 그래프 세트 (v1)
+
+- matplotlib 는 그래프를 실제로 그릴 때만 import (텍스트 분석은 import 비용 없음)
+- pyplot 상태 머신 대신 Figure + Agg 캔버스(OO API) 사용 → 프로세스 풀에서 병렬 렌더링
+- 그래프별 입력 데이터 해시가 이전과 같고 파일이 있으면 다시 그리지 않음
 """
 import os
 import json
+import hashlib
+import statistics
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from pathlib import Path
+from importlib.util import find_spec
+from typing import Dict, Any, List, Optional, Tuple
+
+
+HAS_MATPLOTLIB = find_spec("matplotlib") is not None
+
+# 스타일/그리기 규칙이 바뀌면 올림 (캐시 무효화)
+GRAPH_STYLE_VERSION = "graphs_v1.1"
+GRAPH_HASH_FILENAME = ".graph_hashes.json"
+# workers 를 지정하지 않았을 때 프로세스 풀을 쓰는 최소 작업 수
+# (그래프 몇 장은 프로세스 기동 + matplotlib import 비용이 렌더링보다 큼)
+PARALLEL_GRAPH_MIN_JOBS = 16
 
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    import numpy as np
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-    print("⚠️  matplotlib가 설치되지 않았습니다. 그래프 생성이 불가능합니다.")
+# 한글 폰트 후보 (설치된 첫 번째 사용)
+KOREAN_FONT_CANDIDATES = [
+    "Malgun Gothic",        # Windows
+    "AppleGothic",          # macOS
+    "NanumGothic",          # Linux (fonts-nanum)
+    "Noto Sans CJK KR",
+]
 
 
 # ===============================
 # 그래프 스타일 설정
 # ===============================
-def setup_style():
-    """그래프 스타일 설정"""
-    if not HAS_MATPLOTLIB:
-        return
-    
-    plt.style.use('default')
-    plt.rcParams['font.family'] = 'Malgun Gothic'  # Windows 한글 폰트
-    plt.rcParams['axes.unicode_minus'] = False
-    plt.rcParams['figure.figsize'] = (10, 6)
-    plt.rcParams['figure.dpi'] = 100
+_STYLE_RC: Optional[Dict[str, Any]] = None
+
+
+def setup_style() -> Dict[str, Any]:
+    """그래프 스타일 rcParams (프로세스당 1회 계산, rc_context 로 적용)"""
+    global _STYLE_RC
+    if _STYLE_RC is not None:
+        return _STYLE_RC
+
+    from matplotlib import font_manager
+
+    installed = {font.name for font in font_manager.fontManager.ttflist}
+    font_family = next(
+        (name for name in KOREAN_FONT_CANDIDATES if name in installed),
+        "DejaVu Sans",
+    )
+    _STYLE_RC = {
+        "font.family": font_family,
+        "axes.unicode_minus": False,
+        "figure.figsize": (10, 6),
+        "figure.dpi": 100,
+    }
+    return _STYLE_RC
+
+
+def _new_figure(figsize: Tuple[int, int]):
+    """pyplot 없이 Agg 캔버스에 붙은 Figure 생성"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _save_figure(fig, output_path: str) -> None:
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=150, bbox_inches='tight')
 
 
 # ===============================
@@ -46,16 +91,16 @@ def plot_cycle_outcomes(
 ) -> bool:
     """
     Cycle 종료 유형 분포 (Bar Chart)
-    
+
     "잘 됐다 / 못 됐다" 해석 ❌
     비율만 본다
     """
     if not HAS_MATPLOTLIB:
         return False
-    
+
     try:
-        setup_style()
-        
+        from matplotlib import rc_context
+
         exit_types = ["reached_1pct", "no_reaction", "timeout", "manual_stop"]
         labels = {
             "reached_1pct": "1% 도달 종료",
@@ -63,34 +108,34 @@ def plot_cycle_outcomes(
             "timeout": "타임아웃 종료",
             "manual_stop": "즉시 종료",
         }
-        
+
         counts = [outcome_dist.get(et, 0) for et in exit_types]
         label_names = [labels[et] for et in exit_types]
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        bars = ax.bar(label_names, counts, color=['#4CAF50', '#FF9800', '#2196F3', '#F44336'])
-        
-        # 값 표시
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(
-                    bar.get_x() + bar.get_width() / 2.,
-                    height,
-                    f'{int(height)}',
-                    ha='center',
-                    va='bottom'
-                )
-        
-        ax.set_ylabel('Cycle 개수')
-        ax.set_title('Cycle 종료 유형 분포', fontsize=14, fontweight='bold')
-        ax.grid(axis='y', alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        
+
+        with rc_context(setup_style()):
+            fig = _new_figure((10, 6))
+            ax = fig.add_subplot()
+
+            bars = ax.bar(label_names, counts, color=['#4CAF50', '#FF9800', '#2196F3', '#F44336'])
+
+            # 값 표시
+            for bar in bars:
+                height = bar.get_height()
+                if height > 0:
+                    ax.text(
+                        bar.get_x() + bar.get_width() / 2.,
+                        height,
+                        f'{int(height)}',
+                        ha='center',
+                        va='bottom'
+                    )
+
+            ax.set_ylabel('Cycle 개수')
+            ax.set_title('Cycle 종료 유형 분포', fontsize=14, fontweight='bold')
+            ax.grid(axis='y', alpha=0.3)
+
+            _save_figure(fig, output_path)
+
         return True
     except Exception as e:
         print(f"⚠️  Cycle 종료 유형 분포 그래프 생성 오류: {e}")
@@ -100,65 +145,70 @@ def plot_cycle_outcomes(
 # ===============================
 # 2. 유지 시간 분포 (Histogram)
 # ===============================
+def _cycle_durations_min(cycles: List[Dict[str, Any]]) -> List[float]:
+    """유지 시간(분) 목록 (0초 cycle 제외)"""
+    durations = []
+    for cycle in cycles:
+        duration_sec = cycle.get("duration_sec", 0)
+        if duration_sec > 0:
+            # 초를 분으로 변환
+            durations.append(duration_sec / 60)
+    return durations
+
+
 def plot_cycle_duration_hist(
     cycles: List[Dict[str, Any]],
     output_path: str,
 ) -> bool:
     """
     유지 시간 분포 (Histogram)
-    
+
     평균은 거짓말을 할 수 있다
     분포는 거짓말을 못 한다
     """
     if not HAS_MATPLOTLIB:
         return False
-    
+
     try:
-        setup_style()
-        
-        durations = []
-        for cycle in cycles:
-            duration_sec = cycle.get("duration_sec", 0)
-            if duration_sec > 0:
-                # 초를 분으로 변환
-                duration_min = duration_sec / 60
-                durations.append(duration_min)
-        
+        durations = _cycle_durations_min(cycles)
+
         if not durations:
             print("⚠️  유지 시간 데이터가 없습니다.")
             return False
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        # 히스토그램 생성
-        n, bins, patches = ax.hist(
-            durations,
-            bins=30,
-            edgecolor='black',
-            alpha=0.7,
-            color='#2196F3'
-        )
-        
-        # 평균선 표시
-        mean_duration = np.mean(durations)
-        ax.axvline(
-            mean_duration,
-            color='red',
-            linestyle='--',
-            linewidth=2,
-            label=f'평균: {mean_duration:.1f}분'
-        )
-        
-        ax.set_xlabel('Cycle 유지 시간 (분)')
-        ax.set_ylabel('Cycle 개수')
-        ax.set_title('Cycle 유지 시간 분포', fontsize=14, fontweight='bold')
-        ax.legend()
-        ax.grid(axis='y', alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        
+
+        from matplotlib import rc_context
+
+        with rc_context(setup_style()):
+            fig = _new_figure((10, 6))
+            ax = fig.add_subplot()
+
+            # 히스토그램 생성
+            ax.hist(
+                durations,
+                bins=30,
+                edgecolor='black',
+                alpha=0.7,
+                color='#2196F3'
+            )
+
+            # 평균선 표시
+            mean_duration = statistics.mean(durations)
+            ax.axvline(
+                mean_duration,
+                color='red',
+                linestyle='--',
+                linewidth=2,
+                label=f'평균: {mean_duration:.1f}분'
+            )
+
+            ax.set_xlabel('Cycle 유지 시간 (분)')
+            ax.set_ylabel('Cycle 개수')
+            ax.set_title('Cycle 유지 시간 분포', fontsize=14, fontweight='bold')
+            ax.legend()
+            ax.grid(axis='y', alpha=0.3)
+
+            _save_figure(fig, output_path)
+
         return True
     except Exception as e:
         print(f"⚠️  유지 시간 분포 그래프 생성 오류: {e}")
@@ -174,26 +224,24 @@ def plot_price_zone_hist(
 ) -> bool:
     """
     종료 가격대 분포 (Price Zone Histogram)
-    
+
     지지·저항 후보를 사후적으로 드러내는 유일한 시각화
-    
+
     선 긋기 ❌
     "여기가 지지"라고 말하지 않는다
     → "여기서 많이 끝났다"까지만
     """
     if not HAS_MATPLOTLIB:
         return False
-    
+
     try:
-        setup_style()
-        
         # 종료 가격 수집 (snapshot에서 가져와야 함)
         # 현재는 cycle에 가격 정보가 없으므로, 추후 구현 필요
         # 일단 구조만 제공
-        
+
         print("⚠️  종료 가격대 분포 그래프는 가격 데이터가 필요합니다.")
         print("    현재 cycle 데이터에 가격 정보가 없어 생성하지 않습니다.")
-        
+
         # TODO: cycle에 종료 시점 가격 정보 추가 후 구현
         return False
     except Exception as e:
@@ -204,95 +252,198 @@ def plot_price_zone_hist(
 # ===============================
 # 4. 장중 시간대별 Cycle 발생 수 (Time-of-Day Line Chart)
 # ===============================
+def _time_of_day_bins(cycles: List[Dict[str, Any]]) -> Dict[str, int]:
+    """시간대별 cycle 시작 수 (10분 단위)"""
+    time_bins = {}
+
+    for cycle in cycles:
+        start_time_str = cycle.get("start_time", "")
+        if not start_time_str:
+            continue
+
+        try:
+            start_dt = datetime.fromisoformat(
+                start_time_str.replace("Z", "+00:00")
+            )
+            # 시간을 10분 단위로 반올림
+            hour = start_dt.hour
+            minute = (start_dt.minute // 10) * 10
+            time_key = f"{hour:02d}:{minute:02d}"
+
+            time_bins[time_key] = time_bins.get(time_key, 0) + 1
+        except Exception:
+            continue
+
+    return time_bins
+
+
 def plot_time_of_day_cycles(
     cycles: List[Dict[str, Any]],
     output_path: str,
 ) -> bool:
     """
     장중 시간대별 Cycle 발생 수 (Time-of-Day Line Chart)
-    
+
     정찰봇이 언제 가장 예민하게 반응하는지 확인 가능
     장 초반 / 중반 / 후반의 구조 차이를 감으로 느끼게 해줌
     """
     if not HAS_MATPLOTLIB:
         return False
-    
+
     try:
-        setup_style()
-        
-        # 시간대별 cycle 시작 수 집계 (10분 단위)
-        time_bins = {}
-        
-        for cycle in cycles:
-            start_time_str = cycle.get("start_time", "")
-            if not start_time_str:
-                continue
-            
-            try:
-                start_dt = datetime.fromisoformat(
-                    start_time_str.replace("Z", "+00:00")
-                )
-                # 시간을 10분 단위로 반올림
-                hour = start_dt.hour
-                minute = (start_dt.minute // 10) * 10
-                time_key = f"{hour:02d}:{minute:02d}"
-                
-                time_bins[time_key] = time_bins.get(time_key, 0) + 1
-            except Exception:
-                continue
-        
+        time_bins = _time_of_day_bins(cycles)
+
         if not time_bins:
             print("⚠️  시간대별 cycle 데이터가 없습니다.")
             return False
-        
+
+        from matplotlib import rc_context
+
         # 시간순 정렬
         sorted_times = sorted(time_bins.keys())
         counts = [time_bins[t] for t in sorted_times]
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        ax.plot(sorted_times, counts, marker='o', linewidth=2, markersize=6, color='#2196F3')
-        ax.fill_between(sorted_times, counts, alpha=0.3, color='#2196F3')
-        
-        ax.set_xlabel('시간대 (10분 단위)')
-        ax.set_ylabel('Cycle 발생 수')
-        ax.set_title('장중 시간대별 Cycle 발생 수', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        
-        # x축 레이블 회전
-        plt.xticks(rotation=45, ha='right')
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        
+
+        with rc_context(setup_style()):
+            fig = _new_figure((12, 6))
+            ax = fig.add_subplot()
+
+            ax.plot(sorted_times, counts, marker='o', linewidth=2, markersize=6, color='#2196F3')
+            ax.fill_between(sorted_times, counts, alpha=0.3, color='#2196F3')
+
+            ax.set_xlabel('시간대 (10분 단위)')
+            ax.set_ylabel('Cycle 발생 수')
+            ax.set_title('장중 시간대별 Cycle 발생 수', fontsize=14, fontweight='bold')
+            ax.grid(True, alpha=0.3)
+
+            # x축 레이블 회전
+            ax.tick_params(axis='x', labelrotation=45)
+            for label in ax.get_xticklabels():
+                label.set_horizontalalignment('right')
+
+            _save_figure(fig, output_path)
+
         return True
     except Exception as e:
         print(f"⚠️  시간대별 Cycle 발생 수 그래프 생성 오류: {e}")
         return False
 
 
+# ===============================
+# 렌더링 작업 (프로세스 풀)
+# ===============================
+PLOT_FUNCTIONS = {
+    "cycle_outcomes": plot_cycle_outcomes,
+    "cycle_duration_hist": plot_cycle_duration_hist,
+    "price_zone_hist": plot_price_zone_hist,
+    "time_of_day_cycles": plot_time_of_day_cycles,
+}
+
+
+def _render_graph(job: Tuple[str, Any, str]) -> Tuple[str, bool]:
+    """워커: 그래프 1개 렌더링"""
+    name, data, output_path = job
+    return name, PLOT_FUNCTIONS[name](data, output_path)
+
+
+def _data_hash(name: str, data: Any) -> str:
+    payload = json.dumps(
+        {"graph": name, "version": GRAPH_STYLE_VERSION, "data": data},
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load_hashes(output_dir: str) -> Dict[str, str]:
+    try:
+        with open(os.path.join(output_dir, GRAPH_HASH_FILENAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_hashes(output_dir: str, hashes: Dict[str, str]) -> None:
+    with open(os.path.join(output_dir, GRAPH_HASH_FILENAME), "w", encoding="utf-8") as f:
+        json.dump(hashes, f, ensure_ascii=False, indent=2)
+
+
+def render_graph_jobs(
+    jobs: List[Tuple[str, Any, str]],
+    output_dir: str,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> Dict[str, bool]:
+    """
+    그래프 작업 실행 (입력 해시가 같은 그래프는 생략)
+
+    Args:
+        jobs: [(그래프 이름, 입력 데이터, 출력 경로)]
+        workers: 프로세스 수 (None이면 작업이 PARALLEL_GRAPH_MIN_JOBS 이상일 때만
+                 CPU 수만큼, 그 외에는 현재 프로세스에서 순차 실행)
+        force: 해시와 무관하게 다시 렌더링
+    """
+    hashes = _load_hashes(output_dir)
+    results = {}
+    pending = []
+    for name, data, output_path in jobs:
+        data_hash = _data_hash(name, data)
+        if not force and hashes.get(name) == data_hash and os.path.exists(output_path):
+            results[name] = True
+            print(f"  ♻️  변경 없음: {output_path}")
+            continue
+        pending.append(((name, data, output_path), data_hash))
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(pending) >= PARALLEL_GRAPH_MIN_JOBS else 1
+    workers = min(workers, len(pending))
+    if workers <= 1:
+        rendered = [_render_graph(job) for job, _ in pending]
+    else:
+        # 호출 프로세스가 스레드를 쓰고 있을 수 있으므로 fork 대신 spawn
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            rendered = list(executor.map(_render_graph, [job for job, _ in pending]))
+
+    for ((name, _, output_path), data_hash), (_, ok) in zip(pending, rendered):
+        results[name] = ok
+        if ok:
+            hashes[name] = data_hash
+            print(f"  ✅ 생성: {output_path}")
+        else:
+            hashes.pop(name, None)
+
+    _save_hashes(output_dir, hashes)
+    return results
+
+
 # ===============================
 # 메인 그래프 생성 함수
 # ===============================
 def generate_daily_graphs(
     daily_report_path: str,
     output_dir: str,
+    workers: Optional[int] = None,
+    force: bool = False,
 ) -> Dict[str, bool]:
     """
     Daily Report에서 그래프 생성
-    
+
     Args:
         daily_report_path: daily_report.json 파일 경로
         output_dir: 그래프 저장 디렉토리
-    
+        workers: 렌더링 프로세스 수 (None이면 기본 순차, 2 이상이면 spawn 프로세스 풀)
+        force: 입력 데이터가 같아도 다시 렌더링
+
     Returns:
-        생성된 그래프 파일 경로 딕셔너리
+        그래프별 생성(또는 최신 상태 유지) 여부 딕셔너리
     """
     if not HAS_MATPLOTLIB:
         print("⚠️  matplotlib가 설치되지 않아 그래프를 생성할 수 없습니다.")
         return {}
-    
+
     # daily_report.json 읽기
     try:
         with open(daily_report_path, "r", encoding="utf-8") as f:
@@ -300,77 +451,53 @@ def generate_daily_graphs(
     except Exception as e:
         print(f"⚠️  Daily Report 읽기 오류: {e}")
         return {}
-    
+
     # 출력 디렉토리 생성
     os.makedirs(output_dir, exist_ok=True)
-    
-    results = {}
-    
+
+    jobs = []
+
     # 1. Cycle 종료 유형 분포
     outcome_dist = report_data.get("cycle_outcome_distribution", {})
     if outcome_dist:
-        output_path = os.path.join(output_dir, "cycle_outcomes.png")
-        results["cycle_outcomes"] = plot_cycle_outcomes(
+        jobs.append((
+            "cycle_outcomes",
             outcome_dist,
-            output_path
-        )
-        if results["cycle_outcomes"]:
-            print(f"  ✅ 생성: {output_path}")
-    
-    # 2. 유지 시간 분포
-    cycles = report_data.get("representative_cycles", [])
-    # 모든 cycle 데이터가 필요하므로 daily_analysis.json에서 가져와야 함
-    # 일단 representative_cycles만 사용
-    
-    # 전체 cycle 데이터를 위해 daily_analysis.json도 읽기
+            os.path.join(output_dir, "cycle_outcomes.png"),
+        ))
+
+    # 전체 cycle 데이터를 위해 daily_analysis.json 읽기
+    # (daily_report.json 에는 representative_cycles 만 있음)
     daily_analysis_path = daily_report_path.replace(
         "daily_report.json", "daily_analysis.json"
     )
     all_cycles = []
-    
+
     if os.path.exists(daily_analysis_path):
         try:
             with open(daily_analysis_path, "r", encoding="utf-8") as f:
                 analysis_data = json.load(f)
             observer_stats = analysis_data.get("observer_stats", {})
             observer_summary = observer_stats.get("observer_summary", {})
-            cycle_summary_list = observer_summary.get("cycle_summary", [])
-            all_cycles = cycle_summary_list
+            all_cycles = observer_summary.get("cycle_summary", [])
         except Exception:
             pass
-    
-    if all_cycles:
-        output_path = os.path.join(output_dir, "cycle_duration_hist.png")
-        results["cycle_duration_hist"] = plot_cycle_duration_hist(
-            all_cycles,
-            output_path
-        )
-        if results.get("cycle_duration_hist"):
-            print(f"  ✅ 생성: {output_path}")
-    
-    # 3. 종료 가격대 분포 (현재는 구현 안 됨)
-    # output_path = os.path.join(output_dir, "price_zone_hist.png")
-    # results["price_zone_hist"] = plot_price_zone_hist(all_cycles, output_path)
-    
-    # 4. 장중 시간대별 Cycle 발생 수
-    if all_cycles:
-        output_path = os.path.join(output_dir, "time_of_day_cycles.png")
-        results["time_of_day_cycles"] = plot_time_of_day_cycles(
-            all_cycles,
-            output_path
-        )
-        if results.get("time_of_day_cycles"):
-            print(f"  ✅ 생성: {output_path}")
-    
-    return results
-
-
-
-
-
-
-
 
+    if all_cycles:
+        # 2. 유지 시간 분포 (해시는 그래프가 실제로 쓰는 필드만)
+        jobs.append((
+            "cycle_duration_hist",
+            [{"duration_sec": c.get("duration_sec", 0)} for c in all_cycles],
+            os.path.join(output_dir, "cycle_duration_hist.png"),
+        ))
 
+        # 3. 종료 가격대 분포 (현재는 구현 안 됨)
 
+        # 4. 장중 시간대별 Cycle 발생 수
+        jobs.append((
+            "time_of_day_cycles",
+            [{"start_time": c.get("start_time", "")} for c in all_cycles],
+            os.path.join(output_dir, "time_of_day_cycles.png"),
+        ))
 
+    return render_graph_jobs(jobs, output_dir, workers=workers, force=force)
@@ -0,0 +1,466 @@
+# ===============================
+# test/framework/analyzer/incremental_analyzer.py
+# ===============================
+"""
+장중 증분 분석 (정찰 JSONL tail)
+
+역할:
+- 파일별 읽기 오프셋(byte)을 유지하고 새로 추가된 줄만 파싱
+- streaming_analyzer 누적기(Cycle 상태 머신/카운터)를 실행 간에 유지
+  → /status 같은 장중 조회 비용은 O(신규 record)
+- 상태는 분석 날짜 디렉터리에 저장
+  · intraday_state.pkl     : 오프셋/카운터/열린 cycle (크기 = 종목 수 + 열린 cycle 수)
+  · intraday_state.journal : 하루 동안 계속 늘어나는 트리거 목록/종료 cycle 은 저장할 때마다 새 항목만 추가
+  → 장 마감 리포트(analyze_daily_market(incremental=True))는 남은 줄만 읽고 바로 생성
+- JSONL 이 압축 보관(scout_archive)된 날짜는 컨테이너의 종목 프레임을 같은 오프셋 기준으로 읽음
+- 정찰봇(/status, 장 마감 요약)과 장 마감 분석이 같은 상태를 쓰므로
+  상태 로드/갱신/저장은 파일 잠금(intraday_state.lock) 안에서 수행하고,
+  다른 프로세스가 더 최근 상태를 저장했으면 그것을 다시 읽은 뒤 이어서 집계 (sync)
+
+주의:
+- 쓰기 중인 마지막 줄(개행 없음)은 다음 실행에서 읽음
+- 파일이 줄어들거나(교체) 분석 버전이 바뀌면 처음부터 다시 집계
+"""
+import io
+import os
+import json
+import heapq
+import pickle
+import threading
+import contextlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from test.framework.analyzer import post_market_analyzer as pma
+from test.framework.analyzer.streaming_analyzer import (
+    CycleAccumulator,
+    EnhancedCycleAccumulator,
+    ObserverStatsAccumulator,
+    StreamItem,
+    _empty_stats,
+    _sort_key,
+    build_default_accumulators,
+)
+
+
+INTRADAY_STATE_FILENAME = "intraday_state.pkl"
+INTRADAY_JOURNAL_SUFFIX = ".journal"
+INTRADAY_STATE_VERSION = 4
+INTRADAY_LOCK_SUFFIX = ".lock"
+
+
+@contextlib.contextmanager
+def _file_lock(path: str):
+    """프로세스 간 배타 잠금 (잠금 파일은 지우지 않음)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK 은 10초 재시도 후 실패 → 계속 대기
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class IncrementalAnalyzer:
+    """날짜 1개의 장중 증분 집계기"""
+
+    def __init__(self, date: str, state_path: Optional[str] = None, scout_dir: Optional[str] = None):
+        """
+        Args:
+            date: YYYY-MM-DD
+            state_path: 상태 파일 경로 (None이면 분석 날짜 디렉터리)
+            scout_dir: 정찰 기록 디렉터리 (None이면 get_scout_date_dir)
+        """
+        self.date = date
+        self.scout_dir = scout_dir or pma.get_scout_date_dir(date)
+        self.state_path = state_path or os.path.join(
+            pma.get_analysis_date_dir(date), INTRADAY_STATE_FILENAME
+        )
+        self.journal_path = os.path.splitext(self.state_path)[0] + INTRADAY_JOURNAL_SUFFIX
+        self.lock_path = os.path.splitext(self.state_path)[0] + INTRADAY_LOCK_SUFFIX
+        # 같은 프로세스의 스레드 (/status 처리 스레드, 장 마감 요약) 간 직렬화
+        self.lock = threading.RLock()
+        self._state_stamp = None
+        self._reset()
+        with _file_lock(self.lock_path):
+            self._load_state()
+
+    # -------------------------
+    # 상태
+    # -------------------------
+    def _reset(self) -> None:
+        self.offsets: Dict[str, int] = {}
+        self.accumulators = build_default_accumulators()
+        self.total_records = 0
+        self.first_record: Optional[Dict[str, Any]] = None
+        self.last_item: Optional[StreamItem] = None
+        self.late_records = 0
+        # 저널에 이미 기록된 항목 수 / 저널 유효 길이 (byte)
+        self.journaled = {"triggers": 0, "closed": 0}
+        self.journal_size = 0
+
+    def _append_only_lists(self) -> Tuple[ObserverStatsAccumulator, CycleAccumulator]:
+        observer = next(a for a in self.accumulators if isinstance(a, ObserverStatsAccumulator))
+        cycles = next(a for a in self.accumulators if isinstance(a, CycleAccumulator))
+        return observer, cycles
+
+    def _state_key(self) -> Dict[str, Any]:
+        return {
+            "version": INTRADAY_STATE_VERSION,
+            "analyzer_version": pma.ANALYZER_VERSION,
+            "date": self.date,
+            "scout_dir": os.path.abspath(self.scout_dir),
+        }
+
+    def _disk_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """상태 파일 식별값 (다른 프로세스가 저장했는지 확인)"""
+        try:
+            stat = os.stat(self.state_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _read_journal(self, size: int) -> Iterator[Dict[str, list]]:
+        """저널 앞 size byte 의 chunk (상태 저장 전에 추가된 꼬리는 무시)"""
+        if not size:
+            return
+        with open(self.journal_path, "rb") as f:
+            data = f.read(size)
+        if len(data) != size:
+            raise ValueError(f"장중 분석 저널이 상태보다 짧음 ({len(data)} < {size})")
+        buffer = io.BytesIO(data)
+        while buffer.tell() < size:
+            yield pickle.load(buffer)
+
+    def _load_state(self) -> None:
+        self._state_stamp = self._disk_stamp()
+        if self._state_stamp is None:
+            return
+        try:
+            with open(self.state_path, "rb") as f:
+                state = pickle.load(f)
+            if state.get("key") != self._state_key():
+                return
+            self.offsets = state["offsets"]
+            self.accumulators = state["accumulators"]
+            self.total_records = state["total_records"]
+            self.first_record = state["first_record"]
+            self.last_item = state["last_item"]
+            self.late_records = state.get("late_records", 0)
+            self.journal_size = state["journal_size"]
+
+            observer, cycles = self._append_only_lists()
+            for chunk in self._read_journal(self.journal_size):
+                observer.triggers.extend(chunk["triggers"])
+                cycles.engine.closed.extend(chunk["closed"])
+            self.journaled = {"triggers": len(observer.triggers), "closed": len(cycles.engine.closed)}
+        except Exception as e:
+            print(f"⚠️  장중 분석 상태 로드 실패 (처음부터 집계): {e}")
+            self._reset()
+
+    def _append_journal(self, observer: ObserverStatsAccumulator, cycles: CycleAccumulator) -> None:
+        """지난 저장 이후 추가된 트리거/종료 cycle 만 저널 끝에 기록"""
+        chunk = {
+            "triggers": observer.triggers[self.journaled["triggers"]:],
+            "closed": cycles.engine.closed[self.journaled["closed"]:],
+        }
+        if not chunk["triggers"] and not chunk["closed"] and os.path.exists(self.journal_path):
+            return
+        mode = "r+b" if os.path.exists(self.journal_path) else "wb"
+        with open(self.journal_path, mode) as f:
+            # 상태에 반영되지 않은 꼬리(저장 중단/처음부터 재집계) 제거 후 추가
+            f.truncate(self.journal_size)
+            f.seek(self.journal_size)
+            pickle.dump(chunk, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+            self.journal_size = f.tell()
+        self.journaled = {"triggers": len(observer.triggers), "closed": len(cycles.engine.closed)}
+
+    def save_state(self) -> None:
+        """상태 저장 (파일 잠금 안에서)"""
+        with self.lock, _file_lock(self.lock_path):
+            self._save_state()
+
+    def sync(self) -> int:
+        """
+        다른 프로세스가 저장한 상태 반영 → 새 줄 반영 → 저장 (파일 잠금 안에서)
+
+        Returns:
+            이번에 반영한 record 수
+        """
+        with self.lock, _file_lock(self.lock_path):
+            if self._disk_stamp() != self._state_stamp:
+                self._reset()
+                self._load_state()
+            added = self.update()
+            if added:
+                self._save_state()
+        return added
+
+    def _save_state(self) -> None:
+        """
+        상태 저장
+
+        트리거 목록/종료 cycle 은 저널에 새 항목만 추가하고, 상태 파일에는
+        크기가 일정한 부분(오프셋, 카운터, 열린 cycle)만 원자적으로 다시 기록
+        (저널 추가 → 상태 교체 순서라 중간에 멈춰도 상태 파일 기준으로 일관됨)
+        """
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        observer, cycles = self._append_only_lists()
+        enhanced = [a for a in self.accumulators if isinstance(a, EnhancedCycleAccumulator)]
+        self._append_journal(observer, cycles)
+
+        # 저널로 저장한 목록 / 조회 시 다시 만드는 결과는 상태 파일에서 제외
+        detached = (observer.triggers, cycles.engine.closed, cycles.engine.current, cycles.states_in_order)
+        detached_results = [(a.result, a.watchlist_data) for a in enhanced]
+        observer.triggers, cycles.engine.closed, cycles.engine.current, cycles.states_in_order = [], [], None, []
+        for acc in enhanced:
+            acc.result = acc.watchlist_data = None
+        try:
+            state = {
+                "key": self._state_key(),
+                "offsets": self.offsets,
+                "accumulators": self.accumulators,
+                "total_records": self.total_records,
+                "first_record": self.first_record,
+                "last_item": self.last_item,
+                "late_records": self.late_records,
+                "journal_size": self.journal_size,
+            }
+            tmp_path = self.state_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.state_path)
+            self._state_stamp = self._disk_stamp()
+        finally:
+            observer.triggers, cycles.engine.closed, cycles.engine.current, cycles.states_in_order = detached
+            for acc, (result, watchlist_data) in zip(enhanced, detached_results):
+                acc.result, acc.watchlist_data = result, watchlist_data
+
+    # -------------------------
+    # 증분 읽기
+    # -------------------------
+    def _read_new_items(self, file_path: Path) -> List[StreamItem]:
+        """오프셋 이후의 완성된 줄만 파싱"""
+        offset = self.offsets.get(file_path.name, 0)
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        return self._parse_new_lines(file_path.name, offset, data, file_path)
+
+    def _read_archived_items(self) -> Optional[List[List[StreamItem]]]:
+        """
+        JSONL 이 보관된 날짜: 컨테이너의 종목 프레임(원본 JSONL 과 같은 byte)에서 오프셋 이후 줄
+
+        Returns:
+            종목별 새 item 목록, 컨테이너가 없으면 None
+        """
+        try:
+            from test.framework.analyzer.scout_archive import open_day_archive
+        except ImportError:
+            return None
+        archive = open_day_archive(self.scout_dir)
+        if archive is None:
+            return None
+
+        batches = []
+        for stock in archive.stocks():
+            name = f"{stock}.jsonl"
+            offset = self.offsets.get(name, 0)
+            if offset >= archive.members[name]["raw_size"]:
+                continue
+            data = archive.read_member(name)[offset:]
+            items = self._parse_new_lines(name, offset, data, f"{archive.path}[{stock}]")
+            if items:
+                batches.append(items)
+        return batches
+
+    def _parse_new_lines(self, name: str, offset: int, data: bytes, source: Any) -> List[StreamItem]:
+        end = data.rfind(b"\n")
+        if end < 0:
+            return []
+        self.offsets[name] = offset + end + 1
+
+        items = []
+        for raw in data[:end].split(b"\n"):
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                print(f"⚠️  JSON 파싱 오류 ({source}): {e}")
+                continue
+            items.append(StreamItem(record))
+        return items
+
+    def update(self) -> int:
+        """
+        새로 추가된 줄을 누적기에 반영
+
+        Returns:
+            이번에 반영한 record 수
+        """
+        if not os.path.isdir(self.scout_dir):
+            return 0
+
+        files = list(Path(self.scout_dir).glob("*.jsonl"))
+        for file_path in files:
+            if file_path.stat().st_size < self.offsets.get(file_path.name, 0):
+                print(f"⚠️  정찰 파일이 줄어듦 ({file_path.name}) → 처음부터 다시 집계")
+                self._reset()
+                break
+
+        if files:
+            batches = [items for items in map(self._read_new_items, files) if items]
+        else:
+            # 마감 후 JSONL 이 압축 보관된 날짜 → 컨테이너 프레임
+            batches = self._read_archived_items() or []
+        if not batches:
+            return 0
+        if self.first_record is None:
+            self.first_record = batches[0][0].record
+
+        last_key = _sort_key(self.last_item) if self.last_item is not None else None
+        late_before = self.late_records
+        added = 0
+        for item in heapq.merge(*batches, key=_sort_key):
+            if last_key is not None and _sort_key(item) < last_key:
+                self.late_records += 1
+            item.index = self.total_records
+            for acc in self.accumulators:
+                acc.add(item)
+            self.total_records += 1
+            self.last_item = item
+            added += 1
+
+        # 상태에는 record 본문이 필요 없음
+        self.last_item.record = {}
+        if self.late_records > late_before:
+            print(f"⚠️  이전 실행보다 이른 시각의 record {self.late_records - late_before}건 (도착 순서대로 반영)")
+        return added
+
+    # -------------------------
+    # 결과
+    # -------------------------
+    def snapshot(
+        self,
+        watchlist_data: Optional[Dict[str, Any]] = None,
+        exclude_fail: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        현재까지의 집계 결과 (stream_scout_records 와 같은 구조)
+
+        진행 중 cycle 은 마지막 record 시각 기준 timeout(session_end) 으로 표시
+        """
+        enhanced_result = None
+        stats = _empty_stats()
+        stats["total_records"] = self.total_records
+        for acc in self.accumulators:
+            if isinstance(acc, EnhancedCycleAccumulator):
+                acc.watchlist_data = watchlist_data
+                acc.exclude_fail = exclude_fail
+            acc.finalize(stats, self.last_item)
+            if isinstance(acc, EnhancedCycleAccumulator):
+                enhanced_result = acc.result
+
+        return {
+            "observer_stats": stats,
+            "enhanced_result": enhanced_result,
+            "total_records": self.total_records,
+            "first_record": self.first_record,
+            "accumulators": self.accumulators,
+        }
+
+    def open_cycles_count(self) -> int:
+        for acc in self.accumulators:
+            if isinstance(acc, CycleAccumulator):
+                return len(acc.open_cycles)
+        return 0
+
+
+# ===============================
+# 장중 조회 (/status 등)
+# ===============================
+_ANALYZERS: Dict[str, IncrementalAnalyzer] = {}
+_ANALYZERS_LOCK = threading.Lock()
+
+
+def get_incremental_analyzer(date: str) -> IncrementalAnalyzer:
+    """날짜별 분석기 (프로세스 내 재사용)"""
+    with _ANALYZERS_LOCK:
+        analyzer = _ANALYZERS.get(date)
+        if analyzer is None:
+            analyzer = _ANALYZERS[date] = IncrementalAnalyzer(date)
+    return analyzer
+
+
+def get_intraday_summary(date: str) -> Dict[str, Any]:
+    """
+    장중 요약 (신규 줄만 읽고 상태 저장)
+
+    Returns:
+        {"date", "total_records", "new_records", "triggered_cycles", "open_cycles",
+         "exit_types", "market_character"}
+    """
+    analyzer = get_incremental_analyzer(date)
+    with analyzer.lock:
+        new_records = analyzer.sync()
+        streamed = analyzer.snapshot()
+        open_cycles = analyzer.open_cycles_count()
+    observer_stats = streamed["observer_stats"]
+    market_character = pma.generate_market_character_summary(
+        observer_stats,
+        date=date,
+        total_records=streamed["total_records"],
+    )
+
+    exit_types: Dict[str, int] = {}
+    for cycle in observer_stats["observer_summary"]["cycle_summary"]:
+        exit_type = cycle.get("exit_type", "unknown")
+        exit_types[exit_type] = exit_types.get(exit_type, 0) + 1
+
+    return {
+        "date": date,
+        "total_records": streamed["total_records"],
+        "new_records": new_records,
+        "triggered_cycles": observer_stats["observer_summary"]["triggered_cycles_count"],
+        "open_cycles": open_cycles,
+        "exit_types": exit_types,
+        "market_character": market_character,
+    }
+
+
+def format_intraday_summary(summary: Dict[str, Any]) -> str:
+    """텔레그램용 장중 요약 텍스트"""
+    character = summary["market_character"]
+    lines = [
+        f"🔍 장중 분석 ({summary['date']})",
+        f"정찰 기록: {summary['total_records']}건 (+{summary['new_records']})",
+        f"Cycle: {summary['triggered_cycles']}개 (진행 중 {summary['open_cycles']}개)",
+        f"시장 성격: {character['character']} (트리거 {character['trigger_rate']}%, Box {character['box_rate']}%)",
+    ]
+    if summary["exit_types"]:
+        lines.append("종료 유형: " + ", ".join(f"{k}:{v}" for k, v in sorted(summary["exit_types"].items())))
+    return "\n".join(lines)
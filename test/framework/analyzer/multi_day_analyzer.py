@@ -0,0 +1,378 @@
+# ===============================
+# test/framework/analyzer/multi_day_analyzer.py
+# ===============================
+"""
+다중 날짜 Post-Market 분석 (병렬 + 지문 캐시 + 기간 롤업)
+
+역할:
+- 날짜 범위를 프로세스 풀로 나눠 analyze_daily_market 실행
+- 날짜별 입력 지문(정찰 파일 크기/수정시각, watchlist 파일, ANALYZER_VERSION)을
+  daily_analysis.json 옆 analysis_fingerprint.json 에 저장
+  → 지문이 같은 날짜는 재분석 생략
+- 기간 롤업은 원본 기록이 아닌 날짜별 daily_analysis.json 에서 생성
+
+사용법:
+    python -m test.framework.analyzer.multi_day_analyzer 2026-01-07 2026-03-06
+    python -m test.framework.analyzer.multi_day_analyzer 2026-01-07 2026-03-06 --workers 8 --force
+"""
+import os
+import io
+import sys
+import json
+import time
+import contextlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from test.framework.analyzer import post_market_analyzer as pma
+
+
+FINGERPRINT_FILENAME = "analysis_fingerprint.json"
+ROLLUP_OUTPUT_DIR = os.path.join(pma.ANALYSIS_OUTPUT_DIR, "rollups")
+
+
+# ===============================
+# 입력 지문
+# ===============================
+def iter_dates(start: str, end: str) -> List[str]:
+    start_dt = datetime.strptime(start, "%Y-%m-%d")
+    end_dt = datetime.strptime(end, "%Y-%m-%d")
+    dates = []
+    while start_dt <= end_dt:
+        dates.append(start_dt.strftime("%Y-%m-%d"))
+        start_dt += timedelta(days=1)
+    return dates
+
+
+def _file_stat(path: str) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def get_input_fingerprint(date: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    날짜별 분석 입력 지문
+
+    - 정찰 JSONL(+ 컬럼형 압축 파일) 크기/수정시각
+      (보관 컨테이너만 남은 날짜는 컨테이너에 기록된 원본 JSONL 지문 → 보관만으로는 재분석 안 함)
+    - watchlist 파일 (슬롯 타입용 scout_selector, 사유 집계용 gatekeeper_bot)
+    - ANALYZER_VERSION 및 분석 옵션
+    """
+    date_compact = date.replace("-", "")
+    scout_dir = pma.get_scout_date_dir(date)
+
+    scout_files = {}
+    if os.path.isdir(scout_dir):
+        for file_path in sorted(Path(scout_dir).glob("*.jsonl")):
+            scout_files[file_path.name] = _file_stat(str(file_path))
+        for file_path in sorted(Path(scout_dir).glob("*.parquet")):
+            scout_files[file_path.name] = _file_stat(str(file_path))
+        if not any(name.endswith(".jsonl") for name in scout_files):
+            try:
+                from test.framework.analyzer.scout_archive import open_day_archive
+                archive = open_day_archive(scout_dir)
+            except ImportError:
+                archive = None
+            if archive is not None:
+                sources = archive.index.get("sources", {})
+                for name in sorted(archive.members):
+                    if name in sources:
+                        scout_files[name] = sources[name]
+
+    watchlists = {}
+    for source in ("scout_selector", "gatekeeper_bot"):
+        path = os.path.join(pma.PROJECT_ROOT, source, "output", f"watchlist_{date_compact}.json")
+        watchlists[source] = _file_stat(path)
+
+    return {
+        "analyzer_version": pma.ANALYZER_VERSION,
+        "options": options or {},
+        "scout_files": scout_files,
+        "watchlists": watchlists,
+    }
+
+
+def get_fingerprint_path(date: str) -> str:
+    return os.path.join(pma.get_analysis_date_dir(date), FINGERPRINT_FILENAME)
+
+
+def is_analysis_fresh(date: str, fingerprint: Dict[str, Any]) -> bool:
+    """저장된 지문과 현재 지문이 같고 daily_analysis.json 이 있으면 True"""
+    date_dir = pma.get_analysis_date_dir(date)
+    if not os.path.exists(os.path.join(date_dir, "daily_analysis.json")):
+        return False
+    try:
+        with open(get_fingerprint_path(date), "r", encoding="utf-8") as f:
+            return json.load(f) == fingerprint
+    except (OSError, json.JSONDecodeError):
+        return False
+
+
+def _save_fingerprint(date: str, fingerprint: Dict[str, Any]) -> None:
+    path = get_fingerprint_path(date)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(fingerprint, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ===============================
+# 날짜별 분석 (워커)
+# ===============================
+def analyze_one_date(
+    date: str,
+    fingerprint: Dict[str, Any],
+    include_top_100: bool = False,
+    with_graphs: bool = False,
+) -> Dict[str, Any]:
+    """
+    하루 분석 후 지문 저장 (프로세스 풀 워커)
+
+    지문은 분석 전에 계산한 값을 저장하므로,
+    분석 도중 파일이 바뀌면 다음 실행에서 다시 분석됨
+    """
+    started = time.perf_counter()
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            result = pma.analyze_daily_market(
+                date=date,
+                include_top_100=include_top_100,
+                with_graphs=with_graphs,
+            )
+    except Exception as e:
+        return {
+            "date": date,
+            "status": "error",
+            "message": str(e),
+            "elapsed_sec": round(time.perf_counter() - started, 3),
+        }
+
+    status = "analyzed"
+    if "error" in result:
+        status = "excluded" if result.get("excluded") else result["error"]
+    else:
+        _save_fingerprint(date, fingerprint)
+
+    return {
+        "date": date,
+        "status": status,
+        "total_records": result.get("total_records", 0),
+        "elapsed_sec": round(time.perf_counter() - started, 3),
+    }
+
+
+def analyze_market_range(
+    start: str,
+    end: str,
+    workers: Optional[int] = None,
+    force: bool = False,
+    include_top_100: bool = False,
+    with_graphs: bool = False,
+) -> Dict[str, Any]:
+    """
+    날짜 범위 분석 (변경된 날짜만 병렬 재분석)
+
+    Args:
+        start, end: YYYY-MM-DD (양끝 포함)
+        workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+        force: 지문과 무관하게 전부 재분석
+
+    Returns:
+        {"results": 날짜별 상태 리스트, "analyzed": [...], "cached": [...], "elapsed_sec": float}
+    """
+    started = time.perf_counter()
+    options = {"include_top_100": include_top_100, "with_graphs": with_graphs}
+
+    results = []
+    pending = []
+    for date in iter_dates(start, end):
+        if date in pma.EXCLUDED_DATES:
+            results.append({"date": date, "status": "excluded"})
+            continue
+        if not os.path.isdir(pma.get_scout_date_dir(date)):
+            results.append({"date": date, "status": "no_records"})
+            continue
+        fingerprint = get_input_fingerprint(date, options)
+        if not force and is_analysis_fresh(date, fingerprint):
+            results.append({"date": date, "status": "cached"})
+            continue
+        pending.append((date, fingerprint))
+
+    workers = min(workers or os.cpu_count() or 1, max(1, len(pending)))
+    dates = [date for date, _ in pending]
+    fingerprints = [fp for _, fp in pending]
+    top_100_flags = [include_top_100] * len(pending)
+    graph_flags = [with_graphs] * len(pending)
+
+    if workers <= 1:
+        results.extend(map(analyze_one_date, dates, fingerprints, top_100_flags, graph_flags))
+    elif pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results.extend(executor.map(
+                analyze_one_date, dates, fingerprints, top_100_flags, graph_flags,
+            ))
+
+    results.sort(key=lambda r: r["date"])
+    return {
+        "start": start,
+        "end": end,
+        "results": results,
+        "analyzed": [r["date"] for r in results if r["status"] == "analyzed"],
+        "cached": [r["date"] for r in results if r["status"] == "cached"],
+        "errors": [r for r in results if r["status"] == "error"],
+        "elapsed_sec": round(time.perf_counter() - started, 3),
+    }
+
+
+# ===============================
+# 기간 롤업 (캐시된 날짜별 결과 기반)
+# ===============================
+def load_daily_analysis(date: str) -> Optional[Dict[str, Any]]:
+    path = os.path.join(pma.get_analysis_date_dir(date), "daily_analysis.json")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  daily_analysis.json 읽기 오류 ({date}): {e}")
+        return None
+
+
+def build_range_rollup(start: str, end: str) -> Dict[str, Any]:
+    """날짜별 daily_analysis.json 을 합쳐 기간 롤업 생성"""
+    days = []
+    by_stock: Dict[str, Counter] = {}
+    exit_types = Counter()
+    characters = Counter()
+    sessions = Counter()
+    no_event_reasons = Counter()
+    timeout_subtypes = Counter()
+    totals = Counter()
+
+    for date in iter_dates(start, end):
+        if date in pma.EXCLUDED_DATES:
+            continue
+        analysis = load_daily_analysis(date)
+        if analysis is None:
+            continue
+
+        observer_stats = analysis.get("observer_stats", {})
+        observer_summary = observer_stats.get("observer_summary", {})
+        market_character = analysis.get("market_character", {})
+        cycles = observer_summary.get("cycle_summary", [])
+        enhanced = observer_stats.get("enhanced_cycle_analysis", {})
+
+        day_exit_types = Counter(c.get("exit_type", "unknown") for c in cycles)
+        exit_types.update(day_exit_types)
+        characters[market_character.get("character", "UNKNOWN")] += 1
+        sessions.update(observer_stats.get("session_distribution", {}))
+        no_event_reasons.update(observer_stats.get("no_event_reasons", {}))
+        timeout_subtypes.update(
+            c.get("timeout_subtype") for c in enhanced.get("cycles", []) if c.get("timeout_subtype")
+        )
+
+        for stock_code, stock_stats in observer_stats.get("by_stock", {}).items():
+            by_stock.setdefault(stock_code, Counter()).update(stock_stats)
+        for cycle in cycles:
+            by_stock.setdefault(cycle.get("stock", ""), Counter())["cycles"] += 1
+
+        day = {
+            "date": date,
+            "total_records": observer_stats.get("total_records", 0),
+            "triggered_records": observer_summary.get("triggered_records", 0),
+            "cycles": len(cycles),
+            "enhanced_cycles": len(enhanced.get("cycles", [])),
+            "fail_cycles": enhanced.get("fail_cycles_count", 0),
+            "trigger_rate": market_character.get("trigger_rate", 0),
+            "box_rate": market_character.get("box_rate", 0),
+            "character": market_character.get("character", "UNKNOWN"),
+            "exit_types": dict(day_exit_types),
+        }
+        days.append(day)
+        for key in ("total_records", "triggered_records", "cycles", "enhanced_cycles", "fail_cycles"):
+            totals[key] += day[key]
+
+    return {
+        "start": start,
+        "end": end,
+        "generated_at": datetime.now().isoformat(),
+        "analyzer_version": pma.ANALYZER_VERSION,
+        "days_count": len(days),
+        "totals": dict(totals),
+        "exit_type_distribution": dict(exit_types),
+        "timeout_subtype_distribution": dict(timeout_subtypes),
+        "character_distribution": dict(characters),
+        "session_distribution": dict(sessions),
+        "no_event_reasons": dict(no_event_reasons),
+        "by_stock": {k: dict(v) for k, v in sorted(by_stock.items())},
+        "days": days,
+    }
+
+
+def save_range_rollup(rollup: Dict[str, Any], output_dir: str = ROLLUP_OUTPUT_DIR) -> str:
+    os.makedirs(output_dir, exist_ok=True)
+    start = rollup["start"].replace("-", "")
+    end = rollup["end"].replace("-", "")
+    path = os.path.join(output_dir, f"rollup_{start}_{end}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(rollup, f, ensure_ascii=False, indent=2)
+    return path
+
+
+# ===============================
+# CLI
+# ===============================
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="다중 날짜 Post-Market 분석 (캐시 + 롤업)")
+    parser.add_argument("start", help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("end", help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--force", action="store_true", help="캐시 무시하고 전부 재분석")
+    parser.add_argument("--top100", action="store_true", help="상위 100 결과 포함")
+    parser.add_argument("--with-graphs", action="store_true", dest="with_graphs", help="그래프 생성")
+    parser.add_argument("--no-rollup", action="store_false", dest="rollup", help="기간 롤업 생략")
+    args = parser.parse_args()
+
+    print(f"📊 다중 날짜 분석: {args.start} ~ {args.end}")
+    summary = analyze_market_range(
+        args.start,
+        args.end,
+        workers=args.workers,
+        force=args.force,
+        include_top_100=args.top100,
+        with_graphs=args.with_graphs,
+    )
+
+    status_counts = Counter(r["status"] for r in summary["results"])
+    print(f"  ✅ 분석 {len(summary['analyzed'])}일 / 캐시 {len(summary['cached'])}일 "
+          f"({summary['elapsed_sec']:.2f}s)")
+    for status, count in sorted(status_counts.items()):
+        if status not in ("analyzed", "cached"):
+            print(f"     {status}: {count}일")
+    for error in summary["errors"]:
+        print(f"  ❌ {error['date']}: {error.get('message', '')}")
+
+    if args.rollup:
+        rollup_path = save_range_rollup(build_range_rollup(args.start, args.end))
+        print(f"  📁 롤업: {rollup_path}")
+
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,12 @@ from typing import Dict, Any, List, Optional
 from collections import defaultdict, Counter
 from pathlib import Path
 
+from test.framework.analyzer.cycle_engine import (
+    CycleEngine,
+    build_cycle_summary,
+    record_timestamp,
+)
+
 
 # ===============================
 # 경로 설정
@@ -27,6 +33,9 @@ SCOUT_RECORDS_DIR = os.path.join(PROJECT_ROOT, "records", "scout")
 ANALYSIS_OUTPUT_DIR = os.path.join(PROJECT_ROOT, "records", "analysis")
 os.makedirs(ANALYSIS_OUTPUT_DIR, exist_ok=True)
 
+# 분석 로직 버전 (집계/출력 규칙이 바뀌면 올림 → 다중 날짜 캐시 무효화)
+ANALYZER_VERSION = "post_market_v1.1"
+
 
 # ===============================
 # 날짜 경로 변환 유틸리티
@@ -97,9 +106,29 @@ def load_scout_records(date: str) -> List[Dict[str, Any]]:
     
     if not os.path.exists(date_dir):
         return []
-    
+
+    # ✅ 장 마감 후 압축된 컬럼형 파일이 최신이면 우선 사용 (JSON 재파싱 생략)
+    try:
+        from test.framework.analyzer.scout_compactor import load_columnar_records
+        columnar_records = load_columnar_records(date_dir)
+    except ImportError:
+        columnar_records = None
+
+    if columnar_records is not None:
+        return columnar_records
+
+    # ✅ JSONL 이 압축 보관된 마감 날짜면 컨테이너에서 복원
+    try:
+        from test.framework.analyzer.scout_archive import load_archived_records
+        archived_records = load_archived_records(date_dir)
+    except ImportError:
+        archived_records = None
+
+    if archived_records is not None:
+        return archived_records
+
     all_records = []
-    
+
     # 모든 .jsonl 파일 읽기
     for file_path in Path(date_dir).glob("*.jsonl"):
         try:
@@ -169,104 +198,17 @@ def aggregate_observers(records: List[Dict[str, Any]]) -> Dict[str, Any]:
         "no_event_reasons": Counter(),
     }
     
-    # ============================================================
-    # exit_type 판정 기준 (v1 고정)
-    # ============================================================
-    # 대원칙:
-    # 1. exit_type은 반드시 하나만
-    # 2. 숫자보다 이벤트 기준
-    # 3. 성과/성공/실패 용어 금지
-    #    - "잘 됐냐?" ❌
-    #    - "어떤 이유로 관측이 끝났냐?" ✅
-    #
-    # v1에서 허용하는 exit_type (고정, 변경 불가):
-    VALID_EXIT_TYPES = {
-        "reached_1pct",    # 기준 반응 폭 도달
-        "no_reaction",    # 관측 시간 동안 의미 있는 반응 없음
-        "timeout",        # 최대 관측 시간 초과
-        "manual_stop",    # 시스템/테스트 종료
-    }
-    # ❗ 이 4개 외에는 v1에 넣지 않는다
-    
-    # ============================================================
-    # exit_type 판정 우선순위 (v1 고정)
-    # ============================================================
-    # 같은 record에서 여러 조건이 동시에 만족될 수 있으므로
-    # 우선순위가 필수
-    #
-    # v1 우선순위 (고정):
-    EXIT_TYPE_PRIORITY = [
-        "manual_stop",   # 1순위: 사람이 멈추면 그게 최우선
-        "reached_1pct",  # 2순위: 반응 도달은 가장 명확한 종료
-        "timeout",       # 3순위: timeout은 시스템 조건
-        "no_reaction",   # 4순위: no_reaction은 "나머지"
-    ]
-    
-    def select_exit_type(exit_types) -> Optional[str]:
-        """
-        exit_type 우선순위에 따라 하나 선택
-        
-        Args:
-            exit_types: exit_type 문자열, 리스트, 또는 None
-        
-        Returns:
-            우선순위에 따라 선택된 exit_type (문자열) 또는 None
-        """
-        if not exit_types:
-            return None
-        
-        # 리스트인 경우
-        if isinstance(exit_types, list):
-            exit_type_list = exit_types
-        # 문자열인 경우
-        elif isinstance(exit_types, str):
-            exit_type_list = [exit_types]
-        else:
-            return None
-        
-        # 유효한 exit_type만 필터링
-        valid_types = [
-            et for et in exit_type_list
-            if isinstance(et, str) and et in VALID_EXIT_TYPES
-        ]
-        
-        if not valid_types:
-            return None
-        
-        # 우선순위에 따라 첫 번째 선택
-        for priority_type in EXIT_TYPE_PRIORITY:
-            if priority_type in valid_types:
-                return priority_type
-        
-        # 우선순위에 없으면 첫 번째 유효한 타입 반환
-        return valid_types[0]
+    # exit_type 판정 기준/우선순위 (v1 고정): cycle_engine.VALID_EXIT_TYPES / EXIT_TYPE_PRIORITY
     
     # ============================================================
     # 1. record를 시간순으로 정렬 (필수)
     # ============================================================
-    def get_timestamp(rec: Dict[str, Any]) -> datetime:
-        """record에서 timestamp 추출 및 변환"""
-        ts_str = rec.get("meta", {}).get("timestamp", "")
-        if not ts_str:
-            return datetime.min
-        
-        try:
-            if isinstance(ts_str, str):
-                # ISO 형식 파싱
-                if "T" in ts_str:
-                    return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                else:
-                    return datetime.min
-            return ts_str
-        except Exception:
-            return datetime.min
-    
-    sorted_records = sorted(records, key=get_timestamp)
+    sorted_records = sorted(records, key=record_timestamp)
     
     # ============================================================
     # 2. Cycle 상태 머신 (종목별 IDLE/ACTIVE)
     # ============================================================
-    open_cycles: Dict[str, Dict[str, Any]] = {}  # stock_code -> active cycle
+    cycle_engine = CycleEngine()
     
     # ============================================================
     # 3. record 순회 (시간순)
@@ -311,76 +253,18 @@ def aggregate_observers(records: List[Dict[str, Any]]) -> Dict[str, Any]:
                 })
         
         # ============================================================
-        # 4. Cycle 시작 판정 (IDLE -> ACTIVE)
+        # 4~5. Cycle 시작/종료 판정 (IDLE <-> ACTIVE)
         # ============================================================
-        if stock_code not in open_cycles:
-            # 상태: IDLE
-            if is_triggered:
-                # cycle START
-                open_cycles[stock_code] = {
-                    "stock": stock_code,
-                    "start_time": timestamp_dt if timestamp_dt else None,
-                    "start_time_str": timestamp_str,
-                    "start_record_index": rec_idx,
-                    "start_session": session,
-                    "trigger_type": "observer_triggered",
-                    "records_in_cycle": 1,
-                }
-        else:
-            # 상태: ACTIVE
-            # cycle이 열려있으면 record 수 증가
-            open_cycles[stock_code]["records_in_cycle"] += 1
-        
-        # ============================================================
-        # 5. Cycle 종료 판정 (ACTIVE -> IDLE)
-        # ============================================================
-        if stock_code in open_cycles:
-            outcome = rec.get("outcome", {})
-            raw_exit_type = outcome.get("exit_type")
-            
-            # exit_type 우선순위에 따라 선택
-            exit_type = select_exit_type(raw_exit_type)
-            
-            # exit_type 검증 및 처리
-            if exit_type:
-                # 유효한 exit_type: cycle 종료
-                cycle = open_cycles[stock_code]
-                # datetime 객체는 문자열로 저장 (JSON 직렬화를 위해)
-                cycle["end_time"] = timestamp_dt if timestamp_dt else None
-                cycle["end_time_str"] = timestamp_str
-                cycle["end_record_index"] = rec_idx
-                cycle["end_session"] = session
-                cycle["exit_type"] = exit_type
-                
-                # 완전히 종료된 cycle을 triggered_cycle에 추가
-                # datetime 객체를 문자열로 변환하여 저장
-                cycle_copy = cycle.copy()
-                if cycle_copy.get("start_time"):
-                    if isinstance(cycle_copy["start_time"], datetime):
-                        cycle_copy["start_time"] = (
-                            cycle_copy["start_time"].isoformat()
-                        )
-                if cycle_copy.get("end_time"):
-                    if isinstance(cycle_copy["end_time"], datetime):
-                        cycle_copy["end_time"] = (
-                            cycle_copy["end_time"].isoformat()
-                        )
-                stats["observer_summary"]["triggered_cycle"].append(
-                    cycle_copy
-                )
-                
-                # active_cycles에서 제거 (IDLE로 전환)
-                del open_cycles[stock_code]
-            elif raw_exit_type:
-                # exit_type이 있지만 유효하지 않음: 경고 로그
-                print(
-                    f"⚠️  잘못된 exit_type: {raw_exit_type} "
-                    f"(종목: {stock_code}, record_index: {rec_idx})"
-                )
-                print(
-                    f"    허용되는 exit_type: {VALID_EXIT_TYPES}"
-                )
-                # 잘못된 exit_type은 무시하고 cycle은 계속 진행
+        cycle_engine.advance(
+            stock_code,
+            is_triggered,
+            rec.get("outcome", {}).get("exit_type"),
+            timestamp_str,
+            timestamp_dt,
+            session,
+            rec_idx,
+            meta.get("date", ""),
+        )
         
         # Box 집계
         box = rec.get("box", {})
@@ -405,79 +289,18 @@ def aggregate_observers(records: List[Dict[str, Any]]) -> Dict[str, Any]:
     # 6. 장 종료 시 미종료 cycle 처리
     # ============================================================
     # 마지막 record의 timestamp를 장 종료 시각으로 사용
-    market_close_time = None
+    # 미종료 cycle도 timeout(session_end) 으로 triggered_cycle에 추가 (정책 선택)
+    last_ts_str = ""
     if sorted_records:
-        last_rec = sorted_records[-1]
-        last_ts_str = last_rec.get("meta", {}).get("timestamp", "")
-        if last_ts_str:
-            try:
-                market_close_time = datetime.fromisoformat(
-                    last_ts_str.replace("Z", "+00:00")
-                )
-            except Exception:
-                pass
-    
-    for stock_code, cycle in open_cycles.items():
-        # 미종료 cycle을 timeout으로 종료 처리
-        cycle["end_time"] = market_close_time
-        cycle["end_time_str"] = last_ts_str if last_ts_str else ""
-        cycle["exit_type"] = "timeout"
-        cycle["end_reason"] = "session_end"
-        
-        # 미종료 cycle도 triggered_cycle에 추가 (정책 선택)
-        stats["observer_summary"]["triggered_cycle"].append(cycle.copy())
+        last_ts_str = sorted_records[-1].get("meta", {}).get("timestamp", "")
+    stats["observer_summary"]["triggered_cycle"] = cycle_engine.finalize(last_ts_str)
     
     # ============================================================
     # 7. Cycle 요약 생성 (구조 정보만)
     # ============================================================
-    summary_cycles = []
-    date_str = sorted_records[0].get("meta", {}).get("date", "") if sorted_records else ""
-    
-    for i, cycle in enumerate(stats["observer_summary"]["triggered_cycle"], start=1):
-        # start_time과 end_time이 datetime 또는 문자열일 수 있음
-        start_dt = cycle.get("start_time")
-        end_dt = cycle.get("end_time")
-        
-        # 문자열인 경우 datetime으로 변환
-        if isinstance(start_dt, str):
-            try:
-                start_dt = datetime.fromisoformat(
-                    start_dt.replace("Z", "+00:00")
-                )
-            except Exception:
-                start_dt = None
-        if isinstance(end_dt, str):
-            try:
-                end_dt = datetime.fromisoformat(
-                    end_dt.replace("Z", "+00:00")
-                )
-            except Exception:
-                end_dt = None
-        
-        duration_sec = 0
-        if start_dt and end_dt:
-            try:
-                duration_sec = int((end_dt - start_dt).total_seconds())
-            except Exception:
-                pass
-        
-        # start_time_str과 end_time_str 우선 사용, 없으면 datetime을 문자열로 변환
-        start_time_str = cycle.get("start_time_str", "")
-        if not start_time_str and start_dt:
-            start_time_str = start_dt.isoformat()
-        
-        end_time_str = cycle.get("end_time_str", "")
-        if not end_time_str and end_dt:
-            end_time_str = end_dt.isoformat()
-        
-        summary_cycles.append({
-            "cycle_id": f"{date_str}-{cycle['stock']}-{i:02d}",
-            "stock": cycle["stock"],
-            "start_time": start_time_str,
-            "end_time": end_time_str,
-            "duration_sec": duration_sec,
-            "exit_type": cycle.get("exit_type", "unknown"),
-        })
+    summary_cycles = build_cycle_summary(
+        stats["observer_summary"]["triggered_cycle"], cycle_engine.first_date
+    )
     
     # 요약을 observer_summary에 추가
     stats["observer_summary"]["cycle_summary"] = summary_cycles
@@ -488,7 +311,7 @@ def aggregate_observers(records: List[Dict[str, Any]]) -> Dict[str, Any]:
     stats["observer_summary"]["triggered_cycles_count"] = len(
         stats["observer_summary"]["triggered_cycle"]
     )
-    stats["observer_summary"]["open_cycles_count"] = len(open_cycles)
+    stats["observer_summary"]["open_cycles_count"] = len(cycle_engine.open_cycles)
     
     # set을 list로 변환 (JSON 직렬화를 위해)
     stats["observer_summary"]["triggered_stocks"] = list(
@@ -508,9 +331,13 @@ def aggregate_observers(records: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 def aggregate_reasons(
     date: str,
-    records: List[Dict[str, Any]],
+    records: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
-    """Reason 집계 (watchlist 선정 사유)"""
+    """
+    Reason 집계 (watchlist 선정 사유)
+
+    records 는 사용하지 않음 (기존 호출 호환용, 날짜의 watchlist 만 읽음)
+    """
     # watchlist JSON 파일 읽기
     watchlist_path = os.path.join(
         PROJECT_ROOT,
@@ -627,12 +454,22 @@ def load_top_100_results(date: Optional[str] = None) -> List[Dict[str, Any]]:
 # ===============================
 def generate_market_character_summary(
     observer_stats: Dict[str, Any],
-    records: List[Dict[str, Any]],
+    records: Optional[List[Dict[str, Any]]] = None,
     top_100_results: Optional[List[Dict[str, Any]]] = None,
+    date: Optional[str] = None,
+    total_records: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """시장 성격 요약 생성"""
-    
-    total_records = len(records)
+    """
+    시장 성격 요약 생성
+
+    date / total_records 를 주면 records 없이 생성 (스트리밍/증분 집계)
+    없으면 records 첫 건의 날짜, observer_stats 의 record 수 사용
+    """
+    records = records or []
+    if date is None:
+        date = records[0]["meta"]["date"] if records else ""
+    if total_records is None:
+        total_records = observer_stats.get("total_records", len(records))
     triggered_records = observer_stats["observer_summary"]["triggered_records"]
     box_formed = observer_stats["box_summary"]["formed_count"]
     
@@ -650,7 +487,7 @@ def generate_market_character_summary(
     
     # 시장 성격 판단
     market_character = {
-        "date": records[0]["meta"]["date"] if records else "",
+        "date": date,
         "total_scouts": total_records,
         "trigger_rate": round(trigger_rate, 2),
         "box_rate": round(box_rate, 2),
@@ -941,6 +778,9 @@ def analyze_daily_market(
     date: Optional[str] = None,
     include_top_100: bool = False,
     with_graphs: bool = False,
+    streaming: bool = True,
+    incremental: bool = False,
+    graph_workers: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     일일 시장 분석 실행
@@ -948,6 +788,9 @@ def analyze_daily_market(
     Args:
         date: 분석할 날짜 (YYYY-MM-DD), None이면 오늘
         include_top_100: 상위 100 결과 포함 여부
+        streaming: True면 JSONL 스트리밍 집계 (False면 전체 로드 후 정렬)
+        incremental: True면 장중 증분 상태(intraday_state.pkl)를 이어서 남은 줄만 집계
+        graph_workers: 그래프 렌더링 프로세스 수 (1이면 현재 프로세스에서 순차)
     
     Returns:
         분석 결과 딕셔너리
@@ -973,11 +816,57 @@ def analyze_daily_market(
             "first_valid_date": FIRST_VALID_DATE,
         }
     
-    # 1. 정찰 기록 로드
-    print("  📂 정찰 기록 로드 중...")
-    records = load_scout_records(date)
+    # watchlist 데이터 로드 (슬롯 타입 추출용)
+    watchlist_data = None
+    try:
+        date_str = date.replace("-", "")
+        watchlist_path = os.path.join(
+            PROJECT_ROOT,
+            "scout_selector",
+            "output",
+            f"watchlist_{date_str}.json"
+        )
+        if os.path.exists(watchlist_path):
+            with open(watchlist_path, "r", encoding="utf-8") as f:
+                watchlist_data = json.load(f)
+    except Exception as e:
+        print(f"    ⚠️  watchlist 로드 실패 (슬롯 타입 추출 불가): {e}")
+    
+    # 1~2. 정찰 기록 로드 + Observer/Reason 집계
+    enhanced_result = None
+    if incremental:
+        # 장중 누적 상태 + 새로 추가된 줄만 반영
+        print("  📂 정찰 기록 증분 집계 중...")
+        from test.framework.analyzer.incremental_analyzer import get_incremental_analyzer
+        
+        analyzer = get_incremental_analyzer(date)
+        with analyzer.lock:
+            analyzer.sync()
+            streamed = analyzer.snapshot(watchlist_data=watchlist_data, exclude_fail=True)
+        streaming = True
+    elif streaming:
+        # 종목별 JSONL k-way merge → 1회 순회 (record 전체를 메모리에 올리지 않음)
+        print("  📂 정찰 기록 스트리밍 집계 중...")
+        from test.framework.analyzer.streaming_analyzer import stream_scout_records
+        
+        streamed = stream_scout_records(
+            get_scout_date_dir(date),
+            watchlist_data=watchlist_data,
+            exclude_fail=True,
+        )
+    
+    if streaming:
+        total_records = streamed["total_records"]
+        observer_stats = streamed["observer_stats"]
+        enhanced_result = streamed["enhanced_result"]
+        # 스트리밍/증분 집계는 record 를 보관하지 않음
+        records = []
+    else:
+        print("  📂 정찰 기록 로드 중...")
+        records = load_scout_records(date)
+        total_records = len(records)
     
-    if not records:
+    if not total_records:
         print(f"  ⚠️  {date}의 정찰 기록이 없습니다.")
         return {
             "date": date,
@@ -985,12 +874,12 @@ def analyze_daily_market(
             "message": f"{date}의 정찰 기록이 없습니다.",
         }
     
-    print(f"  ✅ {len(records)}개의 기록 로드 완료")
+    print(f"  ✅ {total_records}개의 기록 로드 완료")
     
-    # 2. Observer/Reason 집계
-    print("  📈 Observer/Reason 집계 중...")
-    observer_stats = aggregate_observers(records)
-    reason_stats = aggregate_reasons(date, records)
+    if not streaming:
+        print("  📈 Observer/Reason 집계 중...")
+        observer_stats = aggregate_observers(records)
+    reason_stats = aggregate_reasons(date)
     
     # 2.5. Cycle 분석 확장 (설계서 v1)
     print("  🔍 Cycle 분석 확장 중...")
@@ -1002,33 +891,18 @@ def analyze_daily_market(
             generate_market_memo,
         )
         
-        # watchlist 데이터 로드 (슬롯 타입 추출용)
-        watchlist_data = None
-        try:
-            date_str = date.replace("-", "")
-            watchlist_path = os.path.join(
-                PROJECT_ROOT,
-                "scout_selector",
-                "output",
-                f"watchlist_{date_str}.json"
-            )
-            if os.path.exists(watchlist_path):
-                with open(watchlist_path, "r", encoding="utf-8") as f:
-                    watchlist_data = json.load(f)
-        except Exception as e:
-            print(f"    ⚠️  watchlist 로드 실패 (슬롯 타입 추출 불가): {e}")
-        
         # 기존 cycle 목록 추출
         cycles = observer_stats.get("observer_summary", {}).get("cycle_summary", [])
         
         if cycles:
-            # 확장 분석 실행
-            enhanced_result = enhance_cycle_analysis(
-                cycles=cycles,
-                all_records=records,
-                watchlist_data=watchlist_data,
-                exclude_fail=True,
-            )
+            # 확장 분석 실행 (스트리밍 모드에서는 이미 누적 계산됨)
+            if enhanced_result is None:
+                enhanced_result = enhance_cycle_analysis(
+                    cycles=cycles,
+                    all_records=records,
+                    watchlist_data=watchlist_data,
+                    exclude_fail=True,
+                )
             
             enhanced_cycles = enhanced_result["enhanced_cycles"]
             
@@ -1075,6 +949,8 @@ def analyze_daily_market(
         observer_stats,
         records,
         top_100_results,
+        date=date,
+        total_records=total_records,
     )
     
     # 5. 일일 평가 기록 저장
@@ -1118,7 +994,7 @@ def analyze_daily_market(
                 )
                 
                 graphs_dir = os.path.join(date_dir, "daily_graphs")
-                graph_results = generate_daily_graphs(report_path, graphs_dir)
+                graph_results = generate_daily_graphs(report_path, graphs_dir, workers=graph_workers)
                 
                 if any(graph_results.values()):
                     print(f"     Graphs: {graphs_dir}")
@@ -1144,7 +1020,7 @@ def analyze_daily_market(
     
     return {
         "date": date,
-        "total_records": len(records),
+        "total_records": total_records,
         "observer_stats": observer_stats,
         "market_character": market_character,
         "saved_paths": saved_paths,
@@ -11,6 +11,7 @@ Post-Market Analyzer 실행 스크립트
     python -m test.framework.analyzer.run_analyzer
     python -m test.framework.analyzer.run_analyzer 2026-01-01
     python -m test.framework.analyzer.run_analyzer 2026-01-01 --top100
+    python -m test.framework.analyzer.run_analyzer 2026-01-01 --compact
 """
 import sys
 import os
@@ -24,7 +25,7 @@ sys.path.insert(0, PROJECT_ROOT)
 from test.framework.analyzer.post_market_analyzer import analyze_daily_market
 
 
-def main():
+def main(argv=None):
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -48,12 +49,79 @@ def main():
         help="그래프 생성 (daily_graphs/ 디렉토리에 저장)"
     )
     
-    args = parser.parse_args()
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="분석 전 JSONL → 컬럼형(Parquet) 압축 (pyarrow 필요)"
+    )
+    parser.add_argument(
+        "--no-streaming",
+        action="store_false",
+        dest="streaming",
+        help="스트리밍 집계 대신 전체 기록 로드 후 정렬 방식 사용"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="장중 증분 상태(intraday_state.pkl)를 이어서 새 줄만 집계"
+    )
+    parser.add_argument(
+        "--end",
+        default=None,
+        help="범위 분석 종료 날짜 (YYYY-MM-DD), date~end 를 병렬 분석 (변경 없는 날짜는 캐시)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="범위 분석 프로세스 수 (기본: CPU 수) / 단일 날짜는 그래프 렌더링 프로세스 수"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="범위 분석 시 캐시 무시"
+    )
+    
+    args = parser.parse_args(argv)
+    
+    if args.compact:
+        from datetime import datetime
+        from test.framework.analyzer.scout_compactor import compact_scout_day
+        
+        compacted_path = compact_scout_day(args.date or datetime.now().strftime("%Y-%m-%d"))
+        if compacted_path:
+            print(f"🗜️  컬럼형 압축: {compacted_path}")
+    
+    if args.end:
+        from test.framework.analyzer.multi_day_analyzer import (
+            analyze_market_range,
+            build_range_rollup,
+            save_range_rollup,
+        )
+        
+        start = args.date or args.end
+        summary = analyze_market_range(
+            start,
+            args.end,
+            workers=args.workers,
+            force=args.force,
+            include_top_100=args.top100,
+            with_graphs=args.with_graphs,
+        )
+        print(f"\n✅ 범위 분석 완료: 분석 {len(summary['analyzed'])}일 / "
+              f"캐시 {len(summary['cached'])}일 ({summary['elapsed_sec']:.2f}s)")
+        for error in summary["errors"]:
+            print(f"❌ {error['date']}: {error.get('message', '')}")
+        print(f"📁 롤업: {save_range_rollup(build_range_rollup(start, args.end))}")
+        sys.exit(1 if summary["errors"] else 0)
     
     result = analyze_daily_market(
         date=args.date,
         include_top_100=args.top100,
         with_graphs=args.with_graphs,
+        streaming=args.streaming,
+        incremental=args.incremental,
+        graph_workers=args.workers,
     )
     
     if "error" in result:
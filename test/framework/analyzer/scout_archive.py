@@ -0,0 +1,594 @@
+# ===============================
+# test/framework/analyzer/scout_archive.py
+# ===============================
+"""
+마감된 날짜의 정찰/이벤트 기록 장기 보관 (압축 컨테이너)
+
+역할:
+- records/scout/YYYY/MM/YYYYMMDD/*.jsonl + scout_bot/output/events/events_YYYYMMDD.jsonl
+  → 날짜 디렉터리 안의 컨테이너 파일 1개 (day_archive.scpk)
+- 종목별로 독립 압축 프레임 → 종목 1개만 읽을 때 그 프레임만 해제 (random access)
+- 분석기/뷰어/이벤트 통계는 JSONL 이 없으면 컨테이너를 자동으로 읽음
+- 검증(프레임 해제 후 원본과 CRC 비교)이 끝난 뒤에만 원본 삭제
+- 파싱할 수 없는 이벤트 줄도 원문 그대로 보관 (기존 컨테이너를 읽을 수 없으면 다시 쓰지 않음)
+
+압축:
+- zstandard 설치 시 zstd, 없으면 zlib (선택 의존성)
+- 작은 프레임 압축률을 위해 날짜별 공유 사전(첫 줄들) 사용
+
+컨테이너 구조:
+    [MAGIC][프레임 ...][사전][인덱스(JSON, zlib)][인덱스 길이 8바이트][FOOTER_MAGIC]
+    인덱스: codec, members{이름: offset/length/raw_size/crc32/lines}, stocks(요약 통계),
+            events_order(이벤트 원래 순서), sources(원본 파일 지문)
+
+사용법:
+    python -m test.framework.analyzer.scout_archive 2026-01-05
+    python -m test.framework.analyzer.scout_archive --closed --keep-days 7
+    python -m test.framework.analyzer.scout_archive 2026-01-05 --keep-source
+"""
+import os
+import sys
+import json
+import zlib
+import shutil
+import struct
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    zstandard = None
+    HAS_ZSTD = False
+
+
+# ===============================
+# 경로 / 형식 설정
+# ===============================
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+SCOUT_RECORDS_DIR = os.path.join(PROJECT_ROOT, "records", "scout")
+EVENTS_DIR = os.path.join(PROJECT_ROOT, "scout_bot", "output", "events")
+
+ARCHIVE_FILENAME = "day_archive.scpk"
+ARCHIVE_VERSION = 1
+
+MAGIC = b"SCPK\x01\x00\x00\x00"
+FOOTER_MAGIC = b"SCPKIDX\x00"
+DICT_MEMBER = "__dict__"
+EVENTS_PREFIX = "events/"
+UNPARSED_EVENTS = "__unparsed__"  # JSON 으로 읽을 수 없는 이벤트 줄 (원문 보관)
+
+ZLIB_LEVEL = 9
+ZSTD_LEVEL = 19
+DICT_MAX_BYTES = 32 * 1024  # zlib 사전 최대 창 크기
+
+
+def get_scout_date_dir(date: str) -> str:
+    """YYYY-MM-DD → records/scout/YYYY/MM/YYYYMMDD"""
+    year, month, day = date.split("-")
+    return os.path.join(SCOUT_RECORDS_DIR, year, month, f"{year}{month}{day}")
+
+
+def resolve_scout_date_dir(date: str) -> str:
+    """YYYY/MM/YYYYMMDD 우선, 없으면 과거 YYYY-MM-DD 구조"""
+    nested = get_scout_date_dir(date)
+    if os.path.isdir(nested):
+        return nested
+    flat = os.path.join(SCOUT_RECORDS_DIR, date)
+    if os.path.isdir(flat):
+        return flat
+    return nested
+
+
+def get_archive_path(date_dir: str) -> str:
+    return os.path.join(date_dir, ARCHIVE_FILENAME)
+
+
+def get_events_path(date: str) -> str:
+    return os.path.join(EVENTS_DIR, f"events_{date.replace('-', '')}.jsonl")
+
+
+# ===============================
+# 코덱
+# ===============================
+def _pick_codec() -> str:
+    return "zstd" if HAS_ZSTD else "zlib"
+
+
+class _Codec:
+    """프레임 압축/해제 (공유 사전 포함)"""
+
+    def __init__(self, codec: str, zdict: bytes = b""):
+        if codec == "zstd" and not HAS_ZSTD:
+            raise RuntimeError("zstd 컨테이너를 읽으려면 zstandard 가 필요합니다 (pip install zstandard)")
+        if codec not in ("zstd", "zlib"):
+            raise ValueError(f"알 수 없는 코덱: {codec}")
+        self.codec = codec
+        self.zdict = zdict
+        self._zstd_dict = None
+        if codec == "zstd" and zdict:
+            self._zstd_dict = zstandard.ZstdCompressionDict(
+                zdict, dict_type=zstandard.DICT_TYPE_RAWCONTENT
+            )
+
+    def compress(self, data: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=self._zstd_dict).compress(data)
+        compressor = (
+            zlib.compressobj(ZLIB_LEVEL, zdict=self.zdict) if self.zdict
+            else zlib.compressobj(ZLIB_LEVEL)
+        )
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, data: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdDecompressor(dict_data=self._zstd_dict).decompress(data)
+        decompressor = zlib.decompressobj(zdict=self.zdict) if self.zdict else zlib.decompressobj()
+        return decompressor.decompress(data) + decompressor.flush()
+
+
+def _build_dictionary(samples: List[bytes]) -> bytes:
+    """
+    공유 사전 (각 파일 첫 줄 모음)
+
+    같은 날 JSONL 은 키/구조가 같으므로 작은 프레임도 사전으로 크게 줄어듦
+    (뒤쪽에 둔 내용이 더 가깝게 참조되므로 최대 크기에서 앞을 잘라냄)
+    """
+    zdict = b"".join(samples)
+    return zdict[-DICT_MAX_BYTES:]
+
+
+# ===============================
+# 읽기
+# ===============================
+class ScoutArchive:
+    """날짜 컨테이너 1개 (인덱스만 읽고 프레임은 요청 시 해제)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"정찰 아카이브 형식이 아닙니다: {path}")
+            f.seek(-(8 + len(FOOTER_MAGIC)), os.SEEK_END)
+            (index_len,) = struct.unpack("<Q", f.read(8))
+            if f.read(len(FOOTER_MAGIC)) != FOOTER_MAGIC:
+                raise ValueError(f"아카이브 인덱스가 손상되었습니다: {path}")
+            f.seek(-(8 + len(FOOTER_MAGIC) + index_len), os.SEEK_END)
+            self.index = json.loads(zlib.decompress(f.read(index_len)).decode("utf-8"))
+
+        self.date = self.index.get("date", "")
+        self.members: Dict[str, Dict[str, Any]] = self.index["members"]
+        zdict = self._read_raw(DICT_MEMBER) if DICT_MEMBER in self.members else b""
+        self._codec = _Codec(self.index["codec"], zdict)
+
+    def _read_raw(self, name: str) -> bytes:
+        member = self.members[name]
+        with open(self.path, "rb") as f:
+            f.seek(member["offset"])
+            return f.read(member["length"])
+
+    def read_member(self, name: str) -> bytes:
+        """프레임 1개 해제 (CRC 확인)"""
+        member = self.members[name]
+        data = self._codec.decompress(self._read_raw(name))
+        if zlib.crc32(data) != member["crc32"]:
+            raise ValueError(f"아카이브 프레임 CRC 불일치: {self.path} [{name}]")
+        return data
+
+    # ---------------------------
+    # 정찰 기록
+    # ---------------------------
+    def stocks(self) -> List[str]:
+        return sorted(self.index.get("stocks", {}))
+
+    def stock_stats(self) -> Dict[str, Dict[str, Any]]:
+        """종목별 요약 (records, triggered, first_time, last_time) - 프레임 해제 없음"""
+        return self.index.get("stocks", {})
+
+    def iter_lines(self, stock: str) -> Iterator[str]:
+        name = f"{stock}.jsonl"
+        if name not in self.members:
+            return
+        for line in self.read_member(name).decode("utf-8").splitlines():
+            yield line
+
+    def read_stock_records(self, stock: str) -> List[Dict[str, Any]]:
+        records = []
+        for line in self.iter_lines(stock):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                print(f"⚠️  JSON 파싱 오류 ({self.path} [{stock}]): {e}")
+        return records
+
+    def read_all_records(self) -> List[Dict[str, Any]]:
+        records = []
+        for stock in self.stocks():
+            records.extend(self.read_stock_records(stock))
+        return records
+
+    # ---------------------------
+    # 이벤트
+    # ---------------------------
+    def has_events(self) -> bool:
+        return bool(self.index.get("events_order"))
+
+    def _event_lines(self, symbol: str) -> List[bytes]:
+        name = f"{EVENTS_PREFIX}{symbol}"
+        if name not in self.members:
+            return []
+        return [l for l in self.read_member(name).splitlines() if l.strip()]
+
+    def read_event_lines(self) -> List[bytes]:
+        """이벤트 로그 원문 줄 (원래 기록 순서, 파싱할 수 없는 줄 포함)"""
+        symbols = self.index.get("events_symbols", [])
+        per_symbol = {s: iter(self._event_lines(s)) for s in symbols}
+        return [next(per_symbol[symbols[i]]) for i in self.index.get("events_order", [])]
+
+    def read_events(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """이벤트 (symbol 지정 시 해당 종목 프레임만, 전체는 원래 기록 순서)"""
+        lines = self._event_lines(symbol) if symbol is not None else self.read_event_lines()
+
+        events = []
+        for line in lines:
+            try:
+                event = json.loads(line)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            if isinstance(event, dict):
+                events.append(event)
+        return events
+
+
+def open_day_archive(date_dir: str) -> Optional[ScoutArchive]:
+    """날짜 디렉터리의 컨테이너 (없거나 읽을 수 없으면 None)"""
+    path = get_archive_path(date_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        return ScoutArchive(path)
+    except Exception as e:
+        print(f"⚠️  아카이브 읽기 오류 ({path}): {e}")
+        return None
+
+
+def has_live_jsonl(date_dir: str) -> bool:
+    return any(Path(date_dir).glob("*.jsonl")) if os.path.isdir(date_dir) else False
+
+
+def load_archived_records(date_dir: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    JSONL 이 없는 날짜의 컨테이너에서 레코드 복원
+
+    Returns:
+        load_scout_records 와 같은 형태의 레코드 리스트, 컨테이너가 없으면 None
+    """
+    if has_live_jsonl(date_dir):
+        return None
+    archive = open_day_archive(date_dir)
+    return archive.read_all_records() if archive else None
+
+
+def load_archived_events(date: str, symbol: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """이벤트 로그가 보관된 경우 컨테이너에서 읽기 (date: YYYY-MM-DD 또는 YYYYMMDD)"""
+    if "-" not in date:
+        date = f"{date[:4]}-{date[4:6]}-{date[6:]}"
+    archive = open_day_archive(resolve_scout_date_dir(date))
+    if archive is None or not archive.has_events():
+        return None
+    return archive.read_events(symbol)
+
+
+# ===============================
+# 쓰기 (보관 작업)
+# ===============================
+def _stock_stats(raw: bytes) -> Dict[str, Any]:
+    stats = {"records": 0, "triggered": 0, "first_time": None, "last_time": None}
+    for line in raw.decode("utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        stats["records"] += 1
+        if record.get("observer", {}).get("triggered", False):
+            stats["triggered"] += 1
+        time_str = record.get("meta", {}).get("time")
+        if time_str:
+            if stats["first_time"] is None or time_str < stats["first_time"]:
+                stats["first_time"] = time_str
+            if stats["last_time"] is None or time_str > stats["last_time"]:
+                stats["last_time"] = time_str
+    return stats
+
+
+def _event_symbol(line: bytes) -> str:
+    """이벤트 줄의 종목 (JSON 객체가 아니면 UNPARSED_EVENTS)"""
+    try:
+        event = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return UNPARSED_EVENTS
+    if not isinstance(event, dict):
+        return UNPARSED_EVENTS
+    return str(event.get("symbol", ""))
+
+
+def _split_events(raw: bytes) -> Dict[str, Any]:
+    """
+    이벤트 로그 → 종목별 줄 + 원래 순서 (종목 번호 목록)
+
+    파싱할 수 없는 줄은 UNPARSED_EVENTS 프레임에 원문 그대로 (빈 줄만 제외)
+    """
+    symbols: List[str] = []
+    symbol_pos: Dict[str, int] = {}
+    per_symbol: Dict[str, List[bytes]] = {}
+    order: List[int] = []
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        symbol = _event_symbol(line)
+        if symbol not in symbol_pos:
+            symbol_pos[symbol] = len(symbols)
+            symbols.append(symbol)
+            per_symbol[symbol] = []
+        per_symbol[symbol].append(line)
+        order.append(symbol_pos[symbol])
+    return {"symbols": symbols, "per_symbol": per_symbol, "order": order}
+
+
+def _write_container(path: str, payloads: Dict[str, bytes], index: Dict[str, Any], zdict: bytes, codec: str) -> None:
+    codec_obj = _Codec(codec, zdict)
+    members: Dict[str, Dict[str, Any]] = {}
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        for name, data in payloads.items():
+            frame = codec_obj.compress(data)
+            members[name] = {
+                "offset": f.tell(),
+                "length": len(frame),
+                "raw_size": len(data),
+                "crc32": zlib.crc32(data),
+            }
+            f.write(frame)
+        if zdict:
+            members[DICT_MEMBER] = {
+                "offset": f.tell(),
+                "length": len(zdict),
+                "raw_size": len(zdict),
+                "crc32": zlib.crc32(zdict),
+            }
+            f.write(zdict)
+        index = {**index, "codec": codec, "members": members}
+        index_bytes = zlib.compress(json.dumps(index, ensure_ascii=False).encode("utf-8"), 9)
+        f.write(index_bytes)
+        f.write(struct.pack("<Q", len(index_bytes)))
+        f.write(FOOTER_MAGIC)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _verify_container(path: str, payloads: Dict[str, bytes], events_raw: bytes = b"") -> bool:
+    """모든 프레임을 해제해 원본과 비교 + 이벤트 로그 줄(빈 줄 제외)이 원래 순서로 복원되는지 확인"""
+    try:
+        archive = ScoutArchive(path)
+        if not all(archive.read_member(name) == data for name, data in payloads.items()):
+            return False
+        if archive.read_event_lines() != [l for l in events_raw.splitlines() if l.strip()]:
+            print(f"⚠️  아카이브 이벤트 줄 불일치 ({path})")
+            return False
+        return True
+    except Exception as e:
+        print(f"⚠️  아카이브 검증 실패 ({path}): {e}")
+        return False
+
+
+def archive_scout_day(
+    date: str,
+    remove_source: bool = True,
+    include_events: bool = True,
+    allow_open_day: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    날짜 1개 보관
+
+    Args:
+        date: YYYY-MM-DD
+        remove_source: 검증 후 원본 JSONL/이벤트 로그/사이드카 인덱스 삭제
+        include_events: 이벤트 로그도 같은 컨테이너에 보관
+        allow_open_day: 오늘(또는 미래) 날짜도 허용 (기본은 마감된 날짜만)
+
+    Returns:
+        {"date", "path", "files", "raw_bytes", "packed_bytes", "ratio"} 또는 None (보관할 것 없음)
+    """
+    if not allow_open_day and date >= datetime.now().strftime("%Y-%m-%d"):
+        print(f"  ⚠️  {date} 는 아직 마감되지 않은 날짜입니다 (보관 생략)")
+        return None
+
+    date_dir = resolve_scout_date_dir(date)
+    archive_path = get_archive_path(date_dir)
+    events_path = get_events_path(date)
+
+    jsonl_files = sorted(Path(date_dir).glob("*.jsonl")) if os.path.isdir(date_dir) else []
+    has_events_file = include_events and os.path.exists(events_path)
+    if not jsonl_files and not has_events_file:
+        return None
+
+    # 기존 컨테이너가 있으면 (이후 추가된 파일과) 합쳐서 다시 작성
+    payloads: Dict[str, bytes] = {}
+    sources: Dict[str, List[int]] = {}
+    stocks: Dict[str, Dict[str, Any]] = {}
+    events_raw = b""
+    if os.path.exists(archive_path):
+        # 읽을 수 없는 컨테이너를 덮어쓰면 그 안의 프레임이 사라지므로 중단 (원본도 그대로 둠)
+        try:
+            previous = ScoutArchive(archive_path)
+            for name in previous.members:
+                if name == DICT_MEMBER or name.startswith(EVENTS_PREFIX):
+                    continue
+                payloads[name] = previous.read_member(name)
+            if previous.has_events():
+                events_raw = b"".join(line + b"\n" for line in previous.read_event_lines())
+        except Exception as e:
+            print(f"  ❌ 기존 아카이브를 읽을 수 없어 보관 중단 ({archive_path}): {e}")
+            return None
+        stocks.update(previous.stock_stats())
+        sources.update(previous.index.get("sources", {}))
+
+    for file_path in jsonl_files:
+        raw = file_path.read_bytes()
+        stat = file_path.stat()
+        payloads[file_path.name] = raw
+        sources[file_path.name] = [stat.st_size, stat.st_mtime_ns]
+        stocks[file_path.stem] = _stock_stats(raw)
+
+    events_order: List[int] = []
+    events_symbols: List[str] = []
+    if has_events_file:
+        with open(events_path, "rb") as f:
+            events_raw = f.read()
+        stat = os.stat(events_path)
+        sources[os.path.basename(events_path)] = [stat.st_size, stat.st_mtime_ns]
+    if events_raw:
+        split = _split_events(events_raw)
+        events_symbols = split["symbols"]
+        events_order = split["order"]
+        for symbol, lines in split["per_symbol"].items():
+            payloads[f"{EVENTS_PREFIX}{symbol}"] = b"\n".join(lines) + b"\n"
+
+    zdict = _build_dictionary([
+        data.split(b"\n", 1)[0] + b"\n" for name, data in sorted(payloads.items())
+    ])
+    index = {
+        "version": ARCHIVE_VERSION,
+        "date": date,
+        "created_at": datetime.now().isoformat(),
+        "stocks": stocks,
+        "events_symbols": events_symbols,
+        "events_order": events_order,
+        "sources": sources,
+    }
+
+    # 새 컨테이너는 검증이 끝난 뒤에만 기존 컨테이너와 교체
+    os.makedirs(date_dir, exist_ok=True)
+    staged_path = archive_path + ".new"
+    _write_container(staged_path, payloads, index, zdict, _pick_codec())
+
+    if not _verify_container(staged_path, payloads, events_raw):
+        # 원본/기존 컨테이너는 그대로 두고 손상된 컨테이너만 제거
+        os.remove(staged_path)
+        return None
+    os.replace(staged_path, archive_path)
+
+    raw_bytes = sum(len(d) for d in payloads.values())
+    packed_bytes = os.path.getsize(archive_path)
+
+    if remove_source:
+        for file_path in jsonl_files:
+            file_path.unlink()
+        if has_events_file:
+            os.remove(events_path)
+        # 사이드카 인덱스의 byte offset 은 원본 JSONL 기준이므로 함께 삭제
+        shutil.rmtree(os.path.join(date_dir, ".scout_index"), ignore_errors=True)
+
+    return {
+        "date": date,
+        "path": archive_path,
+        "files": len(payloads),
+        "raw_bytes": raw_bytes,
+        "packed_bytes": packed_bytes,
+        "ratio": round(raw_bytes / packed_bytes, 2) if packed_bytes else 0.0,
+    }
+
+
+def find_archivable_dates(keep_days: int = 7) -> List[str]:
+    """오늘 기준 keep_days 일보다 오래된, 아직 원본이 남아 있는 날짜"""
+    cutoff = (datetime.now() - timedelta(days=keep_days)).strftime("%Y-%m-%d")
+    dates = set()
+
+    root = Path(SCOUT_RECORDS_DIR)
+    if root.exists():
+        for date_dir in root.glob("*/*/*"):
+            name = date_dir.name
+            if date_dir.is_dir() and len(name) == 8 and name.isdigit() and any(date_dir.glob("*.jsonl")):
+                dates.add(f"{name[:4]}-{name[4:6]}-{name[6:]}")
+        # 과거 YYYY-MM-DD 구조
+        for date_dir in root.glob("????-??-??"):
+            if date_dir.is_dir() and any(date_dir.glob("*.jsonl")):
+                dates.add(date_dir.name)
+    events_root = Path(EVENTS_DIR)
+    if events_root.exists():
+        for events_file in events_root.glob("events_*.jsonl"):
+            compact = events_file.stem.replace("events_", "")
+            if len(compact) == 8 and compact.isdigit():
+                dates.add(f"{compact[:4]}-{compact[4:6]}-{compact[6:]}")
+
+    return sorted(d for d in dates if d < cutoff)
+
+
+def archive_closed_days(keep_days: int = 7, remove_source: bool = True) -> List[Dict[str, Any]]:
+    """keep_days 일보다 오래된 날짜 모두 보관"""
+    results = []
+    for date in find_archivable_dates(keep_days):
+        result = archive_scout_day(date, remove_source=remove_source)
+        if result:
+            results.append(result)
+    return results
+
+
+# ===============================
+# CLI
+# ===============================
+def _print_result(result: Dict[str, Any]) -> None:
+    print(
+        f"  📦 {result['date']}: {result['files']}개 프레임, "
+        f"{result['raw_bytes'] / 1024:,.1f}KB → {result['packed_bytes'] / 1024:,.1f}KB "
+        f"(x{result['ratio']})"
+    )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="마감된 날짜 정찰/이벤트 기록 압축 보관")
+    parser.add_argument("date", nargs="?", default=None, help="보관할 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--closed", action="store_true", help="keep-days 보다 오래된 날짜 모두 보관")
+    parser.add_argument("--keep-days", dest="keep_days", type=int, default=7, help="원본으로 남겨 둘 최근 일수")
+    parser.add_argument("--keep-source", dest="keep_source", action="store_true", help="원본 JSONL 삭제하지 않음")
+    parser.add_argument("--no-events", dest="events", action="store_false", help="이벤트 로그는 보관하지 않음")
+    args = parser.parse_args()
+
+    print(f"🗜️  코덱: {_pick_codec()}" + ("" if HAS_ZSTD else " (zstandard 미설치 → zlib)"))
+
+    if args.closed:
+        results = archive_closed_days(args.keep_days, remove_source=not args.keep_source)
+        for result in results:
+            _print_result(result)
+        print(f"✅ {len(results)}개 날짜 보관 완료")
+        return 0
+
+    if not args.date:
+        parser.error("날짜 또는 --closed 가 필요합니다")
+
+    result = archive_scout_day(args.date, remove_source=not args.keep_source, include_events=args.events)
+    if result is None:
+        print(f"⚠️  {args.date} 보관 대상 없음")
+        return 1
+    _print_result(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,550 @@
+# ===============================
+# test/framework/analyzer/scout_compactor.py
+# ===============================
+"""
+Scout Record 컬럼형 압축 (장 마감 후)
+
+역할:
+- 하루치 records/scout/YYYY/MM/YYYYMMDD/*.jsonl 을 평탄화하여
+  타입이 고정된 컬럼형 파일(Parquet) 1개로 압축
+- 원본 JSONL 은 그대로 보존 (아카이브)
+- 분석기는 컬럼형 파일이 있고 최신이면 JSON 재파싱 없이 이를 사용
+  (스트리밍 집계는 필요한 컬럼만 읽어 record dict 없이 누적기에 전달)
+
+사용법:
+    python -m test.framework.analyzer.scout_compactor [날짜] [--force]
+    python -m test.framework.analyzer.scout_compactor --all
+
+주의:
+- pyarrow 는 선택 의존성 (없으면 압축 생략, 분석기는 JSONL 로 동작)
+- 스키마에 없는 필드/타입이 다른 값은 extra_json 컬럼에 보존 (무손실)
+"""
+import os
+import sys
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    pa = None
+    pq = None
+    HAS_PYARROW = False
+
+
+# ===============================
+# 경로 / 스키마 설정
+# ===============================
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+from test.framework.analyzer.post_market_analyzer import (
+    SCOUT_RECORDS_DIR,
+    get_scout_date_dir,
+)
+
+COLUMNAR_FILENAME = "scout_records.parquet"
+COLUMNAR_SCHEMA_VERSION = "scout_columnar_v2"
+
+# 파일 메타데이터 키
+META_SCHEMA_KEY = b"scout_columnar_schema"
+META_SOURCE_KEY = b"scout_source_fingerprint"
+
+# (컬럼명, 레코드 내 경로, 타입)
+# - 가격(원)은 int 로 고정, float 값이 들어오면 extra_json 으로 보존
+# ⚠️ 컬럼 추가는 가능하나 기존 컬럼의 이름/타입 변경 시 스키마 버전을 올릴 것
+COLUMN_SPECS: List[Tuple[str, Tuple[str, ...], str]] = [
+    ("timestamp", ("meta", "timestamp"), "timestamp"),
+    ("date", ("meta", "date"), "str"),
+    ("time", ("meta", "time"), "str"),
+    ("stock_code", ("meta", "stock_code"), "str"),
+    ("session", ("meta", "session"), "str"),
+    ("schema_version", ("meta", "schema_version"), "str"),
+    ("bot_id", ("meta", "bot_id"), "str"),
+    ("is_large_cap", ("meta", "is_large_cap"), "bool"),
+    ("first_valid_date", ("meta", "first_valid_date"), "str"),
+    ("interval_min", ("interval_min",), "int"),
+    # snapshot
+    ("price_checked", ("snapshot", "price_checked"), "bool"),
+    ("current_price", ("snapshot", "current_price"), "int"),
+    ("high_updated", ("snapshot", "high_updated"), "bool"),
+    ("low_updated", ("snapshot", "low_updated"), "bool"),
+    ("volume", ("snapshot", "volume"), "int"),
+    ("turnover_krw", ("snapshot", "turnover_krw"), "int"),
+    # observer
+    ("observer_triggered", ("observer", "triggered"), "bool"),
+    ("observer_buy_signal", ("observer", "buy_signal"), "bool"),
+    ("observer_sell_signal", ("observer", "sell_signal"), "bool"),
+    # base_candle
+    ("base_candle_exists", ("base_candle", "exists"), "bool"),
+    ("base_candle_anchor_time", ("base_candle", "anchor_time"), "str"),
+    ("base_candle_anchor_open", ("base_candle", "anchor_open"), "int"),
+    ("base_candle_anchor_close", ("base_candle", "anchor_close"), "int"),
+    ("base_candle_anchor_volume", ("base_candle", "anchor_volume"), "int"),
+    # box
+    ("box_formed", ("box", "formed"), "bool"),
+    ("box_high", ("box", "box_high"), "int"),
+    ("box_low", ("box", "box_low"), "int"),
+    ("box_start_time", ("box", "box_start_time"), "str"),
+    ("box_duration", ("box", "duration"), "str"),
+    # outcome / reason
+    ("exit_type", ("outcome", "exit_type"), "str"),
+    ("no_event_reason", ("no_event_reason",), "str_list"),
+    # flow (설명자)
+    ("flow_foreign_net_volume", ("flow", "foreign", "net_volume"), "int"),
+    ("flow_foreign_net_value", ("flow", "foreign", "net_value"), "int"),
+    ("flow_foreign_asof_time", ("flow", "foreign", "asof_time"), "str"),
+    ("flow_foreign_source", ("flow", "foreign", "source"), "str"),
+    ("flow_institution_net_volume", ("flow", "institution", "net_volume"), "int"),
+    ("flow_institution_net_value", ("flow", "institution", "net_value"), "int"),
+    ("flow_institution_asof_time", ("flow", "institution", "asof_time"), "str"),
+    ("flow_institution_source", ("flow", "institution", "source"), "str"),
+]
+
+# 스트리밍 집계(StreamItem)가 읽는 컬럼
+# - 이 값(또는 observer 섹션의 다른 키)이 컬럼에 담기지 못한 행은 stream_spill=True
+#   → 해당 행만 전체 record 로 복원하여 집계
+STREAM_COLUMNS = [
+    "stock_code", "session", "timestamp", "date",
+    "observer_triggered", "observer_buy_signal", "observer_sell_signal",
+    "exit_type", "box_formed", "base_candle_exists", "no_event_reason",
+    "current_price", "volume", "turnover_krw",
+]
+
+
+def _arrow_type(kind: str):
+    """컬럼 타입 → pyarrow 타입"""
+    return {
+        "str": pa.string(),
+        "bool": pa.bool_(),
+        "int": pa.int64(),
+        "timestamp": pa.timestamp("us"),
+        "str_list": pa.list_(pa.string()),
+    }[kind]
+
+
+def get_arrow_schema():
+    """고정 컬럼 스키마 (source_file, extra_json 포함)"""
+    fields = [pa.field("source_file", pa.string())]
+    fields += [pa.field(name, _arrow_type(kind)) for name, _, kind in COLUMN_SPECS]
+    fields.append(pa.field("extra_json", pa.string()))
+    fields.append(pa.field("stream_spill", pa.bool_()))
+    return pa.schema(fields)
+
+
+def get_columnar_path(date_dir: str) -> str:
+    """날짜 디렉터리의 컬럼형 파일 경로"""
+    return os.path.join(date_dir, COLUMNAR_FILENAME)
+
+
+# ===============================
+# 평탄화 / 복원
+# ===============================
+def _coerce(kind: str, value: Any) -> Tuple[bool, Any]:
+    """
+    값을 컬럼 타입으로 변환
+
+    Returns:
+        (성공 여부, 변환된 값) - 실패 시 원본은 extra_json 에 보존
+    """
+    if value is None:
+        return False, None
+    if kind == "str":
+        return isinstance(value, str), value
+    if kind == "bool":
+        return isinstance(value, bool), value
+    if kind == "int":
+        return isinstance(value, int) and not isinstance(value, bool), value
+    if kind == "timestamp":
+        if not isinstance(value, str):
+            return False, None
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return False, None
+        # tz 포함 값이나 isoformat 왕복이 안 되는 값은 원본 유지
+        if dt.tzinfo is not None or dt.isoformat() != value:
+            return False, None
+        return True, dt
+    if kind == "str_list":
+        ok = isinstance(value, list) and all(isinstance(v, str) for v in value)
+        return ok, value
+    return False, None
+
+
+def _prune_empty(rest: Dict[str, Any], orig: Dict[str, Any]) -> Dict[str, Any]:
+    """컬럼으로 옮겨져 비게 된 dict 제거 (원래 비어 있던 dict 는 보존)"""
+    out = {}
+    for key, value in rest.items():
+        if isinstance(value, dict):
+            orig_value = orig.get(key) if isinstance(orig, dict) else None
+            pruned = _prune_empty(value, orig_value or {})
+            if pruned or orig_value == {}:
+                out[key] = pruned
+        else:
+            out[key] = value
+    return out
+
+
+def _spec_groups() -> List[Tuple[Tuple[str, ...], List[Tuple[str, str, str, bool]], bool]]:
+    """COLUMN_SPECS 를 부모 경로별로 묶기: [(부모 경로, [(컬럼명, 키, 타입, 스트리밍 여부)], 스트리밍 포함 여부)]"""
+    groups: Dict[Tuple[str, ...], List[Tuple[str, str, str, bool]]] = {}
+    for name, path, kind in COLUMN_SPECS:
+        groups.setdefault(path[:-1], []).append((name, path[-1], kind, name in STREAM_COLUMNS))
+    return [(parent, specs, any(spec[3] for spec in specs)) for parent, specs in groups.items()]
+
+
+_SPEC_GROUPS = _spec_groups()
+
+
+def flatten_record(record: Dict[str, Any], source_file: str = "") -> Dict[str, Any]:
+    """레코드 1건 → 컬럼 row"""
+    # 컬럼으로 옮길 값이 있는 dict 만 얕은 복사 (원본 record 는 변경하지 않음)
+    rest = dict(record)
+    row: Dict[str, Any] = {"source_file": source_file}
+    spill = False
+
+    for parent_path, specs, stream_group in _SPEC_GROUPS:
+        parent = rest
+        for key in parent_path:
+            child = parent.get(key) if isinstance(parent, dict) else None
+            if isinstance(child, dict):
+                child = parent[key] = dict(child)
+            parent = child
+
+        if not isinstance(parent, dict):
+            for name, _, _, _ in specs:
+                row[name] = None
+            # 섹션이 dict 가 아니면 record 그대로 집계해야 함
+            if stream_group and parent_path[0] in record:
+                spill = True
+            continue
+
+        for name, key, kind, stream in specs:
+            if key not in parent:
+                row[name] = None
+                continue
+            ok, value = _coerce(kind, parent[key])
+            if ok:
+                row[name] = value
+                del parent[key]
+            else:
+                row[name] = None
+                spill = spill or stream
+
+        # observer 는 키가 하나라도 있는지도 집계에 쓰임
+        if parent_path == ("observer",) and parent:
+            spill = True
+
+    extra = _prune_empty(rest, record)
+    row["extra_json"] = json.dumps(extra, ensure_ascii=False) if extra else None
+    row["stream_spill"] = spill
+    return row
+
+
+def _deep_merge(target: Dict[str, Any], extra: Dict[str, Any]) -> None:
+    for key, value in extra.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def _rows_to_records(columns: Dict[str, List[Any]], num_rows: int) -> List[Dict[str, Any]]:
+    """컬럼 dict → 레코드 dict 리스트"""
+    specs = [(name, path, kind) for name, path, kind in COLUMN_SPECS if name in columns]
+    extra_col = columns.get("extra_json")
+    records = []
+
+    for i in range(num_rows):
+        record: Dict[str, Any] = {}
+
+        for name, path, kind in specs:
+            value = columns[name][i]
+            if value is None:
+                continue
+            if kind == "timestamp":
+                value = value.isoformat()
+            parent = record
+            for key in path[:-1]:
+                parent = parent.setdefault(key, {})
+            parent[path[-1]] = value
+
+        if extra_col is not None and extra_col[i]:
+            _deep_merge(record, json.loads(extra_col[i]))
+        records.append(record)
+
+    return records
+
+
+# ===============================
+# 신선도 확인 (원본 JSONL 지문)
+# ===============================
+def get_source_fingerprint(date_dir: str) -> Dict[str, List[int]]:
+    """원본 JSONL 파일별 (크기, 수정시각) 지문"""
+    fingerprint = {}
+    for file_path in sorted(Path(date_dir).glob("*.jsonl")):
+        stat = file_path.stat()
+        fingerprint[file_path.name] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprint
+
+
+def _read_file_metadata(path: str) -> Dict[bytes, bytes]:
+    return pq.read_schema(path).metadata or {}
+
+
+def is_columnar_fresh(date_dir: str) -> bool:
+    """
+    컬럼형 파일이 사용 가능한지 확인
+
+    - 스키마 버전이 일치하고
+    - 원본 JSONL 이 없거나(아카이브 이동), 지문이 압축 시점과 같을 때
+    """
+    if not HAS_PYARROW:
+        return False
+
+    path = get_columnar_path(date_dir)
+    if not os.path.exists(path):
+        return False
+
+    try:
+        metadata = _read_file_metadata(path)
+    except Exception:
+        return False
+
+    if metadata.get(META_SCHEMA_KEY, b"").decode("utf-8") != COLUMNAR_SCHEMA_VERSION:
+        return False
+
+    current = get_source_fingerprint(date_dir)
+    if not current:
+        return True
+
+    try:
+        saved = json.loads(metadata.get(META_SOURCE_KEY, b"{}").decode("utf-8"))
+    except json.JSONDecodeError:
+        return False
+    return saved == current
+
+
+# ===============================
+# 압축 (JSONL → Parquet)
+# ===============================
+def _pick_compression() -> str:
+    for codec in ("zstd", "snappy"):
+        try:
+            if pa.Codec.is_available(codec):
+                return codec
+        except Exception:
+            continue
+    return "none"
+
+
+def compact_scout_dir(date_dir: str, force: bool = False) -> Optional[str]:
+    """
+    날짜 디렉터리의 JSONL 을 컬럼형 파일로 압축
+
+    Args:
+        date_dir: records/scout/YYYY/MM/YYYYMMDD 디렉터리
+        force: 최신 상태여도 다시 생성
+
+    Returns:
+        생성(또는 기존 최신) 파일 경로, 압축하지 못하면 None
+    """
+    if not HAS_PYARROW:
+        print("  ⚠️  pyarrow 미설치 - 컬럼형 압축 생략 (pip install pyarrow)")
+        return None
+
+    if not os.path.isdir(date_dir):
+        return None
+
+    output_path = get_columnar_path(date_dir)
+    if not force and is_columnar_fresh(date_dir):
+        return output_path
+
+    fingerprint = get_source_fingerprint(date_dir)
+    if not fingerprint:
+        return None
+
+    schema = get_arrow_schema().with_metadata({
+        META_SCHEMA_KEY: COLUMNAR_SCHEMA_VERSION.encode("utf-8"),
+        META_SOURCE_KEY: json.dumps(fingerprint).encode("utf-8"),
+    })
+    # 행 dict 리스트 대신 컬럼별 리스트로 모아 한 번에 변환
+    columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+    appenders = [(name, columns[name].append) for name in schema.names]
+    for filename in fingerprint:
+        file_path = os.path.join(date_dir, filename)
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        row = flatten_record(json.loads(line), filename)
+                    except json.JSONDecodeError as e:
+                        print(f"⚠️  JSON 파싱 오류 ({file_path}): {e}")
+                        continue
+                    for name, append in appenders:
+                        append(row[name])
+        except Exception as e:
+            print(f"⚠️  파일 읽기 오류 ({file_path}): {e}")
+
+    table = pa.Table.from_pydict(columns, schema=schema)
+
+    # 원자적 교체 (분석 중 부분 파일 노출 방지)
+    tmp_path = output_path + ".tmp"
+    pq.write_table(table, tmp_path, compression=_pick_compression())
+    os.replace(tmp_path, output_path)
+
+    return output_path
+
+
+def compact_scout_day(date: str, force: bool = False) -> Optional[str]:
+    """특정 날짜(YYYY-MM-DD) 압축"""
+    return compact_scout_dir(get_scout_date_dir(date), force=force)
+
+
+def compact_all_days(force: bool = False) -> List[str]:
+    """records/scout 아래 모든 날짜 디렉터리 압축"""
+    compacted = []
+    root = Path(SCOUT_RECORDS_DIR)
+    if not root.exists():
+        return compacted
+
+    for date_dir in sorted(root.glob("*/*/*")):
+        if not date_dir.is_dir():
+            continue
+        path = compact_scout_dir(str(date_dir), force=force)
+        if path:
+            compacted.append(path)
+    return compacted
+
+
+# ===============================
+# 읽기
+# ===============================
+def read_columnar_table(date_dir: str, columns: Optional[List[str]] = None):
+    """
+    컬럼형 파일을 pyarrow Table 로 읽기 (다일 연구용)
+
+    Returns:
+        pyarrow.Table 또는 None (파일 없음/오래됨/pyarrow 미설치)
+    """
+    if not is_columnar_fresh(date_dir):
+        return None
+    return pq.read_table(get_columnar_path(date_dir), columns=columns)
+
+
+def load_columnar_records(date_dir: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    컬럼형 파일에서 레코드 dict 리스트 복원
+
+    Returns:
+        load_scout_records 와 같은 형태의 레코드 리스트, 사용 불가 시 None
+    """
+    try:
+        table = read_columnar_table(date_dir)
+    except Exception as e:
+        print(f"⚠️  컬럼형 파일 읽기 오류 ({date_dir}): {e}")
+        return None
+
+    if table is None:
+        return None
+
+    columns = {name: table.column(name).to_pylist() for name in table.column_names}
+    return _rows_to_records(columns, table.num_rows)
+
+
+def load_stream_columns(date_dir: str) -> Optional[Tuple[Dict[str, List[Any]], Dict[int, Dict[str, Any]]]]:
+    """
+    스트리밍 집계용 컬럼(STREAM_COLUMNS)만 읽기 (record dict 복원 없음)
+
+    Returns:
+        (컬럼명 → 값 리스트, {행 번호: 복원 record}) - 복원 record 는 첫 행과
+        stream_spill 행 (컬럼 값만으로는 record 와 같게 집계할 수 없는 행),
+        사용 불가 시 None
+    """
+    try:
+        table = read_columnar_table(date_dir, columns=STREAM_COLUMNS + ["stream_spill"])
+        if table is None:
+            return None
+        columns = {name: table.column(name).to_pylist() for name in STREAM_COLUMNS}
+        spill_rows = [i for i, spill in enumerate(table.column("stream_spill").to_pylist()) if spill]
+
+        full = None
+        path = get_columnar_path(date_dir)
+        if spill_rows:
+            spill_rows = sorted(set(spill_rows) | {0})
+            full = pq.read_table(path).take(spill_rows)
+        elif table.num_rows:
+            # 첫 행만 필요하면 첫 batch 1행만 읽기
+            spill_rows = [0]
+            full = pa.Table.from_batches([next(pq.ParquetFile(path).iter_batches(batch_size=1))])
+
+        restored: Dict[int, Dict[str, Any]] = {}
+        if full is not None:
+            full_columns = {name: full.column(name).to_pylist() for name in full.column_names}
+            restored = dict(zip(spill_rows, _rows_to_records(full_columns, full.num_rows)))
+    except Exception as e:
+        print(f"⚠️  컬럼형 파일 읽기 오류 ({date_dir}): {e}")
+        return None
+
+    return columns, restored
+
+
+# ===============================
+# CLI
+# ===============================
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Scout JSONL → 컬럼형(Parquet) 압축"
+    )
+    parser.add_argument(
+        "date",
+        nargs="?",
+        default=None,
+        help="압축할 날짜 (YYYY-MM-DD), 생략 시 오늘"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="모든 날짜 디렉터리 압축"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="최신 상태여도 다시 생성"
+    )
+
+    args = parser.parse_args()
+
+    if not HAS_PYARROW:
+        print("❌ pyarrow 가 설치되어 있지 않습니다 (pip install pyarrow)")
+        return 1
+
+    if args.all:
+        paths = compact_all_days(force=args.force)
+        print(f"✅ {len(paths)}개 날짜 압축 완료")
+        return 0
+
+    date = args.date or datetime.now().strftime("%Y-%m-%d")
+    path = compact_scout_day(date, force=args.force)
+    if path is None:
+        print(f"⚠️  {date} 압축 대상 없음: {get_scout_date_dir(date)}")
+        return 1
+
+    print(f"✅ 압축 완료: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
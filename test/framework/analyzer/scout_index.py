@@ -0,0 +1,620 @@
+# ===============================
+# test/framework/analyzer/scout_index.py
+# ===============================
+"""
+정찰 기록 사이드카 인덱스
+
+날짜 디렉터리마다 작은 인덱스(.scout_index/)를 두고
+필요한 줄만 seek 해서 읽습니다. (전체 JSONL 파싱 없이 종목/시간대 조회)
+
+- _day.json     : 종목별 요약 통계 + 갱신 상태 (요약 화면은 이것만 읽음)
+- {종목}.json   : 종목 offset 상세 (해당 종목 조회 시에만 읽음)
+- _events.json  : 이벤트 로그 종목별 offset
+
+압축 보관된 날짜(scout_archive)는 사이드카 대신 컨테이너 인덱스를 사용합니다.
+
+종목 상세 내용:
+- hours    : 시(HH) → [[시작 offset, 끝 offset], ...] 연속 구간
+- triggers : observer.triggered 레코드 offset
+- reasons  : no_event_reason → 레코드 offset
+- records / triggered / first_time / last_time (요약 통계)
+- indexed_bytes / mtime_ns (증분 갱신용)
+
+이벤트 로그(scout_bot/output/events/events_YYYYMMDD.jsonl)는 종목별 offset 을 함께 저장합니다.
+
+갱신 규칙:
+- 파일이 커졌으면 마지막으로 인덱싱한 위치부터 완결된 줄만 추가
+- 크기가 줄었거나 같은 크기로 다시 쓰였으면 해당 파일만 재인덱싱
+"""
+import os
+import sys
+import json
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# 프로젝트 루트를 경로에 추가
+PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../../..")
+)
+sys.path.insert(0, PROJECT_ROOT)
+
+SCOUT_RECORDS_DIR = os.path.join(PROJECT_ROOT, "records", "scout")
+EVENTS_DIR = os.path.join(PROJECT_ROOT, "scout_bot", "output", "events")
+
+INDEX_DIRNAME = ".scout_index"
+DAY_INDEX_FILENAME = "_day.json"
+EVENTS_INDEX_FILENAME = "_events.json"
+EVENTS_KEY = "_events"
+INDEX_VERSION = 1
+
+# 날짜 요약에 두는 종목별 필드 (나머지 offset 상세는 종목 파일에)
+SUMMARY_FIELDS = ("indexed_bytes", "mtime_ns", "records", "triggered", "first_time", "last_time")
+
+
+# ======================================================
+# 📁 경로
+# ======================================================
+def resolve_scout_date_dir(date: str) -> str:
+    """
+    날짜의 정찰 기록 디렉터리 (YYYY/MM/YYYYMMDD 우선, 없으면 과거 YYYY-MM-DD 구조)
+    """
+    year, month, day = date.split("-")
+    nested = os.path.join(SCOUT_RECORDS_DIR, year, month, f"{year}{month}{day}")
+    if os.path.isdir(nested):
+        return nested
+    flat = os.path.join(SCOUT_RECORDS_DIR, date)
+    if os.path.isdir(flat):
+        return flat
+    return nested
+
+
+def get_events_path(date: str) -> str:
+    return os.path.join(EVENTS_DIR, f"events_{date.replace('-', '')}.jsonl")
+
+
+def _empty_index(date: str, date_dir: str) -> Dict[str, Any]:
+    return {
+        "version": INDEX_VERSION,
+        "date": date,
+        "date_dir": date_dir,
+        "files": {},
+        "events": None,
+    }
+
+
+def _empty_file_entry() -> Dict[str, Any]:
+    return {
+        "indexed_bytes": 0,
+        "mtime_ns": 0,
+        "records": 0,
+        "triggered": 0,
+        "first_time": None,
+        "last_time": None,
+        "hours": {},
+        "last_hour": None,
+        "triggers": [],
+        "reasons": {},
+    }
+
+
+def _record_time(record: Dict[str, Any]) -> str:
+    meta = record.get("meta", {})
+    time_str = meta.get("time")
+    if time_str:
+        return time_str
+    timestamp = meta.get("timestamp", "")
+    return timestamp[11:19] if len(timestamp) >= 19 else ""
+
+
+# ======================================================
+# 🔨 인덱싱
+# ======================================================
+def _iter_complete_lines(path: str, start: int) -> Iterator[Tuple[int, bytes]]:
+    """start 위치부터 (offset, 줄) - 개행으로 끝나지 않은 마지막 줄(쓰는 중)은 제외"""
+    with open(path, "rb") as f:
+        f.seek(start)
+        offset = start
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            yield offset, line
+            offset += len(line)
+
+
+def _index_scout_file(path: str, entry: Dict[str, Any]) -> int:
+    """entry 의 indexed_bytes 이후 줄을 인덱스에 추가, 새로 인덱싱한 레코드 수 반환"""
+    added = 0
+    end = entry["indexed_bytes"]
+    hours = entry["hours"]
+
+    for offset, line in _iter_complete_lines(path, entry["indexed_bytes"]):
+        end = offset + len(line)
+        stripped = line.strip()
+        if not stripped:
+            continue
+        try:
+            record = json.loads(stripped)
+        except json.JSONDecodeError:
+            continue
+
+        time_str = _record_time(record)
+        hour = time_str[:2] or "??"
+        segments = hours.setdefault(hour, [])
+        # 같은 시간대가 이어지면 마지막 구간 확장
+        if entry["last_hour"] == hour and segments and segments[-1][1] == offset:
+            segments[-1][1] = end
+        else:
+            segments.append([offset, end])
+        entry["last_hour"] = hour
+
+        entry["records"] += 1
+        if record.get("observer", {}).get("triggered", False):
+            entry["triggered"] += 1
+            entry["triggers"].append(offset)
+        for reason in record.get("no_event_reason", []) or []:
+            entry["reasons"].setdefault(str(reason), []).append(offset)
+
+        if time_str:
+            if entry["first_time"] is None or time_str < entry["first_time"]:
+                entry["first_time"] = time_str
+            if entry["last_time"] is None or time_str > entry["last_time"]:
+                entry["last_time"] = time_str
+        added += 1
+
+    entry["indexed_bytes"] = end
+    return added
+
+
+def _index_events_file(path: str, entry: Dict[str, Any]) -> int:
+    added = 0
+    end = entry["indexed_bytes"]
+    for offset, line in _iter_complete_lines(path, entry["indexed_bytes"]):
+        end = offset + len(line)
+        stripped = line.strip()
+        if not stripped:
+            continue
+        try:
+            event = json.loads(stripped)
+        except json.JSONDecodeError:
+            continue
+        entry["by_symbol"].setdefault(str(event.get("symbol", "")), []).append(offset)
+        event_type = event.get("event_type", "UNKNOWN")
+        entry["by_type"][event_type] = entry["by_type"].get(event_type, 0) + 1
+        added += 1
+    entry["indexed_bytes"] = end
+    return added
+
+
+def _refresh_entry(path: str, entry: Optional[Dict[str, Any]], indexer: Callable, factory: Callable) -> Tuple[Dict[str, Any], bool]:
+    """파일 상태에 맞춰 entry 증분 갱신 → (entry, 변경 여부)"""
+    stat = os.stat(path)
+    if entry is not None:
+        if stat.st_size == entry["indexed_bytes"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            return entry, False
+        # 줄었거나 같은 크기로 다시 쓰인 파일 → 처음부터
+        if stat.st_size < entry["indexed_bytes"] or (
+            stat.st_size == entry["indexed_bytes"] and stat.st_mtime_ns != entry["mtime_ns"]
+        ):
+            entry = None
+    if entry is None:
+        entry = factory()
+    indexer(path, entry)
+    entry["mtime_ns"] = stat.st_mtime_ns
+    return entry, True
+
+
+def _index_dir(date_dir: str) -> str:
+    return os.path.join(date_dir, INDEX_DIRNAME)
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽이 깨진 인덱스를 보지 않도록)"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _summary_of(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: entry[key] for key in SUMMARY_FIELDS}
+
+
+def _open_archive(date_dir: str):
+    """JSONL 없이 보관 컨테이너만 남은 날짜면 ScoutArchive, 아니면 None"""
+    try:
+        from test.framework.analyzer.scout_archive import has_live_jsonl, open_day_archive
+    except ImportError:
+        return None
+    if has_live_jsonl(date_dir):
+        return None
+    return open_day_archive(date_dir)
+
+
+def load_scout_index(date: str) -> Dict[str, Any]:
+    """
+    날짜 요약 인덱스 로드 (없거나 버전이 다르면 빈 인덱스)
+
+    종목별 offset 상세는 조회/갱신 시점에 해당 종목 파일만 읽음
+    """
+    date_dir = resolve_scout_date_dir(date)
+    index = {
+        "version": INDEX_VERSION,
+        "date": date,
+        "date_dir": date_dir,
+        "files": {},      # 종목 → 요약 통계 (SUMMARY_FIELDS)
+        "events": None,   # 이벤트 로그 요약 (indexed_bytes, mtime_ns, by_type)
+        "_entries": {},   # 종목 → offset 상세 (지연 로드)
+        "_events_entry": None,
+        "_dirty": set(),
+    }
+    archive = _open_archive(date_dir)
+    if archive is not None:
+        # 압축 보관된 날짜 → 컨테이너 인덱스의 종목 요약 사용 (조회 시 종목 프레임만 해제)
+        index["_archive"] = archive
+        index["files"] = {
+            stock: {
+                "indexed_bytes": archive.members[f"{stock}.jsonl"]["raw_size"],
+                "mtime_ns": 0,
+                **stats,
+            }
+            for stock, stats in archive.stock_stats().items()
+        }
+        return index
+    day = _read_json(os.path.join(_index_dir(date_dir), DAY_INDEX_FILENAME))
+    if day and day.get("version") == INDEX_VERSION and day.get("date") == date:
+        index["files"] = day.get("files", {})
+        index["events"] = day.get("events")
+    return index
+
+
+def _get_entry(index: Dict[str, Any], stock: str) -> Optional[Dict[str, Any]]:
+    """종목 offset 상세 (요약과 indexed_bytes 가 다르면 무효)"""
+    entry = index["_entries"].get(stock)
+    if entry is None:
+        summary = index["files"].get(stock)
+        if summary is None:
+            return None
+        entry = _read_json(os.path.join(_index_dir(index["date_dir"]), f"{stock}.json"))
+        if not entry or entry.get("indexed_bytes") != summary["indexed_bytes"]:
+            # 상세 파일 손상/불일치 → 요약도 버려서 다음 갱신 때 재인덱싱
+            index["files"].pop(stock, None)
+            return None
+        index["_entries"][stock] = entry
+    return entry
+
+
+def _get_events_entry(index: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    entry = index["_events_entry"]
+    if entry is None and index.get("events"):
+        entry = _read_json(os.path.join(_index_dir(index["date_dir"]), EVENTS_INDEX_FILENAME))
+        if not entry or entry.get("indexed_bytes") != index["events"]["indexed_bytes"]:
+            return None
+        index["_events_entry"] = entry
+    return entry
+
+
+def _is_fresh(path: str, summary: Optional[Dict[str, Any]]) -> bool:
+    if summary is None:
+        return False
+    stat = os.stat(path)
+    return stat.st_size == summary["indexed_bytes"] and stat.st_mtime_ns == summary["mtime_ns"]
+
+
+def save_scout_index(index: Dict[str, Any]) -> None:
+    """변경된 종목 상세 + 날짜 요약 저장"""
+    if not index["_dirty"]:
+        return
+    index_dir = _index_dir(index["date_dir"])
+    try:
+        os.makedirs(index_dir, exist_ok=True)
+        for stock in index["_dirty"]:
+            if stock == EVENTS_KEY:
+                _write_json(os.path.join(index_dir, EVENTS_INDEX_FILENAME), index["_events_entry"])
+            else:
+                _write_json(os.path.join(index_dir, f"{stock}.json"), index["_entries"][stock])
+        _write_json(os.path.join(index_dir, DAY_INDEX_FILENAME), {
+            "version": INDEX_VERSION,
+            "date": index["date"],
+            "files": index["files"],
+            "events": index["events"],
+        })
+        index["_dirty"] = set()
+    except OSError as e:
+        print(f"⚠️  인덱스 저장 실패: {e}")
+
+
+def update_scout_index(
+    index: Dict[str, Any],
+    stocks: Optional[List[str]] = None,
+) -> Dict[str, Tuple[int, int]]:
+    """
+    인덱스 증분 갱신
+
+    Args:
+        index: load_scout_index() 결과
+        stocks: 갱신할 종목 (None 이면 디렉터리 전체)
+
+    Returns:
+        {종목: (이전 indexed_bytes, 새 indexed_bytes)} - 변경된 파일만
+        (재인덱싱된 파일은 이전 값 0)
+    """
+    date_dir = index["date_dir"]
+    changes: Dict[str, Tuple[int, int]] = {}
+
+    if stocks is None:
+        try:
+            names = [n for n in os.listdir(date_dir) if n.endswith(".jsonl")]
+        except FileNotFoundError:
+            names = []
+        stocks = [n[:-len(".jsonl")] for n in names]
+
+    for stock in stocks:
+        path = os.path.join(date_dir, f"{stock}.jsonl")
+        if not os.path.exists(path):
+            continue
+        summary = index["files"].get(stock)
+        if _is_fresh(path, summary):
+            continue
+        old = _get_entry(index, stock)
+        old_bytes = old["indexed_bytes"] if old else 0
+        entry, changed = _refresh_entry(path, old, _index_scout_file, _empty_file_entry)
+        if changed:
+            if entry is not old:
+                old_bytes = 0
+            index["_entries"][stock] = entry
+            index["files"][stock] = _summary_of(entry)
+            index["_dirty"].add(stock)
+            changes[stock] = (old_bytes, entry["indexed_bytes"])
+
+    events_path = get_events_path(index["date"])
+    if os.path.exists(events_path) and not _is_fresh(events_path, index.get("events")):
+        entry, changed = _refresh_entry(
+            events_path, _get_events_entry(index), _index_events_file,
+            lambda: {"indexed_bytes": 0, "mtime_ns": 0, "by_symbol": {}, "by_type": {}},
+        )
+        if changed:
+            index["_events_entry"] = entry
+            index["events"] = {
+                "indexed_bytes": entry["indexed_bytes"],
+                "mtime_ns": entry["mtime_ns"],
+                "by_type": dict(entry["by_type"]),
+            }
+            index["_dirty"].add(EVENTS_KEY)
+
+    return changes
+
+
+def get_scout_index(date: str, stocks: Optional[List[str]] = None, save: bool = True) -> Dict[str, Any]:
+    """로드 + 증분 갱신 + (변경 시) 저장"""
+    index = load_scout_index(date)
+    update_scout_index(index, stocks)
+    if save:
+        save_scout_index(index)
+    return index
+
+
+# ======================================================
+# 🔎 조회
+# ======================================================
+def _normalize_time(value: Optional[str], end: bool = False) -> Optional[str]:
+    """HH / HH:MM / HH:MM:SS → HH:MM:SS (end 이면 구간 끝까지 포함)"""
+    if not value:
+        return None
+    parts = value.split(":")
+    while len(parts) < 3:
+        parts.append("59" if end else "00")
+    return ":".join(p.zfill(2) for p in parts[:3])
+
+
+def _read_lines_at(path: str, offsets: List[int]) -> Iterator[Dict[str, Any]]:
+    with open(path, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            line = f.readline().strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def _read_ranges(path: str, ranges: List[Tuple[int, int]]) -> Iterator[Dict[str, Any]]:
+    with open(path, "rb") as f:
+        for start, end in ranges:
+            f.seek(start)
+            for line in f.read(end - start).splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
+def _record_matches(
+    record: Dict[str, Any],
+    start_time: Optional[str],
+    end_time: Optional[str],
+    triggered_only: bool,
+    reason: Optional[str],
+) -> bool:
+    if start_time or end_time:
+        time_str = _record_time(record)
+        if start_time and time_str < start_time:
+            return False
+        if end_time and time_str > end_time:
+            return False
+    if triggered_only and not record.get("observer", {}).get("triggered", False):
+        return False
+    if reason and reason not in (record.get("no_event_reason") or []):
+        return False
+    return True
+
+
+def query_scout_records(
+    index: Dict[str, Any],
+    stock: Optional[str] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    triggered_only: bool = False,
+    reason: Optional[str] = None,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    인덱스로 필요한 줄만 읽어 (종목, 레코드) 반환
+
+    Args:
+        stock: 종목 코드 (None 이면 전체)
+        start_time / end_time: HH[:MM[:SS]] (양 끝 포함)
+        triggered_only: observer.triggered 레코드만
+        reason: no_event_reason 에 포함된 사유
+    """
+    start_time = _normalize_time(start_time)
+    end_time = _normalize_time(end_time, end=True)
+    start_hour = start_time[:2] if start_time else None
+    end_hour = end_time[:2] if end_time else None
+
+    stocks = [stock] if stock else sorted(index["files"])
+    archive = index.get("_archive")
+    for code in stocks:
+        if archive is not None:
+            for record in archive.read_stock_records(code):
+                if _record_matches(record, start_time, end_time, triggered_only, reason):
+                    yield code, record
+            continue
+        entry = _get_entry(index, code)
+        if entry is None:
+            update_scout_index(index, [code])
+            entry = _get_entry(index, code)
+        if not entry:
+            continue
+        path = os.path.join(index["date_dir"], f"{code}.jsonl")
+
+        # 시간대 구간
+        ranges = sorted(
+            tuple(seg)
+            for hour, segments in entry["hours"].items()
+            if (start_hour is None or hour >= start_hour) and (end_hour is None or hour <= end_hour)
+            for seg in segments
+        )
+        if not ranges:
+            continue
+
+        if triggered_only or reason:
+            # trigger/사유 offset 교집합 → 시간대 구간 안의 것만 seek
+            candidates = None
+            if triggered_only:
+                candidates = set(entry["triggers"])
+            if reason:
+                reason_offsets = set(entry["reasons"].get(reason, []))
+                candidates = reason_offsets if candidates is None else candidates & reason_offsets
+            offsets = sorted(
+                off for off in candidates
+                if any(start <= off < end for start, end in ranges)
+            )
+            records = _read_lines_at(path, offsets)
+        else:
+            records = _read_ranges(path, ranges)
+
+        for record in records:
+            if _record_matches(record, start_time, end_time, triggered_only, reason):
+                yield code, record
+
+
+def query_stock_events(
+    index: Dict[str, Any],
+    stock: str,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """이벤트 로그에서 종목 이벤트만 seek 해서 읽기 (occurred_at 시각 필터)"""
+    events = _get_events_entry(index)
+    archive = index.get("_archive")
+    if events:
+        offsets = events["by_symbol"].get(stock, [])
+        source = _read_lines_at(get_events_path(index["date"]), offsets)
+    elif archive is not None and archive.has_events():
+        source = archive.read_events(stock)
+    else:
+        return []
+    start_time = _normalize_time(start_time)
+    end_time = _normalize_time(end_time, end=True)
+    result = []
+    for event in source:
+        time_str = str(event.get("occurred_at", ""))[11:19]
+        if start_time and time_str < start_time:
+            continue
+        if end_time and time_str > end_time:
+            continue
+        result.append(event)
+    return result
+
+
+def follow_scout_records(
+    date: str,
+    callback: Callable[[str, Dict[str, Any]], None],
+    stock: Optional[str] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    triggered_only: bool = False,
+    reason: Optional[str] = None,
+    interval_sec: float = 2.0,
+    max_loops: Optional[int] = None,
+) -> None:
+    """
+    새로 추가되는 레코드 실시간 추적 (tail -f)
+
+    현재 끝부터 시작하며, 인덱스 갱신 때 늘어난 구간만 읽어 callback(종목, 레코드) 호출
+    """
+    start_time = _normalize_time(start_time)
+    end_time = _normalize_time(end_time, end=True)
+    stocks = [stock] if stock else None
+
+    index = get_scout_index(date, stocks)
+    loops = 0
+    try:
+        while max_loops is None or loops < max_loops:
+            time.sleep(interval_sec)
+            loops += 1
+            changes = update_scout_index(index, stocks)
+            for code, (old_bytes, new_bytes) in sorted(changes.items()):
+                path = os.path.join(index["date_dir"], f"{code}.jsonl")
+                for record in _read_ranges(path, [(old_bytes, new_bytes)]):
+                    if _record_matches(record, start_time, end_time, triggered_only, reason):
+                        callback(code, record)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        save_scout_index(index)
+
+
+def format_record_line(stock: str, record: Dict[str, Any]) -> str:
+    """레코드 1줄 요약"""
+    snapshot = record.get("snapshot", {})
+    observer = record.get("observer", {})
+    flags = []
+    if observer.get("triggered"):
+        flags.append("TRIG")
+    if record.get("box", {}).get("formed"):
+        flags.append("BOX")
+    if record.get("base_candle", {}).get("exists"):
+        flags.append("BASE")
+    exit_type = record.get("outcome", {}).get("exit_type")
+    if exit_type:
+        flags.append(f"EXIT={exit_type}")
+    reasons = record.get("no_event_reason") or []
+    price = snapshot.get("current_price")
+    price_str = f"{price:>10,}" if isinstance(price, (int, float)) else f"{'-':>10}"
+    line = f"  {_record_time(record) or '--:--:--'} {stock} {price_str}원 {','.join(flags) or '-'}"
+    if reasons:
+        line += f" | {', '.join(str(r) for r in reasons)}"
+    return line
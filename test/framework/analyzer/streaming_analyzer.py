@@ -0,0 +1,694 @@
+# ===============================
+# test/framework/analyzer/streaming_analyzer.py
+# ===============================
+"""
+스트리밍 Post-Market 집계
+
+역할:
+- 종목별 JSONL(각 파일은 이미 시간순) 을 heapq k-way merge 로 시간순 병합
+- record 를 한 번만 파싱하여 1회 순회로 여러 누적기(accumulator)에 전달
+  · ObserverStatsAccumulator  : 종목별/Observer/Box/기준봉 집계
+  · SessionAccumulator        : 세션 분포
+  · ReasonAccumulator         : 이벤트 미발생 사유
+  · CycleAccumulator          : Cycle 상태 머신 (cycle_engine.CycleEngine)
+  · EnhancedCycleAccumulator  : Cycle 확장 지표 (품질/가격/Observer 변화)
+- 메모리는 전체 record 수가 아닌 "열린 cycle 수" 에 비례
+
+결과는 aggregate_observers() + enhance_cycle_analysis() 와 동일한 구조/값
+(파일 내부 시간 역전이 감지되면 전체 정렬 방식으로 다시 계산)
+"""
+import os
+import json
+import heapq
+import contextlib
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from test.framework.analyzer.cycle_analyzer_enhanced import (
+    classify_timeout_subtype,
+    calculate_info_score,
+    get_slot_type,
+)
+from test.framework.analyzer.cycle_engine import (
+    CycleEngine,
+    CycleState,
+    build_cycle_summary,
+)
+
+
+# ===============================
+# 입력: record 1건 + 1회 파싱한 시각
+# ===============================
+class StreamItem:
+    """
+    병합 스트림의 record 1건
+
+    기본 누적기가 쓰는 필드는 생성 시 한 번만 꺼내 둠
+    (컬럼형 파일은 record dict 없이 컬럼 값으로 바로 채움: from_fields)
+    """
+
+    __slots__ = (
+        "index", "record", "stock", "session", "ts_str", "ts_dt",
+        "date", "triggered", "has_observer", "exit_type", "box_formed", "base_exists",
+        "reasons", "price", "volume", "turnover",
+    )
+
+    def __init__(self, record: Dict[str, Any]):
+        meta = record.get("meta", {})
+        observer = record.get("observer", {})
+        snapshot = record.get("snapshot", {})
+        self.index = -1
+        self.record = record
+        self.stock = meta.get("stock_code", "UNKNOWN")
+        self.session = meta.get("session", "UNKNOWN")
+        self.ts_str = meta.get("timestamp", "")
+        try:
+            self.ts_dt = (
+                datetime.fromisoformat(self.ts_str.replace("Z", "+00:00"))
+                if self.ts_str else None
+            )
+        except Exception:
+            self.ts_dt = None
+        self.date = meta.get("date", "")
+        self.triggered = observer.get("triggered")
+        self.has_observer = bool(observer)
+        self.exit_type = record.get("outcome", {}).get("exit_type")
+        self.box_formed = record.get("box", {}).get("formed", False)
+        self.base_exists = record.get("base_candle", {}).get("exists", False)
+        self.reasons = record.get("no_event_reason", [])
+        self.price = snapshot.get("current_price")
+        self.volume = snapshot.get("volume")
+        self.turnover = snapshot.get("turnover_krw")
+
+    @classmethod
+    def from_fields(
+        cls,
+        stock, session, ts_dt, date, triggered, has_observer, exit_type,
+        box_formed, base_exists, reasons, price, volume, turnover,
+    ) -> "StreamItem":
+        """컬럼 값으로 생성 (record 본문 없음, ts_dt 는 tz 없는 datetime)"""
+        item = cls.__new__(cls)
+        item.index = -1
+        item.record = None
+        item.stock = "UNKNOWN" if stock is None else stock
+        item.session = "UNKNOWN" if session is None else session
+        item.ts_dt = ts_dt
+        item.ts_str = ts_dt.isoformat() if ts_dt is not None else ""
+        item.date = "" if date is None else date
+        item.triggered = triggered
+        item.has_observer = has_observer
+        item.exit_type = exit_type
+        item.box_formed = False if box_formed is None else box_formed
+        item.base_exists = False if base_exists is None else base_exists
+        item.reasons = [] if reasons is None else reasons
+        item.price = price
+        item.volume = volume
+        item.turnover = turnover
+        return item
+
+
+def _sort_key(item: StreamItem):
+    """aggregate_observers 의 get_timestamp 와 같은 정렬 기준"""
+    ts_str = item.ts_str
+    if not ts_str:
+        return datetime.min
+    if not isinstance(ts_str, str):
+        return ts_str
+    if "T" not in ts_str or item.ts_dt is None:
+        return datetime.min
+    return item.ts_dt
+
+
+class _FileStream:
+    """
+    JSONL 파일 1개를 시간순 StreamItem 으로 읽기 (역전 감지)
+
+    open_lines 를 주면 파일 대신 그 줄 반복자를 사용 (보관 컨테이너의 종목 프레임 등)
+    """
+
+    def __init__(self, file_path: Path, open_lines: Optional[Callable[[], Iterator[str]]] = None):
+        self.file_path = file_path
+        self.open_lines = open_lines
+        self.out_of_order = False
+        self.first_record: Optional[Dict[str, Any]] = None
+
+    def _lines(self):
+        if self.open_lines is not None:
+            return contextlib.nullcontext(self.open_lines())
+        return open(self.file_path, "r", encoding="utf-8")
+
+    def __iter__(self) -> Iterator[StreamItem]:
+        prev_key = None
+        try:
+            with self._lines() as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        print(f"⚠️  JSON 파싱 오류 ({self.file_path}): {e}")
+                        continue
+                    if self.first_record is None:
+                        self.first_record = record
+                    item = StreamItem(record)
+                    key = _sort_key(item)
+                    if prev_key is not None and key < prev_key:
+                        self.out_of_order = True
+                    prev_key = key
+                    yield item
+        except Exception as e:
+            print(f"⚠️  파일 읽기 오류 ({self.file_path}): {e}")
+
+
+# ===============================
+# 누적기 (Accumulator)
+# ===============================
+class RecordAccumulator:
+    """누적기 공통 인터페이스"""
+
+    def add(self, item: StreamItem) -> None:
+        raise NotImplementedError
+
+    def finalize(self, stats: Dict[str, Any], last_item: Optional[StreamItem]) -> None:
+        """순회 종료 후 stats 에 결과 기록"""
+        pass
+
+
+class ObserverStatsAccumulator(RecordAccumulator):
+    """종목별 record/트리거/Box/기준봉 집계"""
+
+    def __init__(self):
+        self.by_stock: Dict[str, Dict[str, int]] = {}
+        self.triggered_records = 0
+        self.triggered_stocks = set()
+        self.triggers: List[Dict[str, Any]] = []
+        self.box_formed_count = 0
+        self.box_formed_stocks = set()
+        self.base_exists_count = 0
+        self.base_exists_stocks = set()
+
+    def add(self, item: StreamItem) -> None:
+        stock_code = item.stock
+        by_stock = self.by_stock.get(stock_code)
+        if by_stock is None:
+            by_stock = self.by_stock[stock_code] = {
+                "records": 0,
+                "triggered_records": 0,
+                "box_formed": 0,
+                "base_candle_exists": 0,
+            }
+        by_stock["records"] += 1
+
+        if item.triggered:
+            self.triggered_records += 1
+            self.triggered_stocks.add(stock_code)
+            by_stock["triggered_records"] += 1
+            if item.ts_str:
+                self.triggers.append({
+                    "stock": stock_code,
+                    "time": item.ts_str,
+                    "session": item.session,
+                    "record_index": item.index,
+                })
+
+        if item.box_formed:
+            self.box_formed_count += 1
+            self.box_formed_stocks.add(stock_code)
+            by_stock["box_formed"] += 1
+
+        if item.base_exists:
+            self.base_exists_count += 1
+            self.base_exists_stocks.add(stock_code)
+            by_stock["base_candle_exists"] += 1
+
+    def finalize(self, stats: Dict[str, Any], last_item: Optional[StreamItem]) -> None:
+        stats["by_stock"] = {k: dict(v) for k, v in self.by_stock.items()}
+        summary = stats["observer_summary"]
+        summary["triggered_records"] = self.triggered_records
+        summary["triggered_stocks"] = list(self.triggered_stocks)
+        summary["triggers"] = list(self.triggers)
+        stats["box_summary"] = {
+            "formed_count": self.box_formed_count,
+            "formed_stocks": list(self.box_formed_stocks),
+        }
+        stats["base_candle_summary"] = {
+            "exists_count": self.base_exists_count,
+            "exists_stocks": list(self.base_exists_stocks),
+        }
+
+
+class SessionAccumulator(RecordAccumulator):
+    """세션 분포"""
+
+    def __init__(self):
+        self.counter = Counter()
+
+    def add(self, item: StreamItem) -> None:
+        self.counter[item.session] += 1
+
+    def finalize(self, stats: Dict[str, Any], last_item: Optional[StreamItem]) -> None:
+        stats["session_distribution"] = dict(self.counter)
+
+
+class ReasonAccumulator(RecordAccumulator):
+    """이벤트 미발생 사유"""
+
+    def __init__(self):
+        self.counter = Counter()
+
+    def add(self, item: StreamItem) -> None:
+        for reason in item.reasons:
+            self.counter[reason] += 1
+
+    def finalize(self, stats: Dict[str, Any], last_item: Optional[StreamItem]) -> None:
+        stats["no_event_reasons"] = dict(self.counter)
+
+
+class CycleAccumulator(RecordAccumulator):
+    """
+    Cycle 상태 머신 누적기 (cycle_engine.CycleEngine 사용)
+
+    - current_state: 방금 처리한 record 가 속한 cycle (없으면 None)
+      → 다른 누적기가 cycle 단위 지표를 CycleState.payload 에 붙일 때 사용
+    """
+
+    def __init__(self):
+        self.engine = CycleEngine()
+        self.states_in_order: List[CycleState] = []
+
+    @property
+    def open_cycles(self) -> Dict[str, CycleState]:
+        return self.engine.open_cycles
+
+    @property
+    def current_state(self) -> Optional[CycleState]:
+        return self.engine.current
+
+    def add(self, item: StreamItem) -> None:
+        self.engine.advance(
+            item.stock,
+            bool(item.triggered),
+            item.exit_type,
+            item.ts_str,
+            item.ts_dt,
+            item.session,
+            item.index,
+            item.date,
+        )
+
+    def finalize(self, stats: Dict[str, Any], last_item: Optional[StreamItem]) -> None:
+        # 장 종료 시 미종료 cycle → timeout (마지막 record 시각 기준)
+        # 진행 중 상태는 건드리지 않음 (장중 증분 집계에서 finalize 를 여러 번 호출)
+        last_ts_str = last_item.ts_str if last_item is not None else ""
+        market_close_time = last_item.ts_dt if last_ts_str else None
+
+        triggered_cycle = self.engine.finalize(last_ts_str, market_close_time)
+        self.states_in_order = self.engine.states_in_order()
+
+        summary = stats["observer_summary"]
+        summary["triggered_cycle"] = triggered_cycle
+        summary["open_cycles_count"] = len(self.engine.open_cycles)
+        summary["cycle_summary"] = build_cycle_summary(triggered_cycle, self.engine.first_date)
+        summary["triggered_cycles_count"] = len(triggered_cycle)
+
+
+class CycleMetrics:
+    """
+    cycle 1개의 확장 지표 (record 를 보관하지 않고 누적)
+
+    assess_data_quality / extract_cycle_price_info / count_observer_events 와 같은 값
+    """
+
+    __slots__ = (
+        "total", "price_count", "volume_count", "turnover_count", "observer_count",
+        "start_price", "end_price", "max_price", "min_price",
+        "event_count", "changes", "prev",
+    )
+
+    def __init__(self):
+        self.total = 0
+        self.price_count = 0
+        self.volume_count = 0
+        self.turnover_count = 0
+        self.observer_count = 0
+        self.start_price = None
+        self.end_price = None
+        self.max_price = None
+        self.min_price = None
+        self.event_count = 0
+        self.changes = {"volume": 0, "box": 0, "base_candle": 0}
+        self.prev: Dict[str, Any] = {}
+
+    def add(self, item: StreamItem) -> None:
+        self.total += 1
+
+        # 품질
+        price = item.price
+        if price is not None:
+            self.price_count += 1
+        if item.volume is not None and item.volume > 0:
+            self.volume_count += 1
+        if item.turnover is not None and item.turnover > 0:
+            self.turnover_count += 1
+        if item.has_observer:
+            self.observer_count += 1
+
+        # 가격
+        if price is not None and price > 0:
+            if self.start_price is None:
+                self.start_price = price
+                self.max_price = price
+                self.min_price = price
+            else:
+                self.max_price = max(self.max_price, price)
+                self.min_price = min(self.min_price, price)
+            self.end_price = price
+
+        # Observer 변화
+        box_formed = item.box_formed
+        base_exists = item.base_exists
+        if item.triggered != self.prev.get("triggered"):
+            self.changes["volume"] += 1
+            self.event_count += 1
+        if box_formed != self.prev.get("box_formed", False):
+            self.changes["box"] += 1
+            self.event_count += 1
+        if base_exists != self.prev.get("base_exists", False):
+            self.changes["base_candle"] += 1
+            self.event_count += 1
+        self.prev = {
+            "triggered": False if item.triggered is None else item.triggered,
+            "box_formed": box_formed,
+            "base_exists": base_exists,
+        }
+
+    def data_quality(self) -> Dict[str, Any]:
+        reasons = []
+        status = "PASS"
+        if not self.price_count:
+            reasons.append("가격 데이터 없음")
+            status = "FAIL"
+        if not self.volume_count:
+            reasons.append("거래량 데이터 없음")
+            status = "FAIL"
+        if not self.turnover_count:
+            reasons.append("거래대금 데이터 없음")
+            status = "FAIL"
+        if not self.observer_count:
+            reasons.append("Observer 데이터 없음")
+            status = "FAIL"
+
+        if status == "PASS" and self.total > 0:
+            price_ratio = self.price_count / self.total
+            volume_ratio = self.volume_count / self.total
+            turnover_ratio = self.turnover_count / self.total
+            if price_ratio < 0.8:
+                reasons.append(f"가격 데이터 비율 낮음 ({price_ratio:.1%})")
+                status = "WARN"
+            if volume_ratio < 0.5:
+                reasons.append(f"거래량 데이터 비율 낮음 ({volume_ratio:.1%})")
+                status = "WARN"
+            if turnover_ratio < 0.5:
+                reasons.append(f"거래대금 데이터 비율 낮음 ({turnover_ratio:.1%})")
+                status = "WARN"
+
+        return {"status": status, "reasons": reasons}
+
+    def price_info(self) -> Dict[str, Any]:
+        if self.start_price is None:
+            return {
+                "max_return_pct": 0.0,
+                "min_return_pct": 0.0,
+                "amplitude_pct": 0.0,
+                "start_price": None,
+                "end_price": None,
+            }
+        start_price = self.start_price
+        return {
+            "max_return_pct": round(((self.max_price - start_price) / start_price) * 100, 2),
+            "min_return_pct": round(((self.min_price - start_price) / start_price) * 100, 2),
+            "amplitude_pct": round(((self.max_price - self.min_price) / start_price) * 100, 2),
+            "start_price": start_price,
+            "end_price": self.end_price,
+        }
+
+    def event_info(self) -> Dict[str, Any]:
+        return {
+            "event_count": self.event_count,
+            "observer_changes": dict(self.changes),
+        }
+
+
+class EnhancedCycleAccumulator(RecordAccumulator):
+    """
+    Cycle 확장 지표 (enhance_cycle_analysis 와 동일한 결과)
+
+    CycleAccumulator 뒤에 등록해야 함 (current_state 사용)
+    """
+
+    def __init__(
+        self,
+        cycles: CycleAccumulator,
+        watchlist_data: Optional[Dict[str, Any]] = None,
+        exclude_fail: bool = True,
+    ):
+        self.cycles = cycles
+        self.watchlist_data = watchlist_data
+        self.exclude_fail = exclude_fail
+        self.result: Optional[Dict[str, Any]] = None
+
+    def add(self, item: StreamItem) -> None:
+        state = self.cycles.current_state
+        # 시각이 없는 record / 시작 시각이 없는 cycle 은 구간 매칭 대상 아님
+        if state is None or item.ts_dt is None or not state.start_time_str:
+            return
+        if state.payload is None:
+            state.payload = CycleMetrics()
+        state.payload.add(item)
+
+    def finalize(self, stats: Dict[str, Any], last_item: Optional[StreamItem]) -> None:
+        enhanced_cycles = []
+        fail_cycles = []
+        summaries = stats["observer_summary"]["cycle_summary"]
+
+        for cycle, state in zip(summaries, self.cycles.states_in_order):
+            metrics = state.payload
+            if metrics is None or not cycle.get("end_time"):
+                metrics = CycleMetrics()
+
+            data_quality = metrics.data_quality()
+            if self.exclude_fail and data_quality["status"] == "FAIL":
+                fail_cycles.append(cycle.get("cycle_id", ""))
+                continue
+
+            price_info = metrics.price_info()
+            event_info = metrics.event_info()
+            enhanced_cycle = {
+                **cycle,
+                "slot_type": get_slot_type(cycle.get("stock", ""), self.watchlist_data),
+                "timeout_subtype": classify_timeout_subtype(cycle, price_info, event_info),
+                "max_return_pct": price_info["max_return_pct"],
+                "min_return_pct": price_info["min_return_pct"],
+                "amplitude_pct": price_info["amplitude_pct"],
+                "event_count": event_info["event_count"],
+                "observer_changes": event_info["observer_changes"],
+                "data_quality": data_quality,
+                "info_score": calculate_info_score(cycle, price_info, event_info, data_quality),
+            }
+            enhanced_cycle["duration_min"] = round(cycle.get("duration_sec", 0) / 60.0, 2)
+            enhanced_cycles.append(enhanced_cycle)
+
+        self.result = {
+            "enhanced_cycles": enhanced_cycles,
+            "fail_cycles_count": len(fail_cycles),
+            "fail_cycle_ids": fail_cycles,
+        }
+
+
+# ===============================
+# 스트림 실행
+# ===============================
+def build_default_accumulators(
+    watchlist_data: Optional[Dict[str, Any]] = None,
+    exclude_fail: bool = True,
+) -> List[RecordAccumulator]:
+    """기본 누적기 구성 (순서 중요: Cycle → Enhanced)"""
+    cycles = CycleAccumulator()
+    return [
+        ObserverStatsAccumulator(),
+        SessionAccumulator(),
+        ReasonAccumulator(),
+        cycles,
+        EnhancedCycleAccumulator(cycles, watchlist_data, exclude_fail),
+    ]
+
+
+def _empty_stats() -> Dict[str, Any]:
+    """aggregate_observers 결과와 같은 키 순서의 골격"""
+    return {
+        "total_records": 0,
+        "by_stock": {},
+        "observer_summary": {
+            "triggered_records": 0,
+            "triggered_stocks": [],
+            "triggers": [],
+            "triggered_cycle": [],
+            "open_cycles_count": 0,
+        },
+        "box_summary": {"formed_count": 0, "formed_stocks": []},
+        "base_candle_summary": {"exists_count": 0, "exists_stocks": []},
+        "session_distribution": {},
+        "no_event_reasons": {},
+    }
+
+
+def _feed(items, accumulators: List[RecordAccumulator]) -> Tuple[Dict[str, Any], int]:
+    stats = _empty_stats()
+    last_item = None
+    count = 0
+    for index, item in enumerate(items):
+        item.index = index
+        for acc in accumulators:
+            acc.add(item)
+        last_item = item
+        count = index + 1
+    stats["total_records"] = count
+    for acc in accumulators:
+        acc.finalize(stats, last_item)
+    return stats, count
+
+
+def _columnar_items(date_dir: str) -> Optional[Tuple[List[StreamItem], Optional[Dict[str, Any]]]]:
+    """
+    최신 컬럼형 파일의 StreamItem 목록 (필요한 컬럼만 읽고 record dict 는 만들지 않음)
+
+    Returns:
+        (파일 행 순서의 item 목록, 첫 record), 컬럼형 파일이 없거나 오래됐으면 None
+    """
+    try:
+        from test.framework.analyzer.scout_compactor import load_stream_columns
+    except ImportError:
+        return None
+    loaded = load_stream_columns(date_dir) if os.path.isdir(date_dir) else None
+    if loaded is None:
+        return None
+
+    columns, restored = loaded
+    make_item = StreamItem.from_fields
+    items = []
+    rows = zip(
+        columns["stock_code"], columns["session"], columns["timestamp"], columns["date"],
+        columns["observer_triggered"], columns["observer_buy_signal"], columns["observer_sell_signal"],
+        columns["exit_type"], columns["box_formed"], columns["base_candle_exists"],
+        columns["no_event_reason"], columns["current_price"], columns["volume"], columns["turnover_krw"],
+    )
+    for i, (stock, session, ts_dt, date, triggered, buy, sell, exit_type,
+            box_formed, base_exists, reasons, price, volume, turnover) in enumerate(rows):
+        record = restored.get(i)
+        if record is not None:
+            items.append(StreamItem(record))
+            continue
+        has_observer = triggered is not None or buy is not None or sell is not None
+        items.append(make_item(
+            stock, session, ts_dt, date, triggered, has_observer, exit_type,
+            box_formed, base_exists, reasons, price, volume, turnover,
+        ))
+    return items, restored.get(0)
+
+
+def stream_scout_records(
+    date_dir: str,
+    accumulators: Optional[List[RecordAccumulator]] = None,
+    watchlist_data: Optional[Dict[str, Any]] = None,
+    exclude_fail: bool = True,
+) -> Dict[str, Any]:
+    """
+    날짜 디렉터리를 1회 스트리밍하여 집계
+
+    Args:
+        date_dir: records/scout/YYYY/MM/YYYYMMDD
+        accumulators: 사용자 누적기 (None이면 build_default_accumulators)
+        watchlist_data: 슬롯 타입 추출용 watchlist
+        exclude_fail: FAIL 품질 cycle 제외 여부
+
+    Returns:
+        {
+            "observer_stats": aggregate_observers 와 같은 구조,
+            "enhanced_result": enhance_cycle_analysis 와 같은 구조 (기본 누적기 사용 시),
+            "total_records": int,
+            "first_record": 로드 순서상 첫 record (시장 성격 요약의 date 용),
+            "accumulators": 사용한 누적기 리스트,
+        }
+    """
+    make_accumulators = (
+        (lambda: accumulators) if accumulators is not None
+        else (lambda: build_default_accumulators(watchlist_data, exclude_fail))
+    )
+
+    # 장 마감 후 압축된 컬럼형 파일이 최신이면 우선 사용 (JSON 파싱 없음)
+    # 사용자 누적기는 record 본문을 읽을 수 있으므로 JSONL/보관 파일 사용
+    columnar = _columnar_items(date_dir) if accumulators is None else None
+
+    streams = []
+    if columnar is None and os.path.isdir(date_dir):
+        # 파일명 순 (같은 시각의 record 는 컬럼형 파일과 같은 순서로 병합)
+        streams = [_FileStream(p) for p in sorted(Path(date_dir).glob("*.jsonl"))]
+    if columnar is None and not streams:
+        # JSONL 이 보관(압축)된 날짜 → 종목 프레임별 스트림
+        try:
+            from test.framework.analyzer.scout_archive import open_day_archive
+            archive = open_day_archive(date_dir) if os.path.isdir(date_dir) else None
+        except ImportError:
+            archive = None
+        if archive is not None:
+            streams = [
+                _FileStream(Path(f"{archive.path}[{stock}]"), lambda s=stock: archive.iter_lines(s))
+                for stock in archive.stocks()
+            ]
+    accs = make_accumulators()
+
+    if columnar is not None:
+        items, first_record = columnar
+        stats, count = _feed(sorted(items, key=_sort_key), accs)
+    elif streams:
+        merged = heapq.merge(*streams, key=_sort_key)
+        stats, count = _feed(merged, accs)
+        first_record = next((s.first_record for s in streams if s.first_record is not None), None)
+
+        if any(s.out_of_order for s in streams):
+            # 파일 내부 시간 역전 → 전체 정렬 방식으로 재계산 (사용자 누적기는 재사용 불가)
+            if accumulators is not None:
+                raise ValueError("시간 역전된 JSONL 파일이 있어 스트리밍 집계를 할 수 없습니다")
+            print("  ⚠️  시간 역전된 JSONL 파일 감지 → 전체 정렬로 재계산")
+            records = []
+            for stream in streams:
+                records.extend(item.record for item in _FileStream(stream.file_path, stream.open_lines))
+            accs = make_accumulators()
+            stats, count = _feed(sorted((StreamItem(r) for r in records), key=_sort_key), accs)
+    else:
+        # JSONL 이 없고 컬럼형 압축 파일만 있는 경우 (사용자 누적기: record 복원)
+        records = []
+        try:
+            from test.framework.analyzer.scout_compactor import load_columnar_records
+            records = load_columnar_records(date_dir) or []
+        except ImportError:
+            pass
+        first_record = records[0] if records else None
+        stats, count = _feed(sorted((StreamItem(r) for r in records), key=_sort_key), accs)
+
+    enhanced_result = None
+    for acc in accs:
+        if isinstance(acc, EnhancedCycleAccumulator):
+            enhanced_result = acc.result
+
+    return {
+        "observer_stats": stats,
+        "enhanced_result": enhanced_result,
+        "total_records": count,
+        "first_record": first_record,
+        "accumulators": accs,
+    }
@@ -4,18 +4,23 @@
 """
 정찰 결과 간단 확인 스크립트
 
+날짜 디렉터리의 사이드카 인덱스(scout_index)를 사용하므로
+종목/시간대 조회 시 필요한 줄만 읽습니다.
+
 사용법:
-    python -m test.framework.analyzer.view_scout_results [날짜]
+    python -m test.framework.analyzer.view_scout_results [날짜] [옵션]
     
 예시:
     python -m test.framework.analyzer.view_scout_results
     python -m test.framework.analyzer.view_scout_results 2026-01-05
+    python -m test.framework.analyzer.view_scout_results 2026-01-05 --stock 005930 --from 13:00 --to 15:30
+    python -m test.framework.analyzer.view_scout_results 2026-01-05 --triggered --reason 거래량부족
+    python -m test.framework.analyzer.view_scout_results --stock 005930 --follow
 """
 import sys
 import os
-import json
+import argparse
 from datetime import datetime
-from pathlib import Path
 
 # 프로젝트 루트를 경로에 추가
 PROJECT_ROOT = os.path.abspath(
@@ -23,34 +28,34 @@ PROJECT_ROOT = os.path.abspath(
 )
 sys.path.insert(0, PROJECT_ROOT)
 
-SCOUT_RECORDS_DIR = os.path.join(PROJECT_ROOT, "records", "scout")
+from test.framework.analyzer.scout_index import (
+    resolve_scout_date_dir,
+    get_scout_index,
+    query_scout_records,
+    query_stock_events,
+    follow_scout_records,
+    format_record_line,
+)
 
 
 def get_scout_date_dir(date: str) -> str:
     """
-    날짜를 YYYY/MM/YYYYMMDD 구조의 디렉터리 경로로 변환
+    날짜를 정찰 기록 디렉터리 경로로 변환
     
     Args:
         date: 날짜 (YYYY-MM-DD 형식)
         
     Returns:
-        YYYY/MM/YYYYMMDD 구조의 디렉터리 경로
+        YYYY/MM/YYYYMMDD 구조의 디렉터리 경로 (없으면 과거 YYYY-MM-DD 구조)
     """
-    # YYYY-MM-DD → YYYY, MM, YYYYMMDD 추출
-    year, month, day = date.split("-")
-    date_compact = f"{year}{month}{day}"
-    
-    # YYYY/MM/YYYYMMDD 구조로 경로 생성
-    date_dir = os.path.join(SCOUT_RECORDS_DIR, year, month, date_compact)
-    return date_dir
+    return resolve_scout_date_dir(date)
 
 
 def view_scout_results(date: str = None):
-    """정찰 결과 간단 확인"""
+    """정찰 결과 간단 확인 (종목별 요약은 인덱스 통계 사용)"""
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
     
-    # YYYY/MM/YYYYMMDD 구조로 디렉터리 경로 생성
     date_dir = get_scout_date_dir(date)
     
     if not os.path.exists(date_dir):
@@ -62,44 +67,20 @@ def view_scout_results(date: str = None):
     print(f"📊 정찰 결과 확인 - {date}")
     print("=" * 60)
     
-    # 모든 JSONL 파일 읽기
-    jsonl_files = list(Path(date_dir).glob("*.jsonl"))
+    index = get_scout_index(date)
     
-    if not jsonl_files:
+    if not index["files"]:
         print(f"⚠️  {date}에 기록된 파일이 없습니다.")
         return
     
     total_records = 0
     stock_stats = {}
     
-    for jsonl_file in sorted(jsonl_files):
-        stock_code = jsonl_file.stem
-        records = 0  # count → records
-        triggered_records = 0  # observer_triggered → triggered_records
-        
-        try:
-            with open(jsonl_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                        records += 1
-                        total_records += 1
-                        
-                        # trigger: 관측 조건을 만족한 '사건'
-                        if record.get("observer", {}).get("triggered", False):
-                            triggered_records += 1
-                    except json.JSONDecodeError:
-                        continue
-        except Exception as e:
-            print(f"⚠️  {stock_code}.jsonl 읽기 오류: {e}")
-            continue
-        
+    for stock_code, entry in index["files"].items():
+        total_records += entry["records"]
         stock_stats[stock_code] = {
-            "records": records,  # count → records
-            "triggered_records": triggered_records,  # observer_triggered → triggered_records
+            "records": entry["records"],
+            "triggered_records": entry["triggered"],
         }
     
     # 요약 출력
@@ -128,10 +109,92 @@ def view_scout_results(date: str = None):
     print("=" * 60)
 
 
-if __name__ == "__main__":
-    date = None
-    if len(sys.argv) > 1:
-        date = sys.argv[1]
+def view_filtered_records(
+    date: str,
+    stock: str = None,
+    start_time: str = None,
+    end_time: str = None,
+    triggered_only: bool = False,
+    reason: str = None,
+    limit: int = 200,
+    show_events: bool = False,
+):
+    """필터 조건에 맞는 레코드만 출력"""
+    index = get_scout_index(date, [stock] if stock else None)
+    
+    conditions = []
+    if stock:
+        conditions.append(f"종목={stock}")
+    if start_time or end_time:
+        conditions.append(f"시간={start_time or '시작'}~{end_time or '끝'}")
+    if triggered_only:
+        conditions.append("triggered")
+    if reason:
+        conditions.append(f"사유={reason}")
+    
+    print("=" * 60)
+    print(f"🔎 정찰 기록 조회 - {date} ({', '.join(conditions)})")
+    print("=" * 60)
+    
+    shown = 0
+    for stock_code, record in query_scout_records(
+        index, stock, start_time, end_time, triggered_only, reason
+    ):
+        if shown >= limit:
+            print(f"  ... (--limit {limit} 초과, 이후 생략)")
+            break
+        print(format_record_line(stock_code, record))
+        shown += 1
     
-    view_scout_results(date)
+    if shown == 0:
+        print("  (조건에 맞는 기록 없음)")
+    
+    if show_events and stock:
+        events = query_stock_events(index, stock, start_time, end_time)
+        print(f"\n⚡ {stock} 이벤트: {len(events)}건")
+        for event in events[:limit]:
+            print(f"  {event.get('occurred_at', '')[11:19]} {event.get('event_type')} {event.get('metrics', {})}")
+    
+    return shown
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정찰 결과 확인 (인덱스 기반)")
+    parser.add_argument("date", nargs="?", default=None, help="날짜 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("--stock", default=None, help="종목 코드")
+    parser.add_argument("--from", dest="start_time", default=None, help="시작 시각 (HH[:MM[:SS]])")
+    parser.add_argument("--to", dest="end_time", default=None, help="종료 시각 (HH[:MM[:SS]], 포함)")
+    parser.add_argument("--triggered", action="store_true", help="triggered 레코드만")
+    parser.add_argument("--reason", default=None, help="no_event_reason 사유")
+    parser.add_argument("--events", action="store_true", help="종목 이벤트 로그도 출력 (--stock 필요)")
+    parser.add_argument("--limit", type=int, default=200, help="최대 출력 줄 수")
+    parser.add_argument("--follow", action="store_true", help="새 기록 실시간 추적 (Ctrl+C 종료)")
+    parser.add_argument("--interval", type=float, default=2.0, help="--follow 확인 주기 (초)")
+    args = parser.parse_args()
+    
+    date = args.date or datetime.now().strftime("%Y-%m-%d")
+    filtered = any([args.stock, args.start_time, args.end_time, args.triggered, args.reason])
+    
+    if args.follow:
+        print(f"👀 {date} 정찰 기록 추적 중... (Ctrl+C 종료)")
+        follow_scout_records(
+            date,
+            lambda stock_code, record: print(format_record_line(stock_code, record), flush=True),
+            stock=args.stock,
+            start_time=args.start_time,
+            end_time=args.end_time,
+            triggered_only=args.triggered,
+            reason=args.reason,
+            interval_sec=args.interval,
+        )
+    elif filtered:
+        view_filtered_records(
+            date, args.stock, args.start_time, args.end_time,
+            args.triggered, args.reason, args.limit, args.events,
+        )
+    else:
+        view_scout_results(date)
 
+
+if __name__ == "__main__":
+    main()
@@ -155,6 +155,25 @@ class DayController:
             # 이벤트 발생 횟수 계산
             event_count = event_stats.get("total_events", 0) if event_stats else 0
             
+            # 장중 증분 분석 (누적 상태 + 남은 줄만 반영)
+            intraday_text = None
+            try:
+                from test.framework.analyzer.incremental_analyzer import (
+                    get_intraday_summary,
+                    format_intraday_summary,
+                )
+                # 파일 읽기/상태 저장은 블로킹 → 스레드에서 실행 (텔레그램 폴링 유지)
+                loop = asyncio.get_event_loop()
+                intraday_summary = await loop.run_in_executor(
+                    None,
+                    get_intraday_summary,
+                    datetime.now().strftime("%Y-%m-%d"),
+                )
+                if intraday_summary["total_records"]:
+                    intraday_text = format_intraday_summary(intraday_summary)
+            except Exception as e:
+                print(f"[WARN] 장중 분석 요약 실패: {e}")
+            
             tel_log(
                 "DAY SUMMARY",
                 format_day_summary(
@@ -162,6 +181,7 @@ class DayController:
                     total_count=self.total_scout_count,
                     event_count=event_count,
                     event_stats=event_stats,
+                    intraday_text=intraday_text,
                 ),
             )
 
@@ -0,0 +1,419 @@
+# ===============================
+# test/framework/engine/replay.py
+# ===============================
+"""
+정찰 기록 리플레이 엔진 (가상 시계)
+
+역할:
+- 기록된 정찰 JSONL (및 tick JSONL) 을 시간 순으로 재생
+- 실전과 같은 EventDataCollector / EventDetector / CooldownManager / Observer 코드 사용
+- API/실시간 대기 없이 가상 시계로 CPU 속도만큼 빠르게 실행
+- 임계값을 바꿔 "그날 어떤 이벤트가 나왔을지" 오프라인으로 확인
+- 사이클은 기록된 observer.triggered 기준이라 임계값과 무관 → 결과의 recorded_cycles (기록 기준선)
+
+사용법:
+    python -m test.framework.engine.replay 2026-01-07
+    python -m test.framework.engine.replay --records-dir records/scout/2026-01-07
+    python -m test.framework.engine.replay 2026-01-07 --config my_thresholds.yaml
+    python -m test.framework.engine.replay 2026-01-07 --set price.jump_drop.pct_min=2.0
+
+tick JSONL 형식 (있을 때만):
+    {"symbol": "005930", "timestamp": "2026-01-07T09:00:01", "price": 72000,
+     "volume": 1200, "turnover_krw": 86400000}
+"""
+import os
+import sys
+import json
+import copy
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from test.scout_bot.events.data_collector import EventDataCollector
+from test.scout_bot.events.detector import EventDetector
+from test.scout_bot.events.cooldown import CooldownManager
+from test.scout_bot.events.definitions import Event
+from test.framework.engine.events import EventType as FrameworkEventType
+from test.framework.observer.registry import ObserverRegistry
+from test.framework.observer.volume import VolumeObserver
+from test.framework.observer.box import BoxObserver
+from test.framework.observer.base_candle import BaseCandleObserver
+from test.framework.analyzer.cycle_engine import CycleEngine
+
+
+# ===============================
+# 가상 시계
+# ===============================
+class VirtualClock:
+    """리플레이용 가상 시계 (단조 증가)"""
+
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = start or datetime(1970, 1, 1)
+
+    def now(self) -> datetime:
+        return self._now
+
+    __call__ = now
+
+    def advance_to(self, ts: datetime) -> None:
+        if ts > self._now:
+            self._now = ts
+
+
+# ===============================
+# 입력 (tick)
+# ===============================
+@dataclass
+class ReplayTick:
+    """리플레이 입력 1건"""
+    timestamp: datetime
+    symbol: str
+    price: Optional[float]
+    volume: Optional[float] = None
+    turnover_krw: Optional[float] = None
+    record: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+
+def ticks_from_records(records: Iterable[Dict[str, Any]]) -> List[ReplayTick]:
+    """정찰 기록 → tick (timestamp 순, 같은 시각은 입력 순서 유지)"""
+    ticks = []
+    for record in records:
+        meta = record.get("meta", {})
+        timestamp_str = meta.get("timestamp")
+        symbol = meta.get("stock_code")
+        if not timestamp_str or not symbol:
+            continue
+        try:
+            ts = datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            continue
+        snapshot = record.get("snapshot", {})
+        ticks.append(ReplayTick(
+            timestamp=ts.replace(tzinfo=None),
+            symbol=symbol,
+            price=snapshot.get("current_price"),
+            volume=snapshot.get("volume"),
+            turnover_krw=snapshot.get("turnover_krw"),
+            record=record,
+        ))
+    ticks.sort(key=lambda t: t.timestamp)
+    return ticks
+
+
+def load_tick_file(path: str) -> List[ReplayTick]:
+    """tick JSONL 로드"""
+    ticks = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+                ts = datetime.fromisoformat(row["timestamp"]).replace(tzinfo=None)
+            except (json.JSONDecodeError, KeyError, ValueError) as e:
+                print(f"⚠️  tick 파싱 오류 ({path}): {e}")
+                continue
+            ticks.append(ReplayTick(
+                timestamp=ts,
+                symbol=str(row.get("symbol", "")).zfill(6),
+                price=row.get("price"),
+                volume=row.get("volume"),
+                turnover_krw=row.get("turnover_krw"),
+            ))
+    ticks.sort(key=lambda t: t.timestamp)
+    return ticks
+
+
+def load_records_dir(records_dir: str) -> List[Dict[str, Any]]:
+    """임의 디렉터리의 *.jsonl 정찰 기록 로드"""
+    records = []
+    for file_path in sorted(Path(records_dir).glob("*.jsonl")):
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    print(f"⚠️  JSON 파싱 오류 ({file_path}): {e}")
+    return records
+
+
+# ===============================
+# 임계값
+# ===============================
+def apply_threshold_overrides(thresholds: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    "a.b.c" 경로 표기로 임계값 덮어쓰기 (원본은 수정하지 않음)
+
+    예: {"price.jump_drop.pct_min": 2.0, "cooldown.minutes": 5}
+    """
+    result = copy.deepcopy(thresholds)
+    for dotted_key, value in overrides.items():
+        node = result
+        keys = dotted_key.split(".")
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = value
+    return result
+
+
+def _parse_override(text: str):
+    """CLI --set key=value 파싱 (값은 YAML 스칼라로 해석)"""
+    import yaml
+
+    key, _, raw = text.partition("=")
+    if not key or not _:
+        raise ValueError(f"--set 형식 오류: {text} (예: price.jump_drop.pct_min=2.0)")
+    return key.strip(), yaml.safe_load(raw)
+
+
+# ===============================
+# 리플레이 엔진
+# ===============================
+class ReplayEngine:
+    """
+    정찰 리플레이 엔진
+
+    - 실전 runner 와 같은 순서: 스냅샷 수집 → 이벤트 감지 → 쿨다운 → 출력
+    - 출력(emit_event) 대신 결과 리스트에 누적
+    """
+
+    def __init__(self, thresholds: Optional[Dict[str, Any]] = None):
+        if thresholds is None:
+            from test.scout_bot.config.loaders import load_event_thresholds
+            thresholds = load_event_thresholds()
+
+        self.thresholds = thresholds
+        self.clock = VirtualClock()
+        self._prices: Dict[str, Optional[float]] = {}
+
+        self.data_collector = EventDataCollector(
+            token="REPLAY",
+            thresholds=thresholds,
+            price_source=self._price_source,
+            clock=self.clock,
+        )
+        self.detector = EventDetector(self.data_collector, thresholds)
+        self.cooldown = CooldownManager(
+            thresholds.get("cooldown", {}).get("minutes", 10),
+            clock=self.clock,
+        )
+
+        self.events: List[Event] = []
+        self.records: List[Dict[str, Any]] = []
+        self.cycles = CycleEngine()
+        self.ticks_processed = 0
+        self._registries: Dict[str, ObserverRegistry] = {}
+        self._prev_state: Dict[str, Dict[str, bool]] = {}
+
+    def _price_source(self, symbol: str, token: str) -> float:
+        price = self._prices.get(symbol)
+        # 실전 get_current_price 와 같이 실패 시 0 반환
+        return price if price is not None else 0
+
+    def _registry(self, symbol: str) -> ObserverRegistry:
+        registry = self._registries.get(symbol)
+        if registry is None:
+            registry = ObserverRegistry()
+            registry.register(VolumeObserver())
+            registry.register(BoxObserver())
+            registry.register(BaseCandleObserver())
+            self._registries[symbol] = registry
+        return registry
+
+    def _dispatch_record_state(self, tick: ReplayTick) -> None:
+        """기록된 box/기준봉 상태 변화를 Observer 이벤트로 전달"""
+        record = tick.record
+        if record is None:
+            return
+        box = record.get("box", {})
+        base_candle = record.get("base_candle", {})
+        prev = self._prev_state.setdefault(tick.symbol, {"box": False, "base": False})
+        registry = self._registry(tick.symbol)
+
+        if box.get("formed") and not prev["box"]:
+            registry.dispatch({
+                "type": FrameworkEventType.BOX_FORMED,
+                "duration": box.get("duration"),
+            })
+        if base_candle.get("exists") and not prev["base"]:
+            registry.dispatch({
+                "type": "BASE_CANDLE_CONFIRMED",
+                "time": tick.timestamp,
+            })
+        prev["box"] = bool(box.get("formed"))
+        prev["base"] = bool(base_candle.get("exists"))
+
+    def feed(self, tick: ReplayTick) -> List[Event]:
+        """tick 1건 재생, 쿨다운을 통과한 이벤트 반환"""
+        self.clock.advance_to(tick.timestamp)
+        self.ticks_processed += 1
+        self._prices[tick.symbol] = tick.price
+
+        if tick.volume is not None:
+            self.data_collector.update_volume_history(tick.symbol, tick.volume)
+        if tick.turnover_krw is not None:
+            self.data_collector.update_turnover_history(tick.symbol, tick.turnover_krw)
+        if tick.record is not None:
+            self.records.append(tick.record)
+            self.cycles.feed(tick.record)
+            self._dispatch_record_state(tick)
+
+        emitted = []
+        for event in self.detector.detect_events(tick.symbol):
+            if self.cooldown.is_cooldown(tick.symbol, event.event_type):
+                continue
+            self.cooldown.record_event(tick.symbol, event.event_type, event.occurred_at)
+            emitted.append(event)
+            self._registry(tick.symbol).dispatch({
+                "type": event.event_type.value,
+                "time": event.occurred_at,
+                **event.metrics,
+            })
+
+        self.events.extend(emitted)
+        return emitted
+
+    def run(self, ticks: Iterable[ReplayTick]) -> Dict[str, Any]:
+        """전체 tick 재생 후 결과 반환"""
+        started = time.perf_counter()
+        for tick in ticks:
+            self.feed(tick)
+        elapsed = time.perf_counter() - started
+        return self.build_result(elapsed)
+
+    def build_cycles(self) -> List[Dict[str, Any]]:
+        """
+        기록된 사이클 요약 (Post-Market Analyzer 와 같은 규칙)
+
+        기록의 observer.triggered 로 만들어지므로 임계값을 바꿔도 같음 (기록 기준선)
+        """
+        return self.cycles.summary()
+
+    def build_result(self, elapsed_sec: float = 0.0) -> Dict[str, Any]:
+        event_counts = Counter(e.event_type.value for e in self.events)
+        by_symbol = Counter(e.symbol for e in self.events)
+        return {
+            "ticks": self.ticks_processed,
+            "elapsed_sec": round(elapsed_sec, 4),
+            "thresholds": self.thresholds,
+            "event_count": len(self.events),
+            "event_counts": dict(event_counts),
+            "events_by_symbol": dict(by_symbol),
+            "events": [e.to_dict() for e in self.events],
+            "recorded_cycles": self.build_cycles(),
+            "observer_records": {
+                symbol: registry.collect_records()
+                for symbol, registry in sorted(self._registries.items())
+            },
+        }
+
+
+# ===============================
+# 하루 리플레이
+# ===============================
+def load_replay_ticks(
+    date: Optional[str] = None,
+    records_dir: Optional[str] = None,
+    ticks_path: Optional[str] = None,
+) -> List[ReplayTick]:
+    """
+    리플레이 입력 준비
+
+    - ticks_path 가 있으면 tick 파일 사용 (정찰 기록보다 촘촘한 데이터)
+    - 아니면 records_dir 또는 date 의 정찰 기록 사용
+    """
+    if ticks_path:
+        return load_tick_file(ticks_path)
+    if records_dir:
+        return ticks_from_records(load_records_dir(records_dir))
+    if date:
+        from test.framework.analyzer.post_market_analyzer import load_scout_records
+        return ticks_from_records(load_scout_records(date))
+    raise ValueError("date, records_dir, ticks_path 중 하나가 필요합니다")
+
+
+def replay_day(
+    date: Optional[str] = None,
+    records_dir: Optional[str] = None,
+    ticks_path: Optional[str] = None,
+    thresholds: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """하루치 기록을 주어진 임계값으로 재생"""
+    ticks = load_replay_ticks(date=date, records_dir=records_dir, ticks_path=ticks_path)
+    engine = ReplayEngine(thresholds)
+    result = engine.run(ticks)
+    result["date"] = date
+    result["source"] = ticks_path or records_dir or date
+    return result
+
+
+def save_replay_result(result: Dict[str, Any], output_path: str) -> str:
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+    return output_path
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="정찰 기록 리플레이 (가상 시계)")
+    parser.add_argument("date", nargs="?", default=None, help="재생할 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--records-dir", dest="records_dir", default=None, help="정찰 JSONL 디렉터리 직접 지정")
+    parser.add_argument("--ticks", default=None, help="tick JSONL 파일 (있으면 우선 사용)")
+    parser.add_argument("--config", default=None, help="임계값 YAML 파일 (기본: scout_bot/config/event_thresholds.yaml)")
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        help="임계값 덮어쓰기 key=value (여러 번 사용 가능)",
+    )
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+
+    args = parser.parse_args()
+
+    if not (args.date or args.records_dir or args.ticks):
+        parser.error("date, --records-dir, --ticks 중 하나를 지정하세요")
+
+    from test.scout_bot.config.loaders import load_event_thresholds
+
+    thresholds = load_event_thresholds(args.config)
+    if args.overrides:
+        thresholds = apply_threshold_overrides(
+            thresholds, dict(_parse_override(text) for text in args.overrides)
+        )
+
+    result = replay_day(
+        date=args.date,
+        records_dir=args.records_dir,
+        ticks_path=args.ticks,
+        thresholds=thresholds,
+    )
+
+    print("=" * 60)
+    print(f"🔁 리플레이 결과 - {result['source']}")
+    print("=" * 60)
+    print(f"  ticks: {result['ticks']}  ({result['elapsed_sec']}s)")
+    print(f"  events: {result['event_count']}")
+    for event_type, count in sorted(result["event_counts"].items()):
+        print(f"    - {event_type}: {count}")
+    print(f"  recorded cycles (기록 기준선): {len(result['recorded_cycles'])}")
+
+    if args.output:
+        print(f"\n📁 저장: {save_replay_result(result, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,426 @@
+# ===============================
+# test/framework/engine/replay_sweep.py
+# ===============================
+"""
+이벤트 임계값 스윕 (리플레이 병렬 실행)
+
+역할:
+- 파라미터 그리드 / 랜덤 탐색 스펙 × 날짜 범위를 리플레이로 평가
+- 날짜별 기록은 부모 프로세스에서 1회만 파싱 → pickle 캐시 1개로 저장
+  → 워커는 initializer 에서 1회 로드 (조합마다 JSON 재파싱 없음)
+- 조합별 결과(발생 이벤트, 사이클 구간 안 이벤트 커버리지) 를 CSV/JSON 표로 저장
+
+사용법:
+    python -m test.framework.engine.replay_sweep --spec sweep.yaml --start 2026-01-07 --end 2026-01-09
+    python -m test.framework.engine.replay_sweep --spec sweep.yaml --records-dir records/scout/2026-01-07 --workers 8
+
+스펙 예시 (YAML/JSON):
+    grid:
+      volume.spike.ratio_min: [1.5, 2.0, 3.0]
+      price.jump_drop.pct_min: [2.0, 3.0]
+      cooldown.minutes: [5, 10]
+
+    random:
+      n: 200
+      seed: 42
+      params:
+        turnover.threshold.krw_min: {min: 5000000000, max: 20000000000}
+        price.jump_drop.pct_min: {min: 1.0, max: 5.0}
+        cooldown.minutes: [5, 10, 15]
+
+주의:
+- 사이클은 정찰 기록(observer.triggered) 기준이라 조합과 무관
+  → 사이클 수 / 타임아웃 서브타입은 조합별 표에 넣지 않고 recorded_baseline 으로 1번만 저장,
+  조합별로는 "사이클 구간 안에서 발생한 이벤트" 커버리지만 비교
+"""
+import os
+import sys
+import csv
+import json
+import pickle
+import random
+import tempfile
+import time
+import itertools
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+from test.framework.engine.replay import (
+    ReplayEngine,
+    ReplayTick,
+    apply_threshold_overrides,
+    load_records_dir,
+    ticks_from_records,
+)
+
+SWEEP_OUTPUT_DIR = os.path.join(PROJECT_ROOT, "records", "analysis", "replay_sweep")
+
+
+# ===============================
+# 파라미터 스펙
+# ===============================
+def load_sweep_spec(path: str) -> Dict[str, Any]:
+    """스펙 파일 로드 (.json 이외는 YAML 로 해석)"""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return json.load(f)
+        import yaml
+        return yaml.safe_load(f) or {}
+
+
+def expand_param_sets(spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    스펙 → 파라미터 조합 리스트
+
+    - grid: 모든 값의 데카르트 곱
+    - random: {min, max} 는 균등 분포 (둘 다 정수면 정수), 리스트는 무작위 선택
+    """
+    param_sets: List[Dict[str, Any]] = []
+
+    grid = spec.get("grid") or {}
+    if grid:
+        keys = list(grid.keys())
+        for values in itertools.product(*(grid[k] for k in keys)):
+            param_sets.append(dict(zip(keys, values)))
+
+    random_spec = spec.get("random") or {}
+    if random_spec:
+        rng = random.Random(random_spec.get("seed"))
+        params = random_spec.get("params", {})
+        for _ in range(int(random_spec.get("n", 0))):
+            combo = {}
+            for key, domain in params.items():
+                if isinstance(domain, dict):
+                    low, high = domain["min"], domain["max"]
+                    if isinstance(low, int) and isinstance(high, int):
+                        combo[key] = rng.randint(low, high)
+                    else:
+                        combo[key] = round(rng.uniform(low, high), 4)
+                else:
+                    combo[key] = rng.choice(list(domain))
+            param_sets.append(combo)
+
+    # 중복 조합 제거 (순서 유지)
+    unique = {}
+    for combo in param_sets:
+        unique.setdefault(json.dumps(combo, sort_keys=True), combo)
+    return list(unique.values()) or [{}]
+
+
+def iter_dates(start: str, end: str) -> List[str]:
+    start_dt = datetime.strptime(start, "%Y-%m-%d")
+    end_dt = datetime.strptime(end, "%Y-%m-%d")
+    dates = []
+    while start_dt <= end_dt:
+        dates.append(start_dt.strftime("%Y-%m-%d"))
+        start_dt += timedelta(days=1)
+    return dates
+
+
+# ===============================
+# 날짜별 입력 준비 (부모 프로세스 1회)
+# ===============================
+def _build_day_cycles(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """사이클 + 타임아웃 서브타입 (조합과 무관하므로 1회만 계산)"""
+    if not records:
+        return []
+    from test.framework.analyzer.cycle_engine import build_cycles
+    from test.framework.analyzer.cycle_analyzer_enhanced import enhance_cycle_analysis
+
+    cycles = build_cycles(records).summary()
+    enhanced = enhance_cycle_analysis(cycles, records, None, exclude_fail=False)
+    return [
+        {
+            "stock": c.get("stock"),
+            "start": datetime.fromisoformat(c["start_time"]).replace(tzinfo=None),
+            "end": datetime.fromisoformat(c["end_time"]).replace(tzinfo=None),
+            "exit_type": c.get("exit_type"),
+            "timeout_subtype": c.get("timeout_subtype", "N/A"),
+        }
+        for c in enhanced["enhanced_cycles"]
+        if c.get("start_time") and c.get("end_time")
+    ]
+
+
+def prepare_sweep_days(
+    dates: Optional[List[str]] = None,
+    records_dirs: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    날짜별 tick / 사이클 준비
+
+    Returns:
+        [{"day": str, "ticks": [ReplayTick(record=None)], "cycles": [...]}]
+    """
+    sources: List[Tuple[str, List[Dict[str, Any]]]] = []
+    if records_dirs:
+        for records_dir in records_dirs:
+            sources.append((os.path.basename(os.path.normpath(records_dir)), load_records_dir(records_dir)))
+    for date in dates or []:
+        from test.framework.analyzer.post_market_analyzer import load_scout_records
+        sources.append((date, load_scout_records(date)))
+
+    days = []
+    for day, records in sources:
+        if not records:
+            continue
+        # 워커로 보낼 tick 은 원본 record 를 떼어 가볍게 유지
+        ticks = [replace(t, record=None) for t in ticks_from_records(records)]
+        days.append({"day": day, "ticks": ticks, "cycles": _build_day_cycles(records)})
+    return days
+
+
+# ===============================
+# 워커
+# ===============================
+_WORKER_DAYS: List[Dict[str, Any]] = []
+_WORKER_BASE_THRESHOLDS: Dict[str, Any] = {}
+
+
+def recorded_baseline(days: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """기록 기준선: 사이클 수 / 타임아웃 서브타입 (모든 조합에서 같음)"""
+    timeout_subtypes = Counter(
+        c["timeout_subtype"] for day in days for c in day["cycles"] if c["exit_type"] == "timeout"
+    )
+    return {
+        "days": len(days),
+        "cycles": sum(len(day["cycles"]) for day in days),
+        "timeout_subtypes": dict(timeout_subtypes),
+    }
+
+
+def _init_worker(cache_path: str, base_thresholds: Dict[str, Any]) -> None:
+    """워커당 1회: 공유 캐시 로드"""
+    global _WORKER_DAYS, _WORKER_BASE_THRESHOLDS
+    with open(cache_path, "rb") as f:
+        _WORKER_DAYS = pickle.load(f)
+    _WORKER_BASE_THRESHOLDS = base_thresholds
+
+
+def _cycle_coverage(events, cycles) -> Dict[str, Any]:
+    """사이클 구간 안에서 발생한 이벤트 집계 (종목별 정렬 + bisect)"""
+    times_by_stock = defaultdict(list)
+    for event in events:
+        times_by_stock[event.symbol].append(event.occurred_at)
+    for times in times_by_stock.values():
+        times.sort()
+
+    covered_cycles = 0
+    covered_events = 0
+    timeout_covered = Counter()
+    for cycle in cycles:
+        times = times_by_stock.get(cycle["stock"], [])
+        hits = bisect_right(times, cycle["end"]) - bisect_left(times, cycle["start"])
+        if hits:
+            covered_cycles += 1
+            covered_events += hits
+            if cycle["exit_type"] == "timeout":
+                timeout_covered[cycle["timeout_subtype"]] += 1
+    return {
+        "cycles_with_events": covered_cycles,
+        "events_in_cycles": covered_events,
+        "timeout_with_events": dict(timeout_covered),
+    }
+
+
+def run_param_set(index: int, params: Dict[str, Any]) -> Dict[str, Any]:
+    """조합 1개를 전체 날짜에 대해 리플레이"""
+    started = time.perf_counter()
+    thresholds = apply_threshold_overrides(_WORKER_BASE_THRESHOLDS, params)
+
+    event_counts = Counter()
+    ticks = 0
+    cycles_with_events = 0
+    events_in_cycles = 0
+    timeout_with_events = Counter()
+
+    for day in _WORKER_DAYS:
+        engine = ReplayEngine(thresholds)
+        for tick in day["ticks"]:
+            engine.feed(tick)
+        ticks += engine.ticks_processed
+        event_counts.update(e.event_type.value for e in engine.events)
+
+        coverage = _cycle_coverage(engine.events, day["cycles"])
+        cycles_with_events += coverage["cycles_with_events"]
+        events_in_cycles += coverage["events_in_cycles"]
+        timeout_with_events.update(coverage["timeout_with_events"])
+
+    event_total = sum(event_counts.values())
+    return {
+        "index": index,
+        "params": params,
+        "days": len(_WORKER_DAYS),
+        "ticks": ticks,
+        "event_count": event_total,
+        "events_per_day": round(event_total / len(_WORKER_DAYS), 2) if _WORKER_DAYS else 0.0,
+        "event_counts": dict(event_counts),
+        "cycles_with_events": cycles_with_events,
+        "events_in_cycles": events_in_cycles,
+        "timeout_with_events": dict(timeout_with_events),
+        "elapsed_sec": round(time.perf_counter() - started, 4),
+    }
+
+
+# ===============================
+# 스윕 실행
+# ===============================
+def run_sweep(
+    param_sets: List[Dict[str, Any]],
+    days: List[Dict[str, Any]],
+    base_thresholds: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    파라미터 조합들을 프로세스 풀에서 병렬 리플레이
+
+    Args:
+        param_sets: expand_param_sets 결과
+        days: prepare_sweep_days 결과
+        base_thresholds: 기본 임계값 (None이면 설정 파일)
+        workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+    """
+    if base_thresholds is None:
+        from test.scout_bot.config.loaders import load_event_thresholds
+        base_thresholds = load_event_thresholds()
+
+    workers = workers or os.cpu_count() or 1
+    fd, cache_path = tempfile.mkstemp(prefix="replay_sweep_", suffix=".pkl")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(days, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if workers <= 1:
+            _init_worker(cache_path, base_thresholds)
+            return [run_param_set(i, params) for i, params in enumerate(param_sets)]
+
+        chunksize = max(1, len(param_sets) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(cache_path, base_thresholds),
+        ) as executor:
+            results = list(executor.map(
+                run_param_set,
+                range(len(param_sets)),
+                param_sets,
+                chunksize=chunksize,
+            ))
+        return results
+    finally:
+        os.remove(cache_path)
+
+
+def _flatten_row(result: Dict[str, Any], param_keys: List[str], event_types: List[str], subtypes: List[str]) -> Dict[str, Any]:
+    row = {"index": result["index"]}
+    for key in param_keys:
+        row[key] = result["params"].get(key)
+    for column in ("days", "ticks", "event_count", "events_per_day",
+                   "cycles_with_events", "events_in_cycles", "elapsed_sec"):
+        row[column] = result[column]
+    for event_type in event_types:
+        row[f"events.{event_type}"] = result["event_counts"].get(event_type, 0)
+    for subtype in subtypes:
+        row[f"timeout_with_events.{subtype}"] = result["timeout_with_events"].get(subtype, 0)
+    return row
+
+
+def save_sweep_results(
+    results: List[Dict[str, Any]],
+    output_dir: str,
+    baseline: Optional[Dict[str, Any]] = None,
+) -> Dict[str, str]:
+    """
+    결과 표 저장 (CSV + JSON)
+
+    - CSV: 조합별로 달라지는 값만
+    - JSON: {"recorded_baseline": 조합과 무관한 기록 기준선, "results": 조합별 결과}
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    param_keys = sorted({k for r in results for k in r["params"]})
+    event_types = sorted({k for r in results for k in r["event_counts"]})
+    subtypes = sorted(
+        set((baseline or {}).get("timeout_subtypes", {}))
+        | {k for r in results for k in r["timeout_with_events"]}
+    )
+    rows = [_flatten_row(r, param_keys, event_types, subtypes) for r in results]
+
+    csv_path = os.path.join(output_dir, "sweep_results.csv")
+    with open(csv_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ["index"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+    json_path = os.path.join(output_dir, "sweep_results.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"recorded_baseline": baseline, "results": results}, f, ensure_ascii=False, indent=2)
+
+    return {"csv_path": csv_path, "json_path": json_path}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="이벤트 임계값 스윕 (병렬 리플레이)")
+    parser.add_argument("--spec", required=True, help="파라미터 스펙 파일 (YAML/JSON)")
+    parser.add_argument("--start", default=None, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end", default=None, help="종료 날짜 (YYYY-MM-DD, 생략 시 start)")
+    parser.add_argument(
+        "--records-dir",
+        dest="records_dirs",
+        action="append",
+        default=[],
+        help="정찰 JSONL 디렉터리 직접 지정 (여러 번 사용 가능)",
+    )
+    parser.add_argument("--config", default=None, help="기본 임계값 YAML")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--output-dir", dest="output_dir", default=None, help="결과 저장 디렉터리")
+
+    args = parser.parse_args()
+
+    dates = iter_dates(args.start, args.end or args.start) if args.start else []
+    if not dates and not args.records_dirs:
+        parser.error("--start 또는 --records-dir 중 하나를 지정하세요")
+
+    from test.scout_bot.config.loaders import load_event_thresholds
+
+    base_thresholds = load_event_thresholds(args.config)
+    param_sets = expand_param_sets(load_sweep_spec(args.spec))
+
+    started = time.perf_counter()
+    days = prepare_sweep_days(dates=dates, records_dirs=args.records_dirs)
+    if not days:
+        print("❌ 리플레이할 기록이 없습니다.")
+        return 1
+    prepare_sec = time.perf_counter() - started
+
+    results = run_sweep(param_sets, days, base_thresholds, workers=args.workers)
+    total_sec = time.perf_counter() - started
+
+    output_dir = args.output_dir or os.path.join(
+        SWEEP_OUTPUT_DIR, datetime.now().strftime("%Y%m%d_%H%M%S")
+    )
+    baseline = recorded_baseline(days)
+    paths = save_sweep_results(results, output_dir, baseline)
+
+    print("=" * 60)
+    print("🔁 임계값 스윕 완료")
+    print("=" * 60)
+    print(f"  조합: {len(param_sets)}개 × 날짜: {len(days)}일")
+    print(f"  기록 기준선: 사이클 {baseline['cycles']}개 (조합과 무관)")
+    print(f"  준비: {prepare_sec:.2f}s, 전체: {total_sec:.2f}s")
+    print(f"  CSV:  {paths['csv_path']}")
+    print(f"  JSON: {paths['json_path']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -32,6 +32,11 @@ from test.scout_bot.events.data_collector import EventDataCollector
 from test.scout_bot.events.detector import EventDetector
 from test.scout_bot.events.cooldown import CooldownManager
 from test.scout_bot.events.sink import emit_event
+from test.scout_bot.events.batch_detector import (
+    HAS_NUMPY,
+    ArrayCooldownTable,
+    BatchEventDetector,
+)
 
 
 class MainApp:
@@ -49,6 +54,9 @@ class MainApp:
         self._event_data_collector = None
         self._event_detector = None
         self._cooldown_manager = CooldownManager()
+        # 🔹 watchlist 일괄 감지 (numpy 없으면 종목별 감지 사용)
+        self._batch_detector = None
+        self._cooldown_table = None
 
     def _build_snapshot(self, stk: str, token: str):
         """가격/상태 스냅샷 (실제 가격 정보 수집)"""
@@ -175,6 +183,11 @@ class MainApp:
             
             self._event_data_collector = EventDataCollector(self.token, thresholds)
             self._event_detector = EventDetector(self._event_data_collector, thresholds)
+            if HAS_NUMPY:
+                self._batch_detector = BatchEventDetector(thresholds, self._event_data_collector)
+                self._cooldown_table = ArrayCooldownTable(
+                    thresholds.get("cooldown", {}).get("minutes", 10)
+                )
 
         # 🔹 대형주 + 동적 watchlist 병합
         watchlist = list(dict.fromkeys(self.large_caps + get_watchlist()))
@@ -238,24 +251,67 @@ class MainApp:
 
             save_scout_record(record)
             
+            # 🔹 일괄 감지 사용 시 종목별 감지 생략 (루프 종료 후 한 번에 감지)
+            if self._batch_detector is not None:
+                continue
+            
             # 🔹 [추가] 이벤트 감지 및 출력
-            try:
-                # 이벤트 감지 (데이터 부족 시 조용히 스킵)
-                detected_events = self._event_detector.detect_events(stk, debug=False)
-                for event in detected_events:
-                    # 쿨다운 체크
-                    if not self._cooldown_manager.is_cooldown(stk, event.event_type):
-                        # 이벤트 출력 (JSONL + 텔레그램)
-                        emit_event(event)
-                        # 쿨다운 기록
-                        self._cooldown_manager.record_event(
-                            stk, event.event_type, event.occurred_at
-                        )
-                
-                # 만료된 쿨다운 정리 (주기적으로)
-                if len(self._cooldown_manager._cooldown_map) > 100:
-                    self._cooldown_manager.cleanup_expired()
-            except Exception as e:
-                # 예외 발생 시 조용히 스킵 (프로그램 중단 방지)
-                # 디버그 모드일 때만 로그 출력
-                pass
\ No newline at end of file
+            self._detect_symbol_events(stk, self._cooldown_manager)
+            
+            # 만료된 쿨다운 정리 (주기적으로)
+            if len(self._cooldown_manager._cooldown_map) > 100:
+                self._cooldown_manager.cleanup_expired()
+        # 🔹 watchlist 일괄 이벤트 감지 (벡터 연산 + 배열 쿨다운)
+        if self._batch_detector is not None:
+            self._detect_watchlist_events(watchlist)
+
+    def _detect_symbol_events(self, stk: str, cooldown):
+        """
+        종목 1개 이벤트 감지 및 출력 (EventDetector)
+
+        cooldown: CooldownManager 또는 ArrayCooldownTable (is_cooldown/record_event)
+        """
+        try:
+            # 이벤트 감지 (데이터 부족 시 조용히 스킵)
+            detected_events = self._event_detector.detect_events(stk, debug=False)
+            for event in detected_events:
+                # 쿨다운 체크
+                if not cooldown.is_cooldown(stk, event.event_type):
+                    # 이벤트 출력 (JSONL + 텔레그램)
+                    emit_event(event)
+                    # 쿨다운 기록
+                    cooldown.record_event(stk, event.event_type, event.occurred_at)
+        except Exception:
+            # 예외 발생 시 조용히 스킵 (프로그램 중단 방지)
+            pass
+
+    def _detect_watchlist_events(self, watchlist):
+        """
+        watchlist 일괄 이벤트 감지
+
+        - 수집 실패 종목은 detect_symbols 에서 종목 단위로 제외 (나머지는 정상 감지)
+        - 일괄 감지 자체가 실패하면 이번 주기는 종목별 EventDetector 로 감지 (같은 배열 쿨다운 사용)
+        """
+        try:
+            detected_events = self._batch_detector.detect_symbols(
+                watchlist, cooldown=self._cooldown_table
+            )
+        except Exception as e:
+            print(f"⚠️  일괄 이벤트 감지 실패 → 종목별 감지로 대체: {type(e).__name__}: {e}")
+            for stk in watchlist:
+                self._detect_symbol_events(stk, self._cooldown_table)
+        else:
+            if self._batch_detector.last_errors:
+                failed = ", ".join(sorted(self._batch_detector.last_errors))
+                print(f"⚠️  이벤트 감지 제외 종목 ({len(self._batch_detector.last_errors)}): {failed}")
+            for event in detected_events:
+                # 이벤트 출력 (JSONL + 텔레그램), 쿨다운 기록은 detect_symbols 에서 완료
+                try:
+                    emit_event(event)
+                except Exception as e:
+                    print(f"⚠️  이벤트 출력 실패 ({event.symbol}): {e}")
+        
+        try:
+            self._cooldown_table.cleanup_expired()
+        except Exception:
+            pass
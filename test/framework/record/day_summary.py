@@ -41,6 +41,7 @@ def format_day_summary(
     event_count: int,
     aggregated: Dict[str, Any] | None = None,
     event_stats: Dict[str, Any] | None = None,
+    intraday_text: str | None = None,
 ) -> str:
     lines = []
     today = datetime.now().strftime("%Y-%m-%d")
@@ -95,6 +96,11 @@ def format_day_summary(
                 for hour, count in sorted_hours:
                     lines.append(f"- {hour:02d}시: {count}건")
 
+    # 장중 증분 분석 요약 (Cycle/시장 성격)
+    if intraday_text:
+        lines.append("")
+        lines.append(intraday_text)
+
     return "\n".join(lines)
 
 
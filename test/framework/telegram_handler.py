@@ -144,11 +144,27 @@ def handle_command(text: str):
     # 상태 확인
     if text == "/status":
         current_list = get_watchlist()
-        send_message(
+        msg = (
             f"📊 정찰봇 상태\n\n"
             f"현재 watchlist: {len(current_list)} 종목\n"
             f"종목: {', '.join(current_list[:10])}{'...' if len(current_list) > 10 else ''}"
         )
+        
+        # 장중 증분 분석 (새로 기록된 줄만 읽음)
+        try:
+            from datetime import datetime
+            from test.framework.analyzer.incremental_analyzer import (
+                get_intraday_summary,
+                format_intraday_summary,
+            )
+            
+            summary = get_intraday_summary(datetime.now().strftime("%Y-%m-%d"))
+            if summary["total_records"]:
+                msg += "\n\n" + format_intraday_summary(summary)
+        except Exception as e:
+            print(f"⚠️  장중 분석 실패: {e}")
+        
+        send_message(msg)
         return
     
     # 알 수 없는 명령
@@ -225,7 +241,9 @@ async def telegram_polling():
                 if str(chat_id) == str(TELEGRAM_CHAT_ID):
                     if text.startswith("/"):
                         print(f"✅ 명령어 처리: {text}")
-                        handle_command(text)
+                        # 장중 분석(/status)·메시지 전송은 블로킹이므로 스레드에서 실행
+                        loop = asyncio.get_event_loop()
+                        await loop.run_in_executor(None, handle_command, text)
                     else:
                         print(f"ℹ️  일반 메시지 (명령어 아님): {text[:50]}")
                 else:
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 # =========================
@@ -30,6 +30,8 @@ DEFAULT_THRESHOLDS = {
             "enabled": True,
             "window_minutes": 10,
             "ratio_min": 2.0,
+            "ewma_alpha": None,  # None이면 2 / (window_minutes + 1)
+            "track_quantiles": False,
         },
     },
     "turnover": {
@@ -80,14 +82,17 @@ def get_config_file_path() -> Path:
 # 설정 로드
 # =========================
 
-def load_event_thresholds() -> Dict[str, Any]:
+def load_event_thresholds(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """
     이벤트 임계값 설정 로드
     
+    Args:
+        config_path: 설정 파일 경로 (None이면 scout_bot/config/event_thresholds.yaml)
+    
     Returns:
         설정 딕셔너리 (로드 실패 시 기본값)
     """
-    config_path = get_config_file_path()
+    config_path = Path(config_path) if config_path is not None else get_config_file_path()
     
     # 파일 없으면 기본값 반환
     if not config_path.exists():
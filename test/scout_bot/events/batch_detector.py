@@ -0,0 +1,478 @@
+# ===============================
+# test/scout_bot/events/batch_detector.py
+# watchlist 일괄 이벤트 감지 (NumPy 벡터 연산)
+# ===============================
+"""
+watchlist 일괄 이벤트 감지
+
+역할:
+- watchlist 전체 스냅샷을 배열(SnapshotBatch)로 묶어 한 번에 감지
+- 활성화된 이벤트 타입을 NumPy 벡터 비교로 평가 (종목 수와 무관하게 일정한 감지 시간)
+- 배열 기반 쿨다운 테이블(ArrayCooldownTable)로 쿨다운 필터링
+
+판정 규칙은 EventDetector.detect_events() 와 동일:
+- 이벤트 순서: 종목 순 → VOLUME_SPIKE, TURNOVER_THRESHOLD, DAY_HIGH_BREAK,
+  DAY_LOW_BREAK, PRICE_JUMP/PRICE_DROP
+- 고가/저가 갱신 추적은 쿨다운 여부와 무관하게 감지 시점에 갱신
+
+주의:
+- numpy 가 없으면 HAS_NUMPY=False (runner 는 기존 종목별 감지로 동작)
+- detect_symbols() 는 스냅샷 수집/검증에 실패한 종목만 제외 (last_errors 에 사유 기록)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+from test.scout_bot.events.definitions import (
+    Event,
+    EventType,
+)
+
+
+# =========================
+# 스냅샷 배열
+# =========================
+
+# 배열화하는 스냅샷 필드 (EventDataCollector.collect_snapshot 키와 동일)
+SNAPSHOT_FIELDS = (
+    "price",
+    "volume",
+    "turnover_krw",
+    "day_open",
+    "day_high",
+    "day_low",
+    "prev_close",
+    "avg_volume_n",
+)
+
+# 쿨다운 테이블/감지 결과 행렬의 열 순서
+EVENT_TYPE_ORDER = (
+    EventType.VOLUME_SPIKE,
+    EventType.TURNOVER_THRESHOLD,
+    EventType.DAY_HIGH_BREAK,
+    EventType.DAY_LOW_BREAK,
+    EventType.PRICE_JUMP,
+    EventType.PRICE_DROP,
+)
+EVENT_TYPE_INDEX = {event_type: i for i, event_type in enumerate(EVENT_TYPE_ORDER)}
+
+
+def _require_numpy():
+    if not HAS_NUMPY:
+        raise ImportError("numpy 가 필요합니다 (pip install numpy)")
+
+
+def _validate_snapshot(snapshot: Dict[str, Any], symbol: str) -> None:
+    """배열화 가능한 스냅샷인지 확인 (종목 코드 일치, 숫자 필드)"""
+    if snapshot.get("symbol") != symbol:
+        raise ValueError(f"스냅샷 종목 불일치: {snapshot.get('symbol')!r}")
+    for field in SNAPSHOT_FIELDS:
+        value = snapshot.get(field)
+        if value is not None:
+            float(value)
+
+
+class SnapshotBatch:
+    """watchlist 전체 스냅샷 (필드별 float64 배열, 결측값은 NaN)"""
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        arrays: Dict[str, Any],
+        timestamps: Sequence[datetime],
+        snapshots: Optional[List[Dict[str, Any]]] = None,
+    ):
+        _require_numpy()
+        if len(set(symbols)) != len(symbols):
+            raise ValueError("SnapshotBatch 의 종목 코드는 중복될 수 없습니다")
+
+        self.symbols = list(symbols)
+        self.timestamps = list(timestamps)
+        self.arrays = {
+            field: np.asarray(arrays.get(field, np.full(len(self.symbols), np.nan)), dtype=np.float64)
+            for field in SNAPSHOT_FIELDS
+        }
+        # 원본 스냅샷 (metrics 값을 원래 타입 그대로 기록하기 위함)
+        self.snapshots = snapshots
+
+    @classmethod
+    def from_snapshots(cls, snapshots: List[Dict[str, Any]]) -> "SnapshotBatch":
+        """collect_snapshot() 결과 리스트 → SnapshotBatch"""
+        _require_numpy()
+        arrays = {
+            field: np.array(
+                [np.nan if s.get(field) is None else s.get(field) for s in snapshots],
+                dtype=np.float64,
+            )
+            for field in SNAPSHOT_FIELDS
+        }
+        return cls(
+            symbols=[s["symbol"] for s in snapshots],
+            arrays=arrays,
+            timestamps=[s.get("timestamp") or datetime.now() for s in snapshots],
+            snapshots=snapshots,
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def value(self, field: str, i: int) -> Any:
+        """metrics 용 값 (원본 스냅샷 우선)"""
+        if self.snapshots is not None:
+            return self.snapshots[i].get(field)
+        value = self.arrays[field][i]
+        return None if np.isnan(value) else float(value)
+
+
+# =========================
+# 배열 기반 쿨다운
+# =========================
+
+class _SymbolIndex:
+    """종목 코드 → 행 번호 (행 배열은 필요 시 2배씩 확장)"""
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def lookup(self, symbols: Sequence[str]):
+        index = self._index
+        for symbol in symbols:
+            if symbol not in index:
+                index[symbol] = len(index)
+        return np.fromiter((index[s] for s in symbols), dtype=np.int64, count=len(symbols))
+
+    def get(self, symbol: str) -> Optional[int]:
+        return self._index.get(symbol)
+
+    def clear(self):
+        self._index.clear()
+
+
+def _grow_rows(array, rows: int, fill: float = float("nan")):
+    """행 수가 부족하면 2배씩 확장 (기존 값 유지)"""
+    if rows <= array.shape[0]:
+        return array
+    new_rows = max(rows, array.shape[0] * 2, 16)
+    grown = np.full((new_rows,) + array.shape[1:], fill, dtype=array.dtype)
+    grown[:array.shape[0]] = array
+    return grown
+
+
+class ArrayCooldownTable:
+    """
+    배열 기반 이벤트 쿨다운 테이블
+
+    - 행: 종목, 열: EVENT_TYPE_ORDER
+    - 값: 마지막 발생 시각 (epoch 초, 없으면 NaN)
+    - CooldownManager 와 같은 is_cooldown/record_event/cleanup_expired/clear 제공
+      (단, 기준 시각 now 를 인자로 받을 수 있음)
+    """
+
+    def __init__(self, cooldown_minutes: int = None):
+        """
+        Args:
+            cooldown_minutes: 쿨다운 시간 (분) (None이면 설정 파일에서 로드)
+        """
+        _require_numpy()
+        if cooldown_minutes is None:
+            try:
+                from test.scout_bot.config.loaders import load_event_thresholds
+                thresholds = load_event_thresholds()
+                cooldown_minutes = thresholds.get("cooldown", {}).get("minutes", 10)
+            except Exception:
+                cooldown_minutes = 10
+
+        self.cooldown_minutes = cooldown_minutes
+        self._symbols = _SymbolIndex()
+        self._last = np.full((0, len(EVENT_TYPE_ORDER)), np.nan, dtype=np.float64)
+
+    @property
+    def cooldown_seconds(self) -> float:
+        return self.cooldown_minutes * 60.0
+
+    def rows_for(self, symbols: Sequence[str]):
+        """종목 코드 → 행 번호 배열 (신규 종목은 등록)"""
+        rows = self._symbols.lookup(symbols)
+        self._last = _grow_rows(self._last, len(self._symbols))
+        return rows
+
+    def active_mask(self, rows, now: datetime):
+        """(len(rows), 이벤트 타입 수) 쿨다운 중 여부 행렬"""
+        elapsed = now.timestamp() - self._last[rows]
+        # NaN(기록 없음) 비교는 False → 쿨다운 아님
+        with np.errstate(invalid="ignore"):
+            return elapsed < self.cooldown_seconds
+
+    def record_mask(self, rows, fired, occurred_at_sec):
+        """fired 행렬의 True 칸에 발생 시각 기록"""
+        block = self._last[rows]
+        self._last[rows] = np.where(fired, occurred_at_sec[:, None], block)
+
+    def is_cooldown(self, symbol: str, event_type: EventType, now: Optional[datetime] = None) -> bool:
+        row = self._symbols.get(symbol)
+        if row is None:
+            return False
+        last = self._last[row, EVENT_TYPE_INDEX[event_type]]
+        if np.isnan(last):
+            return False
+        now = now or datetime.now()
+        return (now.timestamp() - last) < self.cooldown_seconds
+
+    def record_event(self, symbol: str, event_type: EventType, occurred_at: datetime):
+        row = self.rows_for([symbol])[0]
+        self._last[row, EVENT_TYPE_INDEX[event_type]] = occurred_at.timestamp()
+
+    def cleanup_expired(self, now: Optional[datetime] = None):
+        """만료된 쿨다운 항목 정리 (NaN 으로 되돌림)"""
+        now = now or datetime.now()
+        with np.errstate(invalid="ignore"):
+            expired = (now.timestamp() - self._last) >= self.cooldown_seconds
+        self._last[expired] = np.nan
+
+    def clear(self):
+        self._symbols.clear()
+        self._last = np.full((0, len(EVENT_TYPE_ORDER)), np.nan, dtype=np.float64)
+
+
+# =========================
+# 일괄 감지기
+# =========================
+
+@dataclass(frozen=True)
+class CompiledThresholds:
+    """감지 시 반복 dict 조회를 피하기 위해 미리 풀어둔 임계값"""
+    volume_enabled: bool
+    ratio_min: float
+    turnover_enabled: bool
+    krw_min: float
+    high_break_enabled: bool
+    low_break_enabled: bool
+    price_enabled: bool
+    pct_min: float
+    base_price: str
+
+    @classmethod
+    def from_thresholds(cls, thresholds: dict) -> "CompiledThresholds":
+        volume_config = thresholds.get("volume", {}).get("spike", {})
+        turnover_config = thresholds.get("turnover", {}).get("threshold", {})
+        day_range_config = thresholds.get("day_range", {})
+        price_config = thresholds.get("price", {}).get("jump_drop", {})
+        return cls(
+            volume_enabled=volume_config.get("enabled", True),
+            ratio_min=volume_config.get("ratio_min", 2.0),
+            turnover_enabled=turnover_config.get("enabled", True),
+            krw_min=turnover_config.get("krw_min", 10_000_000_000),
+            high_break_enabled=day_range_config.get("high_break", {}).get("enabled", True),
+            low_break_enabled=day_range_config.get("low_break", {}).get("enabled", True),
+            price_enabled=price_config.get("enabled", True),
+            pct_min=price_config.get("pct_min", 3.0),
+            base_price=price_config.get("base_price", "prev_close"),
+        )
+
+
+class BatchEventDetector:
+    """watchlist 일괄 이벤트 감지기"""
+
+    def __init__(self, thresholds: dict = None, data_collector=None):
+        """
+        Args:
+            thresholds: 이벤트 임계값 설정 (None이면 설정 파일에서 로드)
+            data_collector: detect_symbols() 사용 시 스냅샷 수집기 (EventDataCollector)
+        """
+        _require_numpy()
+        if thresholds is None:
+            try:
+                from test.scout_bot.config.loaders import load_event_thresholds
+                thresholds = load_event_thresholds()
+            except Exception:
+                from test.scout_bot.config.loaders import DEFAULT_THRESHOLDS
+                thresholds = DEFAULT_THRESHOLDS.copy()
+
+        self.thresholds = thresholds
+        self.config = CompiledThresholds.from_thresholds(thresholds)
+        self.data_collector = data_collector
+
+        # 고가/저가 갱신 추적 (중복 이벤트 방지용, 종목 행 배열)
+        self._symbols = _SymbolIndex()
+        self._last_high = np.full(0, np.nan, dtype=np.float64)
+        self._last_low = np.full(0, np.nan, dtype=np.float64)
+        # 직전 detect_symbols() 에서 제외된 종목 {종목: 사유}
+        self.last_errors: Dict[str, str] = {}
+
+    def _rows_for(self, symbols: Sequence[str]):
+        rows = self._symbols.lookup(symbols)
+        self._last_high = _grow_rows(self._last_high, len(self._symbols))
+        self._last_low = _grow_rows(self._last_low, len(self._symbols))
+        return rows
+
+    def evaluate(self, batch: SnapshotBatch):
+        """
+        이벤트 발생 행렬 계산 (쿨다운 미적용)
+
+        Returns:
+            (fired, extras)
+            - fired: (종목 수, 이벤트 타입 수) bool 행렬
+            - extras: metrics 계산용 배열 (ratio, change_pct, base_price, base_is_prev)
+        """
+        cfg = self.config
+        a = batch.arrays
+        n = len(batch)
+        rows = self._rows_for(batch.symbols)
+
+        price = a["price"]
+        has_price = ~np.isnan(price)
+        fired = np.zeros((n, len(EVENT_TYPE_ORDER)), dtype=bool)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # A-1) VOLUME_SPIKE
+            avg_volume = a["avg_volume_n"]
+            ratio = np.divide(a["volume"], avg_volume, out=np.full(n, np.nan), where=avg_volume > 0)
+            if cfg.volume_enabled:
+                fired[:, 0] = has_price & (ratio >= cfg.ratio_min)
+
+            # A-2) TURNOVER_THRESHOLD
+            if cfg.turnover_enabled:
+                fired[:, 1] = has_price & (a["turnover_krw"] >= cfg.krw_min)
+
+            # B-1) DAY_HIGH_BREAK (고가 갱신 시에만)
+            if cfg.high_break_enabled:
+                last_high = self._last_high[rows]
+                high = has_price & (price >= a["day_high"]) & (np.isnan(last_high) | (price > last_high))
+                fired[:, 2] = high
+                self._last_high[rows[high]] = price[high]
+
+            # B-2) DAY_LOW_BREAK (저가 갱신 시에만)
+            if cfg.low_break_enabled:
+                last_low = self._last_low[rows]
+                low = has_price & (price <= a["day_low"]) & (np.isnan(last_low) | (price < last_low))
+                fired[:, 3] = low
+                self._last_low[rows[low]] = price[low]
+
+            # B-3) PRICE_JUMP / PRICE_DROP
+            # 기준 가격 우선순위: 설정 파일 > prev_close > day_open
+            prev_close = a["prev_close"]
+            day_open = a["day_open"]
+            if cfg.base_price == "day_open":
+                base_is_prev = np.isnan(day_open) & ~np.isnan(prev_close)
+            else:
+                base_is_prev = ~np.isnan(prev_close)
+            base_price = np.where(base_is_prev, prev_close, day_open)
+            change_pct = np.divide(
+                price - base_price, base_price,
+                out=np.full(n, np.nan), where=base_price > 0,
+            ) * 100
+            if cfg.price_enabled:
+                jump = has_price & (change_pct >= cfg.pct_min)
+                fired[:, 4] = jump
+                fired[:, 5] = has_price & ~jump & (change_pct <= -cfg.pct_min)
+
+        extras = {
+            "ratio": ratio,
+            "change_pct": change_pct,
+            "base_price": base_price,
+            "base_is_prev": base_is_prev,
+        }
+        return fired, extras
+
+    def detect_batch(
+        self,
+        batch: SnapshotBatch,
+        cooldown: Optional[ArrayCooldownTable] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Event]:
+        """
+        스냅샷 배열에서 이벤트 감지
+
+        Args:
+            batch: watchlist 전체 스냅샷
+            cooldown: 쿨다운 테이블 (None이면 쿨다운 필터링 없음)
+            now: 쿨다운 기준 시각 (None이면 현재 시각, 리플레이 시 가상 시각)
+
+        Returns:
+            발생한 이벤트 리스트 (쿨다운 통과분, 쿨다운 기록까지 완료)
+        """
+        if len(batch) == 0:
+            return []
+
+        fired, extras = self.evaluate(batch)
+
+        if cooldown is not None:
+            rows = cooldown.rows_for(batch.symbols)
+            fired &= ~cooldown.active_mask(rows, now or datetime.now())
+            occurred_sec = np.array([t.timestamp() for t in batch.timestamps], dtype=np.float64)
+            cooldown.record_mask(rows, fired, occurred_sec)
+
+        events = []
+        # np.nonzero 는 행 우선 순서 → 종목 순, 이벤트 타입 순 (EventDetector 와 동일)
+        for i, col in zip(*np.nonzero(fired)):
+            events.append(self._build_event(batch, extras, int(i), EVENT_TYPE_ORDER[col]))
+        return events
+
+    def detect_symbols(
+        self,
+        symbols: Sequence[str],
+        cooldown: Optional[ArrayCooldownTable] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Event]:
+        """
+        data_collector 로 스냅샷을 수집한 뒤 일괄 감지
+
+        종목 1개의 수집 오류/잘못된 값이 watchlist 전체 감지를 막지 않도록
+        해당 종목만 제외하고 last_errors 에 사유를 남김
+        """
+        if self.data_collector is None:
+            raise ValueError("detect_symbols() 에는 data_collector 가 필요합니다")
+        self.last_errors = {}
+        snapshots = []
+        for symbol in dict.fromkeys(symbols):
+            try:
+                snapshot = self.data_collector.collect_snapshot(symbol)
+                _validate_snapshot(snapshot, symbol)
+            except Exception as e:
+                self.last_errors[symbol] = f"{type(e).__name__}: {e}"
+                continue
+            snapshots.append(snapshot)
+        return self.detect_batch(SnapshotBatch.from_snapshots(snapshots), cooldown=cooldown, now=now)
+
+    def _build_event(self, batch: SnapshotBatch, extras: Dict[str, Any], i: int, event_type: EventType) -> Event:
+        """EventDetector 와 같은 metrics 구조로 Event 생성"""
+        price = batch.value("price", i)
+
+        if event_type == EventType.VOLUME_SPIKE:
+            metrics = {
+                "volume_spike_ratio": float(extras["ratio"][i]),
+                "current_volume": batch.value("volume", i),
+                "avg_volume_n": batch.value("avg_volume_n", i),
+            }
+        elif event_type == EventType.TURNOVER_THRESHOLD:
+            metrics = {"turnover_krw": batch.value("turnover_krw", i)}
+        elif event_type == EventType.DAY_HIGH_BREAK:
+            metrics = {"current_price": price, "day_high": batch.value("day_high", i)}
+        elif event_type == EventType.DAY_LOW_BREAK:
+            metrics = {"current_price": price, "day_low": batch.value("day_low", i)}
+        else:
+            base_type = "prev_close" if extras["base_is_prev"][i] else "day_open"
+            metrics = {
+                "current_price": price,
+                base_type: batch.value(base_type, i),
+                "change_pct": float(extras["change_pct"][i]),
+            }
+
+        return Event(
+            symbol=batch.symbols[i],
+            event_type=event_type,
+            occurred_at=batch.timestamps[i],
+            metrics=metrics,
+        )
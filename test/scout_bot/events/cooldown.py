@@ -12,17 +12,22 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Dict, Tuple, Optional
+from typing import Callable, Dict, Tuple, Optional
 from test.scout_bot.events.definitions import EventType
 
 
 class CooldownManager:
     """이벤트 쿨다운 관리자"""
     
-    def __init__(self, cooldown_minutes: int = None):
+    def __init__(
+        self,
+        cooldown_minutes: int = None,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
         """
         Args:
             cooldown_minutes: 쿨다운 시간 (분) (None이면 설정 파일에서 로드)
+            clock: 현재 시각 함수 (None이면 datetime.now, 리플레이 시 가상 시계)
         """
         if cooldown_minutes is None:
             # 설정 파일에서 로드
@@ -35,6 +40,7 @@ class CooldownManager:
                 cooldown_minutes = 10
         
         self.cooldown_minutes = cooldown_minutes
+        self._clock = clock or datetime.now
         # {(symbol, event_type): last_occurred_at}
         self._cooldown_map: Dict[Tuple[str, EventType], datetime] = {}
     
@@ -55,7 +61,7 @@ class CooldownManager:
         if last_occurred is None:
             return False
         
-        elapsed = (datetime.now() - last_occurred).total_seconds() / 60
+        elapsed = (self._clock() - last_occurred).total_seconds() / 60
         return elapsed < self.cooldown_minutes
     
     def record_event(self, symbol: str, event_type: EventType, occurred_at: datetime):
@@ -72,7 +78,7 @@ class CooldownManager:
     
     def cleanup_expired(self):
         """만료된 쿨다운 항목 정리"""
-        now = datetime.now()
+        now = self._clock()
         expired_keys = [
             key
             for key, last_occurred in self._cooldown_map.items()
@@ -11,22 +11,33 @@
 """
 from __future__ import annotations
 
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List
 from datetime import datetime
 
 from test.price_api import get_current_price
+from test.scout_bot.events.rolling import RollingStatsTable, RollingWindow
 
 
 class EventDataCollector:
     """이벤트 감지용 데이터 수집기"""
     
-    def __init__(self, token: str, thresholds: dict = None):
+    def __init__(
+        self,
+        token: str,
+        thresholds: dict = None,
+        price_source: Optional[Callable[[str, str], float]] = None,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
         """
         Args:
             token: API 토큰
             thresholds: 이벤트 임계값 설정 (None이면 설정 파일에서 로드)
+            price_source: 현재가 조회 함수 (symbol, token) → price (None이면 get_current_price)
+            clock: 현재 시각 함수 (None이면 datetime.now, 리플레이 시 가상 시계)
         """
         self.token = token
+        self._price_source = price_source or get_current_price
+        self._clock = clock or datetime.now
         
         # 설정 로드
         if thresholds is None:
@@ -40,12 +51,19 @@ class EventDataCollector:
         
         self.thresholds = thresholds
         
+        # 롤링 윈도우 설정 (호출마다 중첩 dict 조회하지 않도록 1회만 해석)
+        spike_config = thresholds.get("volume", {}).get("spike", {})
+        self.window_minutes = spike_config.get("window_minutes", 10)
+        self.min_data_points = max(5, self.window_minutes // 2)  # 최소 window의 절반 이상 필요
+        ewma_alpha = spike_config.get("ewma_alpha")
+        track_quantiles = spike_config.get("track_quantiles", False)
+        
         # 당일 고가/저가 추적 (런타임 메모리)
         self._day_high_low: Dict[str, Dict[str, float]] = {}  # {symbol: {"high": float, "low": float}}
-        # 분봉 거래량 히스토리 (최근 N분)
-        self._volume_history: Dict[str, List[float]] = {}  # {symbol: [volume1, volume2, ...]}
-        # 분봉 거래대금 히스토리
-        self._turnover_history: Dict[str, List[float]] = {}  # {symbol: [turnover1, turnover2, ...]}
+        # 분봉 거래량 히스토리 (최근 N분, 종목별 링 버퍼)
+        self._volume_history = RollingStatsTable(self.window_minutes, ewma_alpha, track_quantiles)
+        # 분봉 거래대금 히스토리 (volume window와 동일)
+        self._turnover_history = RollingStatsTable(self.window_minutes, ewma_alpha)
     
     def collect_snapshot(self, symbol: str) -> Dict:
         """
@@ -57,16 +75,14 @@ class EventDataCollector:
         Returns:
             스냅샷 데이터 딕셔너리 (체크리스트 구조)
         """
-        from datetime import datetime
-        
         try:
-            price = get_current_price(symbol, self.token)
+            price = self._price_source(symbol, self.token)
             
             if price <= 0:
                 # 필수 필드 부족 시 빈 스냅샷 반환
                 return {
                     "symbol": symbol,
-                    "timestamp": datetime.now(),
+                    "timestamp": self._clock(),
                     "price": None,
                     "volume": None,
                     "turnover_krw": None,
@@ -75,9 +91,11 @@ class EventDataCollector:
                     "day_low": None,
                     "prev_close": None,
                     "avg_volume_n": None,
+                    "std_volume_n": None,
+                    "ewma_volume": None,
                 }
             
-            timestamp = datetime.now()
+            timestamp = self._clock()
             
             # 당일 시가 추적 (첫 수집 시 현재가를 시가로 기록)
             if symbol not in self._day_high_low:
@@ -105,13 +123,15 @@ class EventDataCollector:
             volume = None  # TODO: API에서 분봉 거래량 수집
             turnover_krw = self.get_latest_turnover(symbol)  # None일 수 있음
             
-            # 평균 거래량 계산 (warmup 체크 포함)
+            # 평균 거래량 (링 버퍼 누적 통계, warmup 체크 포함)
             avg_volume_n = None
-            volume_history = self._volume_history.get(symbol, [])
-            window_minutes = self.thresholds.get("volume", {}).get("spike", {}).get("window_minutes", 10)
-            min_data_points = max(5, window_minutes // 2)  # 최소 window의 절반 이상 필요
-            if len(volume_history) >= min_data_points:
-                avg_volume_n = sum(volume_history) / len(volume_history)
+            std_volume_n = None
+            ewma_volume = None
+            volume_window = self._volume_history.get(symbol)
+            if volume_window is not None and len(volume_window) >= self.min_data_points:
+                avg_volume_n = volume_window.mean
+                std_volume_n = volume_window.std
+                ewma_volume = volume_window.ewma
             
             # 전일 종가 (일단 None, API 연동 필요)
             prev_close = None  # TODO: API에서 전일 종가 수집
@@ -127,12 +147,14 @@ class EventDataCollector:
                 "day_low": day_low,
                 "prev_close": prev_close,
                 "avg_volume_n": avg_volume_n,
+                "std_volume_n": std_volume_n,
+                "ewma_volume": ewma_volume,
             }
         except Exception as e:
             # 예외 발생 시 빈 스냅샷 반환 (프로그램 중단 방지)
             return {
                 "symbol": symbol,
-                "timestamp": datetime.now(),
+                "timestamp": self._clock(),
                 "price": None,
                 "volume": None,
                 "turnover_krw": None,
@@ -141,6 +163,8 @@ class EventDataCollector:
                 "day_low": None,
                 "prev_close": None,
                 "avg_volume_n": None,
+                "std_volume_n": None,
+                "ewma_volume": None,
             }
     
     def update_volume_history(self, symbol: str, volume: float):
@@ -151,13 +175,8 @@ class EventDataCollector:
             symbol: 종목 코드
             volume: 분봉 거래량
         """
-        if symbol not in self._volume_history:
-            self._volume_history[symbol] = []
-        self._volume_history[symbol].append(volume)
-        # 최근 N분만 유지 (설정 파일에서 로드)
-        window_minutes = self.thresholds.get("volume", {}).get("spike", {}).get("window_minutes", 10)
-        if len(self._volume_history[symbol]) > window_minutes:
-            self._volume_history[symbol] = self._volume_history[symbol][-window_minutes:]
+        # 최근 N분만 유지 (고정 크기 링 버퍼, O(1))
+        self._volume_history.push(symbol, volume)
     
     def update_turnover_history(self, symbol: str, turnover: float):
         """
@@ -167,13 +186,8 @@ class EventDataCollector:
             symbol: 종목 코드
             turnover: 분봉 거래대금
         """
-        if symbol not in self._turnover_history:
-            self._turnover_history[symbol] = []
-        self._turnover_history[symbol].append(turnover)
-        # 최근 N분만 유지 (volume window와 동일)
-        window_minutes = self.thresholds.get("volume", {}).get("spike", {}).get("window_minutes", 10)
-        if len(self._turnover_history[symbol]) > window_minutes:
-            self._turnover_history[symbol] = self._turnover_history[symbol][-window_minutes:]
+        # 최근 N분만 유지 (volume window와 동일한 링 버퍼)
+        self._turnover_history.push(symbol, turnover)
     
     def calculate_volume_spike_ratio(self, symbol: str, current_volume: float) -> Optional[float]:
         """
@@ -186,16 +200,56 @@ class EventDataCollector:
         Returns:
             volume_spike_ratio (None if insufficient data)
         """
-        history = self._volume_history.get(symbol, [])
-        if len(history) < 5:  # 최소 5분 데이터 필요
+        window = self._volume_history.get(symbol)
+        if window is None or len(window) < 5:  # 최소 5분 데이터 필요
             return None
         
-        avg_volume = sum(history) / len(history)
+        avg_volume = window.mean
         if avg_volume == 0:
             return None
         
         return current_volume / avg_volume
     
+    def calculate_volume_zscore(self, symbol: str, current_volume: float) -> Optional[float]:
+        """
+        거래량 z-score 계산 (윈도우 평균/표준편차 기준)
+        
+        Args:
+            symbol: 종목 코드
+            current_volume: 현재 분봉 거래량
+            
+        Returns:
+            z-score (None if insufficient data or 표준편차 0)
+        """
+        window = self._volume_history.get(symbol)
+        if window is None or len(window) < self.min_data_points:
+            return None
+        return window.zscore(current_volume)
+    
+    def calculate_volume_percentile(self, symbol: str, current_volume: float) -> Optional[float]:
+        """
+        거래량 백분위 (윈도우 내 current_volume 이하 비율, 0~100)
+        
+        volume.spike.track_quantiles: true 설정 시에만 사용 가능
+        
+        Args:
+            symbol: 종목 코드
+            current_volume: 현재 분봉 거래량
+            
+        Returns:
+            백분위 (None if insufficient data or 분위수 미사용)
+        """
+        window = self._volume_history.get(symbol)
+        if window is None or len(window) < self.min_data_points:
+            return None
+        if not self._volume_history.track_quantiles:
+            return None
+        return window.percentile_rank(current_volume)
+    
+    def get_volume_window(self, symbol: str) -> Optional[RollingWindow]:
+        """종목의 거래량 롤링 윈도우 (없으면 None)"""
+        return self._volume_history.get(symbol)
+    
     def get_latest_turnover(self, symbol: str) -> Optional[float]:
         """
         최신 거래대금 반환
@@ -206,8 +260,8 @@ class EventDataCollector:
         Returns:
             최신 거래대금 (None if no data)
         """
-        history = self._turnover_history.get(symbol, [])
-        if not history:
+        window = self._turnover_history.get(symbol)
+        if window is None:
             return None
-        return history[-1]
+        return window.last
 
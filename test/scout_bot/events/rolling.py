@@ -0,0 +1,189 @@
+# ===============================
+# test/scout_bot/events/rolling.py
+# 고정 크기 링 버퍼 기반 롤링 통계
+# ===============================
+"""
+고정 크기 링 버퍼 기반 롤링 통계
+
+역할:
+- 종목별 최근 N개 값(분봉 거래량/거래대금)을 array('d') 링 버퍼에 보관
+- 값 추가 시 O(1)로 평균/분산(슬라이딩 Welford), EWMA 갱신
+- 선택적으로 정렬 버퍼를 유지하여 롤링 분위수/백분위 제공
+
+메모리:
+- 종목당 window 크기의 double 배열 1개 (+ 분위수 사용 시 정렬 리스트 1개)
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Optional
+
+
+class RollingWindow:
+    """종목 1개의 롤링 윈도우 (링 버퍼)"""
+
+    __slots__ = (
+        "window", "alpha", "_buf", "_head", "_count",
+        "_mean", "_m2", "_ewma", "_ewm_var", "_sorted", "_last",
+    )
+
+    def __init__(self, window: int, alpha: Optional[float] = None, track_quantiles: bool = False):
+        """
+        Args:
+            window: 보관할 최근 값 개수
+            alpha: EWMA 평활 계수 (None이면 2 / (window + 1))
+            track_quantiles: 롤링 분위수 계산용 정렬 버퍼 유지 여부
+        """
+        if window <= 0:
+            raise ValueError("window 는 1 이상이어야 합니다")
+
+        self.window = window
+        self.alpha = alpha if alpha is not None else 2.0 / (window + 1)
+        self._buf = array("d", [0.0]) * window
+        self._head = 0      # 다음 기록 위치
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0      # 편차 제곱합 (분산 = m2 / n)
+        self._ewma: Optional[float] = None
+        self._ewm_var = 0.0
+        self._sorted = [] if track_quantiles else None
+        self._last: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push(self, value: float) -> None:
+        """값 추가 (윈도우가 차면 가장 오래된 값 제거)"""
+        x = float(value)
+
+        if self._count < self.window:
+            # Welford 추가
+            self._count += 1
+            delta = x - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (x - self._mean)
+        else:
+            # 슬라이딩 Welford (가장 오래된 값 y 를 x 로 교체)
+            y = self._buf[self._head]
+            old_mean = self._mean
+            self._mean = old_mean + (x - y) / self._count
+            self._m2 += (x - y) * (x - self._mean + y - old_mean)
+            if self._m2 < 0.0:
+                self._m2 = 0.0
+            if self._sorted is not None:
+                del self._sorted[bisect_left(self._sorted, y)]
+
+        self._buf[self._head] = x
+        self._head = (self._head + 1) % self.window
+        self._last = x
+
+        if self._sorted is not None:
+            insort(self._sorted, x)
+
+        # EWMA / EW 분산
+        if self._ewma is None:
+            self._ewma = x
+        else:
+            diff = x - self._ewma
+            incr = self.alpha * diff
+            self._ewma += incr
+            self._ewm_var = (1.0 - self.alpha) * (self._ewm_var + diff * incr)
+
+    # -------------------------
+    # 통계 조회
+    # -------------------------
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._last
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._mean if self._count else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        """모분산 (윈도우 내)"""
+        return self._m2 / self._count if self._count else None
+
+    @property
+    def std(self) -> Optional[float]:
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    @property
+    def ewma(self) -> Optional[float]:
+        return self._ewma
+
+    @property
+    def ewm_std(self) -> Optional[float]:
+        return math.sqrt(self._ewm_var) if self._ewma is not None else None
+
+    def zscore(self, value: float) -> Optional[float]:
+        """윈도우 평균/표준편차 기준 z-score (표준편차 0이면 None)"""
+        std = self.std
+        if not std:
+            return None
+        return (value - self._mean) / std
+
+    def quantile(self, q: float) -> Optional[float]:
+        """롤링 분위수 (선형 보간, track_quantiles=True 필요)"""
+        if self._sorted is None:
+            raise ValueError("track_quantiles=True 로 생성해야 분위수를 계산할 수 있습니다")
+        if not self._sorted:
+            return None
+        pos = (len(self._sorted) - 1) * min(max(q, 0.0), 1.0)
+        lower = int(pos)
+        upper = min(lower + 1, len(self._sorted) - 1)
+        frac = pos - lower
+        return self._sorted[lower] * (1.0 - frac) + self._sorted[upper] * frac
+
+    def percentile_rank(self, value: float) -> Optional[float]:
+        """value 이하인 값의 비율 (0~100, track_quantiles=True 필요)"""
+        if self._sorted is None:
+            raise ValueError("track_quantiles=True 로 생성해야 백분위를 계산할 수 있습니다")
+        if not self._sorted:
+            return None
+        return bisect_right(self._sorted, value) / len(self._sorted) * 100
+
+    def values(self) -> list:
+        """오래된 값 → 최신 값 순서의 리스트 (디버그/직렬화용)"""
+        if self._count < self.window:
+            return list(self._buf[:self._count])
+        return list(self._buf[self._head:]) + list(self._buf[:self._head])
+
+
+class RollingStatsTable:
+    """종목별 RollingWindow 모음"""
+
+    def __init__(self, window: int, alpha: Optional[float] = None, track_quantiles: bool = False):
+        self.window = window
+        self.alpha = alpha
+        self.track_quantiles = track_quantiles
+        self._windows: Dict[str, RollingWindow] = {}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._windows
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+    def push(self, symbol: str, value: float) -> RollingWindow:
+        window = self._windows.get(symbol)
+        if window is None:
+            window = RollingWindow(self.window, self.alpha, self.track_quantiles)
+            self._windows[symbol] = window
+        window.push(value)
+        return window
+
+    def get(self, symbol: str) -> Optional[RollingWindow]:
+        return self._windows.get(symbol)
+
+    def count(self, symbol: str) -> int:
+        window = self._windows.get(symbol)
+        return len(window) if window is not None else 0
+
+    def clear(self):
+        self._windows.clear()
@@ -37,7 +37,12 @@ def load_events_from_jsonl(date: Optional[str] = None) -> List[Dict]:
     log_path = get_events_log_path(date)
     
     if not log_path.exists():
-        return []
+        # 마감 후 압축 보관된 날짜면 정찰 아카이브에서 읽기
+        try:
+            from test.framework.analyzer.scout_archive import load_archived_events
+            return load_archived_events(date) or []
+        except ImportError:
+            return []
     
     events = []
     try:
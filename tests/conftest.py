@@ -0,0 +1,61 @@
+# ===============================
+# tests/conftest.py
+# ===============================
+"""
+공용 테스트 설정
+
+- 프로젝트 루트를 import 경로에 추가 (test.daily_scan.* / scout_selector.* 패키지 import)
+- 기록된 KRX 응답(fixtures/krx) 로더
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+OHLCV_COLUMNS = ["시가", "고가", "저가", "종가", "거래량", "거래대금", "등락률"]
+
+
+class RecordedKrx:
+    """
+    기록된 pykrx get_market_ohlcv 응답 (날짜 × 시장 스냅샷)
+
+    기록에 없는 날짜는 pykrx 처럼 빈 DataFrame 반환
+    """
+
+    def __init__(self, path: Path):
+        self.rows = pd.read_csv(path, dtype={"날짜": str, "티커": str})
+        self.calls = []
+
+    def snapshot(self, date: str, market: str) -> pd.DataFrame:
+        self.calls.append(("get_market_ohlcv", date, market))
+        rows = self.rows[(self.rows["날짜"] == date) & (self.rows["market"] == market)]
+        return rows.set_index("티커")[OHLCV_COLUMNS].rename_axis("티커")
+
+    def tickers(self, market: str):
+        return list(dict.fromkeys(self.rows.loc[self.rows["market"] == market, "티커"]))
+
+    def by_date(self, symbol: str) -> pd.DataFrame:
+        """get_market_ohlcv_by_date 형태 (index: 날짜, 거래일만)"""
+        rows = self.rows[(self.rows["티커"] == symbol) & (self.rows["거래량"] > 0)]
+        out = rows.set_index(pd.to_datetime(rows["날짜"]).rename("날짜"))[OHLCV_COLUMNS]
+        return out
+
+    def pykrx_fetch(self, func: str, *args, **kwargs):
+        """KrxSource(fetch=...) 용 pykrx stock.* 대체"""
+        if func == "get_market_ohlcv":
+            return self.snapshot(args[0], kwargs.get("market", "KOSPI"))
+        if func == "get_market_ticker_list":
+            return self.tickers(kwargs.get("market", "KOSPI"))
+        raise KeyError(f"기록 없는 함수: {func}")
+
+
+@pytest.fixture
+def recorded_krx() -> RecordedKrx:
+    return RecordedKrx(FIXTURE_DIR / "krx" / "get_market_ohlcv_202512_202601.csv")
@@ -0,0 +1,123 @@
+# ===============================
+# tests/daily_scan/test_market_ohlcv.py
+# ===============================
+"""market_ohlcv 날짜별 스냅샷 캐시 / 종목별 창 / 오프라인 필터 실행 (기록된 KRX 응답 사용)"""
+import datetime as dt
+
+import pandas as pd
+import pytest
+
+from test.daily_scan.data import market_ohlcv
+from test.daily_scan.data.krx_source import KrxSource, set_source
+from test.daily_scan.data.market_ohlcv import (
+    OHLCV_COLUMNS,
+    get_market_ohlcv,
+    load_market_panel,
+    split_symbol_windows,
+)
+from scout_selector.utils.market_calendar import TradingCalendar, set_calendar
+
+MARKETS = ("KOSPI", "KOSDAQ")
+
+
+def _never_closed(date: str) -> bool:
+    return False
+
+
+def _always_closed(date: str) -> bool:
+    return True
+
+
+def test_snapshot_cache_miss_then_hit(recorded_krx, tmp_path):
+    stats = {}
+    first = get_market_ohlcv("20260105", MARKETS, recorded_krx.snapshot, tmp_path, stats)
+    assert stats == {"requests": 2}
+    assert sorted(first.index) == sorted(recorded_krx.tickers("KOSPI") + recorded_krx.tickers("KOSDAQ"))
+
+    stats = {}
+    second = get_market_ohlcv("20260105", MARKETS, recorded_krx.snapshot, tmp_path, stats)
+    assert stats == {"cache_hits": 2}
+    assert len(recorded_krx.calls) == 2
+    pd.testing.assert_frame_equal(first.sort_index(), second.sort_index(), check_dtype=False)
+
+
+@pytest.mark.parametrize("date", ["20251225", "20251231"])  # 빈 응답 / 거래량 0 응답
+def test_holiday_is_cached_as_empty(recorded_krx, tmp_path, date):
+    assert get_market_ohlcv(date, MARKETS, recorded_krx.snapshot, tmp_path, closed_check=_always_closed).empty
+    stats = {}
+    assert get_market_ohlcv(date, MARKETS, recorded_krx.snapshot, tmp_path, stats, _always_closed).empty
+    assert stats == {"cache_hits": 2}
+
+
+def test_empty_response_on_trading_day_is_not_cached(recorded_krx, tmp_path, capsys):
+    def failing(date, market):
+        return recorded_krx.snapshot("20251225", market)  # 요청 오류 시 pykrx 빈 응답
+
+    assert get_market_ohlcv("20260107", MARKETS, failing, tmp_path, closed_check=_never_closed).empty
+    assert "캐시하지 않음" in capsys.readouterr().out
+    assert not list(tmp_path.rglob("ohlcv_20260107_*"))
+
+    # 다음 실행에서 다시 요청 → 정상 응답 캐시
+    stats = {}
+    df = get_market_ohlcv("20260107", MARKETS, recorded_krx.snapshot, tmp_path, stats, _never_closed)
+    assert stats == {"requests": 2} and len(df) == 6
+
+
+def test_today_before_close_is_not_cached(recorded_krx, tmp_path, monkeypatch):
+    today = dt.date.today().strftime("%Y%m%d")
+    fetch = lambda date, market: recorded_krx.snapshot("20260105", market)
+
+    monkeypatch.setattr(market_ohlcv, "MARKET_FINAL_TIME", dt.time.max)
+    assert len(get_market_ohlcv(today, MARKETS, fetch, tmp_path)) == 6
+    assert not list(tmp_path.rglob(f"ohlcv_{today}_*"))
+
+    monkeypatch.setattr(market_ohlcv, "MARKET_FINAL_TIME", dt.time.min)
+    get_market_ohlcv(today, MARKETS, fetch, tmp_path)
+    assert len(list(tmp_path.rglob(f"ohlcv_{today}_*"))) == 2
+
+
+def test_is_final_boundary():
+    now = dt.datetime(2026, 1, 7, 15, 0)
+    assert market_ohlcv._is_final("20260106", now)
+    assert not market_ohlcv._is_final("20260107", now)
+    assert market_ohlcv._is_final("20260107", now.replace(hour=16))
+
+
+def test_split_symbol_windows_matches_by_date(recorded_krx, tmp_path):
+    panel = load_market_panel(
+        "20251201", "20260130", MARKETS, recorded_krx.snapshot, tmp_path,
+        closed_check=lambda d: d in ("20251225", "20251231", "20260101"),
+    )
+    windows = split_symbol_windows(panel)
+
+    assert sorted(windows) == sorted(recorded_krx.tickers("KOSPI") + recorded_krx.tickers("KOSDAQ"))
+    for symbol, window in windows.items():
+        expected = recorded_krx.by_date(symbol)
+        assert list(window.columns) == OHLCV_COLUMNS
+        assert window.index.name == "날짜"
+        pd.testing.assert_frame_equal(window, expected, check_dtype=False, check_freq=False)
+
+
+def test_generate_a_volume_burst_offline(recorded_krx, tmp_path, monkeypatch):
+    from test.daily_scan.filters.a_volume_burst import generate_a_volume_burst
+
+    # 기록 → 재생 모드 KrxSource (pykrx/네트워크 없이 실행)
+    krx_cache = tmp_path / "krx_cache"
+    recorder = KrxSource(mode="record", cache_dir=krx_cache, fetch=recorded_krx.pykrx_fetch)
+    for day in pd.bdate_range("2025-12-01", "2026-01-30").strftime("%Y%m%d"):
+        for market in MARKETS:
+            recorder.get_market_ohlcv(day, market=market)
+    for market in MARKETS:
+        recorder.get_market_ticker_list("20260130", market=market)
+
+    monkeypatch.setattr(market_ohlcv, "CACHE_DIR", tmp_path / "market_cache")
+    set_source(KrxSource(mode="replay", cache_dir=krx_cache))
+    set_calendar(TradingCalendar(calendar_dir=tmp_path / "calendar", fetch=False, today="20260131"))
+    try:
+        out = generate_a_volume_burst(dt.date(2026, 1, 30), out_path=tmp_path / "A.csv", verbose=False)
+    finally:
+        set_source(None)
+        set_calendar(None)
+
+    picked = pd.read_csv(out, dtype={"symbol": str})["symbol"].tolist()
+    assert picked == ["005930", "247540"]
@@ -0,0 +1,71 @@
+# ===============================
+# tests/framework/test_scout_archive.py
+# ===============================
+"""정찰/이벤트 기록 보관: 기존 컨테이너 재작성, 파싱 불가 이벤트 줄 보존"""
+import json
+
+import pytest
+
+from test.framework.analyzer import scout_archive
+from test.framework.analyzer.scout_archive import ScoutArchive, archive_scout_day, get_archive_path
+
+DATE = "2026-01-07"
+
+
+def _record(stock, minute):
+    return {"meta": {"stock_code": stock, "timestamp": f"{DATE}T09:{minute:02d}:00", "time": f"09:{minute:02d}"}}
+
+
+@pytest.fixture
+def day_dir(tmp_path, monkeypatch):
+    date_dir = tmp_path / "scout" / "20260107"
+    date_dir.mkdir(parents=True)
+    monkeypatch.setattr(scout_archive, "resolve_scout_date_dir", lambda date: str(date_dir))
+    monkeypatch.setattr(scout_archive, "EVENTS_DIR", str(tmp_path / "events"))
+    (tmp_path / "events").mkdir()
+    return date_dir
+
+
+def _write_jsonl(path, records):
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+
+
+def test_unparsable_event_lines_are_kept_verbatim(day_dir):
+    events_path = scout_archive.get_events_path(DATE)
+    lines = [
+        b'{"symbol": "005930", "type": "A"}',
+        b'{"symbol": "000660", "type": "B"',  # 쓰다 끊긴 줄
+        b"[1, 2]",
+        b'{"symbol": "005930", "type": "C"}',
+        b"\xff\xfe not utf-8",
+    ]
+    with open(events_path, "wb") as f:
+        f.write(b"\n".join(lines) + b"\n\n")
+    _write_jsonl(day_dir / "005930.jsonl", [_record("005930", 1)])
+
+    assert archive_scout_day(DATE, allow_open_day=True)
+    archive = ScoutArchive(get_archive_path(str(day_dir)))
+    assert archive.read_event_lines() == lines
+    assert [e["type"] for e in archive.read_events()] == ["A", "C"]
+
+    # 기존 컨테이너와 합쳐 다시 쓸 때도 원문 유지
+    _write_jsonl(day_dir / "000660.jsonl", [_record("000660", 2)])
+    assert archive_scout_day(DATE, allow_open_day=True)
+    archive = ScoutArchive(get_archive_path(str(day_dir)))
+    assert archive.read_event_lines() == lines
+    assert archive.stocks() == ["000660", "005930"]
+
+
+def test_unreadable_existing_archive_is_not_overwritten(day_dir):
+    _write_jsonl(day_dir / "005930.jsonl", [_record("005930", 1)])
+    assert archive_scout_day(DATE, allow_open_day=True)
+    archive_path = get_archive_path(str(day_dir))
+    with open(archive_path, "r+b") as f:
+        f.seek(-4, 2)
+        f.write(b"\x00\x00\x00\x00")  # footer 손상
+    damaged = open(archive_path, "rb").read()
+
+    _write_jsonl(day_dir / "000660.jsonl", [_record("000660", 2)])
+    assert archive_scout_day(DATE, allow_open_day=True) is None
+    assert open(archive_path, "rb").read() == damaged
+    assert (day_dir / "000660.jsonl").exists()
@@ -0,0 +1,115 @@
+# ===============================
+# tests/framework/test_scout_compactor.py
+# ===============================
+"""컬럼형 압축: 무손실 복원, 스트리밍 집계가 최신 컬럼형 파일을 JSONL 과 같게 사용"""
+import json
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from test.framework.analyzer import streaming_analyzer
+from test.framework.analyzer.scout_compactor import (
+    compact_scout_dir,
+    load_columnar_records,
+)
+from test.framework.analyzer.streaming_analyzer import stream_scout_records
+
+DATE = "2026-01-07"
+
+
+def _record(stock, minute, triggered=False, exit_type=None, **extra):
+    record = {
+        "meta": {
+            "stock_code": stock,
+            "date": DATE,
+            "time": f"09:{minute:02d}:00",
+            "timestamp": f"{DATE}T09:{minute:02d}:00",
+            "session": "OPEN",
+        },
+        "snapshot": {"current_price": 10_000 + minute, "volume": 100 * minute, "turnover_krw": 1_000_000},
+        "observer": {"triggered": triggered},
+        "outcome": {"exit_type": exit_type} if exit_type else {},
+        "no_event_reason": [] if triggered else ["volume_not_enough"],
+    }
+    record.update(extra)
+    return record
+
+
+def _write_day(date_dir, records_by_stock):
+    date_dir.mkdir(parents=True, exist_ok=True)
+    for stock, records in records_by_stock.items():
+        (date_dir / f"{stock}.jsonl").write_text(
+            "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records), encoding="utf-8"
+        )
+
+
+def _day(tmp_path):
+    date_dir = tmp_path / "20260107"
+    odd = _record("000660", 3, triggered=True)
+    odd["meta"]["timestamp"] = f"{DATE}T09:03:00.000"     # isoformat 왕복 불가 → extra_json
+    odd["snapshot"]["current_price"] = 10_003.5            # float → extra_json
+    odd["observer"]["note"] = "manual"                     # 컬럼에 없는 observer 키
+    _write_day(date_dir, {
+        "005930": [
+            _record("005930", 1, triggered=True),
+            _record("005930", 2, triggered=True, box={"formed": True}),
+            _record("005930", 4, exit_type="reached_1pct"),
+        ],
+        "000660": [
+            _record("000660", 1),
+            odd,
+            _record("000660", 5, observer={}),
+        ],
+    })
+    return date_dir
+
+
+def _comparable(result):
+    stats = result["observer_stats"]
+    summary = stats["observer_summary"]
+    summary["triggered_stocks"] = sorted(summary["triggered_stocks"])
+    stats["box_summary"]["formed_stocks"].sort()
+    stats["base_candle_summary"]["exists_stocks"].sort()
+    return json.dumps(
+        [stats, result["enhanced_result"], result["total_records"], result["first_record"]],
+        sort_keys=True, default=str,
+    )
+
+
+def test_columnar_records_round_trip_without_added_keys(tmp_path):
+    date_dir = _day(tmp_path)
+    assert compact_scout_dir(str(date_dir))
+
+    expected = []
+    for path in sorted(date_dir.glob("*.jsonl")):
+        expected.extend(json.loads(line) for line in path.read_text(encoding="utf-8").splitlines())
+    restored = load_columnar_records(str(date_dir))
+
+    assert restored == expected
+    # 원래 없던 섹션/사유 키를 만들지 않음
+    assert [sorted(r) for r in restored] == [sorted(r) for r in expected]
+
+
+def test_stream_prefers_fresh_columnar_and_matches_jsonl(tmp_path, monkeypatch):
+    date_dir = _day(tmp_path)
+    from_jsonl = _comparable(stream_scout_records(str(date_dir)))
+    assert compact_scout_dir(str(date_dir))
+
+    class NoJsonl:
+        def __init__(self, *args, **kwargs):
+            raise AssertionError("최신 컬럼형 파일이 있으면 JSONL 을 읽지 않아야 함")
+
+    monkeypatch.setattr(streaming_analyzer, "_FileStream", NoJsonl)
+    assert _comparable(stream_scout_records(str(date_dir))) == from_jsonl
+
+
+def test_stale_columnar_falls_back_to_jsonl(tmp_path):
+    date_dir = _day(tmp_path)
+    assert compact_scout_dir(str(date_dir))
+
+    with open(date_dir / "005930.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps(_record("005930", 6, triggered=True)) + "\n")
+
+    result = stream_scout_records(str(date_dir))
+    assert result["total_records"] == 7
@@ -0,0 +1,104 @@
+# ===============================
+# tests/research/test_warehouse.py
+# ===============================
+"""연구 웨어하우스: 보관된 날짜/사라진 파일 정리, 중복 watchlist 제거"""
+import json
+
+import pytest
+
+from research import warehouse
+from research.warehouse import ResearchWarehouse
+from test.framework.analyzer import scout_archive
+
+DATE = "2026-01-07"
+
+
+def _record(stock, minute, price, triggered=False):
+    return {
+        "meta": {"stock_code": stock, "date": DATE, "timestamp": f"{DATE}T09:{minute:02d}:00"},
+        "snapshot": {"current_price": price},
+        "observer": {"triggered": triggered},
+    }
+
+
+def _write_jsonl(path, rows):
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+
+
+@pytest.fixture
+def roots(tmp_path, monkeypatch):
+    scout_root = tmp_path / "scout"
+    events_dir = tmp_path / "events"
+    watch_dirs = [tmp_path / "scout_selector", tmp_path / "gatekeeper_bot"]
+    for d in [events_dir, *watch_dirs]:
+        d.mkdir(parents=True)
+    monkeypatch.setattr(warehouse, "SCOUT_RECORDS_DIR", scout_root)
+    monkeypatch.setattr(warehouse, "EVENTS_DIR", events_dir)
+    monkeypatch.setattr(warehouse, "WATCHLIST_DIRS", watch_dirs)
+    monkeypatch.setattr(scout_archive, "SCOUT_RECORDS_DIR", str(scout_root))
+    monkeypatch.setattr(scout_archive, "EVENTS_DIR", str(events_dir))
+
+    date_dir = scout_root / "2026" / "01" / "20260107"
+    date_dir.mkdir(parents=True)
+    _write_jsonl(date_dir / "005930.jsonl", [_record("005930", 1, 100, True), _record("005930", 2, 110)])
+    _write_jsonl(date_dir / "000660.jsonl", [_record("000660", 1, 50)])
+    _write_jsonl(events_dir / "events_20260107.jsonl", [
+        {"symbol": "005930", "event_type": "TRIGGER", "occurred_at": f"{DATE}T09:01:00"},
+    ])
+    return {"tmp": tmp_path, "date_dir": date_dir, "watch_dirs": watch_dirs}
+
+
+def _counts(wh):
+    return {
+        table: wh.query(f"SELECT COUNT(*) AS n FROM {table}")[0]["n"]
+        for table in ["scout_records", "scout_daily", "events"]
+    }
+
+
+def test_archived_day_replaces_jsonl_rows(roots):
+    with ResearchWarehouse(roots["tmp"] / "a.sqlite3") as wh:
+        wh.ingest_all(["scout", "events"])
+        before = _counts(wh)
+        assert before == {"scout_records": 3, "scout_daily": 2, "events": 1}
+
+        assert scout_archive.archive_scout_day(DATE, allow_open_day=True)
+        assert not list(roots["date_dir"].glob("*.jsonl"))
+
+        results = wh.ingest_all(["scout", "events"])
+        assert results["scout"]["removed"] == 2 and results["events"]["removed"] == 1
+        assert _counts(wh) == before
+        sources = {row["source_file"] for row in wh.query("SELECT DISTINCT source_file FROM scout_records")}
+        assert sources == {str(roots["date_dir"] / scout_archive.ARCHIVE_FILENAME)}
+
+        # 다시 실행해도 그대로
+        results = wh.ingest_all(["scout", "events"])
+        assert results["scout"]["files"] == 0 and results["scout"]["removed"] == 0
+        assert _counts(wh) == before
+
+
+def test_day_archived_before_first_ingest_is_visible(roots):
+    assert scout_archive.archive_scout_day(DATE, allow_open_day=True)
+    with ResearchWarehouse(roots["tmp"] / "b.sqlite3") as wh:
+        wh.ingest_all(["scout", "events"])
+        assert _counts(wh) == {"scout_records": 3, "scout_daily": 2, "events": 1}
+        daily = wh.query("SELECT symbol, last_price FROM scout_daily ORDER BY symbol")
+        assert [(r["symbol"], r["last_price"]) for r in daily] == [("000660", 50), ("005930", 110)]
+
+
+def test_watchlist_in_both_output_dirs_counts_once(roots):
+    watchlist = {"date": DATE, "volume": [{"symbol": "005930", "score": 1.5}]}
+    for d in roots["watch_dirs"]:
+        (d / "watchlist_20260107.json").write_text(json.dumps(watchlist), encoding="utf-8")
+    # 이름이 다른 같은 날짜 파일도 조회에서 한 번만
+    (roots["watch_dirs"][1] / "watchlist_20260107_pm.json").write_text(json.dumps(watchlist), encoding="utf-8")
+
+    with ResearchWarehouse(roots["tmp"] / "c.sqlite3") as wh:
+        wh.ingest_all(["scout", "watchlist"])
+        assert wh.query("SELECT COUNT(*) AS n FROM watchlist_picks")[0]["n"] == 2
+        wh.conn.execute(
+            "INSERT INTO scout_cycles (date, symbol, cycle_id, exit_type, source_file) VALUES (?, ?, ?, ?, ?)",
+            (DATE, "005930", "c1", "reached_1pct", "manual"),
+        )
+        picks = wh.picks_next_day_return("reached_1pct")
+        assert [(p["symbol"], p["bucket"]) for p in picks] == [("005930", "volume")]
+        assert wh.symbol_history("005930")[0]["buckets"] == "volume"
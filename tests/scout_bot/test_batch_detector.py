@@ -0,0 +1,50 @@
+# ===============================
+# tests/scout_bot/test_batch_detector.py
+# ===============================
+"""일괄 이벤트 감지: 종목 단위 수집 오류 격리"""
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from test.scout_bot.config.loaders import DEFAULT_THRESHOLDS
+from test.scout_bot.events.batch_detector import BatchEventDetector
+
+NOW = datetime(2026, 1, 7, 10, 0)
+
+
+class _Collector:
+    """종목별 고정 스냅샷 (broken 종목은 예외 / 잘못된 값)"""
+
+    def __init__(self, broken):
+        self.broken = broken
+
+    def collect_snapshot(self, symbol):
+        if self.broken.get(symbol) == "raise":
+            raise ConnectionError("timeout")
+        return {
+            "symbol": symbol,
+            "timestamp": NOW,
+            "price": "N/A" if self.broken.get(symbol) == "bad" else 10_500.0,
+            "volume": None,
+            "turnover_krw": 50_000_000_000,
+            "day_open": 10_000.0,
+            "day_high": 10_500.0,
+            "day_low": 10_000.0,
+            "prev_close": None,
+            "avg_volume_n": None,
+        }
+
+
+def test_failing_symbols_do_not_block_batch():
+    detector = BatchEventDetector(DEFAULT_THRESHOLDS.copy(), _Collector({"000660": "raise", "035720": "bad"}))
+    events = detector.detect_symbols(["005930", "000660", "035720", "247540"], now=NOW)
+
+    assert {e.symbol for e in events} == {"005930", "247540"}
+    assert sorted(detector.last_errors) == ["000660", "035720"]
+    assert detector.last_errors["000660"].startswith("ConnectionError")
+
+    detector.data_collector = _Collector({})
+    detector.detect_symbols(["005930"], now=NOW)
+    assert detector.last_errors == {}
@@ -0,0 +1,93 @@
+# ===============================
+# tests/scout_selector/test_market_calendar.py
+# ===============================
+"""거래일 캘린더: 휴장일 파일 / 기록 검증 / 오늘 조회 / 탐색 범위"""
+import json
+
+import pandas as pd
+import pytest
+
+from test.daily_scan.data.krx_source import KrxSource, set_source
+from scout_selector.utils import market_calendar
+from scout_selector.utils.market_calendar import HOLIDAY_FILE, TradingCalendar, load_holidays
+
+
+def _by_date(days):
+    index = pd.to_datetime(list(days)).rename("날짜")
+    return pd.DataFrame({"종가": 55000, "거래량": 1_000_000}, index=index)
+
+
+@pytest.fixture
+def krx_by_date(tmp_path):
+    """get_market_ohlcv_by_date 응답을 지정하는 cache 모드 KrxSource"""
+    responses = {}
+
+    def fetch(func, fromdate, todate, ticker):
+        days = responses.get((fromdate, todate), [])
+        return _by_date(days) if days is not None else None
+
+    set_source(KrxSource(mode="off", cache_dir=tmp_path / "krx", fetch=fetch))
+    yield responses
+    set_source(None)
+
+
+def test_holiday_file_covers_current_and_next_year():
+    holidays = load_holidays(HOLIDAY_FILE)
+    assert {"20260216", "20260217", "20260218", "20260302", "20260603"} <= holidays
+    assert any(d.startswith("2027") for d in holidays)
+
+    calendar = TradingCalendar(fetch=False, today="20260101")
+    assert not calendar.is_open("20260217")
+    assert calendar.next_day("20260213") == "20260219"
+    assert calendar.prev_day("20260303") == "20260227"
+
+
+def test_empty_fetch_is_not_recorded(tmp_path, krx_by_date):
+    calendar = TradingCalendar(calendar_dir=tmp_path, holiday_file=tmp_path / "none", today="20260115")
+    assert calendar.is_open("20260114")  # 규칙 기반
+    assert calendar.years[2026]["source"] == "rules"
+    assert not list(tmp_path.glob("krx_calendar_*.json"))
+
+
+def test_stale_fetch_is_not_recorded(tmp_path, krx_by_date):
+    krx_by_date[("20260101", "20260130")] = ["20260102", "20260105"]  # 최근 거래일 누락
+    calendar = TradingCalendar(calendar_dir=tmp_path, holiday_file=tmp_path / "none", today="20260131")
+    calendar.ensure_year(2026)
+    assert calendar.years[2026]["source"] == "rules"
+    assert not (tmp_path / "krx_calendar_2026.json").exists()
+
+
+def test_empty_recorded_file_is_ignored(tmp_path):
+    (tmp_path / "krx_calendar_2025.json").write_text(
+        json.dumps({"year": 2025, "recorded_until": "20251231", "trading_days": []}), encoding="utf-8"
+    )
+    calendar = TradingCalendar(calendar_dir=tmp_path, holiday_file=tmp_path / "none", fetch=False, today="20260105")
+    assert calendar.is_open("20251230")
+    assert calendar.prev_day("20260102") == "20251230"
+
+
+def test_today_after_close_uses_lookup(tmp_path, krx_by_date):
+    krx_by_date[("20260101", "20260106")] = ["20260102", "20260105", "20260106"]
+    krx_by_date[("20260107", "20260107")] = []  # 규칙상 거래일이나 KRX 휴장
+    calendar = TradingCalendar(calendar_dir=tmp_path, holiday_file=tmp_path / "none", today="20260107")
+    assert not calendar.is_open("20260107")
+    assert calendar.next_day("20260106") == "20260108"
+
+    krx_by_date[("20260107", "20260107")] = ["20260107"]
+    assert TradingCalendar(calendar_dir=tmp_path, holiday_file=tmp_path / "none", today="20260107").is_open()
+
+
+def test_today_without_lookup_uses_rules(tmp_path, monkeypatch):
+    monkeypatch.setattr(market_calendar, "HOLIDAY_FILE", tmp_path / "none")
+    calendar = TradingCalendar(calendar_dir=tmp_path, fetch=False, today="20260107")
+    assert calendar.is_open("20260107")
+
+
+def test_search_is_bounded(tmp_path, monkeypatch):
+    calendar = TradingCalendar(calendar_dir=tmp_path, holiday_file=tmp_path / "none", fetch=False, today="20260105")
+    empty = lambda year: {"year": year, "days": [], "recorded_until": None, "source": "rules"}
+    monkeypatch.setattr(calendar, "build_year", empty)
+    with pytest.raises(ValueError, match="거래일 없음"):
+        calendar.prev_day("20260105")
+    with pytest.raises(ValueError, match="거래일 없음"):
+        calendar.next_day("20260105")
@@ -0,0 +1,94 @@
+# ===============================
+# tests/scripts/test_post_market_pipeline.py
+# ===============================
+"""Post-Market 파이프라인 러너: 건너뛰기 조건 / 출력 확인"""
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "run" / "post_market_pipeline.py"
+spec = importlib.util.spec_from_file_location("post_market_pipeline", SCRIPT)
+pipeline = sys.modules["post_market_pipeline"] = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(pipeline)
+
+DATE = "20260109"
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline, "PROJECT_ROOT", tmp_path)
+    return tmp_path
+
+
+def _stage_module(monkeypatch, name, fn):
+    module = types.ModuleType(name)
+    module.main = fn
+    monkeypatch.setitem(sys.modules, name, module)
+    return name
+
+
+def _run(root, stages):
+    runner = pipeline.PipelineRunner(
+        DATE, stages=stages, workers=1,
+        state_path=root / "state.json", log_file=root / "logs" / "run.log",
+    )
+    runner.run()
+    return runner.results
+
+
+def test_fetch_stage_with_empty_output_is_retried(root, monkeypatch):
+    calls = []
+    rows = {"n": 0}
+
+    def collect(argv):
+        calls.append(list(argv))
+        path = root / f"ohlcv_{DATE}.csv"
+        if path.exists() and "--force" not in argv:
+            return  # 단계 자체 멱등성
+        path.write_text("date,symbol\n" + "".join(f"{DATE},00593{i}\n" for i in range(rows["n"])), encoding="utf-8")
+
+    (root / "pool.json").write_text("{}", encoding="utf-8")
+    stage = pipeline.Stage(
+        name="collect", label="Collect", module=_stage_module(monkeypatch, "fake_collect", collect),
+        args=["--date", "{date}"], inputs=["pool.json"], outputs=["ohlcv_{date}.csv"],
+        force_args=["--force"], fetches=True, output_check=pipeline.csv_has_rows,
+    )
+
+    first = _run(root, [stage])["collect"]
+    assert first.status == "warn" and "데이터 행 없음" in first.reason
+
+    rows["n"] = 2  # 네트워크 복구
+    second = _run(root, [stage])["collect"]
+    assert second.status == "success"
+    assert calls[-1][-1] == "--force"
+
+    third = _run(root, [stage])["collect"]
+    assert third.status == "success" and len(calls) == 3  # 건너뛰지 않고 단계 멱등성에 맡김
+    assert "--force" not in calls[-1]
+
+
+def test_local_stage_is_skipped_only_after_success(root, monkeypatch):
+    calls = []
+
+    def build(argv):
+        calls.append(argv)
+        (root / "out.json").write_text("{}", encoding="utf-8")
+
+    (root / "in.json").write_text("{}", encoding="utf-8")
+    stage = pipeline.Stage(
+        name="local", label="Local", module=_stage_module(monkeypatch, "fake_local", build),
+        args=[], inputs=["in.json"], outputs=["out.json"],
+    )
+    no_inputs = pipeline.Stage(
+        name="context", label="Context", module=_stage_module(monkeypatch, "fake_context", build),
+        args=[], outputs=["out.json"], critical=False,
+    )
+
+    assert _run(root, [stage, no_inputs])["local"].status == "success"
+    results = _run(root, [stage, no_inputs])
+    assert results["local"].status == "skipped" and results["local"].reason == "inputs unchanged"
+    assert results["context"].status == "success"
+    assert len(calls) == 3